@@ -46,6 +46,7 @@ def case_matrix() -> tuple[CaseDefinition, ...]:
         _case("schema create/drop", "schema", _zero, _zero_expected),
         _case("raw batch insert", "write", _write_rows, _write_rows_expected),
         _case("orm insert models", "write", _write_rows, _write_rows_expected),
+        _case("bulk load rows", "write", _write_rows, _write_rows_expected),
         _case("orm update filtered", "write", _read_rows, _category_expected),
         _case("orm upsert mixed", "write", _lookup_rows, _lookup_expected),
         _case("orm delete filtered", "write", _read_rows, _remaining_after_category),
@@ -58,6 +59,7 @@ def case_matrix() -> tuple[CaseDefinition, ...]:
         _case("paginated find_many", "read", _page_rows, _page_expected),
         _case("ordered find_many", "read", _page_rows, _page_expected),
         _case("hydrate flat rows", "hydration", _page_rows, _page_expected),
+        _case("hydrate flat rows, trusted", "hydration", _page_rows, _page_expected),
         _case(
             "serialize simple payloads",
             "serialization",
@@ -65,6 +67,13 @@ def case_matrix() -> tuple[CaseDefinition, ...]:
             _page_expected,
             comparable=False,
         ),
+        _case(
+            "serialize rows to JSON",
+            "serialization",
+            _page_rows,
+            _page_expected,
+            comparable=False,
+        ),
         _case(
             "serialize nested payloads",
             "serialization",
@@ -17,6 +17,7 @@ from benchmark.config import (
 from benchmark.runner import (
     backend_server_version,
     build_result_payload,
+    run_execution_path_comparison,
     run_from_config,
 )
 
@@ -28,6 +29,8 @@ DEFAULT_DOCS_CHARTS_ROOT = Path("docs/assets/benchmarks")
 def main(argv: list[str] | None = None) -> int:
     parser = _parser()
     args = parser.parse_args(argv)
+    if args.execution_paths:
+        return _run_execution_paths(args)
     try:
         config = build_config(
             profile=args.profile,
@@ -132,6 +135,25 @@ def main(argv: list[str] | None = None) -> int:
     return 0
 
 
+def _run_execution_paths(args: argparse.Namespace) -> int:
+    try:
+        measurements = run_execution_path_comparison(
+            args.backend,
+            rows=args.rows or 1_000,
+            lookups=args.lookup_count or 2_048,
+        )
+    except Exception as exc:
+        print(str(exc), file=sys.stderr)
+        return 2
+    print("path,concurrency,lookups,elapsed_ms,lookups_per_second")
+    for measurement in measurements:
+        print(
+            f"{measurement.path},{measurement.concurrency},{measurement.lookups},"
+            f"{measurement.elapsed_ms:.3f},{measurement.lookups_per_second:.1f}"
+        )
+    return 0
+
+
 def _parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description=(
@@ -181,6 +203,11 @@ def _parser() -> argparse.ArgumentParser:
         action="store_true",
         help="label billion-scale artifacts as planner-scale rather than materialized",
     )
+    parser.add_argument(
+        "--execution-paths",
+        action="store_true",
+        help="compare native awaitable lookups with asyncio.to_thread dispatch",
+    )
     parser.add_argument(
         "--i-understand-this-may-be-expensive",
         action="store_true",
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import importlib.metadata
+import json
 import os
 import platform
 import shutil
@@ -33,6 +34,7 @@ from benchmark.datasets import (
     batched_rows,
     lookup_ids,
     row_dict,
+    row_dicts,
 )
 from benchmark.models import (
     BENCH_ITEM_TABLE,
@@ -75,6 +77,7 @@ from benchmark import models as bm
 ProgressCallback = Callable[[str], None]
 OperationFactory = Callable[[], Awaitable["Operation"]]
 RUNNER_VERSION = "cross-db-v2"
+EXECUTION_PATH_CONCURRENCY = (1, 16, 256)
 
 
 @dataclass(frozen=True)
@@ -211,6 +214,90 @@ async def run_from_config_async(
     return measurements
 
 
+@dataclass(frozen=True)
+class ExecutionPathMeasurement:
+    """Primary-key lookup throughput for one execution path and concurrency."""
+
+    path: str
+    concurrency: int
+    lookups: int
+    elapsed_ms: float
+
+    @property
+    def lookups_per_second(self) -> float:
+        if self.elapsed_ms <= 0:
+            return 0.0
+        return self.lookups / (self.elapsed_ms / 1000)
+
+
+def run_execution_path_comparison(
+    backend_name: str,
+    *,
+    rows: int = 1_000,
+    lookups: int = 2_048,
+    concurrency: tuple[int, ...] = EXECUTION_PATH_CONCURRENCY,
+) -> list[ExecutionPathMeasurement]:
+    """Compare native awaitable execution with `asyncio.to_thread` dispatch."""
+    return asyncio.run(
+        run_execution_path_comparison_async(
+            backend_name, rows=rows, lookups=lookups, concurrency=concurrency
+        )
+    )
+
+
+async def run_execution_path_comparison_async(
+    backend_name: str,
+    *,
+    rows: int = 1_000,
+    lookups: int = 2_048,
+    concurrency: tuple[int, ...] = EXECUTION_PATH_CONCURRENCY,
+) -> list[ExecutionPathMeasurement]:
+    """Measure PK lookups at each concurrency level for both execution paths."""
+    backend = resolve_backend(backend_name)
+    directory, url, _sqlalchemy_url = _urls_for_sample(backend)
+    ids = lookup_ids(rows, lookups)
+    measurements: list[ExecutionPathMeasurement] = []
+    try:
+        for path, native_async in (("native", True), ("thread", False)):
+            db = Ormdantic(url, native_async=native_async)
+            models = register_ormdantic_models(db)
+            await db.init()
+            await db.drop_all()
+            await db.create_all()
+            await _seed_items_native(url, backend.name, rows, 500)
+            table = db[models.item]
+            for level in concurrency:
+                measurements.append(
+                    await _measure_execution_path(table, path, level, ids, lookups)
+                )
+            await db.drop_all()
+    finally:
+        _cleanup_directory(directory)
+    return measurements
+
+
+async def _measure_execution_path(
+    table: Any,
+    path: str,
+    concurrency: int,
+    ids: tuple[str, ...],
+    lookups: int,
+) -> ExecutionPathMeasurement:
+    if not ids:
+        return ExecutionPathMeasurement(path, concurrency, 0, 0.0)
+    # Workers share one iterator so the total lookup count is fixed.
+    remaining = iter(range(lookups))
+
+    async def worker() -> None:
+        for index in remaining:
+            await table.find_one(ids[index % len(ids)])
+
+    started = perf_counter_ns()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed_ms = (perf_counter_ns() - started) / 1_000_000
+    return ExecutionPathMeasurement(path, concurrency, lookups, elapsed_ms)
+
+
 def build_result_payload(
     *,
     config: BenchmarkConfig,
@@ -491,7 +578,7 @@ def _ormdantic_operation_factory(
             return _ormdantic_relationship_operation(context, config, case_name)
 
         context = await _prepare_ormdantic_context(backend, create_schema=True)
-        if case_name not in {"raw batch insert", "orm insert models"}:
+        if case_name not in _WRITE_CASES:
             await _seed_items_native(
                 context.url, backend.name, config.rows, config.batch_size
             )
@@ -515,7 +602,7 @@ def _sqlalchemy_operation_factory(
             return _sqlalchemy_relationship_operation(context, config, case_name)
 
         context = await _prepare_sqlalchemy_context(backend, create_schema=True)
-        if case_name not in {"raw batch insert", "orm insert models"}:
+        if case_name not in _WRITE_CASES:
             await _seed_sqlalchemy_items(context, config.rows, config.batch_size)
         return _sqlalchemy_item_operation(context, config, case_name)
 
@@ -537,7 +624,7 @@ def _sqlmodel_operation_factory(
             return _sqlmodel_relationship_operation(context, config, case_name)
 
         context = await _prepare_sqlmodel_context(backend, create_schema=True)
-        if case_name not in {"raw batch insert", "orm insert models"}:
+        if case_name not in _WRITE_CASES:
             await _seed_sqlmodel_items(context, config.rows, config.batch_size)
         return _sqlmodel_item_operation(context, config, case_name)
 
@@ -695,6 +782,8 @@ def _ormdantic_item_operation(
                     batch_size=config.batch_size,
                 )
             actual = config.write_rows
+        elif case_name == "bulk load rows":
+            actual = await table.copy_from(row_dicts(config.write_rows, prefix="write"))
         elif case_name == "orm update filtered":
             await table.update_where(
                 assignment("score", 9_999),
@@ -762,6 +851,14 @@ def _ormdantic_item_operation(
         elif case_name == "hydrate flat rows":
             result = await table.find_many(limit=min(config.lookup_count, 1_000))
             actual = len(result.data)
+        elif case_name == "hydrate flat rows, trusted":
+            result = await table.find_many(
+                limit=min(config.lookup_count, 1_000), validate=False
+            )
+            actual = len(result.data)
+        elif case_name == "serialize rows to JSON":
+            payload = await table.find_many_json(limit=min(config.lookup_count, 1_000))
+            actual = _json_row_count(payload)
         elif case_name == "hydrate relationship results":
             actual = await _ormdantic_load_parent_count(context, config, case_name)
         else:
@@ -800,6 +897,14 @@ def _sqlalchemy_item_operation(
                     )
                     await session.commit()
             actual = config.write_rows
+        elif case_name == "bulk load rows":
+            async with context.session_factory() as session:
+                await session.execute(
+                    insert(bm.SqlAlchemyBenchItem),
+                    list(row_dicts(config.write_rows, prefix="write")),
+                )
+                await session.commit()
+            actual = config.write_rows
         elif case_name == "orm update filtered":
             async with context.session_factory() as session:
                 result = await session.execute(
@@ -871,6 +976,14 @@ def _sqlmodel_item_operation(
                     session.add_all(bm.SQLModelBenchItem(**values) for values in batch)
                     await session.commit()
             actual = config.write_rows
+        elif case_name == "bulk load rows":
+            async with context.session_factory() as session:
+                await session.execute(
+                    insert(bm.SQLModelBenchItem),
+                    list(row_dicts(config.write_rows, prefix="write")),
+                )
+                await session.commit()
+            actual = config.write_rows
         elif case_name == "orm update filtered":
             async with context.session_factory() as session:
                 result = await session.execute(
@@ -963,7 +1076,11 @@ async def _sqlalchemy_read_case(
                 if await session.get(bm.SqlAlchemyBenchItem, item_id) is not None:
                     found += 1
             return found
-        if case_name in {"paginated find_many", "hydrate flat rows"}:
+        if case_name in {
+            "paginated find_many",
+            "hydrate flat rows",
+            "hydrate flat rows, trusted",
+        }:
             result = await session.execute(
                 select(bm.SqlAlchemyBenchItem).limit(min(config.lookup_count, 1_000))
             )
@@ -975,6 +1092,12 @@ async def _sqlalchemy_read_case(
                 .limit(min(config.lookup_count, 1_000))
             )
             return len(result.scalars().all())
+        if case_name == "serialize rows to JSON":
+            limit = min(config.lookup_count, 1_000)
+            result = await session.execute(select(bm.SqlAlchemyBenchItem).limit(limit))
+            data = [_sqlalchemy_item_dict(item) for item in result.scalars().all()]
+            payload = json.dumps({"offset": 0, "limit": limit, "data": data})
+            return _json_row_count(payload.encode())
         raise ValueError(f"unknown SQLAlchemy benchmark case: {case_name}")
 
 
@@ -1021,7 +1144,11 @@ async def _sqlmodel_read_case(
                 if await session.get(bm.SQLModelBenchItem, item_id) is not None:
                     found += 1
             return found
-        if case_name in {"paginated find_many", "hydrate flat rows"}:
+        if case_name in {
+            "paginated find_many",
+            "hydrate flat rows",
+            "hydrate flat rows, trusted",
+        }:
             result = await session.execute(
                 select(bm.SQLModelBenchItem).limit(min(config.lookup_count, 1_000))
             )
@@ -1033,6 +1160,12 @@ async def _sqlmodel_read_case(
                 .limit(min(config.lookup_count, 1_000))
             )
             return len(result.scalars().all())
+        if case_name == "serialize rows to JSON":
+            limit = min(config.lookup_count, 1_000)
+            result = await session.execute(select(bm.SQLModelBenchItem).limit(limit))
+            data = [item.model_dump() for item in result.scalars().all()]
+            payload = json.dumps({"offset": 0, "limit": limit, "data": data})
+            return _json_row_count(payload.encode())
         raise ValueError(f"unknown SQLModel benchmark case: {case_name}")
 
 
@@ -1622,6 +1755,10 @@ def _sqlalchemy_nested_payloads(read_rows: int) -> list[Any]:
     return payloads
 
 
+def _json_row_count(payload: bytes) -> int:
+    return len(json.loads(payload)["data"])
+
+
 def _sqlalchemy_item_dict(item: Any) -> dict[str, Any]:
     return {
         "id": item.id,
@@ -1762,6 +1899,8 @@ def _ormdantic_version() -> str:
     return ormdantic.__version__
 
 
+_WRITE_CASES = {"raw batch insert", "orm insert models", "bulk load rows"}
+
 _RELATIONSHIP_CASES = {
     "hydrate relationship results",
     "one-to-many relationship loading",
@@ -3,6 +3,12 @@
 __version__ = "2.0.1"
 
 from ormdantic.association import association_proxy, hybrid_property
+from ormdantic.cache import (
+    CachePolicy,
+    FileInvalidationBroadcaster,
+    IdentityCache,
+    ResultCache,
+)
 from ormdantic.engine import runtime_capabilities
 from ormdantic.errors import (
     ConfigurationError,
@@ -103,6 +109,10 @@ __all__ = [
     "MustUnionForeignKeyError",
     "TypeConversionError",
     "EventRegistry",
+    "IdentityCache",
+    "ResultCache",
+    "CachePolicy",
+    "FileInvalidationBroadcaster",
     "QueryExpression",
     "RelationExpression",
     "column",
@@ -46,6 +46,9 @@ from ormdantic._migrations.sql import (
 from ormdantic._migrations.sql import (
     query_rows_url as _query_rows_url,
 )
+from ormdantic._migrations.sql import (
+    shared_catalog_connection as _shared_catalog_connection,
+)
 from ormdantic._migrations.sql import (
     sql_literal as _sql_literal,
 )
@@ -81,20 +84,22 @@ def _reflect_schema_snapshot(
     schema: str | None,
 ) -> SchemaSnapshot:
     dialect_name = _dialect_name(dialect)
-    if dialect_name != "sqlite":
-        return _reflect_server_snapshot(
+    # Catalog queries share one connection instead of reconnecting per query.
+    with _shared_catalog_connection(url):
+        if dialect_name != "sqlite":
+            return _reflect_server_snapshot(
+                url,
+                dialect=dialect_name,
+                include_tables=include_tables,
+                exclude_tables=exclude_tables,
+                schema=schema,
+            )
+        return _reflect_sqlite_snapshot(
             url,
-            dialect=dialect_name,
             include_tables=include_tables,
             exclude_tables=exclude_tables,
             schema=schema,
         )
-    return _reflect_sqlite_snapshot(
-        url,
-        include_tables=include_tables,
-        exclude_tables=exclude_tables,
-        schema=schema,
-    )
 
 
 def _reflect_server_snapshot(
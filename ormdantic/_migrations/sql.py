@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 import json
-from collections.abc import Mapping, Sequence
+from collections.abc import Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
 from fnmatch import fnmatch
+from time import perf_counter
 from typing import Any
 
 
@@ -49,20 +53,83 @@ def sql_literal(value: Any) -> str:
     return f"'{text}'"
 
 
+@dataclass
+class _CatalogScope:
+    url: str
+    connection: Any | None = None
+
+
+_catalog_scope: ContextVar[_CatalogScope | None] = ContextVar(
+    "ormdantic_catalog_scope", default=None
+)
+_catalog_timings: ContextVar[list[dict[str, Any]] | None] = ContextVar(
+    "ormdantic_catalog_timings", default=None
+)
+
+
+@contextmanager
+def shared_catalog_connection(url: str) -> Iterator[None]:
+    """Run every ``query_rows_url`` call for ``url`` on one native connection.
+
+    The connection opens on the first catalog query and closes when the block
+    exits; nested blocks for the same URL reuse the outer connection.
+    """
+    current = _catalog_scope.get()
+    if current is not None and current.url == url:
+        yield
+        return
+    scope = _CatalogScope(url)
+    token = _catalog_scope.set(scope)
+    try:
+        yield
+    finally:
+        _catalog_scope.reset(token)
+        scope.connection = None
+
+
+@contextmanager
+def record_catalog_timings() -> Iterator[list[dict[str, Any]]]:
+    """Collect the SQL, duration, and row count of each catalog query."""
+    timings: list[dict[str, Any]] = []
+    token = _catalog_timings.set(timings)
+    try:
+        yield timings
+    finally:
+        _catalog_timings.reset(token)
+
+
 def query_rows(
     connection: Any, sql: str, params: Sequence[Any] | None = None
 ) -> list[list[Any]]:
-    result = connection.execute(sql, list(params or ()))
-    if not isinstance(result, Mapping):
-        return []
-    rows = result.get("rows", [])
-    if not isinstance(rows, Sequence):
-        return []
-    return [list(row) for row in rows if isinstance(row, Sequence)]
+    return _result_rows(connection.execute(sql, list(params or ())))
 
 
 def query_rows_url(rust_module: Any, url: str, sql: str) -> list[list[Any]]:
-    result = rust_module.execute_native(url, sql, [])
+    started = perf_counter()
+    scope = _catalog_scope.get()
+    if (
+        scope is not None
+        and scope.url == url
+        and hasattr(rust_module, "PyNativeConnection")
+    ):
+        if scope.connection is None:
+            scope.connection = rust_module.PyNativeConnection(url)
+        rows = _result_rows(scope.connection.execute(sql, []))
+    else:
+        rows = _result_rows(rust_module.execute_native(url, sql, []))
+    timings = _catalog_timings.get()
+    if timings is not None:
+        timings.append(
+            {
+                "sql": sql,
+                "duration_ms": (perf_counter() - started) * 1000,
+                "row_count": len(rows),
+            }
+        )
+    return rows
+
+
+def _result_rows(result: Any) -> list[list[Any]]:
     if not isinstance(result, Mapping):
         return []
     rows = result.get("rows", [])
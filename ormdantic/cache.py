@@ -0,0 +1,441 @@
+"""Process-wide caches for rows loaded by primary key and for query results."""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import threading
+import uuid
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from time import monotonic
+from typing import Any, Protocol
+
+from pydantic import BaseModel
+
+DEFAULT_IDENTITY_CACHE_SIZE = 10_000
+DEFAULT_RESULT_CACHE_BYTES = 64 * 1024 * 1024
+
+
+class IdentityCache:
+    """Size-bounded LRU cache of loaded rows keyed by model type and primary key.
+
+    ``ttl`` is the lifetime in seconds of every cached row (``None`` keeps
+    rows until they are evicted or invalidated), and ``ttls`` overrides it per
+    model; a TTL of ``0`` disables caching for that model. Cached models are
+    stored and returned as shallow copies, so callers never share an instance.
+    Pass the same cache to several databases to share it across the process.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_IDENTITY_CACHE_SIZE,
+        *,
+        ttl: float | None = None,
+        ttls: Mapping[type[BaseModel], float | None] | None = None,
+    ) -> None:
+        """Create an empty cache holding at most ``max_size`` rows."""
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        for value in (ttl, *(ttls or {}).values()):
+            if value is not None and value < 0:
+                raise ValueError("cache TTLs must be non-negative")
+        self.max_size = max_size
+        self._ttl = ttl
+        self._ttls = dict(ttls or {})
+        self._entries: OrderedDict[
+            tuple[type[BaseModel], Any], tuple[float | None, BaseModel]
+        ] = OrderedDict()
+        self._generations: dict[type[BaseModel], int] = {}
+        self._epoch = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+
+    def caches(self, model_type: type[BaseModel]) -> bool:
+        """Return whether rows of ``model_type`` are cached at all."""
+        return self._ttl_for(model_type) != 0
+
+    def generation(self, model_type: type[BaseModel]) -> tuple[int, int]:
+        """Return a token that changes whenever ``model_type`` is invalidated."""
+        return self._epoch, self._generations.get(model_type, 0)
+
+    def get(self, model_type: type[BaseModel], pk: Any) -> BaseModel | None:
+        """Return a copy of the cached row for ``pk``, or ``None`` on a miss."""
+        key = (model_type, pk)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] is not None and entry[0] <= monotonic():
+                del self._entries[key]
+                self._expirations += 1
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+        return entry[1].model_copy()
+
+    def put(
+        self,
+        model_type: type[BaseModel],
+        pk: Any,
+        model: BaseModel,
+        *,
+        generation: tuple[int, int] | None = None,
+    ) -> None:
+        """Cache a copy of ``model`` under ``pk``.
+
+        When ``generation`` is given and the model has been invalidated since
+        that token was read, the row may be stale and is not cached.
+        """
+        ttl = self._ttl_for(model_type)
+        if ttl == 0 or pk is None:
+            return
+        expires = monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            if generation is not None and generation != self.generation(model_type):
+                return
+            key = (model_type, pk)
+            self._entries[key] = (expires, model.model_copy())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, model_type: type[BaseModel], pk: Any) -> None:
+        """Drop the cached row for ``pk``."""
+        with self._lock:
+            self._bump(model_type)
+            if self._entries.pop((model_type, pk), None) is not None:
+                self._invalidations += 1
+
+    def invalidate_table(self, model_type: type[BaseModel]) -> None:
+        """Drop every cached row of ``model_type``."""
+        with self._lock:
+            self._bump(model_type)
+            stale = [key for key in self._entries if key[0] is model_type]
+            for key in stale:
+                del self._entries[key]
+            self._invalidations += len(stale)
+
+    def clear(self) -> None:
+        """Drop every cached row."""
+        with self._lock:
+            self._epoch += 1
+            self._invalidations += len(self._entries)
+            self._entries.clear()
+
+    def statistics(self) -> dict[str, int]:
+        """Return hit, miss, eviction and size counters."""
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "invalidations": self._invalidations,
+            }
+
+    def _ttl_for(self, model_type: type[BaseModel]) -> float | None:
+        return self._ttls.get(model_type, self._ttl)
+
+    def _bump(self, model_type: type[BaseModel]) -> None:
+        self._generations[model_type] = self._generations.get(model_type, 0) + 1
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """Opt-in result caching for one read query.
+
+    ``ttl`` is the lifetime in seconds of the cached result; ``None`` keeps it
+    until a write invalidates one of the tables it read or it is evicted, and
+    ``0`` disables caching for the call.
+    """
+
+    ttl: float | None = None
+
+    def __post_init__(self) -> None:
+        if self.ttl is not None and self.ttl < 0:
+            raise ValueError("cache TTLs must be non-negative")
+
+
+class InvalidationBroadcaster(Protocol):
+    """Channel that shares table invalidations between worker processes."""
+
+    def publish(self, tables: Iterable[str]) -> None:
+        """Announce that ``tables`` were written by this process."""
+
+    def poll(self) -> list[str]:
+        """Return tables invalidated by other processes since the last poll."""
+
+
+class FileInvalidationBroadcaster:
+    """Share invalidations between processes through an append-only file.
+
+    Every worker appends one JSON line per invalidation and reads the lines
+    other workers appended since its last poll. The file is only a local
+    stand-in for a real message bus; truncate it to reclaim space.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        """Follow ``path``, ignoring invalidations written before now."""
+        self.path = Path(path)
+        self._sender = uuid.uuid4().hex
+        self._lock = threading.Lock()
+        try:
+            self._offset = self.path.stat().st_size
+        except FileNotFoundError:
+            self._offset = 0
+
+    def publish(self, tables: Iterable[str]) -> None:
+        """Append an invalidation record for ``tables``."""
+        message = {"sender": self._sender, "tables": sorted(tables)}
+        line = json.dumps(message, separators=(",", ":")) + "\n"
+        with open(self.path, "a", encoding="utf-8") as file:
+            file.write(line)
+
+    def poll(self) -> list[str]:
+        """Return tables other processes invalidated since the last poll."""
+        with self._lock:
+            try:
+                size = self.path.stat().st_size
+            except FileNotFoundError:
+                self._offset = 0
+                return []
+            if size < self._offset:
+                # The file was truncated; everything in it is new.
+                self._offset = 0
+            if size == self._offset:
+                return []
+            with open(self.path, "rb") as file:
+                file.seek(self._offset)
+                chunk = file.read(size - self._offset)
+            complete = chunk.rfind(b"\n") + 1
+            self._offset += complete
+        tables: list[str] = []
+        for line in chunk[:complete].splitlines():
+            try:
+                message = json.loads(line)
+            except ValueError:
+                continue
+            if message.get("sender") != self._sender:
+                tables.extend(message.get("tables") or ())
+        return tables
+
+
+@dataclass
+class _ResultEntry:
+    value: Any
+    tables: frozenset[str]
+    expires: float | None
+    size: int
+
+
+class ResultCache:
+    """Memory-bounded LRU cache of read query results.
+
+    Results are keyed by the compiled SQL and bind values of a query and are
+    dropped whenever a table the query read is written. ``max_bytes`` bounds
+    the estimated size of the cached results; results larger than the whole
+    budget are not cached. A ``broadcaster`` shares invalidations with other
+    processes and is polled before every lookup.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_RESULT_CACHE_BYTES,
+        *,
+        broadcaster: InvalidationBroadcaster | None = None,
+    ) -> None:
+        """Create an empty cache holding at most ``max_bytes`` of results."""
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+        self.max_bytes = max_bytes
+        self.broadcaster = broadcaster
+        self._entries: OrderedDict[Hashable, _ResultEntry] = OrderedDict()
+        self._keys_by_table: dict[str, set[Hashable]] = {}
+        self._generations: dict[str, int] = {}
+        self._epoch = 0
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+
+    @staticmethod
+    def key(*parts: Any) -> Hashable:
+        """Build a cache key from query parts such as SQL text and binds.
+
+        Containers are frozen recursively and scalars are tagged with their
+        type, so ``1``, ``1.0`` and ``True`` bind different entries.
+        """
+        return _freeze(parts)
+
+    def generation(self, tables: Iterable[str]) -> tuple[int, int]:
+        """Return a token that changes whenever one of ``tables`` is invalidated."""
+        return self._epoch, sum(self._generations.get(table, 0) for table in tables)
+
+    def get(self, key: Hashable) -> Any | None:
+        """Return the cached result for ``key``, or ``None`` on a miss."""
+        self._poll()
+        with self._lock:
+            entry = self._entries.get(key)
+            if (
+                entry is not None
+                and entry.expires is not None
+                and entry.expires <= monotonic()
+            ):
+                self._discard(key)
+                self._expirations += 1
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry.value
+
+    def put(
+        self,
+        key: Hashable,
+        value: Any,
+        *,
+        tables: Iterable[str],
+        ttl: float | None = None,
+        generation: tuple[int, int] | None = None,
+    ) -> None:
+        """Cache ``value`` as the result of a query that read ``tables``.
+
+        When ``generation`` is given and one of the tables has been
+        invalidated since that token was read, the result may be stale and is
+        not cached. Cached values are shared, so callers must not mutate them.
+        """
+        if ttl == 0:
+            return
+        tables = frozenset(tables)
+        size = _estimate_size(value)
+        if size > self.max_bytes:
+            return
+        expires = monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            if generation is not None and generation != self.generation(tables):
+                return
+            self._discard(key)
+            self._entries[key] = _ResultEntry(value, tables, expires, size)
+            self._bytes += size
+            for table in tables:
+                self._keys_by_table.setdefault(table, set()).add(key)
+            while self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._discard(oldest)
+                self._evictions += 1
+
+    def invalidate_tables(
+        self, tables: Iterable[str], *, broadcast: bool = True
+    ) -> None:
+        """Drop every cached result that read one of ``tables``.
+
+        The invalidation is published to the broadcaster unless ``broadcast``
+        is false.
+        """
+        tables = frozenset(tables)
+        if not tables:
+            return
+        with self._lock:
+            for table in tables:
+                self._generations[table] = self._generations.get(table, 0) + 1
+                for key in list(self._keys_by_table.get(table, ())):
+                    self._discard(key)
+                    self._invalidations += 1
+        if broadcast and self.broadcaster is not None:
+            self.broadcaster.publish(tables)
+
+    def clear(self) -> None:
+        """Drop every cached result."""
+        with self._lock:
+            self._epoch += 1
+            self._invalidations += len(self._entries)
+            self._entries.clear()
+            self._keys_by_table.clear()
+            self._bytes = 0
+
+    def statistics(self) -> dict[str, int]:
+        """Return hit, miss, eviction and size counters."""
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "invalidations": self._invalidations,
+            }
+
+    def _poll(self) -> None:
+        if self.broadcaster is None:
+            return
+        tables = self.broadcaster.poll()
+        if tables:
+            self.invalidate_tables(tables, broadcast=False)
+
+    def _discard(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self._bytes -= entry.size
+        for table in entry.tables:
+            keys = self._keys_by_table.get(table)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_table[table]
+
+
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, Mapping):
+        return (
+            "mapping",
+            tuple(sorted(((str(k), _freeze(v)) for k, v in value.items()))),
+        )
+    if isinstance(value, (list, tuple)):
+        return ("sequence", tuple(_freeze(item) for item in value))
+    if isinstance(value, (set, frozenset)):
+        return ("set", frozenset(_freeze(item) for item in value))
+    if isinstance(value, Hashable):
+        return (type(value).__qualname__, value)
+    return (type(value).__qualname__, repr(value))
+
+
+def _estimate_size(value: Any) -> int:
+    """Estimate the memory held by ``value`` and the containers inside it."""
+    seen: set[int] = set()
+    pending = [value]
+    total = 0
+    while pending:
+        item = pending.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        if isinstance(item, memoryview):
+            total += sys.getsizeof(item) + item.nbytes
+            continue
+        total += sys.getsizeof(item)
+        if isinstance(item, Mapping):
+            pending.extend(item.keys())
+            pending.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            pending.extend(item)
+    return total
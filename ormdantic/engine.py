@@ -3,7 +3,11 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Callable
 from dataclasses import dataclass
+from functools import partial
+from importlib import import_module
+from itertools import pairwise
 from types import TracebackType
 from typing import Any, Iterator
 
@@ -15,6 +19,7 @@ from ormdantic._native import (
     unavailable_runtime_capabilities,
 )
 from ormdantic.errors import (
+    ConfigurationError,
     DatabaseConnectionError,
     NativeExtensionError,
     QueryExecutionError,
@@ -69,6 +74,232 @@ class NativeResult:
             return None
         return self._rows[0][0]
 
+    def to_arrow(self) -> Any:
+        """Return the rows as a `pyarrow.Table`.
+
+        This converts already materialized Python values; use
+        `Table.select_arrow` or `NativeEngine.execute_arrow` to build Arrow
+        data natively without per-cell objects.
+        """
+        pyarrow = _import_optional("pyarrow")
+        names = [name for (name,) in self.cursor.description]
+        columns = [[row[index] for row in self._rows] for index in range(len(names))]
+        return pyarrow.table(columns, names=names)
+
+
+class ArrowResult:
+    """Arrow record batches built natively from a query result.
+
+    Implements the Arrow PyCapsule interface, so Arrow-aware libraries import
+    the batches without copying, for example `pyarrow.table(result)` or
+    `polars.DataFrame(result)`.
+    """
+
+    def __init__(self, table: Any) -> None:
+        """Wrap a native Arrow table exported by the Rust runtime."""
+        self._table = table
+
+    @property
+    def num_rows(self) -> int:
+        """Return the total number of rows across batches."""
+        return int(self._table.num_rows)
+
+    @property
+    def num_batches(self) -> int:
+        """Return the number of record batches."""
+        return int(self._table.num_batches)
+
+    @property
+    def columns(self) -> list[str]:
+        """Return the column names."""
+        return list(self._table.column_names)
+
+    def __arrow_c_schema__(self) -> Any:
+        """Export the schema as an `arrow_schema` PyCapsule."""
+        return self._table.__arrow_c_schema__()
+
+    def __arrow_c_array__(self, requested_schema: Any = None) -> tuple[Any, Any]:
+        """Export a single-batch result as schema and array PyCapsules."""
+        return self._table.__arrow_c_array__(requested_schema)
+
+    def __arrow_c_stream__(self, requested_schema: Any = None) -> Any:
+        """Export all batches as an `arrow_array_stream` PyCapsule."""
+        return self._table.__arrow_c_stream__(requested_schema)
+
+    def to_arrow(self) -> Any:
+        """Return the result as a `pyarrow.Table`."""
+        return self.to_reader().read_all()
+
+    def to_reader(self) -> Any:
+        """Return a `pyarrow.RecordBatchReader` over the batches."""
+        pyarrow = _import_optional("pyarrow")
+        return pyarrow.RecordBatchReader.from_stream(self)
+
+    def to_polars(self) -> Any:
+        """Return the result as a `polars.DataFrame`."""
+        polars = _import_optional("polars")
+        return polars.DataFrame(self)
+
+
+def _import_optional(module: str) -> Any:
+    try:
+        return import_module(module)
+    except ImportError as exc:
+        raise ConfigurationError(
+            f"{module} is required for this conversion; "
+            f"install it with: pip install {module}"
+        ) from exc
+
+
+_BUFFER_FORMATS = {"int64": "q", "float64": "d", "bool": "B"}
+
+
+class ColumnarResult:
+    """Column-major query result backed by native buffers.
+
+    Integer, float and boolean columns arrive as packed native-endian buffers,
+    text columns as int64 offsets into one UTF-8 buffer, and everything else as
+    a list of Python objects. `buffers` exposes the raw memory without copying;
+    `column` and `rows` materialize Python values on demand.
+    """
+
+    def __init__(self, payload: dict[str, Any]) -> None:
+        """Wrap a `layout="columns"` payload returned by the native runtime."""
+        self.columns = list(payload["columns"])
+        self.rowcount = payload.get("rowcount")
+        self._length = int(payload["length"])
+        self._data: list[dict[str, Any]] = list(payload["data"])
+        self._values: dict[int, list[Any]] = {}
+
+    @classmethod
+    def from_rows(
+        cls,
+        columns: list[str],
+        rows: list[Any],
+        rowcount: int | None = None,
+    ) -> ColumnarResult:
+        """Build a columnar result from row-major values."""
+        data = [
+            {"type": "object", "values": [row[index] for row in rows], "validity": None}
+            for index in range(len(columns))
+        ]
+        return cls(
+            {
+                "columns": columns,
+                "length": len(rows),
+                "data": data,
+                "rowcount": rowcount,
+            }
+        )
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return self._length
+
+    def __iter__(self) -> Iterator[tuple[Any, ...]]:
+        """Iterate over result rows."""
+        return iter(self.rows())
+
+    def column_type(self, name: str) -> str:
+        """Return the physical type of a column: int64, float64, bool, text or object."""
+        return str(self._data[self._index(name)]["type"])
+
+    def buffers(self, name: str) -> dict[str, Any]:
+        """Return the raw buffers of a column as typed memoryviews.
+
+        Object columns return their value list under `values` instead.
+        """
+        column = self._data[self._index(name)]
+        validity = column.get("validity")
+        buffers: dict[str, Any] = {
+            "validity": None if validity is None else memoryview(validity)
+        }
+        kind = column["type"]
+        if kind == "text":
+            buffers["offsets"] = memoryview(column["offsets"]).cast("q")
+            buffers["data"] = memoryview(column["data"])
+        elif kind in _BUFFER_FORMATS:
+            buffers["values"] = memoryview(column["values"]).cast(_BUFFER_FORMATS[kind])
+        else:
+            buffers["values"] = column["values"]
+        return buffers
+
+    def column(self, name: str) -> list[Any]:
+        """Return one column as a list of Python values."""
+        return self._column_values(self._index(name))
+
+    def rows(self) -> list[tuple[Any, ...]]:
+        """Return the result as row tuples."""
+        if not self._data:
+            return [() for _ in range(self._length)]
+        return list(
+            zip(
+                *(self._column_values(index) for index in range(len(self._data))),
+                strict=True,
+            )
+        )
+
+    def scalar(self) -> Any:
+        """Return the first column from the first row, if present."""
+        if not self._length or not self._data:
+            return None
+        return self._column_values(0)[0]
+
+    def to_native_result(self) -> NativeResult:
+        """Return a row-major result for the hydration serializer."""
+        return NativeResult(
+            columns=self.columns, rows=self.rows(), rowcount=self.rowcount
+        )
+
+    def _index(self, name: str) -> int:
+        try:
+            return self.columns.index(name)
+        except ValueError:
+            raise KeyError(name) from None
+
+    def _column_values(self, index: int) -> list[Any]:
+        values = self._values.get(index)
+        if values is None:
+            values = _materialize_column(self._data[index])
+            self._values[index] = values
+        return values
+
+
+def _materialize_column(column: dict[str, Any]) -> list[Any]:
+    kind = column["type"]
+    if kind == "object":
+        return list(column["values"])
+    if kind == "text":
+        offsets = memoryview(column["offsets"]).cast("q").tolist()
+        data: bytes = column["data"]
+        bounds = pairwise(offsets)
+        if data.isascii():
+            # Byte offsets are character offsets, so decode once and slice.
+            text = data.decode()
+            values: list[Any] = [text[start:end] for start, end in bounds]
+        else:
+            values = [data[start:end].decode() for start, end in bounds]
+    else:
+        values = memoryview(column["values"]).cast(_BUFFER_FORMATS[kind]).tolist()
+        if kind == "bool":
+            values = list(map(bool, values))
+    validity = column.get("validity")
+    if validity is not None:
+        values = [
+            value if valid else None
+            for value, valid in zip(values, validity, strict=True)
+        ]
+    return values
+
+
+def native_result_from_payload(payload: dict[str, Any]) -> NativeResult:
+    """Build a row-major result from a native row payload."""
+    return NativeResult(
+        columns=list(payload["columns"]),
+        rows=[tuple(row) for row in payload["rows"]],
+        rowcount=payload.get("rowcount"),
+    )
+
 
 class NativeEngine:
     """Async facade over a persistent Rust `PyNativeConnection`."""
@@ -94,31 +325,61 @@ class NativeEngine:
 
     async def execute(self, sql: str, values: tuple[Any, ...]) -> NativeResult:
         """Execute SQL with ordered bind values on the native connection."""
-        loop = asyncio.get_running_loop()
-        result = await loop.run_in_executor(None, self._execute_sync, sql, list(values))
+        result = await self._run(self._execute_sync, sql, list(values))
         return NativeResult(
             columns=list(result["columns"]),
             rows=[tuple(row) for row in result["rows"]],
             rowcount=result.get("rowcount"),
         )
 
+    async def execute_arrow(
+        self,
+        sql: str,
+        values: tuple[Any, ...],
+        batch_size: int | None = None,
+    ) -> ArrowResult:
+        """Execute SQL and return the rows as natively built Arrow batches."""
+        if batch_size is not None and batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        table = await self._run(self._execute_arrow_sync, sql, list(values), batch_size)
+        return ArrowResult(table)
+
+    async def _run(self, call: Callable[..., Any], *args: Any) -> Any:
+        """Await a blocking connection call on the connection's native worker."""
+        spawn = getattr(self._connection, "spawn", None)
+        if spawn is None:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, call, *args)
+        return await spawn(partial(call, *args) if args else call)
+
     def _execute_sync(self, sql: str, values: list[Any]) -> dict[str, Any]:
         """Run the blocking Rust execution call in a worker thread."""
         assert _ormdantic is not None
         try:
             return self._connection.execute(sql, values)
         except Exception as exc:
-            error = classify_native_error(
-                exc,
-                default=QueryExecutionError,
-                message="native SQL execution failed",
-                context={
-                    "operation": "execute",
-                    "backend": _backend(self.url),
-                    "sql": sql,
-                },
-            )
-            raise error from exc
+            raise self._execution_error(exc, sql) from exc
+
+    def _execute_arrow_sync(
+        self, sql: str, values: list[Any], batch_size: int | None
+    ) -> Any:
+        """Run the blocking Rust Arrow export call in a worker thread."""
+        try:
+            return self._connection.execute_arrow(sql, values, batch_size=batch_size)
+        except Exception as exc:
+            raise self._execution_error(exc, sql) from exc
+
+    def _execution_error(self, exc: Exception, sql: str) -> Exception:
+        return classify_native_error(
+            exc,
+            default=QueryExecutionError,
+            message="native SQL execution failed",
+            context={
+                "operation": "execute",
+                "backend": _backend(self.url),
+                "sql": sql,
+            },
+        )
 
     def transaction(self) -> NativeTransaction:
         """Create an async transaction context manager."""
@@ -126,9 +387,8 @@ class NativeEngine:
 
     async def begin(self) -> None:
         """Begin a transaction on the native connection."""
-        loop = asyncio.get_running_loop()
         try:
-            await loop.run_in_executor(None, self._connection.begin)
+            await self._run(self._connection.begin)
         except Exception as exc:
             error = classify_native_error(
                 exc,
@@ -140,9 +400,8 @@ class NativeEngine:
 
     async def commit(self) -> None:
         """Commit the active transaction."""
-        loop = asyncio.get_running_loop()
         try:
-            await loop.run_in_executor(None, self._connection.commit)
+            await self._run(self._connection.commit)
         except Exception as exc:
             error = classify_native_error(
                 exc,
@@ -154,9 +413,8 @@ class NativeEngine:
 
     async def rollback(self) -> None:
         """Roll back the active transaction."""
-        loop = asyncio.get_running_loop()
         try:
-            await loop.run_in_executor(None, self._connection.rollback)
+            await self._run(self._connection.rollback)
         except Exception as exc:
             error = classify_native_error(
                 exc,
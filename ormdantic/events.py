@@ -10,21 +10,29 @@ EventHandler = Callable[..., Any | Awaitable[Any]]
 
 
 class EventRegistry:
-    """Store and dispatch sync or async event handlers."""
+    """Store and dispatch sync or async event handlers.
+
+    The set of events with handlers is recomputed on registration, so
+    ``has_handlers`` is a set lookup and callers can skip building payloads
+    for events nobody listens to.
+    """
 
     def __init__(self) -> None:
         """Create an empty event registry."""
         self._handlers: dict[str, list[EventHandler]] = defaultdict(list)
+        self._listened: frozenset[str] = frozenset()
 
     def on(self, event: str, handler: EventHandler) -> EventHandler:
         """Register a handler for an event and return the handler."""
         self._handlers[event].append(handler)
+        self._refresh()
         return handler
 
     def off(self, event: str, handler: EventHandler) -> None:
         """Remove a previously registered event handler."""
         if handler in self._handlers.get(event, []):
             self._handlers[event].remove(handler)
+            self._refresh()
 
     def clear(self, event: str | None = None) -> None:
         """Clear handlers for one event or for all events."""
@@ -32,14 +40,22 @@ class EventRegistry:
             self._handlers.clear()
         else:
             self._handlers.pop(event, None)
+        self._refresh()
 
-    def has_handlers(self, event: str) -> bool:
-        """Return whether handlers are registered for an event."""
-        return bool(self._handlers.get(event))
+    def has_handlers(self, *events: str) -> bool:
+        """Return whether handlers are registered for any of the events."""
+        return not self._listened.isdisjoint(events)
 
     async def dispatch(self, event: str, **payload: Any) -> None:
         """Dispatch an event payload to all registered handlers."""
-        for handler in self._handlers.get(event, []):
+        if event not in self._listened:
+            return
+        for handler in tuple(self._handlers[event]):
             result = handler(**payload)
             if inspect.isawaitable(result):
                 await result
+
+    def _refresh(self) -> None:
+        self._listened = frozenset(
+            event for event, handlers in self._handlers.items() if handlers
+        )
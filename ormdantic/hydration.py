@@ -5,10 +5,17 @@ from __future__ import annotations
 from typing import Any, cast
 
 from ormdantic._native import import_native_extension
+from ormdantic.models import Map
+from ormdantic.values import py_type_to_sql
 
 _ormdantic: Any = import_native_extension(
     context="result hydration",
-    required_symbols=("hydrate_flat", "hydrate_joined", "plan_result_shape"),
+    required_symbols=(
+        "hydrate_flat",
+        "hydrate_graph",
+        "merge_selectin",
+        "plan_result_shape",
+    ),
 )
 
 
@@ -33,24 +40,58 @@ def hydrate_flat_payload(
     )
 
 
-def hydrate_joined_payload(
+def hydrate_graph_payload(
     *,
     columns: list[str],
     rows: list[tuple[Any, ...]],
-    path_pks: list[tuple[str, str]],
-    array_paths: list[str],
-) -> dict[str, Any] | None:
-    """Hydrate joined SQL rows into nested dict payloads."""
-    payload = cast(
-        dict[str, Any],
-        _ormdantic.hydrate_joined(
-            columns,
-            [list(row) for row in rows],
-            path_pks,
-            array_paths,
+    nodes: list[tuple[str, str, str, bool, Any, Any, dict[str, Any]]],
+) -> list[Any]:
+    """Hydrate joined SQL rows into root models with relationships attached.
+
+    `nodes` describes every loaded path, parents first and the root first, as
+    `(path, tablename, pk, is_array, identity, factory, converters)`.
+    """
+    return cast(
+        list[Any],
+        _ormdantic.hydrate_graph(columns, [list(row) for row in rows], nodes),
+    )
+
+
+def merge_selectin_payload(
+    *,
+    parent_keys: list[Any],
+    children: list[Any],
+    child_key: str,
+    uselist: bool,
+    table_map: Map,
+    filter_by: dict[str, Any] | None = None,
+    order_by: list[str] | None = None,
+) -> tuple[list[Any], list[int]]:
+    """Match select-in children to parents by typed key in Rust.
+
+    Returns, per parent, the indexes of its children (a list, or one index
+    or `None` when `uselist` is false) after `filter_by` and `order_by` are
+    applied, plus every assigned child index in first-assignment order. Both
+    sides are keyed by their SQL form, so a UUID key matches the text foreign
+    keys of `Parent | str` fields.
+    """
+    ordering = [
+        (column.removeprefix("-"), column.startswith("-")) for column in order_by or ()
+    ]
+    return cast(
+        tuple[list[Any], list[int]],
+        _ormdantic.merge_selectin(
+            [py_type_to_sql(table_map, key) for key in parent_keys],
+            children,
+            [
+                py_type_to_sql(table_map, getattr(child, child_key))
+                for child in children
+            ],
+            uselist,
+            list((filter_by or {}).items()),
+            ordering,
         ),
     )
-    return payload or None
 
 
 def plan_result_shape(
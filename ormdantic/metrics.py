@@ -0,0 +1,106 @@
+"""Prometheus text exposition of the native runtime's query metrics."""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterator, Mapping
+from typing import Any
+
+# (metric name, query_metrics key, scale, help text)
+_OPERATION_COUNTERS = (
+    ("ormdantic_queries_total", "calls", 1, "Native table calls."),
+    ("ormdantic_query_errors_total", "errors", 1, "Native table calls that failed."),
+    (
+        "ormdantic_query_rows_total",
+        "rows",
+        1,
+        "Rows returned, or affected by statements without a result set.",
+    ),
+    (
+        "ormdantic_query_bytes_total",
+        "bytes",
+        1,
+        "Approximate size of bound and returned values.",
+    ),
+    (
+        "ormdantic_query_pool_wait_seconds_total",
+        "pool_wait_ms",
+        0.001,
+        "Time spent waiting for a pooled connection.",
+    ),
+)
+_TABLE_COUNTERS = (
+    (
+        "ormdantic_compile_cache_hits_total",
+        "compile_cache_hits",
+        "Statements reused from the compiled query caches.",
+    ),
+    (
+        "ormdantic_compile_cache_misses_total",
+        "compile_cache_misses",
+        "Statements compiled because no cached statement matched.",
+    ),
+    (
+        "ormdantic_statement_cache_hits_total",
+        "statement_cache_hits",
+        "Executions that reused a prepared statement.",
+    ),
+    (
+        "ormdantic_statement_cache_misses_total",
+        "statement_cache_misses",
+        "Executions that prepared their statement.",
+    ),
+)
+_DURATION = "ormdantic_query_duration_seconds"
+
+
+def render_prometheus(query_metrics: Mapping[str, Any]) -> str:
+    """Render ``runtime_diagnostics()["query_metrics"]`` as Prometheus text.
+
+    Every series carries a ``table`` label, and per-operation series add an
+    ``operation`` label. Latencies are exported as a cumulative histogram.
+    """
+    lines: list[str] = []
+    for name, key, scale, help_text in _OPERATION_COUNTERS:
+        _header(lines, name, "counter", help_text)
+        for labels, metrics in _operations(query_metrics):
+            lines.append(f"{name}{{{labels}}} {_number(metrics[key] * scale)}")
+    _header(lines, _DURATION, "histogram", "Native execution time per table call.")
+    for labels, metrics in _operations(query_metrics):
+        for upper, count in metrics["buckets"]:
+            lines.append(
+                f'{_DURATION}_bucket{{{labels},le="{_number(upper)}"}} {count}'
+            )
+        lines.append(
+            f"{_DURATION}_sum{{{labels}}} {_number(metrics['total_ms'] / 1000)}"
+        )
+        lines.append(f"{_DURATION}_count{{{labels}}} {metrics['buckets'][-1][1]}")
+    for name, key, help_text in _TABLE_COUNTERS:
+        _header(lines, name, "counter", help_text)
+        for table, table_metrics in sorted(query_metrics.items()):
+            lines.append(f"{name}{{table={_label(table)}}} {table_metrics[key]}")
+    return "\n".join(lines) + "\n"
+
+
+def _operations(
+    query_metrics: Mapping[str, Any],
+) -> Iterator[tuple[str, Mapping[str, Any]]]:
+    for table, table_metrics in sorted(query_metrics.items()):
+        for operation, metrics in sorted(table_metrics["operations"].items()):
+            yield f"table={_label(table)},operation={_label(operation)}", metrics
+
+
+def _header(lines: list[str], name: str, kind: str, help_text: str) -> None:
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} {kind}")
+
+
+def _label(value: str) -> str:
+    escaped = value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    return f'"{escaped}"'
+
+
+def _number(value: float) -> str:
+    if isinstance(value, float) and math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(value)
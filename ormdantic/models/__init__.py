@@ -2,6 +2,7 @@ from ormdantic.models.models import (
     DatabaseNamespace,
     DatabaseSequence,
     DatabaseView,
+    LazyResult,
     Map,
     OrmTable,
     Relationship,
@@ -52,4 +53,5 @@ __all__ = [
     "OrmTable",
     "Map",
     "Result",
+    "LazyResult",
 ]
@@ -6,7 +6,14 @@ import re
 from collections.abc import Mapping, Sequence
 from typing import Any, Generic, Type
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import (
+    BaseModel,
+    Field,
+    PrivateAttr,
+    SerializerFunctionWrapHandler,
+    field_serializer,
+    model_validator,
+)
 
 from ormdantic.types import ModelType
 
@@ -28,6 +35,32 @@ class Result(BaseModel, Generic[ModelType]):
     limit: int
     data: list[ModelType]
 
+    def to_json_bytes(self, *, by_alias: bool = False) -> bytes:
+        """Serialize the result, as `Table.find_many_json` returns it."""
+        return self.model_dump_json(by_alias=by_alias).encode()
+
+
+class LazyResult(BaseModel, Generic[ModelType]):
+    """Search result of `find_many(..., lazy=True)`.
+
+    `data` is a read-only `LazyModels` sequence that builds each model on
+    first access; it serializes like `Result.data`.
+    """
+
+    offset: int
+    limit: int
+    data: Sequence[ModelType]
+
+    @field_serializer("data", mode="wrap")
+    def _serialize_data(
+        self, data: Sequence[ModelType], handler: SerializerFunctionWrapHandler
+    ) -> Any:
+        return handler(list(data))
+
+    def to_json_bytes(self, *, by_alias: bool = False) -> bytes:
+        """Serialize the result, as `Table.find_many_json` returns it."""
+        return self.model_dump_json(by_alias=by_alias).encode()
+
 
 class Relationship(BaseModel):
     """Describes a relationship from one table to another."""
@@ -1239,6 +1272,7 @@ class OrmTable(BaseModel, Generic[ModelType]):
     columns: list[str]
     relationships: dict[str, Relationship]
     back_references: dict[str, str]
+    _row_hydrator: Any = PrivateAttr(default=None)
 
 
 class Map(BaseModel):
@@ -1,9 +1,21 @@
 """Module providing a way to create ORM models and schemas"""
 
 import asyncio
+from contextvars import ContextVar
+from functools import partial
 from time import perf_counter
 from types import TracebackType, UnionType
-from typing import Any, Callable, ForwardRef, Literal, Type, Union, get_args, get_origin
+from typing import (
+    Any,
+    Callable,
+    ForwardRef,
+    Literal,
+    Type,
+    Union,
+    cast,
+    get_args,
+    get_origin,
+)
 
 from typing_extensions import Self
 
@@ -15,6 +27,7 @@ from ormdantic._introspect import (
     model_fields,
 )
 from ormdantic._native import import_native_extension
+from ormdantic.cache import IdentityCache, ResultCache
 from ormdantic.errors import (
     MismatchingBackReferenceError,
     MustUnionForeignKeyError,
@@ -32,6 +45,7 @@ from ormdantic.loaders import (
     joinedload,
     path_parts,
 )
+from ormdantic.metrics import render_prometheus
 from ormdantic.migrations import MigrationManager
 from ormdantic.models import (
     DatabaseNamespace,
@@ -76,9 +90,12 @@ from ormdantic.schema import (
     table_check_descriptors,
     unique_constraint_descriptors,
 )
+from ormdantic.serializer import row_hydrator
 from ormdantic.session import Session
-from ormdantic.table import Table
+from ormdantic.table import DEFAULT_SELECTIN_CONCURRENCY, Table
+from ormdantic.tracking import install_change_tracking
 from ormdantic.types import ModelType
+from ormdantic.values import py_type_to_sql
 
 _ormdantic: Any = import_native_extension(
     context="database runtime initialization",
@@ -91,6 +108,16 @@ _ormdantic: Any = import_native_extension(
     ),
 )
 
+_CACHE_EVENTS = frozenset(
+    {
+        "after_insert",
+        "after_update",
+        "after_upsert",
+        "after_delete",
+        "after_commit",
+    }
+)
+
 TransactionIsolationLevel = Literal[
     "read_uncommitted",
     "read_committed",
@@ -140,6 +167,35 @@ def _drop_runtime_enum_type_sql(enum_type: tuple[Any, ...]) -> str:
     )
 
 
+def _pool_options(
+    *,
+    min_size: int | None,
+    max_size: int | None,
+    timeout: float | None,
+    idle_timeout: float | None,
+    pre_ping: bool | None,
+) -> dict[str, Any]:
+    if min_size is not None and min_size < 0:
+        raise ValueError("pool_min_size must be non-negative")
+    if max_size is not None and max_size < 1:
+        raise ValueError("pool_max_size must be at least 1")
+    if min_size is not None and max_size is not None and min_size > max_size:
+        raise ValueError("pool_min_size must not exceed pool_max_size")
+    if timeout is not None and timeout < 0:
+        raise ValueError("pool_timeout must be non-negative")
+    if idle_timeout is not None and idle_timeout < 0:
+        raise ValueError("pool_idle_timeout must be non-negative")
+    options = {
+        "pool_min_size": min_size,
+        "pool_max_size": max_size,
+        "pool_timeout": timeout,
+        "pool_idle_timeout": idle_timeout,
+        "pool_pre_ping": pre_ping,
+    }
+    # Only forward explicit settings so the runtime keeps backend defaults.
+    return {name: value for name, value in options.items() if value is not None}
+
+
 def _quote_postgres_ident(value: str) -> str:
     escaped = value.replace('"', '""')
     return f'"{escaped}"'
@@ -157,6 +213,19 @@ class Ormdantic:
         debug: bool = False,
         log_queries: bool = False,
         query_logger: EventHandler | None = None,
+        pool_min_size: int | None = None,
+        pool_max_size: int | None = None,
+        pool_timeout: float | None = None,
+        pool_idle_timeout: float | None = None,
+        pool_pre_ping: bool | None = None,
+        native_async: bool = True,
+        statement_cache_size: int | None = None,
+        select_cache_size: int | None = None,
+        trusted_hydration: bool = False,
+        selectin_concurrency: int = DEFAULT_SELECTIN_CONCURRENCY,
+        find_one_batch_window: float | None = None,
+        identity_cache: IdentityCache | None = None,
+        result_cache: ResultCache | None = None,
     ) -> None:
         """Register models as ORM models and create schemas"""
         self._tables: dict[Type, Table] = {}  # type: ignore
@@ -169,8 +238,43 @@ class Ormdantic:
         self._runtime: Any | None = None
         self._debug = debug
         self._log_queries = log_queries
+        self._trusted_hydration = trusted_hydration
+        if selectin_concurrency < 1:
+            raise ValueError("selectin_concurrency must be at least 1")
+        self._selectin_concurrency = selectin_concurrency
+        if find_one_batch_window is not None and find_one_batch_window < 0:
+            raise ValueError("find_one_batch_window must be non-negative")
+        self._find_one_batch_window = find_one_batch_window
+        self._identity_cache = identity_cache
+        self._result_cache = result_cache
+        self._native_async = native_async
+        # Pin token of the transaction opened in the current task's context.
+        self._transaction: ContextVar[int | None] = ContextVar(
+            "ormdantic_transaction", default=None
+        )
+        # Cache invalidations made by the open transaction, replayed at commit.
+        self._pending_invalidations: ContextVar[list[Callable[[], None]] | None] = (
+            ContextVar("ormdantic_pending_invalidations", default=None)
+        )
+        self._runtime_options = _pool_options(
+            min_size=pool_min_size,
+            max_size=pool_max_size,
+            timeout=pool_timeout,
+            idle_timeout=pool_idle_timeout,
+            pre_ping=pool_pre_ping,
+        )
+        for name, size in (
+            ("statement_cache_size", statement_cache_size),
+            ("select_cache_size", select_cache_size),
+        ):
+            if size is None:
+                continue
+            if size < 0:
+                raise ValueError(f"{name} must be non-negative")
+            self._runtime_options[name] = size
         if query_logger is not None:
             self._events.on("after_execute", query_logger)
+        self._install_cache_invalidation()
 
     def __getitem__(self, item: Type[ModelType]) -> Table[ModelType]:
         """Get a `Table` for the given pydantic model."""
@@ -500,6 +604,7 @@ class Ormdantic:
             )
             self._table_map.model_to_data[cls] = table_metadata
             self._table_map.name_to_data[tablename_] = table_metadata
+            install_change_tracking(cls, table_metadata.columns)
             return cls
 
         return _wrapper
@@ -596,24 +701,37 @@ class Ormdantic:
         for table_data in self._table_map.name_to_data.values():
             for field_name in table_data.relationships:
                 install_relationship_path_descriptor(table_data.model, field_name)
+            row_hydrator(table_data)
         self._runtime = await asyncio.to_thread(self._build_runtime_database)
         for table_data in self._table_map.name_to_data.values():
             self._tables[table_data.model] = Table(
                 table_data=table_data,
                 table_map=self._table_map,
-                rust_handle=self._runtime.table(table_data.model.__name__),
+                rust_handle=self._table_handle(table_data.model.__name__),
                 events=self._events,
                 runtime=self._runtime,
                 connection=self._connection,
                 debug=self._debug,
                 log_queries=self._log_queries,
+                trusted_hydration=self._trusted_hydration,
+                selectin_concurrency=self._selectin_concurrency,
+                find_one_batch_window=self._find_one_batch_window,
+                identity_cache=self._identity_cache,
+                result_cache=self._result_cache,
+                transaction=self._transaction,
+                written=(
+                    self._table_written
+                    if self._identity_cache is not None
+                    or self._result_cache is not None
+                    else None
+                ),
             )
         await self.create_all()
 
     async def create_all(self) -> None:
         """Create all registered tables."""
         try:
-            await asyncio.to_thread(self._create_all_sync)
+            await self._run_native(self._create_all_sync)
         except Exception as exc:
             error = classify_native_error(
                 exc,
@@ -625,8 +743,12 @@ class Ormdantic:
 
     async def drop_all(self) -> None:
         """Drop all registered tables."""
+        if self._identity_cache is not None:
+            self._identity_cache.clear()
+        if self._result_cache is not None:
+            self._result_cache.clear()
         try:
-            await asyncio.to_thread(self._drop_all_sync)
+            await self._run_native(self._drop_all_sync)
         except Exception as exc:
             error = classify_native_error(
                 exc,
@@ -755,8 +877,80 @@ class Ormdantic:
         self._events.off(event, handler)
 
     def clear_events(self, event: str | None = None) -> None:
-        """Clear event handlers for one event or all events."""
+        """Clear event handlers for one event or all events.
+
+        Identity- and result-cache invalidation handlers stay registered.
+        """
         self._events.clear(event)
+        if event is None or event in _CACHE_EVENTS:
+            self._install_cache_invalidation()
+
+    def _install_cache_invalidation(self) -> None:
+        handlers: list[tuple[str, EventHandler]] = []
+        if self._identity_cache is not None:
+            handlers.extend(
+                (
+                    ("after_insert", self._invalidate_cached_model),
+                    ("after_update", self._invalidate_cached_model),
+                    ("after_upsert", self._invalidate_cached_model),
+                    ("after_delete", self._invalidate_cached_model),
+                )
+            )
+        if self._identity_cache is not None or self._result_cache is not None:
+            handlers.append(("after_commit", self._replay_pending_invalidations))
+        for event, handler in handlers:
+            self._events.off(event, handler)
+            self._events.on(event, handler)
+
+    def _invalidate_cached_model(
+        self,
+        *,
+        table: OrmTable,  # type: ignore[type-arg]
+        model: Any = None,
+        pk: Any = None,
+        **_: Any,
+    ) -> None:
+        if model is not None:
+            pk = getattr(model, table.pk)
+        self._invalidate(
+            partial(
+                cast(IdentityCache, self._identity_cache).invalidate,
+                table.model,
+                py_type_to_sql(self._table_map, pk),
+            )
+        )
+
+    def _table_written(
+        self,
+        operation: str,
+        table: OrmTable,  # type: ignore[type-arg]
+    ) -> None:
+        # Called by table handles after every write statement, outside the
+        # event registry so caching does not turn on execute payloads.
+        if self._identity_cache is not None and operation in {
+            "update_where",
+            "delete_where",
+        }:
+            # Set-based writes can touch any row, so the whole table is dropped.
+            self._invalidate(
+                partial(self._identity_cache.invalidate_table, table.model)
+            )
+        if self._result_cache is not None:
+            self._invalidate(
+                partial(self._result_cache.invalidate_tables, {table.tablename})
+            )
+
+    def _invalidate(self, invalidation: Callable[[], None]) -> None:
+        invalidation()
+        # Other tasks can cache the pre-commit rows until the transaction
+        # commits, so its invalidations run again then.
+        pending = self._pending_invalidations.get()
+        if pending is not None:
+            pending.append(invalidation)
+
+    def _replay_pending_invalidations(self, **_: Any) -> None:
+        for invalidation in self._pending_invalidations.get() or ():
+            invalidation()
 
     def runtime_diagnostics(self) -> dict[str, Any]:
         """Return non-secret runtime metadata for this database instance."""
@@ -767,8 +961,31 @@ class Ormdantic:
             "runtime_initialized": self._runtime is not None,
             "registered_tables": sorted(self._table_map.name_to_data),
             "capabilities": _ormdantic.runtime_capabilities(),
+            "pool": self._runtime_statistics("pool_statistics"),
+            "select_cache": self._runtime_statistics("select_cache_statistics"),
+            "query_metrics": self._runtime_statistics("query_metrics"),
+            "identity_cache": (
+                self._identity_cache.statistics()
+                if self._identity_cache is not None
+                else None
+            ),
+            "result_cache": (
+                self._result_cache.statistics()
+                if self._result_cache is not None
+                else None
+            ),
         }
 
+    def prometheus_metrics(self) -> str:
+        """Return the native query metrics in the Prometheus text format."""
+        return render_prometheus(self._runtime_statistics("query_metrics") or {})
+
+    def _runtime_statistics(self, name: str) -> dict[str, Any] | None:
+        statistics = getattr(self._runtime, name, None)
+        if statistics is None:
+            return None
+        return dict(statistics())
+
     async def load(self, model: ModelType, path: LoaderPathLike) -> Any:
         """Explicitly load a relationship path for a model instance."""
         table = self._table_map.model_to_data[type(model)]
@@ -972,6 +1189,36 @@ class Ormdantic:
             foreign_table=related_table.tablename, back_references=back_reference
         )
 
+    def _table_handle(self, model_key: str) -> Any:
+        assert self._runtime is not None
+        if self._native_async:
+            return self._runtime.table(model_key, awaitable=True)
+        return self._runtime.table(model_key)
+
+    async def _run_native(
+        self, call: Callable[..., Any], *args: Any, pinned: bool = False
+    ) -> Any:
+        """Run a blocking runtime call without blocking the event loop.
+
+        Native runtimes complete the call on their own worker threads; the
+        default executor is only used before the runtime exists or when
+        `native_async=False`. `pinned` calls work on an open transaction's
+        connection and run on the workers reserved for transactions.
+        """
+        spawn = getattr(self._runtime, "spawn", None)
+        if not self._native_async or spawn is None:
+            return await asyncio.to_thread(call, *args)
+        call = partial(call, *args) if args else call
+        if pinned:
+            return await spawn(call, pinned=True)
+        return await spawn(call)
+
+    def _transaction_token(self) -> int:
+        token = self._transaction.get()
+        if token is None:
+            raise TransactionError("no transaction is open")
+        return token
+
     def _ensure_runtime(self) -> Any:
         if self._runtime is None:
             self._runtime = self._build_runtime_database()
@@ -1004,9 +1251,14 @@ class Ormdantic:
                     for name, values, schema, _comment in enum_types
                 ]
                 return _ormdantic.PyDatabase(
-                    self._connection, tables, runtime_enum_types
+                    self._connection,
+                    tables,
+                    runtime_enum_types,
+                    **self._runtime_options,
                 )
-            return _ormdantic.PyDatabase(self._connection, tables)
+            return _ormdantic.PyDatabase(
+                self._connection, tables, **self._runtime_options
+            )
         except Exception as exc:
             error = classify_native_error(
                 exc,
@@ -1596,7 +1848,7 @@ class Ormdantic:
         await self._events.dispatch("before_begin", **payload)
         started = perf_counter()
         try:
-            await asyncio.to_thread(self._ensure_runtime().begin, options)
+            token = await self._run_native(self._ensure_runtime().begin, options)
         except Exception as exc:
             error = classify_native_error(
                 exc,
@@ -1611,6 +1863,8 @@ class Ormdantic:
                 error=error,
             )
             raise error from exc
+        self._transaction.set(token)
+        self._pending_invalidations.set([])
         await self._events.dispatch(
             "after_begin",
             **payload,
@@ -1623,7 +1877,9 @@ class Ormdantic:
         await self._events.dispatch("before_commit", **payload)
         started = perf_counter()
         try:
-            await asyncio.to_thread(self._ensure_runtime().commit)
+            await self._run_native(
+                self._ensure_runtime().commit, self._transaction_token(), pinned=True
+            )
         except Exception as exc:
             error = classify_native_error(
                 exc,
@@ -1631,26 +1887,35 @@ class Ormdantic:
                 message="transaction commit failed",
                 context=self._context("commit"),
             )
+            self._transaction.set(None)
             await self._events.dispatch(
                 "after_commit",
                 **payload,
                 duration_ms=(perf_counter() - started) * 1000,
                 error=error,
             )
+            self._pending_invalidations.set(None)
             raise error from exc
+        self._transaction.set(None)
         await self._events.dispatch(
             "after_commit",
             **payload,
             duration_ms=(perf_counter() - started) * 1000,
             error=None,
         )
+        self._pending_invalidations.set(None)
 
     async def _rollback(self) -> None:
         payload = {"database": self, **self._context("rollback")}
         await self._events.dispatch("before_rollback", **payload)
         started = perf_counter()
         try:
-            await asyncio.to_thread(self._ensure_runtime().rollback)
+            token = self._transaction.get()
+            # A failed commit has already rolled back and released the connection.
+            if token is not None:
+                await self._run_native(
+                    self._ensure_runtime().rollback, token, pinned=True
+                )
         except Exception as exc:
             error = classify_native_error(
                 exc,
@@ -1658,26 +1923,35 @@ class Ormdantic:
                 message="transaction rollback failed",
                 context=self._context("rollback"),
             )
+            self._transaction.set(None)
             await self._events.dispatch(
                 "after_rollback",
                 **payload,
                 duration_ms=(perf_counter() - started) * 1000,
                 error=error,
             )
+            self._pending_invalidations.set(None)
             raise error from exc
+        self._transaction.set(None)
         await self._events.dispatch(
             "after_rollback",
             **payload,
             duration_ms=(perf_counter() - started) * 1000,
             error=None,
         )
+        self._pending_invalidations.set(None)
 
     async def _savepoint(self, name: str) -> None:
         payload = {"database": self, **self._context("savepoint", savepoint=name)}
         await self._events.dispatch("before_savepoint", **payload)
         started = perf_counter()
         try:
-            await asyncio.to_thread(self._ensure_runtime().savepoint, name)
+            await self._run_native(
+                self._ensure_runtime().savepoint,
+                self._transaction_token(),
+                name,
+                pinned=True,
+            )
         except Exception as exc:
             error = classify_native_error(
                 exc,
@@ -1707,7 +1981,12 @@ class Ormdantic:
         await self._events.dispatch("before_rollback_to_savepoint", **payload)
         started = perf_counter()
         try:
-            await asyncio.to_thread(self._ensure_runtime().rollback_to_savepoint, name)
+            await self._run_native(
+                self._ensure_runtime().rollback_to_savepoint,
+                self._transaction_token(),
+                name,
+                pinned=True,
+            )
         except Exception as exc:
             error = classify_native_error(
                 exc,
@@ -1737,7 +2016,12 @@ class Ormdantic:
         await self._events.dispatch("before_release_savepoint", **payload)
         started = perf_counter()
         try:
-            await asyncio.to_thread(self._ensure_runtime().release_savepoint, name)
+            await self._run_native(
+                self._ensure_runtime().release_savepoint,
+                self._transaction_token(),
+                name,
+                pinned=True,
+            )
         except Exception as exc:
             error = classify_native_error(
                 exc,
@@ -16,6 +16,7 @@ from ormdantic._migrations.models import (
     SchemaSnapshot,
     TableSnapshot,
 )
+from ormdantic._migrations.sql import record_catalog_timings
 from ormdantic.errors import ReflectionError, classify_native_error
 
 _CacheKey = tuple[str | None, tuple[str, ...] | None, tuple[str, ...] | None]
@@ -362,9 +363,23 @@ class Inspector:
             "backend": context["backend"],
         }
         await self._database._events.dispatch("before_reflection", **payload)
+        catalog_queries: list[dict[str, Any]] = []
+
+        def timed_call() -> Any:
+            # Recorded where the call runs; native workers do not share context.
+            with record_catalog_timings() as timings:
+                try:
+                    return call()
+                finally:
+                    catalog_queries.extend(timings)
+
         started = perf_counter()
         try:
-            result = await asyncio.to_thread(call)
+            run_native = getattr(self._database, "_run_native", None)
+            if run_native is None:
+                result = await asyncio.to_thread(timed_call)
+            else:
+                result = await run_native(timed_call)
         except Exception as exc:
             duration_ms = (perf_counter() - started) * 1000
             error = classify_native_error(
@@ -377,6 +392,7 @@ class Inspector:
                 "after_reflection",
                 **payload,
                 duration_ms=duration_ms,
+                catalog_queries=catalog_queries,
                 error=error,
             )
             raise error from exc
@@ -385,6 +401,7 @@ class Inspector:
             **payload,
             duration_ms=(perf_counter() - started) * 1000,
             row_count=_row_count(result),
+            catalog_queries=catalog_queries,
             error=None,
         )
         return result
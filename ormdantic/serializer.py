@@ -1,17 +1,427 @@
 """Pydantic model construction from Rust row payloads."""
 
 import json
+from collections.abc import Callable, Iterator, Sequence
+from enum import Enum
 from types import NoneType
-from typing import Any, Generic, cast, get_args
+from typing import (
+    Annotated,
+    Any,
+    Generic,
+    Literal,
+    Optional,
+    cast,
+    get_args,
+    get_origin,
+    overload,
+)
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PlainSerializer, TypeAdapter, WrapSerializer
+from pydantic_core import PydanticUndefined
 
-from ormdantic._introspect import is_dict_annotation, is_list_annotation, model_field
-from ormdantic.hydration import hydrate_joined_payload
+from ormdantic._introspect import (
+    is_dict_annotation,
+    is_list_annotation,
+    is_union_annotation,
+)
+from ormdantic.hydration import hydrate_graph_payload
 from ormdantic.loaders import LoaderOption, path_parts
 from ormdantic.models import Map, OrmTable
 from ormdantic.types import ModelType, SerializedType
 
+ColumnConverter = Callable[[Any], Any]
+JsonFieldSpec = tuple[str, str, str, str, Callable[[Any], bytes] | None]
+
+_JSON_SCALARS = (str, int, float, bool, Any)
+
+
+class RowHydrator:
+    """Column converters compiled once from a model's field annotations.
+
+    `converters` holds every column that needs more than the raw cell value;
+    `flat_converters` is the subset holding JSON-encoded structured values,
+    the only columns flat results prepare before validation. `construct` and
+    `construct_rows` build models from trusted rows without validation.
+    """
+
+    def __init__(self, model: type[BaseModel]) -> None:
+        self.model = model
+        self.converters: dict[str, ColumnConverter] = {}
+        self.flat_converters: dict[str, ColumnConverter] = {}
+        self._trusted_fields: dict[str, _TrustedField] | None = None
+        self._field_count = 0
+        self._plain_instances = True
+        self._json_fields: dict[bool, list[JsonFieldSpec] | None] = {}
+        for name, field in model.model_fields.items():
+            converter, structured = compile_column_converter(field.annotation)
+            if converter is None:
+                continue
+            self.converters[name] = converter
+            if structured:
+                self.flat_converters[name] = converter
+
+    def json_fields(self, by_alias: bool = False) -> list[JsonFieldSpec] | None:
+        """Describe how flat rows of the model serialize to JSON.
+
+        Returns one `(key, column, kind, default, encoder)` spec per serialized
+        field for the native JSON writer, or `None` when the model customizes
+        serialization and must go through `model_dump_json`.
+        """
+        if by_alias not in self._json_fields:
+            self._json_fields[by_alias] = _json_fields(self, by_alias)
+        return self._json_fields[by_alias]
+
+    def convert(self, column: str, value: Any) -> Any:
+        """Convert one cell of `column` to its Python value."""
+        converter = self.converters.get(column)
+        return value if converter is None else converter(value)
+
+    def construct(self, record: dict[str, Any]) -> BaseModel:
+        """Build a model from one trusted record without validating it.
+
+        Values already of a field's type are stored as they are; others are
+        coerced by a pydantic-core validator for the bare field type, so
+        constraints and validators do not run.
+        """
+        fields = self._trusted()
+        values = {
+            name: field.coerce(record[name])
+            for name, field in fields.items()
+            if name in record
+        }
+        return self._instance(values, set(values))
+
+    def construct_rows(
+        self, columns: Sequence[str], rows: Sequence[Sequence[Any]]
+    ) -> list[BaseModel]:
+        """Build models from trusted flat rows, coercing them column by column."""
+        fields = self._trusted()
+        kept = [(index, name) for index, name in enumerate(columns) if name in fields]
+        names = [name for _, name in kept]
+        column_values = list(zip(*rows, strict=True))
+        coerced = [
+            fields[name].coerce_column(column_values[index]) for index, name in kept
+        ]
+        records = zip(*coerced, strict=True) if coerced else [()] * len(rows)
+        fields_set = set(names)
+        if not self._plain_instances or len(names) < self._field_count:
+            return [
+                self._instance(dict(zip(names, values, strict=True)), fields_set.copy())
+                for values in records
+            ]
+        model = self.model
+        new = model.__new__
+        setattr_ = object.__setattr__
+        models = []
+        for values in records:
+            instance = new(model)
+            setattr_(instance, "__dict__", dict(zip(names, values, strict=True)))
+            setattr_(instance, "__pydantic_fields_set__", fields_set.copy())
+            setattr_(instance, "__pydantic_extra__", None)
+            setattr_(instance, "__pydantic_private__", None)
+            models.append(instance)
+        return models
+
+    def _trusted(self) -> dict[str, "_TrustedField"]:
+        if self._trusted_fields is None:
+            self._trusted_fields = {
+                name: _TrustedField(field.annotation)
+                for name, field in self.model.model_fields.items()
+            }
+            self._field_count = len(self._trusted_fields)
+            self._plain_instances = not (
+                self.model.__private_attributes__ or self.model.__pydantic_post_init__
+            )
+        return self._trusted_fields
+
+    def _instance(self, values: dict[str, Any], fields_set: set[str]) -> BaseModel:
+        model = self.model
+        if len(values) < self._field_count:
+            values = self._with_defaults(values)
+        if not self._plain_instances:
+            return model.model_construct(fields_set, **values)
+        # What `model_construct` does for models without private state.
+        instance = model.__new__(model)
+        object.__setattr__(instance, "__dict__", values)
+        object.__setattr__(instance, "__pydantic_fields_set__", fields_set)
+        object.__setattr__(instance, "__pydantic_extra__", None)
+        object.__setattr__(instance, "__pydantic_private__", None)
+        return instance
+
+    def _with_defaults(self, values: dict[str, Any]) -> dict[str, Any]:
+        complete = {}
+        for name, field in self.model.model_fields.items():
+            if name in values:
+                complete[name] = values[name]
+                continue
+            default = field.get_default(call_default_factory=True)
+            if default is not PydanticUndefined:
+                complete[name] = default
+        return complete
+
+
+class _TrustedField:
+    """Coerce trusted values of one field only where their type differs."""
+
+    def __init__(self, annotation: Any) -> None:
+        self._annotation = annotation
+        self._accepted = _accepted_types(annotation)
+        self._column_types = {*self._accepted, NoneType}
+        self._adapter: TypeAdapter[Any] | None = None
+        self._column_adapter: TypeAdapter[list[Any]] | None = None
+
+    def coerce(self, value: Any) -> Any:
+        if value is None or isinstance(value, self._accepted):
+            return value
+        if self._adapter is None:
+            self._adapter = TypeAdapter(self._annotation)
+        return self._adapter.validate_python(value)
+
+    def coerce_column(self, values: Sequence[Any]) -> Sequence[Any]:
+        if object in self._accepted or set(map(type, values)) <= self._column_types:
+            return values
+        if self._column_adapter is None:
+            self._column_adapter = TypeAdapter(list[Optional[self._annotation]])
+        return self._column_adapter.validate_python(values)
+
+
+def _accepted_types(annotation: Any) -> tuple[type[Any], ...]:
+    members = get_args(annotation) if is_union_annotation(annotation) else (annotation,)
+    accepted: list[type[Any]] = []
+    for member in members:
+        if member is Any:
+            return (object,)
+        if get_origin(member) is Literal:
+            accepted.extend(type(value) for value in get_args(member))
+            continue
+        origin = get_origin(member) or member
+        if isinstance(origin, type):
+            accepted.append(origin)
+    return tuple(accepted)
+
+
+def _json_fields(hydrator: RowHydrator, by_alias: bool) -> list[JsonFieldSpec] | None:
+    model = hydrator.model
+    decorators = model.__pydantic_decorators__
+    if (
+        decorators.field_serializers
+        or decorators.model_serializers
+        or model.model_computed_fields
+    ):
+        return None
+    native_floats = model.model_config.get("ser_json_inf_nan", "null") == "null"
+    specs: list[JsonFieldSpec] = []
+    for name, field in model.model_fields.items():
+        if field.exclude:
+            continue
+        annotation = field.annotation
+        if field.metadata:
+            annotation = Annotated[(annotation, *field.metadata)]
+        if any(
+            isinstance(item, (PlainSerializer, WrapSerializer))
+            for item in field.metadata
+        ):
+            kind = "python"
+        else:
+            kind = _json_field_kind(field.annotation)
+        if kind == "float" and not native_floats:
+            kind = "python"
+        adapter = TypeAdapter(annotation)
+        default_value = field.get_default(call_default_factory=True)
+        if kind == "raw":
+            default = "{}" if is_dict_annotation(field.annotation) else "[]"
+        elif default_value is PydanticUndefined:
+            default = "null"
+        else:
+            default = adapter.dump_json(default_value).decode()
+        encoder = (
+            _json_encoder(adapter, field.annotation, hydrator.converters.get(name))
+            if kind == "python"
+            else None
+        )
+        key = (field.serialization_alias or name) if by_alias else name
+        specs.append((key, name, kind, default, encoder))
+    return specs
+
+
+def _json_field_kind(annotation: Any) -> str:
+    """Return how the native writer serializes cells of `annotation`."""
+    if is_dict_annotation(annotation) or is_list_annotation(annotation):
+        native = all(arg in _JSON_SCALARS for arg in get_args(annotation))
+        return "raw" if native else "python"
+    members = (
+        [member for member in get_args(annotation) if member is not NoneType]
+        if is_union_annotation(annotation)
+        else [annotation]
+    )
+    if len(members) != 1:
+        return "python"
+    member = members[0]
+    if get_origin(member) is Literal:
+        values = get_args(member)
+        if all(isinstance(value, str) for value in values):
+            return "string"
+        if all(type(value) is int for value in values):
+            return "value"
+        return "python"
+    if isinstance(member, type) and issubclass(member, Enum):
+        if issubclass(member, str):
+            return "string"
+        return "value" if issubclass(member, int) else "python"
+    return {bool: "bool", int: "value", float: "float", str: "string"}.get(
+        member, "python"
+    )
+
+
+def _json_encoder(
+    adapter: TypeAdapter[Any],
+    annotation: Any,
+    converter: ColumnConverter | None,
+) -> Callable[[Any], bytes]:
+    trusted = _TrustedField(annotation)
+
+    def encode(value: Any) -> bytes:
+        if converter is not None:
+            value = converter(value)
+        return adapter.dump_json(trusted.coerce(value))
+
+    return encode
+
+
+def row_hydrator(table_data: OrmTable[Any]) -> RowHydrator:
+    """Return the row hydrator cached on a table, compiling it on first use."""
+    hydrator = table_data._row_hydrator
+    if hydrator is None or hydrator.model is not table_data.model:
+        hydrator = RowHydrator(table_data.model)
+        table_data._row_hydrator = hydrator
+    return hydrator
+
+
+def compile_column_converter(annotation: Any) -> tuple[ColumnConverter | None, bool]:
+    """Compile the converter for one field annotation.
+
+    Returns the converter, or `None` when cells pass through unchanged, and
+    whether the column stores a JSON-encoded structured value.
+    """
+    if is_dict_annotation(annotation):
+        return _json_converter(dict), True
+    if is_list_annotation(annotation) or annotation is list:
+        return _json_converter(list), True
+    if args := get_args(annotation):
+        structured = any(_is_model_class(arg) for arg in args)
+        constructors = tuple(
+            arg for arg in args if arg is not NoneType and callable(arg)
+        )
+        if not constructors:
+            return None, structured
+        return _constructor_converter(constructors), structured
+    if _is_model_class(annotation):
+        return _json_converter(None), True
+    return None, False
+
+
+def _json_converter(
+    empty: type[dict[Any, Any]] | type[list[Any]] | None,
+) -> ColumnConverter:
+    def convert(value: Any) -> Any:
+        if value is None:
+            return None if empty is None else empty()
+        return json.loads(value)
+
+    return convert
+
+
+def _constructor_converter(constructors: tuple[Any, ...]) -> ColumnConverter:
+    def convert(value: Any) -> Any:
+        if value is None:
+            return None
+        for constructor in constructors:
+            try:
+                return constructor(value)
+            except (AttributeError, TypeError):
+                continue
+        return value
+
+    return convert
+
+
+def _is_model_class(annotation: Any) -> bool:
+    try:
+        return issubclass(annotation, BaseModel)
+    except TypeError:
+        return False
+
+
+class LazyModels(Sequence[ModelType]):
+    """Flat result rows whose models are built on first access.
+
+    Built models are cached, so every access returns the same instance.
+    `len()`, slicing and `rows()` build no models; slices share the cache of
+    the sequence they were taken from.
+    """
+
+    _CHUNK_SIZE = 256
+
+    def __init__(self, source: "_LazyRows", positions: range) -> None:
+        self._source = source
+        self._positions = positions
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    @overload
+    def __getitem__(self, index: int) -> ModelType: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "LazyModels[ModelType]": ...
+
+    def __getitem__(self, index: int | slice) -> "ModelType | LazyModels[ModelType]":
+        if isinstance(index, slice):
+            return LazyModels(self._source, self._positions[index])
+        return cast(ModelType, self._source.model(self._positions[index]))
+
+    def __iter__(self) -> Iterator[ModelType]:
+        for start in range(0, len(self._positions), self._CHUNK_SIZE):
+            chunk = self._positions[start : start + self._CHUNK_SIZE]
+            yield from cast(list[ModelType], self._source.models(chunk))
+
+    def __repr__(self) -> str:
+        return f"LazyModels({len(self)} rows)"
+
+    def rows(self) -> list[tuple[Any, ...]]:
+        """Return the raw row tuples without building models."""
+        rows = self._source.rows
+        return [rows[position] for position in self._positions]
+
+
+class _LazyRows:
+    """Rows and built models shared by a lazy sequence and its slices."""
+
+    def __init__(
+        self,
+        rows: list[tuple[Any, ...]],
+        build: Callable[[list[tuple[Any, ...]]], list[BaseModel]],
+    ) -> None:
+        self.rows = rows
+        self._built: list[BaseModel | None] = [None] * len(rows)
+        self._build = build
+
+    def model(self, position: int) -> BaseModel:
+        model = self._built[position]
+        if model is None:
+            model = self._build([self.rows[position]])[0]
+            self._built[position] = model
+        return model
+
+    def models(self, positions: range) -> list[BaseModel]:
+        built = self._built
+        missing = [position for position in positions if built[position] is None]
+        if missing:
+            models = self._build([self.rows[position] for position in missing])
+            for position, model in zip(missing, models, strict=True):
+                built[position] = model
+        return cast(list[BaseModel], [built[position] for position in positions])
+
 
 class ResultSchema(BaseModel):
     """Model to describe the schema of a model result."""
@@ -33,6 +443,7 @@ class OrmSerializer(Generic[SerializedType]):
         depth: int,
         load_paths: tuple[str, ...] | None = None,
         load_options: tuple[LoaderOption, ...] = (),
+        validate: bool = True,
     ) -> None:
         self._table_data = table_data
         self._table_map = table_map
@@ -41,8 +452,8 @@ class OrmSerializer(Generic[SerializedType]):
         self._depth = depth
         self._load_paths = load_paths
         self._load_options = load_options
-        self._identity_map: dict[tuple[type[BaseModel], Any], BaseModel] = {}
-        self._building_identities: set[tuple[type[BaseModel], Any]] = set()
+        self._validate = validate
+        self._hydrators: dict[str, RowHydrator] = {}
         result_schema = (
             self._get_path_result_schema(
                 table_data, self._path_tree(load_paths), is_array
@@ -58,116 +469,112 @@ class OrmSerializer(Generic[SerializedType]):
         )
         self._columns = [it[0] for it in self._result_set.cursor.description]
         self._flat_columns = [column.rsplit("\\", 1)[-1] for column in self._columns]
-        self._flat_conversion_columns = (
-            {
-                column
+        flat_converters = row_hydrator(table_data).flat_converters
+        self._flat_conversions = (
+            [
+                (column, converter)
                 for column in self._flat_columns
-                if self._requires_preparation(table_data.model, column)
-            }
+                if (converter := flat_converters.get(column)) is not None
+            ]
             if depth <= 0 and load_paths is None
-            else set()
+            else []
         )
-        self._return_dict: dict[str, Any] = {}
 
     def deserialize(self) -> SerializedType:
         """Deserialize the result set into Python models."""
         if self._depth <= 0 and self._load_paths is None:
             return self._deserialize_flat()
-        self._return_dict = (
-            hydrate_joined_payload(
-                columns=self._columns,
-                rows=[tuple(row) for row in self._result_set],
-                path_pks=self._path_pks(self._result_schema),
-                array_paths=self._array_paths(self._result_schema),
-            )
-            or {}
+        roots = hydrate_graph_payload(
+            columns=self._columns,
+            rows=[tuple(row) for row in self._result_set],
+            nodes=self._graph_nodes(self._result_schema),
         )
-        if not self._return_dict:
+        if not roots:
             return None  # type: ignore
-        root_schema = self._result_schema.references[self._table_data.tablename]
-        prepared = self._prep_result(self._return_dict, self._result_schema)[
-            self._table_data.tablename
-        ]
-        if self._result_schema.is_array:
-            result = [
-                self._build_model(record, root_schema, cache_identity=False)
-                for record in prepared
-            ]
-            return cast(SerializedType, self._apply_loader_options(result))
-        model = self._build_model(prepared, root_schema, cache_identity=False)
-        return cast(SerializedType, self._apply_loader_options(model))
+        result = roots if self._result_schema.is_array else roots[0]
+        return cast(SerializedType, self._apply_loader_options(result))
+
+    def deserialize_lazy(self) -> LazyModels[Any]:
+        """Wrap flat result rows in a sequence that builds models on access."""
+        if self._depth > 0 or self._load_paths is not None:
+            raise ValueError("lazy results do not load relationships")
+        rows = self._unique_rows([tuple(row) for row in self._result_set])
+        return LazyModels(_LazyRows(rows, self._flat_models), range(len(rows)))
 
     def _deserialize_flat(self) -> SerializedType:
         rows = [tuple(row) for row in self._result_set]
         if not rows:
             return [] if self._is_array else None  # type: ignore
         if self._is_array:
-            primary_key_index = self._flat_columns.index(self._table_data.pk)
-            seen = set()
-            models = []
-            for row in rows:
-                primary_key = row[primary_key_index]
-                if primary_key in seen:
-                    continue
-                seen.add(primary_key)
-                record = dict(zip(self._flat_columns, row, strict=True))
-                models.append(self._table_data.model(**self._prep_flat_result(record)))
-            return models  # type: ignore
-        record = dict(zip(self._flat_columns, rows[0], strict=True))
-        return self._table_data.model(**self._prep_flat_result(record))
+            return self._flat_models(self._unique_rows(rows))  # type: ignore
+        return cast(SerializedType, self._flat_models(rows[:1])[0])
+
+    def _unique_rows(self, rows: list[tuple[Any, ...]]) -> list[tuple[Any, ...]]:
+        if not rows:
+            return rows
+        primary_key_index = self._flat_columns.index(self._table_data.pk)
+        seen = set()
+        unique_rows = []
+        for row in rows:
+            primary_key = row[primary_key_index]
+            if primary_key in seen:
+                continue
+            seen.add(primary_key)
+            unique_rows.append(row)
+        return unique_rows
+
+    def _flat_models(self, rows: list[tuple[Any, ...]]) -> list[BaseModel]:
+        if self._validate:
+            return [
+                self._table_data.model(
+                    **self._prep_flat_result(
+                        dict(zip(self._flat_columns, row, strict=True))
+                    )
+                )
+                for row in rows
+            ]
+        if self._flat_conversions:
+            positions = {
+                column: index for index, column in enumerate(self._flat_columns)
+            }
+            converted = [list(row) for row in rows]
+            for column, converter in self._flat_conversions:
+                index = positions[column]
+                for row in converted:
+                    row[index] = converter(row[index])
+            rows = [tuple(row) for row in converted]
+        return self._hydrator(self._table_data).construct_rows(self._flat_columns, rows)
 
     def _prep_flat_result(self, record: dict[str, Any]) -> dict[str, Any]:
-        if not self._flat_conversion_columns:
+        if not self._flat_conversions:
             return record
         prepared = dict(record)
-        for column in self._flat_conversion_columns:
-            if column in prepared:
-                prepared[column] = self._sql_type_to_py(
-                    self._table_data.model, column, prepared[column]
-                )
+        for column, converter in self._flat_conversions:
+            prepared[column] = converter(prepared[column])
         return prepared
 
-    def _path_pks(
+    def _graph_nodes(
         self, schema: ResultSchema, prefix: str | None = None
-    ) -> list[tuple[str, str]]:
-        paths = []
+    ) -> list[tuple[str, str, str, bool, Any, Any, dict[str, ColumnConverter]]]:
+        nodes = []
         for name, reference in schema.references.items():
-            path = name if prefix is None else f"{prefix}/{name}"
-            if reference.table_data is not None:
-                paths.append((path, reference.table_data.pk))
-            paths.extend(self._path_pks(reference, path))
-        return paths
-
-    def _array_paths(
-        self, schema: ResultSchema, prefix: str | None = None
-    ) -> list[str]:
-        paths = []
-        for name, reference in schema.references.items():
-            path = name if prefix is None else f"{prefix}/{name}"
-            if reference.is_array:
-                paths.append(path)
-            paths.extend(self._array_paths(reference, path))
-        return paths
-
-    def _prep_result(
-        self, node: dict[Any, Any], schema: ResultSchema
-    ) -> dict[str, Any]:
-        for key, val in node.items():
-            if key in schema.references:
-                ref_schema = schema.references[key]
-                if ref_schema.is_array:
-                    node[key] = [
-                        self._prep_result(v, ref_schema) for v in node[key].values()
-                    ]
-                else:
-                    node[key] = self._prep_result(node[key], ref_schema)
+            table_data = reference.table_data
+            if table_data is None:
                 continue
-            if table_data := schema.table_data:
-                node[key] = self._sql_type_to_py(table_data.model, key, val)
-        for key, ref_schema in schema.references.items():
-            if key not in node and not ref_schema.is_array:
-                node[key] = None
-        return node
+            path = name if prefix is None else f"{prefix}/{name}"
+            nodes.append(
+                (
+                    path,
+                    table_data.tablename,
+                    table_data.pk,
+                    reference.is_array,
+                    table_data.model,
+                    self._factory(table_data),
+                    self._hydrator(table_data).converters,
+                )
+            )
+            nodes.extend(self._graph_nodes(reference, path))
+        return nodes
 
     def _get_result_schema(
         self,
@@ -227,72 +634,20 @@ class OrmSerializer(Generic[SerializedType]):
                 node = node.setdefault(part, {})
         return tree
 
-    def _build_model(
-        self,
-        record: dict[str, Any],
-        schema: ResultSchema,
-        *,
-        cache_identity: bool = True,
-    ) -> BaseModel:
-        table_data = schema.table_data
-        if table_data is None:
-            raise ValueError("result schema node is missing table metadata")
-        if not cache_identity and self._is_collection_tree(schema):
-            return table_data.model(**record)
-
-        identity = self._identity_for(record, table_data)
-        cached = self._identity_map.get(identity) if identity is not None else None
-        if cached is not None:
-            if identity in self._building_identities:
-                cache_identity = False
-            else:
-                self._merge_relationships(cached, record, schema)
-                return cached
-
-        model = table_data.model(**record)
-        if identity is not None and cache_identity:
-            self._identity_map[identity] = model
-            self._building_identities.add(identity)
-        try:
-            self._merge_relationships(model, record, schema)
-        finally:
-            if identity is not None and cache_identity:
-                self._building_identities.discard(identity)
-        return model
+    def _factory(
+        self, table_data: OrmTable[Any]
+    ) -> Callable[[dict[str, Any]], BaseModel]:
+        if not self._validate:
+            return self._hydrator(table_data).construct
+        model = table_data.model
+        return lambda record: model(**record)
 
-    @classmethod
-    def _is_collection_tree(cls, schema: ResultSchema) -> bool:
-        return all(
-            reference.is_array and cls._is_collection_tree(reference)
-            for reference in schema.references.values()
-        )
-
-    def _merge_relationships(
-        self, model: BaseModel, record: dict[str, Any], schema: ResultSchema
-    ) -> None:
-        for key, ref_schema in schema.references.items():
-            if key not in record:
-                continue
-            value = record[key]
-            if value is None:
-                object.__setattr__(model, key, None)
-            elif ref_schema.is_array:
-                object.__setattr__(
-                    model,
-                    key,
-                    [self._build_model(item, ref_schema) for item in value],
-                )
-            else:
-                object.__setattr__(model, key, self._build_model(value, ref_schema))
-
-    @staticmethod
-    def _identity_for(
-        record: dict[str, Any], table_data: OrmTable[Any]
-    ) -> tuple[type[BaseModel], Any] | None:
-        value = record.get(table_data.pk)
-        if value is None:
-            return None
-        return (table_data.model, value)
+    def _hydrator(self, table_data: OrmTable[Any]) -> RowHydrator:
+        hydrator = self._hydrators.get(table_data.tablename)
+        if hydrator is None:
+            hydrator = row_hydrator(table_data)
+            self._hydrators[table_data.tablename] = hydrator
+        return hydrator
 
     def _apply_loader_options(self, result: Any) -> Any:
         if not self._load_options:
@@ -353,46 +708,3 @@ class OrmSerializer(Generic[SerializedType]):
             if actual != expected and str(actual) != str(expected):
                 return False
         return True
-
-    @staticmethod
-    def _sql_type_to_py(model_type: type[ModelType], column: str, value: Any) -> Any:
-        field = model_field(model_type, column)
-        annotation = field.annotation
-        if is_dict_annotation(annotation):
-            return {} if value is None else json.loads(value)
-        if is_list_annotation(annotation) or annotation is list:
-            return [] if value is None else json.loads(value)
-        if value is None:
-            return None
-        if get_args(annotation):
-            for arg in get_args(annotation):
-                if arg is NoneType:
-                    continue
-                try:
-                    return arg(value)
-                except (AttributeError, TypeError):
-                    continue
-        try:
-            if issubclass(annotation, BaseModel):
-                return json.loads(value)
-        except TypeError:
-            return value
-        return value
-
-    @staticmethod
-    def _requires_preparation(model_type: type[ModelType], column: str) -> bool:
-        annotation = model_field(model_type, column).annotation
-        if (
-            is_dict_annotation(annotation)
-            or is_list_annotation(annotation)
-            or annotation is list
-        ):
-            return True
-        candidates = get_args(annotation) or (annotation,)
-        for candidate in candidates:
-            try:
-                if issubclass(candidate, BaseModel):
-                    return True
-            except TypeError:
-                continue
-        return False
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable, Iterator
 from copy import deepcopy
 from dataclasses import dataclass
 from types import TracebackType
@@ -10,6 +11,65 @@ from typing import Any, TypeGuard
 from pydantic import BaseModel
 from typing_extensions import Self
 
+from ormdantic.tracking import is_change_tracked, is_immutable, track, untrack
+
+_IdentityKey = tuple[type[BaseModel], Any]
+
+
+class _StagedModels:
+    """Insertion-ordered set of staged models compared by identity.
+
+    Membership uses ``id()`` rather than Pydantic's field-by-field ``__eq__``,
+    and models are indexed by the identity key they had when staged, so
+    staging and lookups stay constant-time however many models are pending.
+    """
+
+    __slots__ = ("_identity_key", "_keys", "_models")
+
+    def __init__(
+        self,
+        identity_key: Callable[[BaseModel], _IdentityKey],
+        models: Iterable[BaseModel] = (),
+    ) -> None:
+        self._identity_key = identity_key
+        self._models: dict[int, tuple[BaseModel, _IdentityKey]] = {}
+        self._keys: dict[_IdentityKey, BaseModel] = {}
+        for model in models:
+            self.add(model)
+
+    def __contains__(self, model: object) -> bool:
+        return id(model) in self._models
+
+    def __iter__(self) -> Iterator[BaseModel]:
+        return (model for model, _key in self._models.values())
+
+    def __len__(self) -> int:
+        return len(self._models)
+
+    def add(self, model: BaseModel) -> None:
+        if id(model) in self._models:
+            return
+        key = self._identity_key(model)
+        self._models[id(model)] = (model, key)
+        if key[1] is not None:
+            self._keys.setdefault(key, model)
+
+    def discard(self, model: BaseModel) -> None:
+        entry = self._models.pop(id(model), None)
+        if entry is not None and self._keys.get(entry[1]) is model:
+            del self._keys[entry[1]]
+
+    def clear(self) -> None:
+        self._models.clear()
+        self._keys.clear()
+
+    def get(self, key: _IdentityKey) -> BaseModel | None:
+        """Return the staged model with ``key``, if it still has that key."""
+        model = self._keys.get(key)
+        if model is not None and self._identity_key(model) == key:
+            return model
+        return None
+
 
 @dataclass(frozen=True)
 class _UnitOfWorkSnapshot:
@@ -18,11 +78,18 @@ class _UnitOfWorkSnapshot:
     deleted: list[BaseModel]
     identity_map: dict[tuple[type[BaseModel], Any], BaseModel]
     snapshots: dict[tuple[type[BaseModel], Any], dict[str, Any]]
+    changes: dict[tuple[type[BaseModel], Any], dict[str, Any]]
     failed_flush_error: Exception | None
 
 
 class Session:
-    """Minimal async unit-of-work session for Ormdantic models."""
+    """Minimal async unit-of-work session for Ormdantic models.
+
+    Assignments to the columns of registered models are recorded as they
+    happen, so flush only compares the models that were changed. Columns
+    holding mutable values such as JSON lists and dicts are copied when a
+    model is loaded and compared on flush, since they can change in place.
+    """
 
     def __init__(
         self, database: Any, *, transaction_options: Any | None = None
@@ -30,11 +97,12 @@ class Session:
         """Create a session bound to an `Ormdantic` database instance."""
         self._database = database
         self._transaction_options = transaction_options
-        self._new: list[BaseModel] = []
-        self._dirty: list[BaseModel] = []
-        self._deleted: list[BaseModel] = []
+        self._new = _StagedModels(self._identity_key)
+        self._dirty = _StagedModels(self._identity_key)
+        self._deleted = _StagedModels(self._identity_key)
         self._identity_map: dict[tuple[type[BaseModel], Any], BaseModel] = {}
         self._snapshots: dict[tuple[type[BaseModel], Any], dict[str, Any]] = {}
+        self._changes: dict[tuple[type[BaseModel], Any], dict[str, Any]] = {}
         self._failed_flush_error: Exception | None = None
         self._savepoint_sequence = 0
         self._closed = False
@@ -72,8 +140,8 @@ class Session:
     def mark_dirty(self, model: BaseModel) -> None:
         """Stage an existing model for update on flush."""
         self._ensure_usable()
-        if model not in self._new and model not in self._dirty:
-            self._dirty.append(model)
+        if model not in self._new:
+            self._dirty.add(model)
 
     def delete(self, model: BaseModel) -> None:
         """Stage an existing model for deletion on flush."""
@@ -104,8 +172,7 @@ class Session:
         """Remove a model from the identity map."""
         self._ensure_usable()
         key = self._identity_key(model)
-        self._identity_map.pop(key, None)
-        self._snapshots.pop(key, None)
+        self._forget(key)
 
     async def flush(self) -> None:
         """Write staged inserts and updates without ending the transaction."""
@@ -115,8 +182,10 @@ class Session:
             await self._database._events.dispatch("before_flush", session=self)
             self._detect_relationship_changes()
 
-            for model in self._detect_dirty_models():
+            changed_columns: dict[int, frozenset[str]] = {}
+            for model, columns in self._detect_dirty_models():
                 self.mark_dirty(model)
+                changed_columns[id(model)] = columns
 
             inserted = self._dependency_ordered(list(self._new))
             for batch in self._model_batches(inserted):
@@ -125,21 +194,28 @@ class Session:
                     self._remember(stored)
             self._new.clear()
 
-            updated = list(self._dirty)
-            for batch in self._model_batches(updated):
-                for model in batch:
-                    stored = await self._database[type(model)].update(model)
+            updated: dict[
+                tuple[type[BaseModel], frozenset[str] | None], list[BaseModel]
+            ] = {}
+            for model in self._dirty:
+                shape = (type(model), changed_columns.get(id(model)))
+                updated.setdefault(shape, []).append(model)
+            for (model_type, columns), batch in updated.items():
+                stored_models = await self._database[model_type].update_many(
+                    batch, columns=columns
+                )
+                for stored in stored_models:
                     self._remember(stored)
             self._dirty.clear()
 
             deleted = list(reversed(self._dependency_ordered(list(self._deleted))))
             for batch in self._model_batches(deleted):
-                for model in batch:
-                    key = self._identity_key(model)
-                    pk = key[1]
-                    await self._database[type(model)].delete(pk)
-                    self._identity_map.pop(key, None)
-                    self._snapshots.pop(key, None)
+                keys = [self._identity_key(model) for model in batch]
+                await self._database[type(batch[0])].delete_many(
+                    [key[1] for key in keys]
+                )
+                for key in keys:
+                    self._forget(key)
             self._deleted.clear()
         except Exception as exc:
             self._restore_state(state)
@@ -165,8 +241,11 @@ class Session:
             self._new.clear()
             self._dirty.clear()
             self._deleted.clear()
+            for model in self._identity_map.values():
+                untrack(model, self)
             self._identity_map.clear()
             self._snapshots.clear()
+            self._changes.clear()
             self._failed_flush_error = None
             self._closed = True
 
@@ -222,18 +301,20 @@ class Session:
             dirty=list(self._dirty),
             deleted=list(self._deleted),
             identity_map=dict(self._identity_map),
-            snapshots={key: deepcopy(value) for key, value in self._snapshots.items()},
+            # Snapshot dictionaries are replaced, never mutated, so sharing
+            # them is safe; only the recorded changes need copying.
+            snapshots=dict(self._snapshots),
+            changes={key: dict(value) for key, value in self._changes.items()},
             failed_flush_error=self._failed_flush_error,
         )
 
     def _restore_state(self, state: _UnitOfWorkSnapshot) -> None:
-        self._new = list(state.new)
-        self._dirty = list(state.dirty)
-        self._deleted = list(state.deleted)
+        self._new = _StagedModels(self._identity_key, state.new)
+        self._dirty = _StagedModels(self._identity_key, state.dirty)
+        self._deleted = _StagedModels(self._identity_key, state.deleted)
         self._identity_map = dict(state.identity_map)
-        self._snapshots = {
-            key: deepcopy(value) for key, value in state.snapshots.items()
-        }
+        self._snapshots = dict(state.snapshots)
+        self._changes = {key: dict(value) for key, value in state.changes.items()}
         self._failed_flush_error = state.failed_flush_error
 
     def _remember(self, model: BaseModel) -> None:
@@ -249,7 +330,13 @@ class Session:
         key = self._identity_key(model)
         if overwrite_existing or key not in self._identity_map:
             self._identity_map[key] = model
-            self._snapshots[key] = self._snapshot(model)
+            self._changes.pop(key, None)
+            snapshot = self._snapshot(model)
+            if snapshot:
+                self._snapshots[key] = snapshot
+            else:
+                self._snapshots.pop(key, None)
+            track(model, self, key)
         for related in self._scalar_related_models(model):
             self._remember_graph(related, seen, overwrite_existing=False)
         for child, _back_reference in self._collection_related_models(model):
@@ -266,8 +353,8 @@ class Session:
         for related in self._scalar_related_models(model):
             self._cascade_add(related, seen)
 
-        if not self._is_remembered(model) and model not in self._new:
-            self._new.append(model)
+        if not self._is_remembered(model):
+            self._new.add(model)
 
         for child, back_reference in self._collection_related_models(model):
             if getattr(child, back_reference, None) is None:
@@ -284,10 +371,9 @@ class Session:
             self._cascade_delete(child, seen)
 
         if model in self._new:
-            self._new.remove(model)
+            self._new.discard(model)
             return
-        if model not in self._deleted:
-            self._deleted.append(model)
+        self._deleted.add(model)
 
     def _identity_key(self, model: BaseModel) -> tuple[type[BaseModel], Any]:
         """Return the identity-map key for a managed model."""
@@ -298,13 +384,45 @@ class Session:
         """Return whether this model identity is already managed."""
         return self._identity_key(model) in self._identity_map
 
+    def _forget(self, key: tuple[type[BaseModel], Any]) -> None:
+        model = self._identity_map.pop(key, None)
+        if model is not None:
+            untrack(model, self)
+        self._snapshots.pop(key, None)
+        self._changes.pop(key, None)
+
+    def _record_change(
+        self,
+        model: BaseModel,
+        key: tuple[type[BaseModel], Any],
+        column: str,
+        previous: Any,
+    ) -> None:
+        """Remember the loaded value of a column before its first assignment."""
+        if self._closed or self._identity_map.get(key) is not model:
+            return
+        originals = self._changes.setdefault(key, {})
+        if column not in originals:
+            originals[column] = self._snapshot_value(previous)
+
     def _snapshot(self, model: BaseModel) -> dict[str, Any]:
-        """Return comparable persisted-column values for dirty detection."""
+        """Return persisted-column values that assignments do not report.
+
+        Instrumented models only need their mutable values copied; models
+        registered without change tracking are snapshotted in full.
+        """
         table = self._database._table_map.model_to_data[type(model)]
-        return {
-            column: self._snapshot_value(getattr(model, column))
-            for column in table.columns
-        }
+        if not is_change_tracked(type(model)):
+            return {
+                column: self._snapshot_value(getattr(model, column))
+                for column in table.columns
+            }
+        snapshot = {}
+        for column in table.columns:
+            value = getattr(model, column)
+            if not is_immutable(value) and not self._is_registered_model(value):
+                snapshot[column] = self._snapshot_value(value)
+        return snapshot
 
     def _snapshot_value(self, value: Any) -> Any:
         """Return a comparable persisted value without relationship cycles."""
@@ -313,15 +431,39 @@ class Session:
             return getattr(value, related_table.pk)
         return deepcopy(value)
 
-    def _detect_dirty_models(self) -> list[BaseModel]:
-        """Find remembered models whose persisted-column values changed."""
+    def _comparable_value(self, value: Any) -> Any:
+        """Return a value comparable with its snapshot, without copying it."""
+        if self._is_registered_model(value):
+            related_table = self._database._table_map.model_to_data[type(value)]
+            return getattr(value, related_table.pk)
+        return value
+
+    def _detect_dirty_models(self) -> list[tuple[BaseModel, frozenset[str]]]:
+        """Find remembered models and the persisted columns that changed.
+
+        Only models with recorded assignments or mutable column snapshots are
+        compared, so the cost follows what changed rather than what was loaded.
+        """
         staged = {id(model) for model in (*self._new, *self._dirty, *self._deleted)}
         changed = []
-        for key, model in self._identity_map.items():
-            if id(model) in staged:
+        candidates = [
+            *self._changes,
+            *(key for key in self._snapshots if key not in self._changes),
+        ]
+        for key in candidates:
+            model = self._identity_map.get(key)
+            if model is None or id(model) in staged:
                 continue
-            if self._snapshots.get(key) != self._snapshot(model):
-                changed.append(model)
+            baseline = {**self._changes.get(key, {}), **self._snapshots.get(key, {})}
+            columns = frozenset(
+                column
+                for column, value in baseline.items()
+                if self._comparable_value(getattr(model, column)) != value
+            )
+            if columns:
+                changed.append((model, columns))
+            else:
+                self._changes.pop(key, None)
         return changed
 
     def _detect_relationship_changes(self) -> None:
@@ -455,9 +597,9 @@ class Session:
     ) -> BaseModel | None:
         if key[1] is None:
             return None
-        for staged in (*self._new, *self._dirty, *self._deleted):
-            if self._identity_key(staged) == key:
-                return staged
+        for staged in (self._new, self._dirty, self._deleted):
+            if (model := staged.get(key)) is not None:
+                return model
         return None
 
     def _raise_for_identity_conflict(self, model: BaseModel) -> None:
@@ -4,16 +4,24 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from collections.abc import Iterable
-from dataclasses import dataclass
+from collections.abc import AsyncIterator, Callable, Coroutine, Iterable, Mapping
+from contextlib import aclosing
+from contextvars import ContextVar
+from dataclasses import dataclass, replace
 from enum import Enum
 from time import perf_counter
-from typing import Any, Generic, Literal, cast
+from typing import Any, Generic, Literal, TypeVar, cast, overload
 
 from pydantic import BaseModel
 
 from ormdantic._native import import_native_extension
-from ormdantic.engine import NativeResult
+from ormdantic.cache import CachePolicy, IdentityCache, ResultCache
+from ormdantic.engine import (
+    ArrowResult,
+    ColumnarResult,
+    NativeResult,
+    native_result_from_payload,
+)
 from ormdantic.errors import (
     HydrationError,
     QueryCompilationError,
@@ -41,9 +49,10 @@ from ormdantic.expressions import (
 from ormdantic.expressions import (
     count as count_expr,
 )
+from ormdantic.hydration import merge_selectin_payload
 from ormdantic.loaders import LoaderOption, path_parts
-from ormdantic.models import Map, OrmTable, Result
-from ormdantic.serializer import OrmSerializer
+from ormdantic.models import LazyResult, Map, OrmTable, Result
+from ormdantic.serializer import LazyModels, OrmSerializer, row_hydrator
 from ormdantic.types import ModelType
 from ormdantic.values import py_type_to_sql
 
@@ -63,7 +72,12 @@ _ormdantic: Any = import_native_extension(
     ),
 )
 DEFAULT_SELECTIN_BATCH_SIZE = 500
+DEFAULT_STREAM_CHUNK_SIZE = 1_000
+DEFAULT_SELECTIN_CONCURRENCY = 8
 QUERY_LOGGER = logging.getLogger("ormdantic.query")
+_READ_OPERATIONS = frozenset({"select", "select_one", "select_many", "count", "stream"})
+
+_T = TypeVar("_T")
 
 
 class Order(Enum):
@@ -80,6 +94,16 @@ class _ResolvedLoadPlan:
     selectin_paths: tuple[str, ...] = ()
     options: tuple[LoaderOption, ...] = ()
     use_selectin: bool = False
+    validate: bool = True
+    lazy: bool = False
+    cache: CachePolicy | None = None
+
+
+@dataclass(frozen=True)
+class _CachedRead:
+    policy: CachePolicy
+    tables: frozenset[str]
+    shape: tuple[Any, ...]
 
 
 class Table(Generic[ModelType]):
@@ -96,26 +120,98 @@ class Table(Generic[ModelType]):
         connection: str | None = None,
         debug: bool = False,
         log_queries: bool = False,
+        trusted_hydration: bool = False,
+        selectin_concurrency: int = DEFAULT_SELECTIN_CONCURRENCY,
+        find_one_batch_window: float | None = None,
+        identity_cache: IdentityCache | None = None,
+        result_cache: ResultCache | None = None,
+        transaction: ContextVar[int | None] | None = None,
+        written: Callable[[str, OrmTable[Any]], None] | None = None,
     ) -> None:
         self._table_data = table_data
         self._table_map = table_map
-        self._rust_handle = rust_handle
+        self._handle = rust_handle
+        self._transaction = transaction
+        self._written = written
+        self._bound_handle: tuple[int, Any] | None = None
+        self._native_async = getattr(rust_handle, "awaitable", False) is True
+        self._columnar = getattr(rust_handle, "columnar_results", False) is True
         self._events = events
         self._runtime = runtime
         self._connection = connection
         self._debug = debug
         self._log_queries = log_queries
+        self._trusted_hydration = trusted_hydration
+        self._selectin_concurrency = selectin_concurrency
+        self._find_one_batch_window = find_one_batch_window
+        self._find_one_futures: dict[
+            tuple[tuple[int | None, bool], Any], asyncio.Future[Any]
+        ] = {}
+        self._find_one_queue: dict[tuple[int | None, bool], list[Any]] = {}
+        self._find_one_tasks: set[asyncio.Future[None]] = set()
+        self._identity_cache = identity_cache
+        self._result_cache = result_cache
         self.tablename = table_data.tablename
         self.columns = table_data.columns
 
+    @property
+    def _rust_handle(self) -> Any:
+        """The native handle, bound to the caller's open transaction if any."""
+        token = self._transaction_token()
+        if token is None:
+            return self._handle
+        if self._bound_handle is None or self._bound_handle[0] != token:
+            self._bound_handle = (token, self._handle.in_transaction(token))
+        return self._bound_handle[1]
+
+    def _transaction_token(self) -> int | None:
+        if self._transaction is None:
+            return None
+        return self._transaction.get()
+
     async def find_one(
         self,
         pk: Any,
         depth: int = 0,
         load: list[LoaderOption] | None = None,
+        *,
+        validate: bool | None = None,
     ) -> ModelType | None:
-        """Find a model by primary key."""
-        load_plan = self._resolve_load_plan(depth, load)
+        """Find a model by primary key.
+
+        ``validate=False`` builds the model from trusted rows without running
+        Pydantic validation; ``None`` uses the database's ``trusted_hydration``.
+        With a ``find_one_batch_window``, plain lookups made concurrently are
+        coalesced into one ``IN`` query and callers asking for the same key
+        share its row, each receiving its own model. With an ``identity_cache``, lookups that do not join
+        relationships are answered from cached rows without hydration events;
+        lookups inside a transaction bypass the cache.
+        """
+        load_plan = replace(
+            self._resolve_load_plan(depth, load),
+            validate=self._validate_rows(validate),
+        )
+        plain = load_plan.depth == 0 and not load_plan.paths
+        cache = self._model_cache(self._table_data) if plain else None
+        generation = None
+        if cache is not None:
+            cached = cache.get(
+                self._table_data.model, py_type_to_sql(self._table_map, pk)
+            )
+            if cached is not None:
+                if load_plan.selectin_paths:
+                    await self._load_selectin_graph([cached], load_plan)
+                return cast(ModelType, cached)
+            generation = cache.generation(self._table_data.model)
+        if (
+            self._find_one_batch_window is not None
+            and plain
+            and not load_plan.selectin_paths
+        ):
+            model = await self._coalesced_find_one(pk, load_plan.validate)
+            if model is not None:
+                self._cache_models(self._table_data, [model], generation)
+            return cast(ModelType | None, model)
         if load_plan.paths:
             load_paths = load_plan.paths
             joined_filters, joined_order_by, joined_values = (
@@ -155,11 +251,15 @@ class Table(Generic[ModelType]):
             depth=load_plan.depth,
             load_paths=load_plan.paths,
             load_options=load_plan.options,
+            validate=load_plan.validate,
         )
+        if model is not None and plain:
+            self._cache_models(self._table_data, [model], generation)
         if model is not None and load_plan.selectin_paths:
             await self._load_selectin_graph([model], load_plan)
         return model
 
+    @overload
     async def find_many(
         self,
         where: dict[str, Any] | QueryExpression | None = None,
@@ -169,9 +269,62 @@ class Table(Generic[ModelType]):
         offset: int = 0,
         depth: int = 0,
         load: list[LoaderOption] | None = None,
-    ) -> Result[ModelType]:
-        """Find many model instances."""
-        load_plan = self._resolve_load_plan(depth, load)
+        *,
+        validate: bool | None = None,
+        lazy: Literal[False] = False,
+        cache: CachePolicy | None = None,
+    ) -> Result[ModelType]: ...
+
+    @overload
+    async def find_many(
+        self,
+        where: dict[str, Any] | QueryExpression | None = None,
+        order_by: list[str | OrderExpression] | None = None,
+        order: Order = Order.asc,
+        limit: int = 0,
+        offset: int = 0,
+        depth: int = 0,
+        load: list[LoaderOption] | None = None,
+        *,
+        validate: bool | None = None,
+        lazy: Literal[True],
+        cache: CachePolicy | None = None,
+    ) -> LazyResult[ModelType]: ...
+
+    async def find_many(
+        self,
+        where: dict[str, Any] | QueryExpression | None = None,
+        order_by: list[str | OrderExpression] | None = None,
+        order: Order = Order.asc,
+        limit: int = 0,
+        offset: int = 0,
+        depth: int = 0,
+        load: list[LoaderOption] | None = None,
+        *,
+        validate: bool | None = None,
+        lazy: bool = False,
+        cache: CachePolicy | None = None,
+    ) -> Result[ModelType] | LazyResult[ModelType]:
+        """Find many model instances.
+
+        ``validate=False`` builds models from trusted rows without running
+        Pydantic validation; ``None`` uses the database's ``trusted_hydration``.
+        ``lazy=True`` returns a `LazyResult` whose ``data`` is a `LazyModels`
+        sequence that builds each model on first access; it cannot load
+        relationships.
+        ``cache`` reads the rows through the database's result cache,
+        including the queries of select-in loaders.
+        """
+        load_plan = replace(
+            self._resolve_load_plan(depth, load),
+            validate=self._validate_rows(validate),
+            lazy=lazy,
+            cache=cache,
+        )
+        if lazy and (
+            load_plan.depth > 0 or load_plan.paths or load_plan.selectin_paths
+        ):
+            raise ValueError("lazy results do not load relationships")
         if self._requires_expression_select(where, order_by):
             return await self._find_many_expression(
                 where=where if isinstance(where, QueryExpression) else None,
@@ -208,6 +361,21 @@ class Table(Generic[ModelType]):
                     "offset": offset or None,
                     "load_paths": list(load_paths),
                 },
+                cached=self._cached_read(
+                    load_plan.cache,
+                    self._query_tables(load_plan),
+                    (
+                        "find_many_with_paths",
+                        filters,
+                        legacy_order_by,
+                        order.value,
+                        limit,
+                        offset,
+                        load_paths,
+                        joined_filters,
+                        joined_order_by,
+                    ),
+                ),
             )
             data = (
                 await self._deserialize(
@@ -216,6 +384,7 @@ class Table(Generic[ModelType]):
                     depth=load_plan.depth,
                     load_paths=load_plan.paths,
                     load_options=load_plan.options,
+                    validate=load_plan.validate,
                 )
                 or []
             )
@@ -246,20 +415,172 @@ class Table(Generic[ModelType]):
                     "offset": offset or None,
                     "depth": load_plan.depth,
                 },
+                cached=self._cached_read(
+                    load_plan.cache,
+                    self._query_tables(load_plan),
+                    (
+                        "find_many",
+                        filters,
+                        legacy_order_by,
+                        order.value,
+                        limit,
+                        offset,
+                        load_plan.depth,
+                    ),
+                ),
             )
-            data = (
-                await self._deserialize(
-                    result,
-                    is_array=True,
-                    depth=load_plan.depth,
-                    load_paths=load_plan.paths,
-                    load_options=load_plan.options,
-                )
-                or []
+            data = await self._deserialize(
+                result,
+                is_array=True,
+                depth=load_plan.depth,
+                load_paths=load_plan.paths,
+                load_options=load_plan.options,
+                validate=load_plan.validate,
+                lazy=load_plan.lazy,
             )
+            if data is None:
+                data = []
             if load_plan.selectin_paths:
                 await self._load_selectin_graph(data, load_plan)
-        return Result(offset=offset, limit=limit, data=data)
+        return self._result(offset, limit, data)
+
+    async def find_many_json(
+        self,
+        where: dict[str, Any] | QueryExpression | None = None,
+        order_by: list[str | OrderExpression] | None = None,
+        order: Order = Order.asc,
+        limit: int = 0,
+        offset: int = 0,
+        depth: int = 0,
+        load: list[LoaderOption] | None = None,
+        *,
+        by_alias: bool = False,
+    ) -> bytes:
+        """Find many rows and return the `Result` serialized as JSON bytes.
+
+        Flat results are written by the native engine straight from the
+        database rows, so no model is built and no validator runs; hydration
+        events are not dispatched. Relationship loads, expression queries and
+        models with custom serializers or computed fields fall back to
+        ``find_many(...).to_json_bytes()``.
+        """
+        load_plan = self._resolve_load_plan(depth, load)
+        fields = row_hydrator(self._table_data).json_fields(by_alias)
+        if (
+            fields is None
+            or load_plan.depth > 0
+            or load_plan.paths
+            or load_plan.selectin_paths
+            or self._requires_expression_select(where, order_by)
+        ):
+            result = await self.find_many(
+                where, order_by, order, limit, offset, depth, load
+            )
+            return result.to_json_bytes(by_alias=by_alias)
+        filters, values = self._compile_where(where)
+        legacy_order_by = self._legacy_order_columns(order_by)
+        rows = await self._execute_rust(
+            "select_many",
+            lambda: self._rust_handle.find_many_json(
+                filters,
+                values,
+                legacy_order_by,
+                order.value,
+                fields,
+                limit or None,
+                offset or None,
+            ),
+            parameters=values,
+            compile_query=lambda: self._compile_find_many_query(
+                filters,
+                legacy_order_by,
+                order.value,
+                limit or None,
+                offset or None,
+            ),
+            context={"limit": limit or None, "offset": offset or None, "json": True},
+        )
+        return b"".join(
+            (f'{{"offset":{offset},"limit":{limit},"data":'.encode(), rows, b"}")
+        )
+
+    async def stream(
+        self,
+        where: dict[str, Any] | QueryExpression | None = None,
+        order_by: list[str] | None = None,
+        order: Order = Order.asc,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+        *,
+        validate: bool | None = None,
+    ) -> AsyncIterator[list[ModelType]]:
+        """Yield matching models in batches of at most `chunk_size`.
+
+        Rows are read incrementally from the database, so memory depends on
+        `chunk_size` rather than on the number of matching rows. The stream
+        holds one pooled connection until it is exhausted or closed; queries
+        issued meanwhile that need that connection, because they run in the
+        same transaction or the pool has no other, raise instead of waiting.
+        """
+        validate = self._validate_rows(validate)
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        if self._requires_expression_select(where, order_by):
+            raise ValueError(
+                "stream() supports dict filters and legacy-compatible expressions"
+            )
+        filters, values = self._compile_where(where)
+        legacy_order_by = self._legacy_order_columns(order_by)
+        try:
+            rows = self._rust_handle.stream(
+                filters, values, legacy_order_by, order.value, chunk_size
+            )
+        except Exception as exc:
+            raise classify_native_error(
+                exc,
+                default=QueryExecutionError,
+                message=f"stream failed for table '{self.tablename}'",
+                context=self._context("stream", chunk_size=chunk_size),
+            ) from exc
+        try:
+            while True:
+                result = await self._execute_rust(
+                    "stream",
+                    rows.next_chunk,
+                    parameters=values,
+                    compile_query=lambda: self._compile_find_many_query(
+                        filters, legacy_order_by, order.value, None, None
+                    ),
+                    context={"chunk_size": chunk_size},
+                )
+                if result is None:
+                    return
+                yield (
+                    await self._deserialize(
+                        result, is_array=True, depth=0, validate=validate
+                    )
+                    or []
+                )
+        finally:
+            rows.close()
+
+    async def find_iter(
+        self,
+        where: dict[str, Any] | QueryExpression | None = None,
+        order_by: list[str] | None = None,
+        order: Order = Order.asc,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+        *,
+        validate: bool | None = None,
+    ) -> AsyncIterator[ModelType]:
+        """Yield matching models one at a time, fetching `chunk_size` rows at once."""
+        async with aclosing(
+            self.stream(
+                where, order_by, order=order, chunk_size=chunk_size, validate=validate
+            )
+        ) as batches:
+            async for batch in batches:
+                for model in batch:
+                    yield model
 
     async def insert(self, model_instance: ModelType) -> ModelType:
         """Insert a model instance."""
@@ -289,10 +610,89 @@ class Table(Generic[ModelType]):
         models: Iterable[ModelType],
         *,
         batch_size: int | None = None,
+        method: Literal["insert", "copy"] = "insert",
     ) -> list[ModelType]:
-        """Insert model instances with dialect-safe multi-row statements."""
+        """Insert model instances with dialect-safe multi-row statements.
+
+        ``method="copy"`` loads them through :meth:`copy_from` instead.
+        """
+        if method == "copy":
+            materialized = list(models)
+            for model in materialized:
+                if not isinstance(model, self._table_data.model):
+                    raise TypeError(
+                        "insert_many expected instances of "
+                        f"{self._table_data.model.__name__}"
+                    )
+            await self.copy_from(materialized, batch_size=batch_size)
+            return materialized
+        if method != "insert":
+            raise ValueError("method must be 'insert' or 'copy'")
         return await self._write_many("insert", models, batch_size=batch_size)
 
+    async def copy_from(
+        self,
+        models_or_rows: Iterable[ModelType | Mapping[str, Any]],
+        *,
+        batch_size: int | None = None,
+    ) -> int:
+        """Bulk load model instances or column mappings; return the row count.
+
+        PostgreSQL streams binary ``COPY``; other backends re-execute one
+        prepared INSERT. Each batch of ``batch_size`` rows commits atomically
+        unless the call runs inside a transaction. Model instances fire the
+        insert events, while mappings are loaded as raw column values.
+        """
+        if batch_size is not None and batch_size <= 0:
+            raise ValueError("batch_size must be greater than zero")
+        grouped: dict[
+            tuple[str, ...], list[tuple[ModelType | None, dict[str, Any]]]
+        ] = {}
+        for item in models_or_rows:
+            if isinstance(item, self._table_data.model):
+                model: ModelType | None = item
+                payload = self._payload(item, mode="insert")
+            elif isinstance(item, Mapping):
+                model = None
+                payload = self._row_payload(item)
+            else:
+                raise TypeError(
+                    "copy_from expected instances of "
+                    f"{self._table_data.model.__name__} or column mappings"
+                )
+            grouped.setdefault(tuple(payload), []).append((model, payload))
+
+        before_events = self._listened(("before_create", "before_insert"))
+        after_events = self._listened(("after_insert", "after_create"))
+        inserted = 0
+        for shape, entries in grouped.items():
+            if not shape:
+                raise ValueError("bulk writes require at least one persisted column")
+            columns = list(shape)
+            chunk_size = batch_size or len(entries)
+            for start in range(0, len(entries), chunk_size):
+                chunk = entries[start : start + chunk_size]
+                models = [model for model, _payload in chunk if model is not None]
+                for model in models:
+                    for event in before_events:
+                        await self._events.dispatch(
+                            event, model=model, table=self._table_data
+                        )
+                rows = [[payload[column] for column in shape] for _, payload in chunk]
+                inserted += await self._execute_rust(
+                    "copy_from",
+                    lambda columns=columns, rows=rows: self._rust_handle.copy_rows(
+                        columns, rows
+                    ),
+                    context={"batch_rows": len(rows), "columns": columns},
+                )
+                for model in models:
+                    for event in after_events:
+                        await self._events.dispatch(
+                            event, model=model, table=self._table_data
+                        )
+        return inserted
+
     async def _write_many(
         self,
         operation: Literal["insert", "upsert"],
@@ -317,12 +717,12 @@ class Table(Generic[ModelType]):
             payload = self._payload(model, mode=operation)
             grouped.setdefault(tuple(payload), []).append((model, payload))
 
-        before_events = (
+        before_events = self._listened(
             ("before_create", "before_insert")
             if operation == "insert"
             else ("before_upsert",)
         )
-        after_events = (
+        after_events = self._listened(
             ("after_insert", "after_create")
             if operation == "insert"
             else ("after_upsert",)
@@ -338,11 +738,15 @@ class Table(Generic[ModelType]):
                             event, model=model, table=self._table_data
                         )
                 payloads = [payload for _model, payload in chunk]
-                debug_parameters = {
-                    f"row_{row}__{column}": payload[column]
-                    for row, payload in enumerate(payloads)
-                    for column in shape
-                }
+                debug_parameters = (
+                    {
+                        f"row_{row}__{column}": payload[column]
+                        for row, payload in enumerate(payloads)
+                        for column in shape
+                    }
+                    if self._debug
+                    else None
+                )
                 await self._execute_rust(
                     f"{operation}_many",
                     lambda payloads=payloads: rust_method(payloads),
@@ -356,23 +760,89 @@ class Table(Generic[ModelType]):
                         )
         return materialized
 
-    async def update(self, model_instance: ModelType) -> ModelType:
-        """Update a model instance."""
+    async def update(
+        self,
+        model_instance: ModelType,
+        *,
+        columns: Iterable[str] | None = None,
+    ) -> ModelType:
+        """Update a model instance.
+
+        ``columns`` limits the ``SET`` clause to the named columns, so only
+        changed values are written. Each column set compiles its own cached
+        statement.
+        """
+        selected = self._update_columns(columns)
         await self._events.dispatch(
             "before_update", model=model_instance, table=self._table_data
         )
-        payload = self._payload(model_instance, mode="update")
-        await self._execute_rust(
-            "update",
-            lambda: self._rust_handle.update(payload),
-            parameters=payload,
-            compile_query=lambda: self._compile_update_query(payload),
-        )
+        payload = self._payload(model_instance, mode="update", columns=selected)
+        if selected is None or len(payload) > 1:
+            await self._execute_rust(
+                "update",
+                lambda: self._rust_handle.update(payload),
+                parameters=payload,
+                compile_query=lambda: self._compile_update_query(payload),
+            )
         await self._events.dispatch(
             "after_update", model=model_instance, table=self._table_data
         )
         return model_instance
 
+    async def update_many(
+        self,
+        models: Iterable[ModelType],
+        *,
+        columns: Iterable[str] | None = None,
+        batch_size: int | None = None,
+    ) -> list[ModelType]:
+        """Update model instances with batched multi-row statements.
+
+        Models sharing a payload shape are written with a few ``CASE``-based
+        ``UPDATE`` statements over one connection, in one transaction unless
+        the call runs inside an active one. ``columns`` limits every
+        statement to the named columns.
+        """
+        materialized = list(models)
+        if not materialized:
+            return []
+        if batch_size is not None and batch_size <= 0:
+            raise ValueError("batch_size must be greater than zero")
+        selected = self._update_columns(columns)
+        grouped: dict[tuple[str, ...], list[tuple[ModelType, dict[str, Any]]]] = {}
+        for model in materialized:
+            if not isinstance(model, self._table_data.model):
+                raise TypeError(
+                    "update_many expected instances of "
+                    f"{self._table_data.model.__name__}"
+                )
+            payload = self._payload(model, mode="update", columns=selected)
+            grouped.setdefault(tuple(payload), []).append((model, payload))
+
+        before_events = self._listened(("before_update",))
+        after_events = self._listened(("after_update",))
+        for entries in grouped.values():
+            for model, _payload in entries:
+                for event in before_events:
+                    await self._events.dispatch(
+                        event, model=model, table=self._table_data
+                    )
+            payloads = [payload for _model, payload in entries]
+            if selected is None or len(payloads[0]) > 1:
+                await self._execute_rust(
+                    "update_many",
+                    lambda payloads=payloads: self._rust_handle.update_many(
+                        payloads, batch_size
+                    ),
+                    context={"batch_rows": len(payloads)},
+                )
+            for model, _payload in entries:
+                for event in after_events:
+                    await self._events.dispatch(
+                        event, model=model, table=self._table_data
+                    )
+        return materialized
+
     async def upsert(self, model_instance: ModelType) -> ModelType:
         """Insert or update a model instance."""
         await self._events.dispatch(
@@ -412,6 +882,34 @@ class Table(Generic[ModelType]):
         await self._events.dispatch("after_delete", pk=pk, table=self._table_data)
         return True
 
+    async def delete_many(
+        self,
+        pks: Iterable[Any],
+        *,
+        batch_size: int | None = None,
+    ) -> int:
+        """Delete models by primary key with batched ``IN`` statements."""
+        keys = list(pks)
+        if not keys:
+            return 0
+        if batch_size is not None and batch_size <= 0:
+            raise ValueError("batch_size must be greater than zero")
+        before_events = self._listened(("before_delete",))
+        after_events = self._listened(("after_delete",))
+        for pk in keys:
+            for event in before_events:
+                await self._events.dispatch(event, pk=pk, table=self._table_data)
+        primary_keys = [py_type_to_sql(self._table_map, pk) for pk in keys]
+        result = await self._execute_rust(
+            "delete_many",
+            lambda: self._rust_handle.delete_many(primary_keys, batch_size),
+            context={"batch_rows": len(primary_keys)},
+        )
+        for pk in keys:
+            for event in after_events:
+                await self._events.dispatch(event, pk=pk, table=self._table_data)
+        return int(result.get("rowcount") or 0)
+
     async def delete_where(
         self,
         where: dict[str, Any] | QueryExpression | None = None,
@@ -443,11 +941,18 @@ class Table(Generic[ModelType]):
         return int(result.get("rowcount") or 0)
 
     async def count(
-        self, where: dict[str, Any] | QueryExpression | None = None, depth: int = 0
+        self,
+        where: dict[str, Any] | QueryExpression | None = None,
+        depth: int = 0,
+        *,
+        cache: CachePolicy | None = None,
     ) -> int:
-        """Count records matching an optional filter."""
+        """Count records matching an optional filter.
+
+        ``cache`` reads the count through the database's result cache.
+        """
         if isinstance(where, QueryExpression) and not where.supports_legacy_filters():
-            result = await self.select(count_expr(), where=where)
+            result = await self.select(count_expr(), where=where, cache=cache)
             return int(result.scalar())
         filters, values = self._compile_where(where)
         result = await self._execute_rust(
@@ -455,6 +960,9 @@ class Table(Generic[ModelType]):
             lambda: self._rust_handle.count(filters, values),
             parameters=values,
             compile_query=lambda: self._compile_count_query(filters),
+            cached=self._cached_read(
+                cache, frozenset({self.tablename}), ("count", filters)
+            ),
         )
         return NativeResult(
             columns=list(result["columns"]),
@@ -473,8 +981,111 @@ class Table(Generic[ModelType]):
         limit: int | None = None,
         offset: int | None = None,
         distinct: bool = False,
-    ) -> NativeResult:
-        """Execute a typed projection query and return raw projected rows."""
+        result_format: Literal["rows", "columns"] = "rows",
+        cache: CachePolicy | None = None,
+    ) -> NativeResult | ColumnarResult:
+        """Execute a typed projection query and return raw projected rows.
+
+        `result_format="columns"` returns a `ColumnarResult` whose numeric and
+        text columns are transferred as packed buffers instead of per-cell
+        objects.
+        `cache` reads the rows through the database's result cache; writes to
+        any table the query references, subqueries included, invalidate them.
+        """
+        if result_format not in ("rows", "columns"):
+            raise ValueError("result_format must be 'rows' or 'columns'")
+        payload = self._select_payload(
+            projections,
+            query=query,
+            where=where,
+            group_by=group_by,
+            having=having,
+            order_by=order_by,
+            limit=limit,
+            offset=offset,
+            distinct=distinct,
+        )
+        columnar = result_format == "columns" and self._columnar
+        result = await self._execute_rust(
+            "select",
+            lambda: (
+                self._rust_handle.select_expression(payload, columnar=True)
+                if columnar
+                else self._rust_handle.select_expression(payload)
+            ),
+            parameters=dict(payload.get("values") or {}),
+            compile_query=lambda: self._compile_typed_select_query(payload),
+            cached=self._cached_read(
+                cache,
+                self._payload_tables(payload),
+                ("select_expression", payload, columnar),
+            ),
+        )
+        if result_format == "rows":
+            return native_result_from_payload(result)
+        if result.get("layout") == "columns":
+            return ColumnarResult(result)
+        return ColumnarResult.from_rows(
+            list(result["columns"]), list(result["rows"]), result.get("rowcount")
+        )
+
+    async def select_arrow(
+        self,
+        *projections: ProjectionExpression | SerializableExpression,
+        query: SelectExpressionQuery | None = None,
+        where: QueryExpression | None = None,
+        group_by: list[SerializableExpression] | None = None,
+        having: QueryExpression | None = None,
+        order_by: list[OrderExpression] | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+        distinct: bool = False,
+        batch_size: int | None = None,
+    ) -> ArrowResult:
+        """Execute a typed projection query and return Arrow record batches.
+
+        The batches are built natively and exported through the Arrow PyCapsule
+        interface, so `pyarrow.table(result)` or `polars.DataFrame(result)`
+        import them without copying. `batch_size` splits the rows into
+        several batches read through `__arrow_c_stream__`.
+        """
+        if batch_size is not None and batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        payload = self._select_payload(
+            projections,
+            query=query,
+            where=where,
+            group_by=group_by,
+            having=having,
+            order_by=order_by,
+            limit=limit,
+            offset=offset,
+            distinct=distinct,
+        )
+        table = await self._execute_rust(
+            "select",
+            lambda: self._rust_handle.select_expression_arrow(
+                payload, batch_size=batch_size
+            ),
+            parameters=dict(payload.get("values") or {}),
+            compile_query=lambda: self._compile_typed_select_query(payload),
+            context={"format": "arrow"},
+        )
+        return ArrowResult(table)
+
+    def _select_payload(
+        self,
+        projections: tuple[ProjectionExpression | SerializableExpression, ...],
+        *,
+        query: SelectExpressionQuery | None,
+        where: QueryExpression | None,
+        group_by: list[SerializableExpression] | None,
+        having: QueryExpression | None,
+        order_by: list[OrderExpression] | None,
+        limit: int | None,
+        offset: int | None,
+        distinct: bool,
+    ) -> dict[str, Any]:
         if query is None:
             query = select_query(
                 self.tablename,
@@ -494,17 +1105,7 @@ class Table(Generic[ModelType]):
             raise ValueError(
                 f"typed query targets table '{payload['table']}', not '{self.tablename}'"
             )
-        result = await self._execute_rust(
-            "select",
-            lambda: self._rust_handle.select_expression(payload),
-            parameters=dict(payload.get("values") or {}),
-            compile_query=lambda: self._compile_typed_select_query(payload),
-        )
-        return NativeResult(
-            columns=list(result["columns"]),
-            rows=[tuple(row) for row in result["rows"]],
-            rowcount=result.get("rowcount"),
-        )
+        return payload
 
     async def update_where(
         self,
@@ -523,7 +1124,7 @@ class Table(Generic[ModelType]):
                 f"typed update targets table '{payload['table']}', not '{self.tablename}'"
             )
         result = await self._execute_rust(
-            "update",
+            "update_where",
             lambda: self._rust_handle.update_expression(payload),
             parameters=dict(payload.get("values") or {}),
             compile_query=lambda: self._compile_typed_update_query(payload),
@@ -543,7 +1144,7 @@ class Table(Generic[ModelType]):
         limit: int,
         offset: int,
         load_plan: _ResolvedLoadPlan,
-    ) -> Result[ModelType]:
+    ) -> Result[ModelType] | LazyResult[ModelType]:
         if load_plan.depth > 0 or load_plan.paths:
             data = await self._find_many_expression_by_primary_keys(
                 where=where,
@@ -573,20 +1174,26 @@ class Table(Generic[ModelType]):
             parameters=dict(payload.get("values") or {}),
             compile_query=lambda: self._compile_typed_select_query(payload),
             context={"limit": limit or None, "offset": offset or None},
+            cached=self._cached_read(
+                load_plan.cache,
+                self._payload_tables(payload),
+                ("select_expression", payload),
+            ),
         )
-        data = (
-            await self._deserialize(
-                result,
-                is_array=True,
-                depth=0,
-                load_paths=load_plan.paths,
-                load_options=load_plan.options,
-            )
-            or []
+        data = await self._deserialize(
+            result,
+            is_array=True,
+            depth=0,
+            load_paths=load_plan.paths,
+            load_options=load_plan.options,
+            validate=load_plan.validate,
+            lazy=load_plan.lazy,
         )
+        if data is None:
+            data = []
         if load_plan.selectin_paths:
             await self._load_selectin_graph(data, load_plan)
-        return Result(offset=offset, limit=limit, data=data)
+        return self._result(offset, limit, data)
 
     async def _find_many_expression_by_primary_keys(
         self,
@@ -613,6 +1220,11 @@ class Table(Generic[ModelType]):
             parameters=dict(payload.get("values") or {}),
             compile_query=lambda: self._compile_typed_select_query(payload),
             context={"limit": limit or None, "offset": offset or None},
+            cached=self._cached_read(
+                load_plan.cache,
+                self._payload_tables(payload),
+                ("select_expression", payload),
+            ),
         )
         native_result = NativeResult(
             columns=list(result["columns"]),
@@ -647,6 +1259,17 @@ class Table(Generic[ModelType]):
                 ),
                 parameters=values,
                 context={"load_paths": list(load_paths)},
+                cached=self._cached_read(
+                    load_plan.cache,
+                    self._query_tables(load_plan),
+                    (
+                        "find_many_with_paths",
+                        filters,
+                        load_paths,
+                        joined_filters,
+                        joined_order_by,
+                    ),
+                ),
             )
             data = (
                 await self._deserialize(
@@ -655,6 +1278,7 @@ class Table(Generic[ModelType]):
                     depth=load_plan.depth,
                     load_paths=load_plan.paths,
                     load_options=load_plan.options,
+                    validate=load_plan.validate,
                 )
                 or []
             )
@@ -679,6 +1303,11 @@ class Table(Generic[ModelType]):
                     None,
                 ),
                 context={"depth": load_plan.depth},
+                cached=self._cached_read(
+                    load_plan.cache,
+                    self._query_tables(load_plan),
+                    ("find_many", filters, load_plan.depth),
+                ),
             )
             data = (
                 await self._deserialize(
@@ -687,6 +1316,7 @@ class Table(Generic[ModelType]):
                     depth=load_plan.depth,
                     load_paths=load_plan.paths,
                     load_options=load_plan.options,
+                    validate=load_plan.validate,
                 )
                 or []
             )
@@ -702,27 +1332,29 @@ class Table(Generic[ModelType]):
         depth: int,
         load_paths: tuple[str, ...] | None = None,
         load_options: tuple[LoaderOption, ...] = (),
+        validate: bool = True,
+        lazy: bool = False,
     ) -> Any:
-        native_result = NativeResult(
-            columns=list(result["columns"]),
-            rows=[tuple(row) for row in result["rows"]],
-            rowcount=result.get("rowcount"),
-        )
-        payload = {
-            "operation": "hydrate",
-            "table": self._table_data,
-            "table_name": self.tablename,
-            "model": self._table_data.model,
-            "model_name": self._table_data.model.__name__,
-            "row_count": len(native_result._rows),
-            "is_array": is_array,
-            "depth": depth,
-            "load_paths": list(load_paths or ()),
-        }
-        await self._events.dispatch("before_hydration", **payload)
-        started = perf_counter()
+        native_result = native_result_from_payload(result)
+        observed = self._events.has_handlers("before_hydration", "after_hydration")
+        if observed:
+            payload = {
+                "operation": "hydrate",
+                "table": self._table_data,
+                "table_name": self.tablename,
+                "model": self._table_data.model,
+                "model_name": self._table_data.model.__name__,
+                "row_count": len(native_result._rows),
+                "is_array": is_array,
+                "depth": depth,
+                "load_paths": list(load_paths or ()),
+                "validate": validate,
+                "lazy": lazy,
+            }
+            await self._events.dispatch("before_hydration", **payload)
+            started = perf_counter()
         try:
-            hydrated = OrmSerializer[ModelType | None](
+            serializer = OrmSerializer[ModelType | None](
                 table_data=self._table_data,
                 table_map=self._table_map,
                 result_set=native_result,
@@ -730,9 +1362,12 @@ class Table(Generic[ModelType]):
                 depth=depth,
                 load_paths=load_paths,
                 load_options=load_options,
-            ).deserialize()
+                validate=validate,
+            )
+            hydrated = (
+                serializer.deserialize_lazy() if lazy else serializer.deserialize()
+            )
         except Exception as exc:
-            duration_ms = self._duration_ms(started)
             context = self._context("hydrate", row_count=len(native_result._rows))
             error = classify_native_error(
                 exc,
@@ -740,20 +1375,21 @@ class Table(Generic[ModelType]):
                 message=f"hydration failed for table '{self.tablename}'",
                 context=context,
             )
+            if observed:
+                await self._events.dispatch(
+                    "after_hydration",
+                    **payload,
+                    duration_ms=self._duration_ms(started),
+                    error=error,
+                )
+            raise error from exc
+        if observed:
             await self._events.dispatch(
                 "after_hydration",
                 **payload,
-                duration_ms=duration_ms,
-                error=error,
+                duration_ms=self._duration_ms(started),
+                error=None,
             )
-            raise error from exc
-        duration_ms = self._duration_ms(started)
-        await self._events.dispatch(
-            "after_hydration",
-            **payload,
-            duration_ms=duration_ms,
-            error=None,
-        )
         return hydrated
 
     async def _load_selectin_graph(
@@ -765,7 +1401,7 @@ class Table(Generic[ModelType]):
             raise RuntimeError(
                 "select-in relationship loading requires an initialized runtime"
             )
-        identity_map: dict[tuple[type[Any], str], Any] = {}
+        identity_map: dict[tuple[type[Any], Any], Any] = {}
         for root in roots:
             self._remember_identity(root, self._table_data, identity_map)
         option_by_path = {
@@ -779,6 +1415,8 @@ class Table(Generic[ModelType]):
             identity_map,
             option_by_path,
             set(load_plan.paths or ()),
+            load_plan.validate,
+            cache_policy=load_plan.cache,
         )
 
     async def _load_selectin_tree(
@@ -787,60 +1425,103 @@ class Table(Generic[ModelType]):
         table_data: OrmTable[Any],
         path_tree: dict[str, Any],
         path_prefix: tuple[str, ...],
-        identity_map: dict[tuple[type[Any], str], Any],
+        identity_map: dict[tuple[type[Any], Any], Any],
         option_by_path: dict[str, LoaderOption],
         joined_paths: set[str],
+        validate: bool = True,
+        limiter: asyncio.Semaphore | None = None,
+        cache_policy: CachePolicy | None = None,
     ) -> None:
         if not parents:
             return
-        for field_name, subtree in path_tree.items():
-            relationship = table_data.relationships[field_name]
-            related_table = self._table_map.name_to_data[relationship.foreign_table]
-            path = (*path_prefix, field_name)
-            option = option_by_path.get(self._slash_path(path))
-            if self._joined_path_contains(joined_paths, path):
-                related = self._loaded_relationship_values(
-                    parents, field_name, related_table
-                )
-                related = [
-                    self._remember_identity(model, related_table, identity_map)
-                    for model in related
-                ]
-            else:
-                try:
-                    related = await self._selectin_load_relationship(
-                        parents,
-                        table_data,
-                        field_name,
-                        relationship.back_references,
-                        related_table,
-                        option,
-                        identity_map,
-                    )
-                except Exception as exc:
-                    context = self._context(
-                        "relationship_load",
-                        relationship=".".join(path),
-                        source_table=table_data.tablename,
-                        target_table=related_table.tablename,
-                    )
-                    error = RelationshipLoadingError(
-                        "relationship loading failed for "
-                        f"'{table_data.model.__name__}.{field_name}'",
-                        context=context,
-                        cause=exc,
-                    )
-                    raise error from exc
-            if subtree:
-                await self._load_selectin_tree(
-                    related,
+        if limiter is None:
+            limiter = asyncio.Semaphore(self._selectin_fan_out())
+        # Sibling relationships are independent; each branch only waits for
+        # its own parent level before descending.
+        await self._gather_selectin(
+            self._load_selectin_branch(
+                parents,
+                table_data,
+                field_name,
+                subtree,
+                path_prefix,
+                identity_map,
+                option_by_path,
+                joined_paths,
+                validate,
+                limiter,
+                cache_policy,
+            )
+            for field_name, subtree in path_tree.items()
+        )
+
+    async def _load_selectin_branch(
+        self,
+        parents: list[Any],
+        table_data: OrmTable[Any],
+        field_name: str,
+        subtree: dict[str, Any],
+        path_prefix: tuple[str, ...],
+        identity_map: dict[tuple[type[Any], Any], Any],
+        option_by_path: dict[str, LoaderOption],
+        joined_paths: set[str],
+        validate: bool,
+        limiter: asyncio.Semaphore,
+        cache_policy: CachePolicy | None = None,
+    ) -> None:
+        relationship = table_data.relationships[field_name]
+        related_table = self._table_map.name_to_data[relationship.foreign_table]
+        path = (*path_prefix, field_name)
+        option = option_by_path.get(self._slash_path(path))
+        if self._joined_path_contains(joined_paths, path):
+            related = self._loaded_relationship_values(
+                parents, field_name, related_table
+            )
+            related = [
+                self._remember_identity(model, related_table, identity_map)
+                for model in related
+            ]
+        else:
+            try:
+                related = await self._selectin_load_relationship(
+                    parents,
+                    table_data,
+                    field_name,
+                    relationship.back_references,
                     related_table,
-                    subtree,
-                    path,
+                    option,
                     identity_map,
-                    option_by_path,
-                    joined_paths,
+                    validate,
+                    limiter,
+                    cache_policy,
+                )
+            except Exception as exc:
+                context = self._context(
+                    "relationship_load",
+                    relationship=".".join(path),
+                    source_table=table_data.tablename,
+                    target_table=related_table.tablename,
+                )
+                error = RelationshipLoadingError(
+                    "relationship loading failed for "
+                    f"'{table_data.model.__name__}.{field_name}'",
+                    context=context,
+                    cause=exc,
                 )
+                raise error from exc
+        if subtree:
+            await self._load_selectin_tree(
+                related,
+                related_table,
+                subtree,
+                path,
+                identity_map,
+                option_by_path,
+                joined_paths,
+                validate,
+                limiter,
+                cache_policy,
+            )
 
     async def _selectin_load_relationship(
         self,
@@ -850,9 +1531,21 @@ class Table(Generic[ModelType]):
         back_reference: str | None,
         related_table: OrmTable[Any],
         option: LoaderOption | None,
-        identity_map: dict[tuple[type[Any], str], Any],
+        identity_map: dict[tuple[type[Any], Any], Any],
+        validate: bool = True,
+        limiter: asyncio.Semaphore | None = None,
+        cache_policy: CachePolicy | None = None,
     ) -> list[Any]:
         related_handle = self._related_table(related_table)
+        if limiter is None:
+            limiter = asyncio.Semaphore(self._selectin_fan_out())
+        validation: dict[str, Any] = {} if validate else {"validate": False}
+        if cache_policy is not None:
+            validation["cache"] = cache_policy
+        cache = self._model_cache(related_table)
+        generation = (
+            cache.generation(related_table.model) if cache is not None else None
+        )
         if back_reference is not None:
             parent_ids = self._unique_values(
                 getattr(parent, table_data.pk) for parent in parents
@@ -861,26 +1554,37 @@ class Table(Generic[ModelType]):
                 for parent in parents:
                     object.__setattr__(parent, field_name, [])
                 return []
-            children = []
-            for batch in self._selectin_batches(parent_ids, option):
-                where = self._selectin_where(back_reference, batch, option)
-                children.extend((await related_handle.find_many(where=where)).data)
+            pages = await self._gather_selectin(
+                self._selectin_page(
+                    related_handle,
+                    self._selectin_where(back_reference, batch, option),
+                    limiter,
+                    validation,
+                )
+                for batch in self._selectin_batches(parent_ids, option)
+            )
+            self._cache_models(
+                related_table, [child for page in pages for child in page], generation
+            )
             children = [
                 self._remember_identity(child, related_table, identity_map)
-                for child in children
+                for page in pages
+                for child in page
             ]
-            children_by_parent: dict[str, list[Any]] = {}
-            for child in children:
-                children_by_parent.setdefault(
-                    str(getattr(child, back_reference)), []
-                ).append(child)
-            assigned: list[Any] = []
-            for parent in parents:
-                value = children_by_parent.get(str(getattr(parent, table_data.pk)), [])
-                value = self._filter_and_order_relationship(value, option)
-                object.__setattr__(parent, field_name, value)
-                assigned.extend(value)
-            return self._unique_models(assigned, related_table)
+            collections, assigned = merge_selectin_payload(
+                parent_keys=[getattr(parent, table_data.pk) for parent in parents],
+                children=children,
+                child_key=back_reference,
+                uselist=True,
+                table_map=self._table_map,
+                filter_by=option.filter_by if option else None,
+                order_by=option.order_by if option else None,
+            )
+            for parent, indexes in zip(parents, collections, strict=True):
+                object.__setattr__(
+                    parent, field_name, [children[index] for index in indexes]
+                )
+            return [children[index] for index in assigned]
 
         foreign_keys = self._unique_values(
             self._foreign_key_value(getattr(parent, field_name, None))
@@ -890,25 +1594,175 @@ class Table(Generic[ModelType]):
             for parent in parents:
                 object.__setattr__(parent, field_name, None)
             return []
-        related_rows = []
-        for batch in self._selectin_batches(foreign_keys, option):
-            where = self._selectin_where(related_table.pk, batch, option)
-            related_rows.extend((await related_handle.find_many(where=where)).data)
-        related_by_pk = {
-            str(getattr(related, related_table.pk)): self._remember_identity(
-                related, related_table, identity_map
+        cached: list[Any] = []
+        if cache is not None:
+            missing = []
+            for key in foreign_keys:
+                hit = cache.get(
+                    related_table.model, py_type_to_sql(self._table_map, key)
+                )
+                if hit is None:
+                    missing.append(key)
+                else:
+                    cached.append(hit)
+            foreign_keys = missing
+        pages = await self._gather_selectin(
+            self._selectin_page(
+                related_handle,
+                self._selectin_where(related_table.pk, batch, option),
+                limiter,
+                validation,
+            )
+            for batch in self._selectin_batches(foreign_keys, option)
+        )
+        loaded = [model for page in pages for model in page]
+        self._cache_models(related_table, loaded, generation)
+        related = [
+            self._remember_identity(model, related_table, identity_map)
+            for model in (*cached, *loaded)
+        ]
+        matches, assigned = merge_selectin_payload(
+            parent_keys=[
+                self._foreign_key_value(getattr(parent, field_name, None))
+                for parent in parents
+            ],
+            children=related,
+            child_key=related_table.pk,
+            uselist=False,
+            table_map=self._table_map,
+            filter_by=option.filter_by if option else None,
+        )
+        for parent, index in zip(parents, matches, strict=True):
+            object.__setattr__(
+                parent, field_name, related[index] if index is not None else None
+            )
+        return [related[index] for index in assigned]
+
+    async def _coalesced_find_one(self, pk: Any, validate: bool) -> Any:
+        key = py_type_to_sql(self._table_map, pk)
+        # Lookups only share a batch with callers in the same transaction.
+        batch = (self._transaction_token(), validate)
+        future = self._find_one_futures.get((batch, key))
+        shared = future is not None
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._find_one_futures[(batch, key)] = future
+            queue = self._find_one_queue.get(batch)
+            if queue is None:
+                queue = self._find_one_queue[batch] = []
+                loop.call_later(
+                    cast(float, self._find_one_batch_window),
+                    self._flush_find_one,
+                    batch,
+                )
+            queue.append(key)
+        # Shield the shared lookup so one cancelled caller does not cancel it
+        # for everyone else waiting on the same key.
+        model = await asyncio.shield(future)
+        if shared and model is not None:
+            # Each caller joining a lookup gets its own copy to mutate.
+            return model.model_copy()
+        return model
+
+    def _flush_find_one(self, batch: tuple[int | None, bool]) -> None:
+        keys = self._find_one_queue.pop(batch, [])
+        task = asyncio.ensure_future(self._load_find_one_batch(keys, batch))
+        self._find_one_tasks.add(task)
+        task.add_done_callback(self._find_one_tasks.discard)
+
+    async def _load_find_one_batch(
+        self, keys: list[Any], batch: tuple[int | None, bool]
+    ) -> None:
+        futures = [self._find_one_futures[(batch, key)] for key in keys]
+        limiter = asyncio.Semaphore(self._selectin_fan_out())
+        validation = {} if batch[1] else {"validate": False}
+        pk = self._table_data.pk
+        try:
+            pages = await self._gather_selectin(
+                self._selectin_page(self, {f"{pk}__in": batch}, limiter, validation)
+                for batch in self._selectin_batches(keys, None)
+            )
+            found = {
+                py_type_to_sql(self._table_map, getattr(model, pk)): model
+                for page in pages
+                for model in page
+            }
+        except Exception as exc:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(exc)
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+        else:
+            for key, future in zip(keys, futures, strict=True):
+                if not future.done():
+                    future.set_result(found.get(key))
+        finally:
+            for key in keys:
+                self._find_one_futures.pop((batch, key), None)
+
+    def _model_cache(self, table_data: OrmTable[Any]) -> IdentityCache | None:
+        cache = self._identity_cache
+        if cache is None or not cache.caches(table_data.model):
+            return None
+        # Rows read inside a transaction may hold uncommitted writes.
+        if self._transaction_token() is not None:
+            return None
+        return cache
+
+    def _cache_models(
+        self,
+        table_data: OrmTable[Any],
+        models: list[Any],
+        generation: tuple[int, int] | None,
+    ) -> None:
+        cache = self._model_cache(table_data)
+        if cache is None:
+            return
+        for model in models:
+            cache.put(
+                table_data.model,
+                py_type_to_sql(self._table_map, getattr(model, table_data.pk)),
+                model,
+                generation=generation,
             )
-            for related in related_rows
-        }
-        scalar_assigned: list[Any] = []
-        for parent in parents:
-            key = self._foreign_key_value(getattr(parent, field_name, None))
-            related_value = related_by_pk.get(str(key)) if key is not None else None
-            related_value = self._filter_and_order_relationship(related_value, option)
-            object.__setattr__(parent, field_name, related_value)
-            if related_value is not None:
-                scalar_assigned.append(related_value)
-        return self._unique_models(scalar_assigned, related_table)
+
+    @staticmethod
+    async def _selectin_page(
+        handle: "Table[Any]",
+        where: dict[str, Any],
+        limiter: asyncio.Semaphore,
+        validation: dict[str, Any],
+    ) -> list[Any]:
+        async with limiter:
+            return (await handle.find_many(where=where, **validation)).data
+
+    @staticmethod
+    async def _gather_selectin(
+        coroutines: Iterable[Coroutine[Any, Any, _T]],
+    ) -> list[_T]:
+        """Run select-in steps concurrently, cancelling the rest on failure."""
+        pending = list(coroutines)
+        if len(pending) == 1:
+            return [await pending[0]]
+        tasks = [asyncio.ensure_future(coroutine) for coroutine in pending]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+    def _selectin_fan_out(self) -> int:
+        """Cap concurrent select-in queries at the connection pool size."""
+        pool_statistics = getattr(self._runtime, "pool_statistics", None)
+        if pool_statistics is None:
+            return self._selectin_concurrency
+        pool_size = int(pool_statistics()["max_size"])
+        return max(1, min(self._selectin_concurrency, pool_size))
 
     def _related_table(self, table_data: OrmTable[Any]) -> "Table[Any]":
         if self._runtime is None:
@@ -918,12 +1772,23 @@ class Table(Generic[ModelType]):
         return Table(
             table_data=table_data,
             table_map=self._table_map,
-            rust_handle=self._runtime.table(table_data.model.__name__),
+            rust_handle=(
+                self._runtime.table(table_data.model.__name__, awaitable=True)
+                if self._native_async
+                else self._runtime.table(table_data.model.__name__)
+            ),
             events=self._events,
             runtime=self._runtime,
             connection=self._connection,
             debug=self._debug,
             log_queries=self._log_queries,
+            trusted_hydration=self._trusted_hydration,
+            selectin_concurrency=self._selectin_concurrency,
+            find_one_batch_window=self._find_one_batch_window,
+            identity_cache=self._identity_cache,
+            result_cache=self._result_cache,
+            transaction=self._transaction,
+            written=self._written,
         )
 
     @staticmethod
@@ -945,10 +1810,10 @@ class Table(Generic[ModelType]):
                 related.extend(item for item in value if isinstance(item, BaseModel))
             elif isinstance(value, BaseModel):
                 related.append(value)
-        unique: dict[tuple[type[Any], str], Any] = {}
+        unique: dict[tuple[type[Any], Any], Any] = {}
         for item in related:
             primary_key = getattr(item, related_table.pk, id(item))
-            unique.setdefault((type(item), str(primary_key)), item)
+            unique.setdefault((type(item), primary_key), item)
         return list(unique.values())
 
     @staticmethod
@@ -980,11 +1845,7 @@ class Table(Generic[ModelType]):
 
     @staticmethod
     def _unique_values(values: Any) -> list[Any]:
-        unique: dict[str, Any] = {}
-        for value in values:
-            if value is not None:
-                unique.setdefault(str(value), value)
-        return list(unique.values())
+        return list(dict.fromkeys(value for value in values if value is not None))
 
     def _selectin_batches(
         self, values: list[Any], option: LoaderOption | None
@@ -1031,54 +1892,15 @@ class Table(Generic[ModelType]):
     def _remember_identity(
         model: Any,
         table_data: OrmTable[Any],
-        identity_map: dict[tuple[type[Any], str], Any],
+        identity_map: dict[tuple[type[Any], Any], Any],
     ) -> Any:
-        key = (table_data.model, str(getattr(model, table_data.pk)))
+        key = (table_data.model, getattr(model, table_data.pk))
         existing = identity_map.get(key)
         if existing is not None:
             return existing
         identity_map[key] = model
         return model
 
-    @staticmethod
-    def _unique_models(models: list[Any], table_data: OrmTable[Any]) -> list[Any]:
-        unique: dict[str, Any] = {}
-        for model in models:
-            unique.setdefault(str(getattr(model, table_data.pk)), model)
-        return list(unique.values())
-
-    def _filter_and_order_relationship(
-        self, value: Any, option: LoaderOption | None
-    ) -> Any:
-        if option is None:
-            return value
-        if isinstance(value, list):
-            items = [
-                item for item in value if self._matches_loader_filter(item, option)
-            ]
-            for column in reversed(option.order_by):
-                descending = column.startswith("-")
-                key = column[1:] if descending else column
-                items.sort(
-                    key=lambda item: (
-                        getattr(item, key, None) is None,
-                        getattr(item, key, None),
-                    ),
-                    reverse=descending,
-                )
-            return items
-        if value is None:
-            return None
-        return value if self._matches_loader_filter(value, option) else None
-
-    @staticmethod
-    def _matches_loader_filter(value: Any, option: LoaderOption) -> bool:
-        for column, expected in (option.filter_by or {}).items():
-            actual = getattr(value, column, None)
-            if actual != expected and str(actual) != str(expected):
-                return False
-        return True
-
     def _joined_loader_query_parts(
         self, load_plan: _ResolvedLoadPlan
     ) -> tuple[
@@ -1121,21 +1943,48 @@ class Table(Generic[ModelType]):
         parameters: dict[str, Any] | None = None,
         compile_query: Any | None = None,
         context: dict[str, Any] | None = None,
+        cached: _CachedRead | None = None,
     ) -> Any:
-        error_context = self._context(operation, **(context or {}))
-        debug_payload = self._debug_payload(
-            operation,
-            parameters=parameters,
-            compile_query=compile_query,
-            context=error_context,
+        result_cache = cast(ResultCache, self._result_cache)
+        if cached is not None:
+            compiled = self._compile(
+                operation, compile_query, self._context(operation, **(context or {}))
+            )
+            cache_key = ResultCache.key(
+                self._connection,
+                operation,
+                (compiled or {}).get("sql"),
+                parameters,
+                cached.shape,
+            )
+            hit = result_cache.get(cache_key)
+            if hit is not None:
+                return hit
+            generation = result_cache.generation(cached.tables)
+        # Payloads are only built for listeners and query logging; the error
+        # path builds them on demand.
+        observed = self._log_queries or self._events.has_handlers(
+            "before_execute", "after_execute"
         )
-        payload = self._event_payload(error_context, debug_payload)
-        await self._events.dispatch("before_execute", **payload)
+        if observed:
+            error_context, debug_payload, payload = self._execution_payloads(
+                operation, parameters, compile_query, context
+            )
+            await self._events.dispatch("before_execute", **payload)
         started = perf_counter()
         try:
-            result = await asyncio.to_thread(call)
+            if self._native_async:
+                # Awaitable handles bind on the loop and run I/O on native workers.
+                result = await call()
+            else:
+                result = await asyncio.to_thread(call)
         except Exception as exc:
             duration_ms = self._duration_ms(started)
+            self._mark_written(operation)
+            if not observed:
+                error_context, debug_payload, payload = self._execution_payloads(
+                    operation, parameters, compile_query, context
+                )
             native_error = classify_native_error(
                 exc,
                 default=QueryExecutionError,
@@ -1156,23 +2005,100 @@ class Table(Generic[ModelType]):
                 error=native_error,
             )
             raise native_error from exc
-        duration_ms = self._duration_ms(started)
-        row_count = self._row_count(result)
-        await self._events.dispatch(
-            "after_execute",
-            **payload,
-            duration_ms=duration_ms,
-            row_count=row_count,
-            error=None,
-        )
-        self._log_query(
-            payload,
-            duration_ms=duration_ms,
-            row_count=row_count,
-            error=None,
-        )
+        self._mark_written(operation)
+        if observed:
+            duration_ms = self._duration_ms(started)
+            row_count = self._row_count(result)
+            await self._events.dispatch(
+                "after_execute",
+                **payload,
+                duration_ms=duration_ms,
+                row_count=row_count,
+                error=None,
+            )
+            self._log_query(
+                payload,
+                duration_ms=duration_ms,
+                row_count=row_count,
+                error=None,
+            )
+        if cached is not None:
+            result_cache.put(
+                cache_key,
+                result,
+                tables=cached.tables,
+                ttl=cached.policy.ttl,
+                generation=generation,
+            )
         return result
 
+    def _mark_written(self, operation: str) -> None:
+        # Cache invalidation hook; kept off the event registry so cached
+        # databases still skip execute payloads when nothing listens.
+        if self._written is not None and operation not in _READ_OPERATIONS:
+            self._written(operation, self._table_data)
+
+    def _cached_read(
+        self,
+        policy: CachePolicy | None,
+        tables: frozenset[str],
+        shape: tuple[Any, ...],
+    ) -> _CachedRead | None:
+        if policy is None or policy.ttl == 0:
+            return None
+        if self._result_cache is None:
+            raise ValueError("cache= requires a database created with result_cache")
+        # Results read inside a transaction may hold uncommitted writes.
+        if self._transaction_token() is not None:
+            return None
+        return _CachedRead(policy=policy, tables=tables, shape=shape)
+
+    def _query_tables(self, load_plan: _ResolvedLoadPlan) -> frozenset[str]:
+        """Return the tables read by the root query of ``load_plan``."""
+        paths = set(load_plan.paths or ())
+        if load_plan.depth:
+            paths.update(self._expand_depth_paths(load_plan.depth))
+        tables = {self.tablename}
+        for path in paths:
+            current = self._table_data
+            for part in path_parts(path):
+                relationship = current.relationships[part]
+                current = self._table_map.name_to_data[relationship.foreign_table]
+                tables.add(current.tablename)
+        return frozenset(tables)
+
+    @staticmethod
+    def _payload_tables(payload: Any) -> frozenset[str]:
+        """Return every table named in a typed query payload."""
+        tables: set[str] = set()
+        pending = [payload]
+        while pending:
+            item = pending.pop()
+            if isinstance(item, dict):
+                if isinstance(item.get("table"), str):
+                    tables.add(item["table"])
+                pending.extend(item.values())
+            elif isinstance(item, (list, tuple)):
+                pending.extend(item)
+        return frozenset(tables)
+
+    def _compile(
+        self,
+        operation: str,
+        compile_query: Any | None,
+        context: dict[str, Any],
+    ) -> dict[str, Any] | None:
+        if compile_query is None:
+            return None
+        try:
+            return cast("dict[str, Any] | None", compile_query())
+        except Exception as exc:
+            raise QueryCompilationError(
+                f"{operation} compilation failed for table '{self.tablename}'",
+                context=context,
+                cause=exc,
+            ) from exc
+
     def _debug_payload(
         self,
         operation: str,
@@ -1183,16 +2109,7 @@ class Table(Generic[ModelType]):
     ) -> dict[str, Any]:
         if not self._debug:
             return {"debug": False}
-        compiled: dict[str, Any] | None = None
-        if compile_query is not None:
-            try:
-                compiled = compile_query()
-            except Exception as exc:
-                raise QueryCompilationError(
-                    f"{operation} compilation failed for table '{self.tablename}'",
-                    context=context,
-                    cause=exc,
-                ) from exc
+        compiled = self._compile(operation, compile_query, context)
         bind_names = list((compiled or {}).get("params") or [])
         if not bind_names and parameters is not None:
             bind_names = list(parameters)
@@ -1203,6 +2120,31 @@ class Table(Generic[ModelType]):
             "parameters": redact_parameter_values(parameters, bind_names=bind_names),
         }
 
+    def _execution_payloads(
+        self,
+        operation: str,
+        parameters: dict[str, Any] | None,
+        compile_query: Any | None,
+        context: dict[str, Any] | None,
+    ) -> tuple[dict[str, Any], dict[str, Any], dict[str, Any]]:
+        """Return the error context, debug payload and event payload."""
+        error_context = self._context(operation, **(context or {}))
+        debug_payload = self._debug_payload(
+            operation,
+            parameters=parameters,
+            compile_query=compile_query,
+            context=error_context,
+        )
+        return (
+            error_context,
+            debug_payload,
+            self._event_payload(error_context, debug_payload),
+        )
+
+    def _listened(self, events: tuple[str, ...]) -> tuple[str, ...]:
+        """Return the subset of ``events`` that have registered handlers."""
+        return tuple(event for event in events if self._events.has_handlers(event))
+
     def _event_payload(
         self,
         context: dict[str, Any],
@@ -1387,9 +2329,16 @@ class Table(Generic[ModelType]):
         model_instance: ModelType,
         *,
         mode: Literal["insert", "update", "upsert"],
+        columns: frozenset[str] | None = None,
     ) -> dict[str, Any]:
         payload: dict[str, Any] = {}
         for column in self._table_data.columns:
+            if (
+                columns is not None
+                and column not in columns
+                and column != self._table_data.pk
+            ):
+                continue
             options = self._table_data.column_options.get(column)
             if options is not None and options.computed is not None:
                 continue
@@ -1411,6 +2360,28 @@ class Table(Generic[ModelType]):
             payload[column] = py_type_to_sql(self._table_map, value)
         return payload
 
+    def _update_columns(self, columns: Iterable[str] | None) -> frozenset[str] | None:
+        if columns is None:
+            return None
+        selected = frozenset(columns)
+        for column in selected:
+            if column not in self._table_data.columns:
+                raise ValueError(
+                    f"'{column}' is not a column on {self._table_data.model.__name__}"
+                )
+        return selected
+
+    def _row_payload(self, row: Mapping[str, Any]) -> dict[str, Any]:
+        for column in row:
+            if column not in self._table_data.columns:
+                raise ValueError(
+                    f"'{column}' is not a column on {self._table_data.model.__name__}"
+                )
+        return {
+            column: py_type_to_sql(self._table_map, value)
+            for column, value in row.items()
+        }
+
     @staticmethod
     def _normalize_where(where: dict[str, Any] | None) -> dict[str, Any]:
         if where is None:
@@ -1523,6 +2494,18 @@ class Table(Generic[ModelType]):
             combined = predicate if combined is None else combined & predicate
         return combined
 
+    def _validate_rows(self, validate: bool | None) -> bool:
+        return not self._trusted_hydration if validate is None else validate
+
+    @staticmethod
+    def _result(
+        offset: int, limit: int, data: Any
+    ) -> Result[ModelType] | LazyResult[ModelType]:
+        if isinstance(data, LazyModels):
+            # Validating the sequence would build every model.
+            return LazyResult.model_construct(offset=offset, limit=limit, data=data)
+        return Result(offset=offset, limit=limit, data=data)
+
     def _resolve_load_plan(
         self, depth: int, load: list[LoaderOption] | None
     ) -> _ResolvedLoadPlan:
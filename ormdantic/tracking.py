@@ -0,0 +1,116 @@
+"""Attribute-level change tracking for session-managed models."""
+
+from __future__ import annotations
+
+import datetime
+import weakref
+from collections.abc import Iterable
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Protocol
+from uuid import UUID
+
+from pydantic import BaseModel
+
+_IMMUTABLE_TYPES = (
+    type(None),
+    bool,
+    int,
+    float,
+    complex,
+    str,
+    bytes,
+    Decimal,
+    datetime.date,
+    datetime.time,
+    datetime.timedelta,
+    UUID,
+    Enum,
+    frozenset,
+)
+
+
+class ChangeRecorder(Protocol):
+    """Receiver of the column assignments made to a tracked instance."""
+
+    def _record_change(
+        self, model: BaseModel, key: Any, column: str, previous: Any
+    ) -> None: ...
+
+
+# Instance id -> (instance, recorder -> identity key). Every session that
+# remembers an instance gets its assignments. All references are weak so that
+# tracking never keeps a model or a finished session alive.
+_TRACKED: dict[
+    int,
+    tuple[weakref.ref[BaseModel], weakref.WeakKeyDictionary[ChangeRecorder, Any]],
+] = {}
+
+
+def install_change_tracking(model: type[BaseModel], columns: Iterable[str]) -> None:
+    """Report assignments to the persisted ``columns`` of ``model`` instances.
+
+    The hook wraps the class's ``__setattr__`` and is a dictionary lookup for
+    instances no session is tracking. Installing it again replaces the
+    tracked columns.
+    """
+    tracked_columns = frozenset(columns)
+    current = model.__dict__.get("__setattr__")
+    if current is not None and hasattr(current, "__ormdantic_columns__"):
+        current.__ormdantic_columns__ = tracked_columns
+        return
+    base_setattr = model.__setattr__
+
+    def __setattr__(self: BaseModel, name: str, value: Any) -> None:
+        if name in __setattr__.__ormdantic_columns__:  # type: ignore[attr-defined]
+            entry = _TRACKED.get(id(self))
+            if entry is not None and entry[0]() is self:
+                previous = self.__dict__.get(name)
+                for recorder, key in list(entry[1].items()):
+                    recorder._record_change(self, key, name, previous)
+        base_setattr(self, name, value)
+
+    __setattr__.__ormdantic_columns__ = tracked_columns  # type: ignore[attr-defined]
+    model.__setattr__ = __setattr__  # type: ignore[method-assign,assignment]
+
+
+def is_change_tracked(model: type[BaseModel]) -> bool:
+    """Return whether assignments to ``model`` instances are reported."""
+    return any(
+        hasattr(cls.__dict__.get("__setattr__"), "__ormdantic_columns__")
+        for cls in model.__mro__
+    )
+
+
+def track(model: BaseModel, recorder: ChangeRecorder, key: Any) -> None:
+    """Send column assignments made to ``model`` to ``recorder``.
+
+    Recorders already tracking ``model`` keep receiving its assignments.
+    """
+    marker = id(model)
+    entry = _TRACKED.get(marker)
+    if entry is None or entry[0]() is not model:
+
+        def forget(reference: weakref.ref[BaseModel]) -> None:
+            current = _TRACKED.get(marker)
+            if current is not None and current[0] is reference:
+                del _TRACKED[marker]
+
+        entry = (weakref.ref(model, forget), weakref.WeakKeyDictionary())
+        _TRACKED[marker] = entry
+    entry[1][recorder] = key
+
+
+def untrack(model: BaseModel, recorder: ChangeRecorder) -> None:
+    """Stop sending assignments made to ``model`` to ``recorder``."""
+    marker = id(model)
+    entry = _TRACKED.get(marker)
+    if entry is not None and entry[0]() is model:
+        entry[1].pop(recorder, None)
+        if not entry[1]:
+            del _TRACKED[marker]
+
+
+def is_immutable(value: Any) -> bool:
+    """Return whether ``value`` can only change by being reassigned."""
+    return isinstance(value, _IMMUTABLE_TYPES)
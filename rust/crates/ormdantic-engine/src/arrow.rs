@@ -0,0 +1,354 @@
+use crate::{DbValue, QueryResult};
+
+/// Arrow type a result column is exported as.
+///
+/// Decimals are exported as their exact text form because the driver layer
+/// does not report precision and scale. Columns whose values cannot share one
+/// numeric type fall back to text.
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+pub enum ArrowDataType {
+    Null,
+    Boolean,
+    Int64,
+    UInt64,
+    Float64,
+    LargeUtf8,
+}
+
+impl ArrowDataType {
+    /// Format string used by the Arrow C data interface.
+    pub fn format(self) -> &'static str {
+        match self {
+            Self::Null => "n",
+            Self::Boolean => "b",
+            Self::Int64 => "l",
+            Self::UInt64 => "L",
+            Self::Float64 => "g",
+            Self::LargeUtf8 => "U",
+        }
+    }
+
+    fn widen(self, value: &DbValue) -> Self {
+        let value_type = match value {
+            DbValue::Null => return self,
+            DbValue::Bool(_) => Self::Boolean,
+            DbValue::Integer(_) => Self::Int64,
+            DbValue::UnsignedInteger(value) if i64::try_from(*value).is_ok() => Self::Int64,
+            DbValue::UnsignedInteger(_) => Self::UInt64,
+            DbValue::Real(_) => Self::Float64,
+            DbValue::Decimal(_) | DbValue::Text(_) => Self::LargeUtf8,
+        };
+        match (self, value_type) {
+            (Self::Null, value_type) => value_type,
+            (current, value_type) if current == value_type => current,
+            (Self::Int64, Self::Float64) | (Self::Float64, Self::Int64) => Self::Float64,
+            _ => Self::LargeUtf8,
+        }
+    }
+}
+
+#[derive(Debug, Clone, PartialEq, Eq)]
+pub struct ArrowField {
+    name: String,
+    data_type: ArrowDataType,
+}
+
+impl ArrowField {
+    pub fn name(&self) -> &str {
+        &self.name
+    }
+
+    pub fn data_type(&self) -> ArrowDataType {
+        self.data_type
+    }
+}
+
+/// Value buffers of one column, laid out as the Arrow format specifies.
+#[derive(Debug, Clone, PartialEq)]
+pub enum ArrowValues {
+    Null,
+    /// Bit-packed, least significant bit first.
+    Boolean(Vec<u8>),
+    Int64(Vec<i64>),
+    UInt64(Vec<u64>),
+    Float64(Vec<f64>),
+    LargeUtf8 {
+        offsets: Vec<i64>,
+        data: Vec<u8>,
+    },
+}
+
+#[derive(Debug, Clone, PartialEq)]
+pub struct ArrowColumn {
+    validity: Option<Vec<u8>>,
+    null_count: usize,
+    values: ArrowValues,
+}
+
+impl ArrowColumn {
+    /// Bit-packed validity bitmap, absent when the column has no nulls.
+    pub fn validity(&self) -> Option<&[u8]> {
+        self.validity.as_deref()
+    }
+
+    pub fn null_count(&self) -> usize {
+        self.null_count
+    }
+
+    pub fn values(&self) -> &ArrowValues {
+        &self.values
+    }
+}
+
+#[derive(Debug, Clone, PartialEq)]
+pub struct RecordBatch {
+    num_rows: usize,
+    columns: Vec<ArrowColumn>,
+}
+
+impl RecordBatch {
+    pub fn num_rows(&self) -> usize {
+        self.num_rows
+    }
+
+    pub fn columns(&self) -> &[ArrowColumn] {
+        &self.columns
+    }
+}
+
+/// Query result converted to Arrow record batches sharing one schema.
+#[derive(Debug, Clone, PartialEq)]
+pub struct ArrowTable {
+    fields: Vec<ArrowField>,
+    batches: Vec<RecordBatch>,
+}
+
+impl ArrowTable {
+    /// Convert `result` into batches of at most `batch_size` rows.
+    ///
+    /// Column types are inferred over the whole result so every batch shares
+    /// one schema. Without a batch size the result becomes a single batch.
+    pub fn from_result(result: &QueryResult, batch_size: Option<usize>) -> Self {
+        let rows = result.rows();
+        let fields = result
+            .columns()
+            .iter()
+            .enumerate()
+            .map(|(index, name)| ArrowField {
+                name: name.clone(),
+                data_type: rows.iter().fold(ArrowDataType::Null, |data_type, row| {
+                    data_type.widen(&row[index])
+                }),
+            })
+            .collect::<Vec<_>>();
+        let batch_size = batch_size.unwrap_or(rows.len()).max(1);
+        let mut batches = rows
+            .chunks(batch_size)
+            .map(|rows| record_batch(&fields, rows))
+            .collect::<Vec<_>>();
+        if batches.is_empty() {
+            batches.push(record_batch(&fields, &[]));
+        }
+        Self { fields, batches }
+    }
+
+    pub fn fields(&self) -> &[ArrowField] {
+        &self.fields
+    }
+
+    pub fn batches(&self) -> &[RecordBatch] {
+        &self.batches
+    }
+
+    pub fn num_rows(&self) -> usize {
+        self.batches.iter().map(RecordBatch::num_rows).sum()
+    }
+}
+
+fn record_batch(fields: &[ArrowField], rows: &[Vec<DbValue>]) -> RecordBatch {
+    RecordBatch {
+        num_rows: rows.len(),
+        columns: fields
+            .iter()
+            .enumerate()
+            .map(|(index, field)| arrow_column(field.data_type, rows, index))
+            .collect(),
+    }
+}
+
+fn arrow_column(data_type: ArrowDataType, rows: &[Vec<DbValue>], index: usize) -> ArrowColumn {
+    let values = rows.iter().map(|row| &row[index]);
+    let null_count = values
+        .clone()
+        .filter(|value| matches!(value, DbValue::Null))
+        .count();
+    let validity = (null_count > 0 && data_type != ArrowDataType::Null)
+        .then(|| bitmap(values.clone().map(|value| !matches!(value, DbValue::Null))));
+    let values = match data_type {
+        ArrowDataType::Null => ArrowValues::Null,
+        ArrowDataType::Boolean => ArrowValues::Boolean(bitmap(
+            values.map(|value| matches!(value, DbValue::Bool(true))),
+        )),
+        ArrowDataType::Int64 => ArrowValues::Int64(
+            values
+                .map(|value| match value {
+                    DbValue::Integer(value) => *value,
+                    DbValue::UnsignedInteger(value) => *value as i64,
+                    _ => 0,
+                })
+                .collect(),
+        ),
+        ArrowDataType::UInt64 => ArrowValues::UInt64(
+            values
+                .map(|value| match value {
+                    DbValue::UnsignedInteger(value) => *value,
+                    _ => 0,
+                })
+                .collect(),
+        ),
+        ArrowDataType::Float64 => ArrowValues::Float64(
+            values
+                .map(|value| match value {
+                    DbValue::Real(value) => *value,
+                    DbValue::Integer(value) => *value as f64,
+                    DbValue::UnsignedInteger(value) => *value as f64,
+                    _ => 0.0,
+                })
+                .collect(),
+        ),
+        ArrowDataType::LargeUtf8 => {
+            let mut offsets = Vec::with_capacity(rows.len() + 1);
+            let mut data = Vec::new();
+            offsets.push(0);
+            for value in values {
+                append_text(&mut data, value);
+                offsets.push(data.len() as i64);
+            }
+            ArrowValues::LargeUtf8 { offsets, data }
+        }
+    };
+    ArrowColumn {
+        validity,
+        null_count,
+        values,
+    }
+}
+
+fn append_text(data: &mut Vec<u8>, value: &DbValue) {
+    match value {
+        DbValue::Null => {}
+        DbValue::Text(value) | DbValue::Decimal(value) => data.extend_from_slice(value.as_bytes()),
+        DbValue::Integer(value) => data.extend_from_slice(value.to_string().as_bytes()),
+        DbValue::UnsignedInteger(value) => data.extend_from_slice(value.to_string().as_bytes()),
+        DbValue::Real(value) => data.extend_from_slice(value.to_string().as_bytes()),
+        DbValue::Bool(value) => data.extend_from_slice(value.to_string().as_bytes()),
+    }
+}
+
+fn bitmap(bits: impl Iterator<Item = bool>) -> Vec<u8> {
+    let mut bitmap = Vec::new();
+    for (index, bit) in bits.enumerate() {
+        if index % 8 == 0 {
+            bitmap.push(0);
+        }
+        if bit {
+            *bitmap.last_mut().expect("byte pushed above") |= 1 << (index % 8);
+        }
+    }
+    bitmap
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn result() -> QueryResult {
+        QueryResult::new(
+            vec![
+                "id".to_string(),
+                "score".to_string(),
+                "name".to_string(),
+                "active".to_string(),
+            ],
+            vec![
+                vec![
+                    DbValue::Integer(1),
+                    DbValue::Integer(2),
+                    DbValue::Text("dark".to_string()),
+                    DbValue::Bool(true),
+                ],
+                vec![
+                    DbValue::Integer(2),
+                    DbValue::Real(2.5),
+                    DbValue::Null,
+                    DbValue::Null,
+                ],
+                vec![
+                    DbValue::Integer(3),
+                    DbValue::Null,
+                    DbValue::Decimal("1.10".to_string()),
+                    DbValue::Bool(false),
+                ],
+            ],
+        )
+    }
+
+    #[test]
+    fn arrow_table_infers_one_schema_for_all_batches() {
+        let table = ArrowTable::from_result(&result(), Some(2));
+
+        let types = table
+            .fields()
+            .iter()
+            .map(ArrowField::data_type)
+            .collect::<Vec<_>>();
+        assert_eq!(
+            types,
+            vec![
+                ArrowDataType::Int64,
+                ArrowDataType::Float64,
+                ArrowDataType::LargeUtf8,
+                ArrowDataType::Boolean,
+            ]
+        );
+        assert_eq!(table.batches().len(), 2);
+        assert_eq!(table.num_rows(), 3);
+        let second = &table.batches()[1];
+        assert_eq!(
+            second.columns()[1].values(),
+            &ArrowValues::Float64(vec![0.0])
+        );
+        assert_eq!(second.columns()[1].validity(), Some(&[0_u8][..]));
+    }
+
+    #[test]
+    fn arrow_columns_use_bitmaps_and_large_offsets() {
+        let table = ArrowTable::from_result(&result(), None);
+        let batch = &table.batches()[0];
+
+        assert_eq!(
+            batch.columns()[2].values(),
+            &ArrowValues::LargeUtf8 {
+                offsets: vec![0, 4, 4, 8],
+                data: b"dark1.10".to_vec(),
+            }
+        );
+        assert_eq!(batch.columns()[2].validity(), Some(&[0b101_u8][..]));
+        assert_eq!(batch.columns()[2].null_count(), 1);
+        assert_eq!(
+            batch.columns()[3].values(),
+            &ArrowValues::Boolean(vec![0b001])
+        );
+        assert_eq!(batch.columns()[0].validity(), None);
+    }
+
+    #[test]
+    fn empty_results_export_one_empty_batch_of_null_columns() {
+        let table =
+            ArrowTable::from_result(&QueryResult::new(vec!["id".to_string()], vec![]), None);
+
+        assert_eq!(table.fields()[0].data_type(), ArrowDataType::Null);
+        assert_eq!(table.batches().len(), 1);
+        assert_eq!(table.num_rows(), 0);
+    }
+}
@@ -1,8 +1,14 @@
-use ormdantic_core::{IsolationLevel, OrmdanticResult, SavepointName, TransactionOptions};
+use ormdantic_core::{
+    IsolationLevel, OrmdanticError, OrmdanticResult, SavepointName, TransactionOptions,
+};
 use ormdantic_dialects::{AnyDialect, Dialect, DialectKind};
 
+use crate::stream::{ChunkSink, RowChunker};
 use crate::{drivers, DbValue, QueryResult, StatementResult};
 
+/// SQL Server rejects table value constructors with more rows than this.
+const MAX_ROWS_PER_INSERT: usize = 1_000;
+
 #[derive(Debug, Clone, Copy, PartialEq, Eq)]
 pub enum TransactionState {
     Idle,
@@ -64,11 +70,149 @@ impl NativeConnection {
         }
     }
 
+    /// Run a query and pass its rows to `sink` in chunks of at most `chunk_size`.
+    ///
+    /// PostgreSQL, MySQL/MariaDB, and SQLite decode rows incrementally, so
+    /// memory is bounded by the chunk size rather than the result size; the
+    /// other backends materialize the result and then chunk it. Returning
+    /// `Ok(false)` from `sink` stops reading.
+    pub fn query_chunks<'a>(
+        &mut self,
+        sql: &str,
+        params: &[DbValue],
+        chunk_size: usize,
+        sink: &'a mut ChunkSink<'a>,
+    ) -> OrmdanticResult<()> {
+        let chunker = RowChunker::new(chunk_size, sink);
+        match self {
+            Self::Sqlite(connection) => connection.query_chunks(sql, params, chunker),
+            Self::Postgres(connection) => connection.query_chunks(sql, params, chunker),
+            Self::MySql(connection) | Self::MariaDb(connection) => {
+                connection.query_chunks(sql, params, chunker)
+            }
+            Self::MsSql(_) | Self::Oracle(_) => chunker.drain(self.execute(sql, params)?),
+        }
+    }
+
+    /// Insert `rows` into `table` through the backend's bulk ingestion path.
+    ///
+    /// PostgreSQL streams `COPY ... FROM STDIN (FORMAT binary)`; SQLite and
+    /// Oracle re-execute one prepared single-row INSERT; MySQL/MariaDB and SQL
+    /// Server reuse one prepared multi-row INSERT sized to the dialect's bind
+    /// parameter limit. The load is only atomic inside a transaction, which
+    /// the caller owns.
+    pub fn bulk_insert(
+        &mut self,
+        table: &str,
+        columns: &[String],
+        rows: &[Vec<DbValue>],
+    ) -> OrmdanticResult<u64> {
+        if columns.is_empty() {
+            return Err(OrmdanticError::SqlCompile {
+                message: "bulk insert requires at least one column".to_string(),
+            });
+        }
+        if let Some(row) = rows.iter().find(|row| row.len() != columns.len()) {
+            return Err(OrmdanticError::SqlCompile {
+                message: format!(
+                    "bulk insert row has {} values for {} columns",
+                    row.len(),
+                    columns.len()
+                ),
+            });
+        }
+        if rows.is_empty() {
+            return Ok(0);
+        }
+        let dialect = AnyDialect::parse(self.dialect())?;
+        let table = table
+            .split('.')
+            .map(|part| dialect.quote_ident(part))
+            .collect::<Vec<_>>()
+            .join(".");
+        let column_list = columns
+            .iter()
+            .map(|column| dialect.quote_ident(column))
+            .collect::<Vec<_>>()
+            .join(", ");
+        let rows_per_statement = match self {
+            Self::Postgres(connection) => {
+                let insert = insert_values_sql(&dialect, &table, &column_list, columns.len(), 1);
+                let copy = format!("COPY {table} ({column_list}) FROM STDIN (FORMAT binary)");
+                return connection.copy_in(&copy, &insert, rows);
+            }
+            Self::Sqlite(_) | Self::Oracle(_) => 1,
+            Self::MySql(_) | Self::MariaDb(_) | Self::MsSql(_) => {
+                (dialect.max_bind_parameters().unwrap_or(usize::MAX) / columns.len())
+                    .clamp(1, MAX_ROWS_PER_INSERT)
+            }
+        };
+        let mut inserted = 0;
+        for chunk in rows.chunks(rows_per_statement) {
+            // Every full chunk renders the same SQL, so drivers reuse one
+            // prepared statement for the whole load.
+            let sql = insert_values_sql(&dialect, &table, &column_list, columns.len(), chunk.len());
+            let result = self.execute(&sql, &chunk.concat())?;
+            inserted += result.row_count().unwrap_or(chunk.len() as u64);
+        }
+        Ok(inserted)
+    }
+
     pub fn statement(&mut self, sql: &str, params: &[DbValue]) -> OrmdanticResult<StatementResult> {
         self.execute(sql, params)
             .map(StatementResult::from_query_result)
     }
 
+    /// Bound the number of prepared statements this connection keeps.
+    ///
+    /// PostgreSQL, MySQL/MariaDB, and SQLite reuse server-side or driver
+    /// statement handles for repeated SQL; other backends ignore the setting.
+    pub fn set_statement_cache_capacity(&mut self, capacity: usize) {
+        match self {
+            Self::Sqlite(connection) => connection.set_statement_cache_capacity(capacity),
+            Self::Postgres(connection) => connection.set_statement_cache_capacity(capacity),
+            Self::MySql(connection) | Self::MariaDb(connection) => {
+                connection.set_statement_cache_capacity(capacity)
+            }
+            Self::MsSql(_) | Self::Oracle(_) => {}
+        }
+    }
+
+    /// Discard prepared statements, e.g. after another connection changed the schema.
+    pub fn clear_statement_cache(&mut self) {
+        match self {
+            Self::Sqlite(connection) => connection.clear_statement_cache(),
+            Self::Postgres(connection) => connection.clear_statement_cache(),
+            Self::MySql(connection) | Self::MariaDb(connection) => {
+                connection.clear_statement_cache()
+            }
+            Self::MsSql(_) | Self::Oracle(_) => {}
+        }
+    }
+
+    /// Return and reset the `(hits, misses)` of the prepared statement cache.
+    ///
+    /// Backends without a statement cache always report `(0, 0)`.
+    pub fn take_statement_cache_counts(&mut self) -> (u64, u64) {
+        match self {
+            Self::Sqlite(connection) => connection.take_statement_cache_counts(),
+            Self::Postgres(connection) => connection.take_statement_cache_counts(),
+            Self::MySql(connection) | Self::MariaDb(connection) => {
+                connection.take_statement_cache_counts()
+            }
+            Self::MsSql(_) | Self::Oracle(_) => (0, 0),
+        }
+    }
+
+    /// Run a trivial round trip to confirm the connection is still usable.
+    pub fn ping(&mut self) -> OrmdanticResult<()> {
+        let sql = match self {
+            Self::Oracle(_) => "SELECT 1 FROM DUAL",
+            _ => "SELECT 1",
+        };
+        self.execute(sql, &[]).map(|_| ())
+    }
+
     pub fn begin(&mut self) -> OrmdanticResult<()> {
         match self {
             Self::MySql(connection) | Self::MariaDb(connection) => connection.begin(),
@@ -190,6 +334,26 @@ impl NativeConnection {
     }
 }
 
+fn insert_values_sql(
+    dialect: &AnyDialect,
+    table: &str,
+    column_list: &str,
+    width: usize,
+    rows: usize,
+) -> String {
+    let values = (0..rows)
+        .map(|row| {
+            let placeholders = (1..=width)
+                .map(|column| dialect.placeholder(row * width + column))
+                .collect::<Vec<_>>()
+                .join(", ");
+            format!("({placeholders})")
+        })
+        .collect::<Vec<_>>()
+        .join(", ");
+    format!("INSERT INTO {table} ({column_list}) VALUES {values}")
+}
+
 impl Connection for NativeConnection {
     fn execute(&mut self, sql: &str, params: &[DbValue]) -> OrmdanticResult<StatementResult> {
         self.statement(sql, params)
@@ -1,25 +1,89 @@
 use mysql::consts::ColumnType;
-use mysql::prelude::Queryable;
-use mysql::{Params, Pool, PooledConn, Row, Value};
+use mysql::prelude::{AsStatement, Queryable};
+use mysql::{Opts, OptsBuilder, Params, Pool, PooledConn, Row, Statement, Value};
 use ormdantic_core::OrmdanticResult;
 
+use crate::statement_cache::{
+    changes_schema, is_cacheable, StatementCache, DEFAULT_STATEMENT_CACHE_SIZE,
+};
+use crate::stream::RowChunker;
 use crate::url::normalize_driver_url;
 use crate::{sql_error, DbValue, QueryResult};
 
 pub struct MySqlConnection {
     connection: PooledConn,
+    statements: StatementCache<Statement>,
 }
 
 impl MySqlConnection {
     pub fn open(url: &str) -> OrmdanticResult<Self> {
-        let pool = Pool::new(normalize_driver_url(url).as_str()).map_err(sql_error)?;
+        let opts = Opts::from_url(&normalize_driver_url(url)).map_err(sql_error)?;
+        // Statements are cached by this connection so they can be closed on
+        // eviction and invalidated after schema changes.
+        let opts = OptsBuilder::from_opts(opts).stmt_cache_size(0);
+        let pool = Pool::new(opts).map_err(sql_error)?;
         Ok(Self {
             connection: pool.get_conn().map_err(sql_error)?,
+            statements: StatementCache::new(DEFAULT_STATEMENT_CACHE_SIZE),
         })
     }
 
     pub fn execute(&mut self, sql: &str, params: &[DbValue]) -> OrmdanticResult<QueryResult> {
-        execute_conn(&mut self.connection, sql, params)
+        if changes_schema(sql) {
+            self.clear_statement_cache();
+        }
+        if self.statements.capacity() == 0 || !is_cacheable(sql) {
+            return execute_conn(&mut self.connection, sql, sql, params);
+        }
+        let statement = self.prepared(sql)?;
+        let result = execute_conn(&mut self.connection, &statement, sql, params);
+        if result.is_err() {
+            if let Some(stale) = self.statements.remove(sql) {
+                let _ = self.connection.close(stale);
+            }
+        }
+        result
+    }
+
+    /// Read rows from the unbuffered binary result set one chunk at a time.
+    pub(crate) fn query_chunks(
+        &mut self,
+        sql: &str,
+        params: &[DbValue],
+        chunker: RowChunker<'_>,
+    ) -> OrmdanticResult<()> {
+        if self.statements.capacity() == 0 || !is_cacheable(sql) {
+            return stream_conn(&mut self.connection, sql, params, chunker);
+        }
+        let statement = self.prepared(sql)?;
+        stream_conn(&mut self.connection, &statement, params, chunker)
+    }
+
+    fn prepared(&mut self, sql: &str) -> OrmdanticResult<Statement> {
+        if let Some(statement) = self.statements.get(sql) {
+            return Ok(statement);
+        }
+        let statement = self.connection.prep(sql).map_err(sql_error)?;
+        if let Some(evicted) = self.statements.insert(sql, statement.clone()) {
+            let _ = self.connection.close(evicted);
+        }
+        Ok(statement)
+    }
+
+    pub fn set_statement_cache_capacity(&mut self, capacity: usize) {
+        for evicted in self.statements.set_capacity(capacity) {
+            let _ = self.connection.close(evicted);
+        }
+    }
+
+    pub fn clear_statement_cache(&mut self) {
+        for statement in self.statements.clear() {
+            let _ = self.connection.close(statement);
+        }
+    }
+
+    pub fn take_statement_cache_counts(&mut self) -> (u64, u64) {
+        self.statements.take_counts()
     }
 
     pub fn begin(&mut self) -> OrmdanticResult<()> {
@@ -60,14 +124,18 @@ pub fn execute_url(url: &str, sql: &str, params: &[DbValue]) -> OrmdanticResult<
     connection.execute(sql, params)
 }
 
-fn execute_conn(
+fn execute_conn<S>(
     conn: &mut PooledConn,
+    statement: S,
     sql: &str,
     params: &[DbValue],
-) -> OrmdanticResult<QueryResult> {
+) -> OrmdanticResult<QueryResult>
+where
+    S: AsStatement,
+{
     if crate::returns_rows(sql) {
         let result = conn
-            .exec_iter(sql, Params::Positional(mysql_params(params)))
+            .exec_iter(statement, Params::Positional(mysql_params(params)))
             .map_err(sql_error)?;
         let columns = result
             .columns()
@@ -80,12 +148,40 @@ fn execute_conn(
             .collect::<OrmdanticResult<Vec<_>>>()?;
         Ok(QueryResult::new(columns, rows))
     } else {
-        conn.exec_drop(sql, Params::Positional(mysql_params(params)))
+        conn.exec_drop(statement, Params::Positional(mysql_params(params)))
             .map_err(sql_error)?;
         Ok(QueryResult::affected(conn.affected_rows()))
     }
 }
 
+fn stream_conn<S>(
+    conn: &mut PooledConn,
+    statement: S,
+    params: &[DbValue],
+    mut chunker: RowChunker<'_>,
+) -> OrmdanticResult<()>
+where
+    S: AsStatement,
+{
+    let mut result = conn
+        .exec_iter(statement, Params::Positional(mysql_params(params)))
+        .map_err(sql_error)?;
+    chunker.set_columns(
+        result
+            .columns()
+            .as_ref()
+            .iter()
+            .map(|column| column.name_str().to_string())
+            .collect(),
+    );
+    for row in result.by_ref() {
+        if !chunker.push(mysql_row(row.map_err(sql_error)?))? {
+            return Ok(());
+        }
+    }
+    chunker.finish()
+}
+
 fn mysql_params(params: &[DbValue]) -> Vec<Value> {
     params
         .iter()
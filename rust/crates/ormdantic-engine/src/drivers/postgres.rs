@@ -1,25 +1,122 @@
 use ormdantic_core::{ExecutionErrorKind, OrmdanticError, OrmdanticResult};
+use postgres::binary_copy::BinaryCopyInWriter;
+use postgres::fallible_iterator::FallibleIterator;
 use postgres::types::private::BytesMut;
 use postgres::types::{to_sql_checked, FromSql, IsNull, ToSql, Type};
-use postgres::{Client, NoTls, Row};
+use postgres::{Client, NoTls, Row, Statement, ToStatement};
 use std::error::Error;
 
+use crate::statement_cache::{
+    changes_schema, is_cacheable, StatementCache, DEFAULT_STATEMENT_CACHE_SIZE,
+};
+use crate::stream::RowChunker;
 use crate::url::normalize_driver_url;
 use crate::{sql_error, DbValue, QueryResult};
 
 pub struct PostgresConnection {
     client: Client,
+    statements: StatementCache<Statement>,
 }
 
 impl PostgresConnection {
     pub fn open(url: &str) -> OrmdanticResult<Self> {
         Ok(Self {
             client: Client::connect(&normalize_driver_url(url), NoTls).map_err(postgres_error)?,
+            statements: StatementCache::new(DEFAULT_STATEMENT_CACHE_SIZE),
         })
     }
 
     pub fn execute(&mut self, sql: &str, params: &[DbValue]) -> OrmdanticResult<QueryResult> {
-        execute_client(&mut self.client, sql, params)
+        if changes_schema(sql) {
+            self.statements.clear();
+        }
+        if self.statements.capacity() == 0 || !is_cacheable(sql) {
+            return execute_client(&mut self.client, sql, sql, params);
+        }
+        let statement = self.prepared(sql)?;
+        let result = execute_client(&mut self.client, &statement, sql, params);
+        if result.is_err() {
+            // Re-prepare on the next call in case the cached plan went stale.
+            self.statements.remove(sql);
+        }
+        result
+    }
+
+    /// Decode rows as the server sends them instead of collecting the whole result.
+    pub(crate) fn query_chunks(
+        &mut self,
+        sql: &str,
+        params: &[DbValue],
+        mut chunker: RowChunker<'_>,
+    ) -> OrmdanticResult<()> {
+        let statement = self.prepared(sql)?;
+        chunker.set_columns(
+            statement
+                .columns()
+                .iter()
+                .map(|column| column.name().to_string())
+                .collect(),
+        );
+        let boxed = pg_params(params);
+        let refs = boxed.iter().map(|value| &**value as &(dyn ToSql + Sync));
+        let mut rows = self
+            .client
+            .query_raw(&statement, refs)
+            .map_err(postgres_error)?;
+        while let Some(row) = rows.next().map_err(postgres_error)? {
+            if !chunker.push(pg_row(&row))? {
+                return Ok(());
+            }
+        }
+        chunker.finish()
+    }
+
+    /// Stream rows through `copy` using the binary COPY format.
+    ///
+    /// Column types come from preparing the equivalent single-row `insert`,
+    /// so values are encoded exactly as a parameterized INSERT encodes them.
+    pub(crate) fn copy_in(
+        &mut self,
+        copy: &str,
+        insert: &str,
+        rows: &[Vec<DbValue>],
+    ) -> OrmdanticResult<u64> {
+        let types = self.prepared(insert)?.params().to_vec();
+        let writer = self.client.copy_in(copy).map_err(postgres_error)?;
+        let mut writer = BinaryCopyInWriter::new(writer, &types);
+        for row in rows {
+            let boxed = pg_params(row);
+            let refs = boxed
+                .iter()
+                .map(|value| &**value as &(dyn ToSql + Sync))
+                .collect::<Vec<_>>();
+            writer.write(&refs).map_err(postgres_error)?;
+        }
+        writer.finish().map_err(postgres_error)
+    }
+
+    fn prepared(&mut self, sql: &str) -> OrmdanticResult<Statement> {
+        if let Some(statement) = self.statements.get(sql) {
+            return Ok(statement);
+        }
+        let statement = self.client.prepare(sql).map_err(postgres_error)?;
+        if is_cacheable(sql) {
+            self.statements.insert(sql, statement.clone());
+        }
+        Ok(statement)
+    }
+
+    pub fn set_statement_cache_capacity(&mut self, capacity: usize) {
+        self.statements.set_capacity(capacity);
+    }
+
+    /// Drop cached statements; the server deallocates them as handles drop.
+    pub fn clear_statement_cache(&mut self) {
+        self.statements.clear();
+    }
+
+    pub fn take_statement_cache_counts(&mut self) -> (u64, u64) {
+        self.statements.take_counts()
     }
 }
 
@@ -28,21 +125,25 @@ pub fn execute_url(url: &str, sql: &str, params: &[DbValue]) -> OrmdanticResult<
     connection.execute(sql, params)
 }
 
-fn execute_client(
+fn execute_client<T>(
     client: &mut Client,
+    statement: &T,
     sql: &str,
     params: &[DbValue],
-) -> OrmdanticResult<QueryResult> {
+) -> OrmdanticResult<QueryResult>
+where
+    T: ?Sized + ToStatement,
+{
     let boxed = pg_params(params);
     let refs = boxed
         .iter()
         .map(|value| &**value as &(dyn ToSql + Sync))
         .collect::<Vec<_>>();
     if crate::returns_rows(sql) {
-        let rows = client.query(sql, &refs).map_err(postgres_error)?;
+        let rows = client.query(statement, &refs).map_err(postgres_error)?;
         Ok(rows_to_result(&rows))
     } else {
-        let row_count = client.execute(sql, &refs).map_err(postgres_error)?;
+        let row_count = client.execute(statement, &refs).map_err(postgres_error)?;
         Ok(QueryResult::affected(row_count))
     }
 }
@@ -99,19 +200,18 @@ fn rows_to_result(rows: &[Row]) -> QueryResult {
                 .collect::<Vec<_>>()
         })
         .unwrap_or_default();
-    let data = rows
-        .iter()
-        .map(|row| {
-            row.columns()
-                .iter()
-                .enumerate()
-                .map(|(idx, column)| pg_value(row, idx, column.type_()))
-                .collect::<Vec<_>>()
-        })
-        .collect();
+    let data = rows.iter().map(pg_row).collect();
     QueryResult::new(columns, data)
 }
 
+fn pg_row(row: &Row) -> Vec<DbValue> {
+    row.columns()
+        .iter()
+        .enumerate()
+        .map(|(idx, column)| pg_value(row, idx, column.type_()))
+        .collect()
+}
+
 fn pg_value(row: &Row, idx: usize, ty: &Type) -> DbValue {
     if *ty == Type::BOOL {
         nullable::<bool>(row, idx).map_or(DbValue::Null, DbValue::Bool)
@@ -2,26 +2,80 @@ use ormdantic_core::OrmdanticResult;
 use regex::Regex;
 use rusqlite::functions::FunctionFlags;
 use rusqlite::types::ValueRef;
-use rusqlite::{params_from_iter, Connection};
+use rusqlite::{params_from_iter, Connection, Statement};
 use std::cmp::Ordering;
 use std::io;
 
+use crate::statement_cache::{
+    changes_schema, is_cacheable, StatementCache, DEFAULT_STATEMENT_CACHE_SIZE,
+};
+use crate::stream::RowChunker;
 use crate::url::sqlite_path;
 use crate::{sql_error, DbValue, QueryResult};
 
 pub struct SqliteConnection {
     connection: Connection,
+    /// Mirror of rusqlite's prepared statement LRU, kept to count reuse.
+    statements: StatementCache<()>,
 }
 
 impl SqliteConnection {
     pub fn open(url: &str) -> OrmdanticResult<Self> {
         let connection = Connection::open(sqlite_path(url)).map_err(sql_error)?;
         register_sqlite_functions(&connection)?;
-        Ok(Self { connection })
+        connection.set_prepared_statement_cache_capacity(DEFAULT_STATEMENT_CACHE_SIZE);
+        Ok(Self {
+            connection,
+            statements: StatementCache::new(DEFAULT_STATEMENT_CACHE_SIZE),
+        })
     }
 
     pub fn execute(&mut self, sql: &str, params: &[DbValue]) -> OrmdanticResult<QueryResult> {
-        execute_connection(&mut self.connection, sql, params)
+        if changes_schema(sql) {
+            self.clear_statement_cache();
+        }
+        if self.statements.capacity() == 0 || !is_cacheable(sql) {
+            return execute_connection(&mut self.connection, sql, params);
+        }
+        self.record_prepared(sql);
+        let mut statement = self.connection.prepare_cached(sql).map_err(sql_error)?;
+        execute_statement(&mut statement, sql, params)
+    }
+
+    pub(crate) fn query_chunks(
+        &mut self,
+        sql: &str,
+        params: &[DbValue],
+        chunker: RowChunker<'_>,
+    ) -> OrmdanticResult<()> {
+        if self.statements.capacity() == 0 || !is_cacheable(sql) {
+            let mut statement = self.connection.prepare(sql).map_err(sql_error)?;
+            return stream_statement(&mut statement, params, chunker);
+        }
+        self.record_prepared(sql);
+        let mut statement = self.connection.prepare_cached(sql).map_err(sql_error)?;
+        stream_statement(&mut statement, params, chunker)
+    }
+
+    pub fn set_statement_cache_capacity(&mut self, capacity: usize) {
+        self.statements.set_capacity(capacity);
+        self.connection
+            .set_prepared_statement_cache_capacity(capacity);
+    }
+
+    pub fn clear_statement_cache(&mut self) {
+        self.statements.clear();
+        self.connection.flush_prepared_statement_cache();
+    }
+
+    pub fn take_statement_cache_counts(&mut self) -> (u64, u64) {
+        self.statements.take_counts()
+    }
+
+    fn record_prepared(&mut self, sql: &str) {
+        if self.statements.get(sql).is_none() {
+            self.statements.insert(sql, ());
+        }
     }
 }
 
@@ -34,9 +88,17 @@ pub fn execute_connection(
     connection: &mut Connection,
     sql: &str,
     params: &[DbValue],
+) -> OrmdanticResult<QueryResult> {
+    let mut statement = connection.prepare(sql).map_err(sql_error)?;
+    execute_statement(&mut statement, sql, params)
+}
+
+fn execute_statement(
+    statement: &mut Statement<'_>,
+    sql: &str,
+    params: &[DbValue],
 ) -> OrmdanticResult<QueryResult> {
     if crate::returns_rows(sql) {
-        let mut statement = connection.prepare(sql).map_err(sql_error)?;
         let columns = statement
             .column_names()
             .into_iter()
@@ -66,13 +128,52 @@ pub fn execute_connection(
             .map_err(sql_error)?;
         Ok(QueryResult::new(columns, rows))
     } else {
-        let row_count = connection
-            .execute(sql, params_from_iter(params.iter()))
+        let row_count = statement
+            .execute(params_from_iter(params.iter()))
             .map_err(sql_error)?;
         Ok(QueryResult::affected(row_count as u64))
     }
 }
 
+/// Step a statement row by row so only one chunk is buffered at a time.
+fn stream_statement(
+    statement: &mut Statement<'_>,
+    params: &[DbValue],
+    mut chunker: RowChunker<'_>,
+) -> OrmdanticResult<()> {
+    chunker.set_columns(
+        statement
+            .column_names()
+            .into_iter()
+            .map(ToString::to_string)
+            .collect(),
+    );
+    let column_decl_types = statement
+        .columns()
+        .into_iter()
+        .map(|column| column.decl_type().map(str::to_string))
+        .collect::<Vec<_>>();
+    let column_count = statement.column_count();
+    let mut rows = statement
+        .query(params_from_iter(params.iter()))
+        .map_err(sql_error)?;
+    while let Some(row) = rows.next().map_err(sql_error)? {
+        let mut values = Vec::with_capacity(column_count);
+        for idx in 0..column_count {
+            values.push(sqlite_value(
+                row.get_ref(idx).map_err(sql_error)?,
+                column_decl_types
+                    .get(idx)
+                    .and_then(|value| value.as_deref()),
+            ));
+        }
+        if !chunker.push(values)? {
+            return Ok(());
+        }
+    }
+    chunker.finish()
+}
+
 fn sqlite_value(value: ValueRef<'_>, decl_type: Option<&str>) -> DbValue {
     if sqlite_decl_type_is_decimal(decl_type) {
         return sqlite_decimal_value(value);
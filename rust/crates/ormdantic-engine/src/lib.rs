@@ -14,20 +14,27 @@
 //! assert!(runtime_capabilities().iter().any(|(name, _)| *name == "sqlite"));
 //! ```
 
+mod arrow;
 mod connection;
 mod drivers;
 mod migration_store;
+mod pool;
 mod reflection;
 mod result;
 mod runtime;
 mod statement;
+mod statement_cache;
+mod stream;
 mod url;
 mod value;
 
+pub use arrow::{ArrowColumn, ArrowDataType, ArrowField, ArrowTable, ArrowValues, RecordBatch};
 pub use connection::{Connection, NativeConnection, TransactionState};
 pub use migration_store::MigrationStore;
+pub use pool::{ConnectionPool, PoolConfig, PoolStatistics, PooledConnection};
 pub use reflection::{Inspector, Reflector};
 pub use result::QueryResult;
 pub use runtime::{execute_url, returns_rows, runtime_capabilities, sql_error};
 pub use statement::StatementResult;
+pub use stream::ChunkSink;
 pub use value::DbValue;
@@ -0,0 +1,804 @@
+use std::collections::{HashMap, HashSet, VecDeque};
+use std::ops::{Deref, DerefMut};
+use std::sync::{Arc, Condvar, Mutex, MutexGuard};
+use std::time::{Duration, Instant};
+
+use ormdantic_core::{ExecutionErrorKind, OrmdanticError, OrmdanticResult};
+use ormdantic_dialects::DialectKind;
+
+use crate::statement_cache::DEFAULT_STATEMENT_CACHE_SIZE;
+use crate::url::sqlite_path;
+use crate::NativeConnection;
+
+const DEFAULT_MAX_SIZE: usize = 10;
+const DEFAULT_ACQUIRE_TIMEOUT: Duration = Duration::from_secs(30);
+const DEFAULT_IDLE_TIMEOUT: Duration = Duration::from_secs(600);
+
+#[derive(Debug, Clone, PartialEq, Eq)]
+pub struct PoolConfig {
+    min_size: usize,
+    max_size: usize,
+    acquire_timeout: Duration,
+    idle_timeout: Option<Duration>,
+    pre_ping: bool,
+    statement_cache_size: usize,
+}
+
+impl PoolConfig {
+    /// Return backend-aware defaults for a database URL.
+    ///
+    /// SQLite defaults to a single connection so per-connection pragmas and
+    /// write locking behave exactly like the unpooled runtime; in-memory
+    /// databases are always capped at one connection because every SQLite
+    /// connection to `:memory:` opens a distinct database.
+    pub fn for_url(url: &str) -> Self {
+        let max_size = match DialectKind::parse(url) {
+            Ok(DialectKind::Sqlite) => 1,
+            _ => DEFAULT_MAX_SIZE,
+        };
+        Self {
+            min_size: 1,
+            max_size,
+            acquire_timeout: DEFAULT_ACQUIRE_TIMEOUT,
+            idle_timeout: Some(DEFAULT_IDLE_TIMEOUT),
+            pre_ping: false,
+            statement_cache_size: DEFAULT_STATEMENT_CACHE_SIZE,
+        }
+    }
+
+    pub fn with_min_size(mut self, min_size: usize) -> Self {
+        self.min_size = min_size;
+        self
+    }
+
+    pub fn with_max_size(mut self, max_size: usize) -> Self {
+        self.max_size = max_size;
+        self
+    }
+
+    pub fn with_acquire_timeout(mut self, acquire_timeout: Duration) -> Self {
+        self.acquire_timeout = acquire_timeout;
+        self
+    }
+
+    pub fn with_idle_timeout(mut self, idle_timeout: Option<Duration>) -> Self {
+        self.idle_timeout = idle_timeout;
+        self
+    }
+
+    pub fn with_pre_ping(mut self, pre_ping: bool) -> Self {
+        self.pre_ping = pre_ping;
+        self
+    }
+
+    /// Prepared statements kept per connection; `0` disables statement reuse.
+    pub fn with_statement_cache_size(mut self, statement_cache_size: usize) -> Self {
+        self.statement_cache_size = statement_cache_size;
+        self
+    }
+
+    pub fn min_size(&self) -> usize {
+        self.min_size
+    }
+
+    pub fn max_size(&self) -> usize {
+        self.max_size
+    }
+
+    pub fn acquire_timeout(&self) -> Duration {
+        self.acquire_timeout
+    }
+
+    pub fn idle_timeout(&self) -> Option<Duration> {
+        self.idle_timeout
+    }
+
+    pub fn pre_ping(&self) -> bool {
+        self.pre_ping
+    }
+
+    pub fn statement_cache_size(&self) -> usize {
+        self.statement_cache_size
+    }
+
+    fn normalized(mut self, url: &str) -> Self {
+        if is_sqlite_memory(url) {
+            self.max_size = 1;
+        }
+        self.max_size = self.max_size.max(1);
+        self.min_size = self.min_size.min(self.max_size);
+        self
+    }
+}
+
+#[derive(Debug, Clone, Default, PartialEq, Eq)]
+pub struct PoolStatistics {
+    pub min_size: usize,
+    pub max_size: usize,
+    pub size: usize,
+    pub idle: usize,
+    pub in_use: usize,
+    pub pinned: bool,
+    pub acquired: u64,
+    pub waited: u64,
+    pub wait_time: Duration,
+    pub max_wait_time: Duration,
+    pub timeouts: u64,
+    pub created: u64,
+    pub closed: u64,
+    pub health_check_failures: u64,
+}
+
+struct IdleConnection {
+    connection: NativeConnection,
+    since: Instant,
+    schema_generation: u64,
+}
+
+#[derive(Default)]
+struct PoolState {
+    idle: VecDeque<IdleConnection>,
+    /// Connections of open transactions that no statement is using, by pin token.
+    parked: HashMap<u64, (NativeConnection, u64)>,
+    /// Pin tokens of open transactions.
+    pins: HashSet<u64>,
+    next_pin: u64,
+    /// Connections held by open row streams.
+    streams: usize,
+    /// Pin tokens of transactions whose connection an open row stream holds.
+    streaming_pins: HashSet<u64>,
+    schema_generation: u64,
+    size: usize,
+    acquired: u64,
+    waited: u64,
+    wait_time: Duration,
+    max_wait_time: Duration,
+    timeouts: u64,
+    created: u64,
+    closed: u64,
+    health_check_failures: u64,
+}
+
+impl PoolState {
+    fn reap_idle(&mut self, config: &PoolConfig) -> Vec<NativeConnection> {
+        let Some(idle_timeout) = config.idle_timeout else {
+            return Vec::new();
+        };
+        let mut reaped = Vec::new();
+        // The oldest idle connections sit at the front of the queue.
+        while self.size > config.min_size {
+            match self.idle.front() {
+                Some(idle) if idle.since.elapsed() >= idle_timeout => {
+                    if let Some(idle) = self.idle.pop_front() {
+                        reaped.push(idle.connection);
+                        self.size -= 1;
+                        self.closed += 1;
+                    }
+                }
+                _ => break,
+            }
+        }
+        reaped
+    }
+
+    /// Describe why no connection can be freed for an unpinned checkout when
+    /// open transactions and row streams reserve every connection.
+    fn exhausted_by_reservations(&self, max_size: usize) -> Option<OrmdanticError> {
+        // A stream inside a transaction holds that transaction's connection.
+        let streams = self.streams - self.streaming_pins.len();
+        if self.pins.len() + streams < max_size {
+            return None;
+        }
+        let message = if self.pins.is_empty() {
+            format!(
+                "all {max_size} pooled connections are held by open row streams; \
+                 exhaust or close a stream before running other statements"
+            )
+        } else {
+            format!(
+                "pool exhausted by open transactions: all {max_size} pooled connections \
+                 are reserved by open transactions or row streams; run the statement \
+                 inside the transaction or after it ends"
+            )
+        };
+        Some(OrmdanticError::ExecutionError {
+            kind: ExecutionErrorKind::Connection,
+            message,
+        })
+    }
+
+    fn record_checkout(&mut self, waited: Duration, had_to_wait: bool) {
+        self.acquired += 1;
+        if had_to_wait {
+            self.waited += 1;
+            self.wait_time += waited;
+            self.max_wait_time = self.max_wait_time.max(waited);
+        }
+    }
+}
+
+enum Checkout {
+    Idle(NativeConnection, u64),
+    Open,
+}
+
+/// A bounded pool of native connections shared by a database and its tables.
+///
+/// A pinned connection is reserved for its transaction: only checkouts made
+/// with its pin token through [`ConnectionPool::acquire_pinned`] reach it, and
+/// every other checkout keeps using the remaining connections. When open
+/// transactions and row streams reserve every connection, unpinned checkouts
+/// fail immediately instead of waiting for one of them to end.
+pub struct ConnectionPool {
+    url: String,
+    config: PoolConfig,
+    state: Mutex<PoolState>,
+    available: Condvar,
+}
+
+impl ConnectionPool {
+    pub fn open(url: &str, config: PoolConfig) -> OrmdanticResult<Arc<Self>> {
+        let config = config.normalized(url);
+        let pool = Arc::new(Self {
+            url: url.to_string(),
+            config,
+            state: Mutex::new(PoolState::default()),
+            available: Condvar::new(),
+        });
+        // Open eagerly so an unreachable database fails at initialization.
+        let warm = pool.config.min_size.max(1);
+        let mut state = pool.lock_state()?;
+        for _ in 0..warm {
+            let connection = pool.open_connection()?;
+            state.idle.push_back(IdleConnection {
+                connection,
+                since: Instant::now(),
+                schema_generation: 0,
+            });
+            state.size += 1;
+            state.created += 1;
+        }
+        drop(state);
+        Ok(pool)
+    }
+
+    pub fn url(&self) -> &str {
+        &self.url
+    }
+
+    pub fn config(&self) -> &PoolConfig {
+        &self.config
+    }
+
+    pub fn acquire(self: &Arc<Self>) -> OrmdanticResult<PooledConnection> {
+        let started = Instant::now();
+        let deadline = started + self.config.acquire_timeout;
+        let mut had_to_wait = false;
+        // Reaped connections are closed after the pool lock is released.
+        let mut reaped = Vec::new();
+        let mut state = self.lock_state()?;
+        let checkout = loop {
+            reaped.extend(state.reap_idle(&self.config));
+            if let Some(idle) = state.idle.pop_back() {
+                break Checkout::Idle(idle.connection, idle.schema_generation);
+            }
+            if state.size < self.config.max_size {
+                state.size += 1;
+                break Checkout::Open;
+            }
+            if let Some(error) = state.exhausted_by_reservations(self.config.max_size) {
+                // Waiting could only succeed once a stream closes or a
+                // transaction ends, which the caller may be waiting on itself.
+                return Err(error);
+            }
+            had_to_wait = true;
+            state = self.wait(state, deadline)?;
+        };
+        state.record_checkout(started.elapsed(), had_to_wait);
+        let schema_generation = state.schema_generation;
+        drop(state);
+        drop(reaped);
+
+        match checkout {
+            Checkout::Idle(mut connection, generation) => {
+                if generation != schema_generation {
+                    connection.clear_statement_cache();
+                }
+                if self.config.pre_ping && connection.ping().is_err() {
+                    drop(connection);
+                    {
+                        let mut state = self.lock_state()?;
+                        state.health_check_failures += 1;
+                        state.closed += 1;
+                    }
+                    return self.open_reserved();
+                }
+                Ok(self.guard(connection, None, schema_generation))
+            }
+            Checkout::Open => self.open_reserved(),
+        }
+    }
+
+    /// Check out the connection pinned under `token` by an open transaction.
+    ///
+    /// Waits while another statement of the same transaction is using it and
+    /// fails once the transaction has ended.
+    pub fn acquire_pinned(self: &Arc<Self>, token: u64) -> OrmdanticResult<PooledConnection> {
+        let started = Instant::now();
+        let deadline = started + self.config.acquire_timeout;
+        let mut had_to_wait = false;
+        let mut state = self.lock_state()?;
+        let (mut connection, generation) = loop {
+            if let Some(parked) = state.parked.remove(&token) {
+                break parked;
+            }
+            if !state.pins.contains(&token) {
+                return Err(OrmdanticError::ExecutionError {
+                    kind: ExecutionErrorKind::Connection,
+                    message: "the pinned transaction has already ended".to_string(),
+                });
+            }
+            if state.streaming_pins.contains(&token) {
+                return Err(OrmdanticError::ExecutionError {
+                    kind: ExecutionErrorKind::Connection,
+                    message: "the transaction's connection is held by an open row stream; \
+                              exhaust or close the stream before running other statements \
+                              in the transaction"
+                        .to_string(),
+                });
+            }
+            had_to_wait = true;
+            state = self.wait(state, deadline)?;
+        };
+        state.record_checkout(started.elapsed(), had_to_wait);
+        let schema_generation = state.schema_generation;
+        drop(state);
+        if generation != schema_generation {
+            connection.clear_statement_cache();
+        }
+        Ok(self.guard(connection, Some(token), schema_generation))
+    }
+
+    /// Check out the connection of the transaction pinned under `pin`, or a
+    /// free pooled connection when no pin token is given.
+    pub fn acquire_for(self: &Arc<Self>, pin: Option<u64>) -> OrmdanticResult<PooledConnection> {
+        match pin {
+            Some(token) => self.acquire_pinned(token),
+            None => self.acquire(),
+        }
+    }
+
+    /// Check out a connection, like [`ConnectionPool::acquire_for`], that an
+    /// open row stream holds until it is exhausted or closed.
+    ///
+    /// Checkouts that could only be served by a connection a stream holds
+    /// fail immediately instead of waiting for the stream to close.
+    pub fn acquire_stream(self: &Arc<Self>, pin: Option<u64>) -> OrmdanticResult<PooledConnection> {
+        let mut connection = self.acquire_for(pin)?;
+        let mut state = self.lock_state()?;
+        state.streams += 1;
+        if let Some(token) = pin {
+            state.streaming_pins.insert(token);
+        }
+        connection.streaming = true;
+        Ok(connection)
+    }
+
+    /// Invalidate prepared statements on every pooled connection.
+    ///
+    /// Call after DDL or migrations; each connection drops its cached
+    /// statements the next time it is checked out.
+    pub fn invalidate_statements(&self) -> OrmdanticResult<()> {
+        self.lock_state()?.schema_generation += 1;
+        Ok(())
+    }
+
+    /// Drop idle connections that outlived the idle timeout.
+    pub fn reap_idle(&self) -> OrmdanticResult<usize> {
+        let reaped = self.lock_state()?.reap_idle(&self.config);
+        Ok(reaped.len())
+    }
+
+    pub fn statistics(&self) -> OrmdanticResult<PoolStatistics> {
+        let state = self.lock_state()?;
+        Ok(PoolStatistics {
+            min_size: self.config.min_size,
+            max_size: self.config.max_size,
+            size: state.size,
+            idle: state.idle.len(),
+            in_use: state.size - state.idle.len() - state.parked.len(),
+            pinned: !state.pins.is_empty(),
+            acquired: state.acquired,
+            waited: state.waited,
+            wait_time: state.wait_time,
+            max_wait_time: state.max_wait_time,
+            timeouts: state.timeouts,
+            created: state.created,
+            closed: state.closed,
+            health_check_failures: state.health_check_failures,
+        })
+    }
+
+    fn open_connection(&self) -> OrmdanticResult<NativeConnection> {
+        let mut connection = NativeConnection::open(&self.url)?;
+        connection.set_statement_cache_capacity(self.config.statement_cache_size);
+        Ok(connection)
+    }
+
+    fn open_reserved(self: &Arc<Self>) -> OrmdanticResult<PooledConnection> {
+        match self.open_connection() {
+            Ok(connection) => {
+                let schema_generation = {
+                    let mut state = self.lock_state()?;
+                    state.created += 1;
+                    state.schema_generation
+                };
+                Ok(self.guard(connection, None, schema_generation))
+            }
+            Err(error) => {
+                self.lock_state()?.size -= 1;
+                self.available.notify_one();
+                Err(error)
+            }
+        }
+    }
+
+    fn guard(
+        self: &Arc<Self>,
+        connection: NativeConnection,
+        pin: Option<u64>,
+        schema_generation: u64,
+    ) -> PooledConnection {
+        PooledConnection {
+            pool: Arc::clone(self),
+            connection: Some(connection),
+            schema_generation,
+            pin,
+            pinned: pin.is_some(),
+            streaming: false,
+            discard: false,
+        }
+    }
+
+    fn lock_state(&self) -> OrmdanticResult<MutexGuard<'_, PoolState>> {
+        self.state.lock().map_err(|_| pool_poisoned())
+    }
+
+    /// Wait for a connection to be released, failing once `deadline` passes.
+    fn wait<'a>(
+        &'a self,
+        mut state: MutexGuard<'a, PoolState>,
+        deadline: Instant,
+    ) -> OrmdanticResult<MutexGuard<'a, PoolState>> {
+        let now = Instant::now();
+        if now >= deadline {
+            state.timeouts += 1;
+            return Err(OrmdanticError::ExecutionError {
+                kind: ExecutionErrorKind::Timeout,
+                message: format!(
+                    "timed out after {:.3}s waiting for a pooled connection",
+                    self.config.acquire_timeout.as_secs_f64()
+                ),
+            });
+        }
+        Ok(self
+            .available
+            .wait_timeout(state, deadline - now)
+            .map_err(|_| pool_poisoned())?
+            .0)
+    }
+
+    fn release(&self, guard: &mut PooledConnection) {
+        let Some(connection) = guard.connection.take() else {
+            return;
+        };
+        let Ok(mut state) = self.state.lock() else {
+            return;
+        };
+        if guard.streaming {
+            state.streams -= 1;
+            if let Some(token) = guard.pin {
+                state.streaming_pins.remove(&token);
+            }
+        }
+        match (guard.pin, guard.pinned && !guard.discard) {
+            (Some(token), true) => {
+                state
+                    .parked
+                    .insert(token, (connection, guard.schema_generation));
+                self.available.notify_all();
+                return;
+            }
+            (Some(token), false) => {
+                state.pins.remove(&token);
+            }
+            (None, _) => {}
+        }
+        if guard.discard {
+            state.size -= 1;
+            state.closed += 1;
+            drop(state);
+            drop(connection);
+        } else {
+            state.idle.push_back(IdleConnection {
+                connection,
+                since: Instant::now(),
+                schema_generation: guard.schema_generation,
+            });
+        }
+        self.available.notify_all();
+    }
+}
+
+/// A connection checked out from a [`ConnectionPool`].
+///
+/// The connection returns to the pool when the guard is dropped.
+pub struct PooledConnection {
+    pool: Arc<ConnectionPool>,
+    connection: Option<NativeConnection>,
+    schema_generation: u64,
+    /// Token of the transaction this connection is reserved for.
+    pin: Option<u64>,
+    /// Whether the connection stays reserved when the guard drops.
+    pinned: bool,
+    /// Whether an open row stream holds the connection.
+    streaming: bool,
+    discard: bool,
+}
+
+impl PooledConnection {
+    /// Reserve this connection for checkouts made with the returned token.
+    ///
+    /// The reservation lasts until a guard holding the connection is
+    /// unpinned or discarded.
+    pub fn pin(&mut self) -> OrmdanticResult<u64> {
+        if let Some(token) = self.pin {
+            self.pinned = true;
+            return Ok(token);
+        }
+        let mut state = self.pool.lock_state()?;
+        state.next_pin += 1;
+        let token = state.next_pin;
+        state.pins.insert(token);
+        self.pin = Some(token);
+        self.pinned = true;
+        Ok(token)
+    }
+
+    /// Return this connection to the shared idle set when the guard drops.
+    pub fn unpin(&mut self) {
+        self.pinned = false;
+    }
+
+    /// Close this connection instead of returning it to the pool.
+    pub fn discard(&mut self) {
+        self.discard = true;
+    }
+
+    pub fn is_pinned(&self) -> bool {
+        self.pinned
+    }
+}
+
+impl Deref for PooledConnection {
+    type Target = NativeConnection;
+
+    fn deref(&self) -> &Self::Target {
+        self.connection
+            .as_ref()
+            .expect("pooled connection is present until drop")
+    }
+}
+
+impl DerefMut for PooledConnection {
+    fn deref_mut(&mut self) -> &mut Self::Target {
+        self.connection
+            .as_mut()
+            .expect("pooled connection is present until drop")
+    }
+}
+
+impl Drop for PooledConnection {
+    fn drop(&mut self) {
+        let pool = Arc::clone(&self.pool);
+        pool.release(self);
+    }
+}
+
+fn is_sqlite_memory(url: &str) -> bool {
+    matches!(DialectKind::parse(url), Ok(DialectKind::Sqlite)) && sqlite_path(url) == ":memory:"
+}
+
+fn pool_poisoned() -> OrmdanticError {
+    OrmdanticError::ExecutionError {
+        kind: ExecutionErrorKind::Connection,
+        message: "native connection pool lock poisoned".to_string(),
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::{ConnectionPool, PoolConfig};
+    use std::time::Duration;
+
+    fn memory_pool(config: PoolConfig) -> std::sync::Arc<ConnectionPool> {
+        ConnectionPool::open("sqlite:///:memory:", config).expect("sqlite memory pool should open")
+    }
+
+    #[test]
+    fn checkouts_blocked_by_open_streams_fail_without_waiting() {
+        let pool = memory_pool(
+            PoolConfig::for_url("sqlite:///:memory:").with_acquire_timeout(Duration::from_secs(30)),
+        );
+
+        let stream = pool.acquire_stream(None).unwrap();
+        let started = std::time::Instant::now();
+        assert!(pool.acquire().is_err());
+        assert!(started.elapsed() < Duration::from_secs(1));
+        drop(stream);
+
+        let token = pool.acquire().unwrap().pin().unwrap();
+        let stream = pool.acquire_stream(Some(token)).unwrap();
+        assert!(pool.acquire_pinned(token).is_err());
+        drop(stream);
+        assert!(pool.acquire_pinned(token).is_ok());
+    }
+
+    #[test]
+    fn checkouts_blocked_by_open_transactions_fail_without_waiting() {
+        let pool = memory_pool(
+            PoolConfig::for_url("sqlite:///:memory:").with_acquire_timeout(Duration::from_secs(30)),
+        );
+        assert_eq!(pool.config().max_size(), 1);
+
+        let token = pool.acquire().unwrap().pin().unwrap();
+        let started = std::time::Instant::now();
+        let error = pool
+            .acquire()
+            .err()
+            .expect("unpinned checkout should fail while the transaction is open");
+        assert!(started.elapsed() < Duration::from_secs(1));
+        assert!(error
+            .to_string()
+            .contains("pool exhausted by open transactions"));
+        assert_eq!(pool.statistics().unwrap().timeouts, 0);
+
+        pool.acquire_pinned(token).unwrap().unpin();
+        assert!(pool.acquire().is_ok());
+    }
+
+    #[test]
+    fn sqlite_memory_pool_is_capped_at_one_connection() {
+        let pool = memory_pool(
+            PoolConfig::for_url("sqlite:///:memory:")
+                .with_min_size(4)
+                .with_max_size(8),
+        );
+
+        let statistics = pool.statistics().unwrap();
+        assert_eq!(statistics.max_size, 1);
+        assert_eq!(statistics.min_size, 1);
+        assert_eq!(statistics.size, 1);
+    }
+
+    #[test]
+    fn acquire_times_out_when_pool_is_exhausted() {
+        let pool = memory_pool(
+            PoolConfig::for_url("sqlite:///:memory:")
+                .with_acquire_timeout(Duration::from_millis(10)),
+        );
+        let held = pool.acquire().unwrap();
+
+        let error = pool
+            .acquire()
+            .err()
+            .expect("second checkout should time out");
+
+        assert!(error
+            .to_string()
+            .contains("waiting for a pooled connection"));
+        drop(held);
+        assert!(pool.acquire().is_ok());
+        let statistics = pool.statistics().unwrap();
+        assert_eq!(statistics.timeouts, 1);
+        assert_eq!(statistics.acquired, 2);
+    }
+
+    #[test]
+    fn pinned_connection_serves_only_its_token_until_unpinned() {
+        let url = format!(
+            "sqlite:///{}",
+            std::env::temp_dir()
+                .join(format!("ormdantic_pool_pin_{}.sqlite3", std::process::id()))
+                .display()
+        );
+        let pool = ConnectionPool::open(
+            &url,
+            PoolConfig::for_url(&url)
+                .with_max_size(2)
+                .with_acquire_timeout(Duration::from_millis(10)),
+        )
+        .unwrap();
+        let token = {
+            let mut connection = pool.acquire().unwrap();
+            connection
+                .execute("CREATE TEMP TABLE pinned_marker (id INTEGER)", &[])
+                .unwrap();
+            connection.pin().unwrap()
+        };
+        {
+            let mut unrelated = pool.acquire().unwrap();
+            assert!(!unrelated.is_pinned());
+            assert!(unrelated
+                .execute("SELECT id FROM pinned_marker", &[])
+                .is_err());
+        }
+        {
+            let mut connection = pool.acquire_pinned(token).unwrap();
+            assert!(connection.is_pinned());
+            assert!(connection
+                .execute("SELECT id FROM pinned_marker", &[])
+                .is_ok());
+            assert!(pool.statistics().unwrap().pinned);
+            connection.unpin();
+        }
+
+        assert!(pool.acquire_pinned(token).is_err());
+        let statistics = pool.statistics().unwrap();
+        assert!(!statistics.pinned);
+        assert_eq!(statistics.idle, 2);
+        assert_eq!(statistics.in_use, 0);
+        let _ = std::fs::remove_file(url.trim_start_matches("sqlite:///"));
+    }
+
+    #[test]
+    fn idle_connections_above_min_size_are_reaped() {
+        let url = format!(
+            "sqlite:///{}",
+            std::env::temp_dir()
+                .join(format!(
+                    "ormdantic_pool_reap_{}.sqlite3",
+                    std::process::id()
+                ))
+                .display()
+        );
+        let pool = ConnectionPool::open(
+            &url,
+            PoolConfig::for_url(&url)
+                .with_max_size(2)
+                .with_idle_timeout(Some(Duration::ZERO)),
+        )
+        .unwrap();
+        let first = pool.acquire().unwrap();
+        let second = pool.acquire().unwrap();
+        drop(first);
+        drop(second);
+
+        assert_eq!(pool.reap_idle().unwrap(), 1);
+        let statistics = pool.statistics().unwrap();
+        assert_eq!(statistics.size, 1);
+        assert_eq!(statistics.closed, 1);
+        let _ = std::fs::remove_file(url.trim_start_matches("sqlite:///"));
+    }
+
+    #[test]
+    fn invalidated_statements_are_dropped_on_next_checkout() {
+        let pool =
+            memory_pool(PoolConfig::for_url("sqlite:///:memory:").with_statement_cache_size(4));
+        {
+            let mut connection = pool.acquire().unwrap();
+            connection
+                .execute("CREATE TABLE cached (id INTEGER)", &[])
+                .unwrap();
+            connection.execute("SELECT id FROM cached", &[]).unwrap();
+        }
+        pool.invalidate_statements().unwrap();
+
+        let mut connection = pool.acquire().unwrap();
+        connection
+            .execute("ALTER TABLE cached ADD COLUMN name TEXT", &[])
+            .unwrap();
+        let result = connection.execute("SELECT * FROM cached", &[]).unwrap();
+        assert_eq!(result.columns(), &["id".to_string(), "name".to_string()]);
+    }
+}
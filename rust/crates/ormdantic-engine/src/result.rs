@@ -48,4 +48,8 @@ impl QueryResult {
     pub fn row_count(&self) -> Option<u64> {
         self.row_count
     }
+
+    pub fn into_rows(self) -> Vec<Vec<DbValue>> {
+        self.rows
+    }
 }
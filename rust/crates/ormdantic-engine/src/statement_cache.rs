@@ -0,0 +1,179 @@
+use std::collections::HashMap;
+
+pub(crate) const DEFAULT_STATEMENT_CACHE_SIZE: usize = 128;
+
+/// Per-connection least-recently-used cache of prepared statement handles.
+///
+/// Drivers own the handles; evicted and cleared handles are returned to the
+/// caller so drivers that need an explicit server round trip can close them.
+/// Lookups are counted so callers can report the cache hit rate.
+pub(crate) struct StatementCache<S> {
+    capacity: usize,
+    entries: HashMap<String, (S, u64)>,
+    tick: u64,
+    hits: u64,
+    misses: u64,
+}
+
+impl<S: Clone> StatementCache<S> {
+    pub(crate) fn new(capacity: usize) -> Self {
+        Self {
+            capacity,
+            entries: HashMap::new(),
+            tick: 0,
+            hits: 0,
+            misses: 0,
+        }
+    }
+
+    pub(crate) fn capacity(&self) -> usize {
+        self.capacity
+    }
+
+    pub(crate) fn get(&mut self, sql: &str) -> Option<S> {
+        self.tick += 1;
+        let tick = self.tick;
+        let Some((statement, last_used)) = self.entries.get_mut(sql) else {
+            self.misses += 1;
+            return None;
+        };
+        self.hits += 1;
+        *last_used = tick;
+        Some(statement.clone())
+    }
+
+    /// Return the `(hits, misses)` counted since the last call and reset them.
+    pub(crate) fn take_counts(&mut self) -> (u64, u64) {
+        (
+            std::mem::take(&mut self.hits),
+            std::mem::take(&mut self.misses),
+        )
+    }
+
+    /// Cache `statement` for `sql`, returning the handle it displaced, if any.
+    pub(crate) fn insert(&mut self, sql: &str, statement: S) -> Option<S> {
+        if self.capacity == 0 {
+            return None;
+        }
+        let mut evicted = None;
+        if self.entries.len() >= self.capacity && !self.entries.contains_key(sql) {
+            let oldest = self
+                .entries
+                .iter()
+                .min_by_key(|(_, (_, last_used))| *last_used)
+                .map(|(sql, _)| sql.clone());
+            if let Some(oldest) = oldest {
+                evicted = self.entries.remove(&oldest).map(|(statement, _)| statement);
+            }
+        }
+        self.tick += 1;
+        self.entries
+            .insert(sql.to_string(), (statement, self.tick))
+            .map(|(statement, _)| statement)
+            .or(evicted)
+    }
+
+    pub(crate) fn remove(&mut self, sql: &str) -> Option<S> {
+        self.entries.remove(sql).map(|(statement, _)| statement)
+    }
+
+    pub(crate) fn set_capacity(&mut self, capacity: usize) -> Vec<S> {
+        self.capacity = capacity;
+        let mut evicted = Vec::new();
+        while self.entries.len() > self.capacity {
+            let oldest = self
+                .entries
+                .iter()
+                .min_by_key(|(_, (_, last_used))| *last_used)
+                .map(|(sql, _)| sql.clone());
+            match oldest.and_then(|sql| self.remove(&sql)) {
+                Some(statement) => evicted.push(statement),
+                None => break,
+            }
+        }
+        evicted
+    }
+
+    pub(crate) fn clear(&mut self) -> Vec<S> {
+        self.entries
+            .drain()
+            .map(|(_, (statement, _))| statement)
+            .collect()
+    }
+}
+
+/// Whether a statement is worth keeping prepared across calls.
+///
+/// Transaction control and savepoint statements are cheap and often carry
+/// generated names, so only DML and queries are cached.
+pub(crate) fn is_cacheable(sql: &str) -> bool {
+    matches!(
+        first_keyword(sql).as_str(),
+        "select" | "with" | "insert" | "update" | "delete" | "merge"
+    )
+}
+
+/// Whether a statement may change the shape of tables other statements use.
+pub(crate) fn changes_schema(sql: &str) -> bool {
+    matches!(
+        first_keyword(sql).as_str(),
+        "create" | "alter" | "drop" | "truncate" | "rename" | "comment"
+    )
+}
+
+fn first_keyword(sql: &str) -> String {
+    sql.split_whitespace()
+        .next()
+        .unwrap_or_default()
+        .to_ascii_lowercase()
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn statement_cache_evicts_least_recently_used_sql() {
+        let mut cache = StatementCache::new(2);
+        cache.insert("SELECT 1", 1);
+        cache.insert("SELECT 2", 2);
+        assert_eq!(cache.get("SELECT 1"), Some(1));
+
+        assert_eq!(cache.insert("SELECT 3", 3), Some(2));
+        assert_eq!(cache.get("SELECT 2"), None);
+        assert_eq!(cache.get("SELECT 1"), Some(1));
+        assert_eq!(cache.set_capacity(1), vec![3]);
+        assert_eq!(cache.clear(), vec![1]);
+    }
+
+    #[test]
+    fn statement_cache_counts_hits_and_misses_until_taken() {
+        let mut cache = StatementCache::new(2);
+        assert_eq!(cache.get("SELECT 1"), None);
+        cache.insert("SELECT 1", 1);
+        cache.get("SELECT 1");
+        cache.get("SELECT 1");
+
+        assert_eq!(cache.take_counts(), (2, 1));
+        assert_eq!(cache.take_counts(), (0, 0));
+    }
+
+    #[test]
+    fn statement_cache_with_zero_capacity_stores_nothing() {
+        let mut cache = StatementCache::new(0);
+
+        assert_eq!(cache.insert("SELECT 1", 1), None);
+        assert_eq!(cache.get("SELECT 1"), None);
+    }
+
+    #[test]
+    fn statement_classification_separates_dml_from_schema_changes() {
+        assert!(is_cacheable("  select * from t"));
+        assert!(is_cacheable("INSERT INTO t VALUES (?)"));
+        assert!(!is_cacheable("SAVEPOINT sp_1"));
+        assert!(!is_cacheable("CREATE TABLE t (id INTEGER)"));
+        assert!(changes_schema("ALTER TABLE t ADD COLUMN name TEXT"));
+        assert!(changes_schema("drop table t"));
+        assert!(!changes_schema("SELECT 1"));
+    }
+}
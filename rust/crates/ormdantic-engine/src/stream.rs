@@ -0,0 +1,87 @@
+use ormdantic_core::OrmdanticResult;
+
+use crate::{DbValue, QueryResult};
+
+/// Callback receiving one chunk of rows; return `Ok(false)` to stop reading.
+pub type ChunkSink<'a> = dyn FnMut(QueryResult) -> OrmdanticResult<bool> + 'a;
+
+/// Accumulates decoded rows and hands them to a sink in bounded chunks.
+pub(crate) struct RowChunker<'a> {
+    chunk_size: usize,
+    columns: Vec<String>,
+    rows: Vec<Vec<DbValue>>,
+    sink: &'a mut ChunkSink<'a>,
+}
+
+impl<'a> RowChunker<'a> {
+    pub(crate) fn new(chunk_size: usize, sink: &'a mut ChunkSink<'a>) -> Self {
+        let chunk_size = chunk_size.max(1);
+        Self {
+            chunk_size,
+            columns: Vec::new(),
+            rows: Vec::with_capacity(chunk_size),
+            sink,
+        }
+    }
+
+    pub(crate) fn set_columns(&mut self, columns: Vec<String>) {
+        self.columns = columns;
+    }
+
+    /// Buffer `row`, flushing a full chunk; `Ok(false)` means the sink stopped.
+    pub(crate) fn push(&mut self, row: Vec<DbValue>) -> OrmdanticResult<bool> {
+        self.rows.push(row);
+        if self.rows.len() >= self.chunk_size {
+            return self.flush();
+        }
+        Ok(true)
+    }
+
+    pub(crate) fn finish(mut self) -> OrmdanticResult<()> {
+        if !self.rows.is_empty() {
+            self.flush()?;
+        }
+        Ok(())
+    }
+
+    /// Chunk an already materialized result for drivers without cursors.
+    pub(crate) fn drain(mut self, result: QueryResult) -> OrmdanticResult<()> {
+        self.set_columns(result.columns().to_vec());
+        for row in result.into_rows() {
+            if !self.push(row)? {
+                return Ok(());
+            }
+        }
+        self.finish()
+    }
+
+    fn flush(&mut self) -> OrmdanticResult<bool> {
+        let rows = std::mem::replace(&mut self.rows, Vec::with_capacity(self.chunk_size));
+        (self.sink)(QueryResult::new(self.columns.clone(), rows))
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::RowChunker;
+    use crate::{DbValue, QueryResult};
+    use ormdantic_core::OrmdanticResult;
+
+    #[test]
+    fn row_chunker_emits_bounded_chunks_and_stops_on_request() {
+        let mut sizes = Vec::new();
+        let mut sink = |chunk: QueryResult| -> OrmdanticResult<bool> {
+            sizes.push(chunk.rows().len());
+            Ok(sizes.len() < 2)
+        };
+        let rows = (0..7)
+            .map(|value| vec![DbValue::Integer(value)])
+            .collect::<Vec<_>>();
+
+        RowChunker::new(3, &mut sink)
+            .drain(QueryResult::new(vec!["id".to_string()], rows))
+            .unwrap();
+
+        assert_eq!(sizes, vec![3, 3]);
+    }
+}
@@ -168,6 +168,87 @@ fn sqlite_execute_url_runs_basic_statements() {
     support::assert_rows(&result, &[vec![DbValue::Text("vanilla".to_string())]]);
 }
 
+#[test]
+fn sqlite_query_chunks_streams_bounded_batches() {
+    let url = support::sqlite_url(&support::unique_name("engine_query_chunks"));
+    let mut connection = NativeConnection::open(&url).expect("sqlite should open");
+    connection
+        .execute("CREATE TABLE flavors (id INTEGER PRIMARY KEY)", &[])
+        .expect("create table should work");
+    for id in 0..10 {
+        connection
+            .execute(
+                "INSERT INTO flavors (id) VALUES (?1)",
+                &[DbValue::Integer(id)],
+            )
+            .expect("insert should work");
+    }
+
+    let mut chunks = Vec::new();
+    connection
+        .query_chunks(
+            "SELECT id FROM flavors WHERE id >= ?1 ORDER BY id",
+            &[DbValue::Integer(2)],
+            3,
+            &mut |chunk: QueryResult| {
+                assert_eq!(chunk.columns(), &["id".to_string()]);
+                chunks.push(chunk.rows().len());
+                Ok(true)
+            },
+        )
+        .expect("streaming select should work");
+
+    assert_eq!(chunks, vec![3, 3, 2]);
+}
+
+#[test]
+fn sqlite_bulk_insert_loads_rows_and_validates_width() {
+    let url = support::sqlite_url(&support::unique_name("engine_bulk_insert"));
+    let mut connection = NativeConnection::open(&url).expect("sqlite should open");
+    connection
+        .execute(
+            "CREATE TABLE flavors (id INTEGER PRIMARY KEY, name TEXT)",
+            &[],
+        )
+        .expect("create table should work");
+    let columns = vec!["id".to_string(), "name".to_string()];
+    let rows = (0..250)
+        .map(|id| {
+            vec![
+                DbValue::Integer(id),
+                if id % 2 == 0 {
+                    DbValue::Text(format!("flavor-{id}"))
+                } else {
+                    DbValue::Null
+                },
+            ]
+        })
+        .collect::<Vec<_>>();
+
+    let inserted = connection
+        .bulk_insert("flavors", &columns, &rows)
+        .expect("bulk insert should work");
+    assert_eq!(inserted, 250);
+    let result = connection
+        .execute("SELECT COUNT(*), COUNT(name) FROM flavors", &[])
+        .expect("count should work");
+    support::assert_rows(
+        &result,
+        &[vec![DbValue::Integer(250), DbValue::Integer(125)]],
+    );
+
+    let error = connection
+        .bulk_insert("flavors", &columns, &[vec![DbValue::Integer(1)]])
+        .expect_err("short rows should be rejected");
+    assert!(error.to_string().contains("1 values for 2 columns"));
+    assert_eq!(
+        connection
+            .bulk_insert("flavors", &columns, &[])
+            .expect("empty loads are a no-op"),
+        0
+    );
+}
+
 #[test]
 fn sqlite_declared_numeric_columns_decode_as_decimal() {
     let url = support::sqlite_url(&support::unique_name("engine_sqlite_decimal"));
@@ -1,6 +1,6 @@
 use std::collections::HashSet;
 
-use ormdantic_schema::{RelationshipDef, TableDef};
+use ormdantic_schema::{ColumnAlias, RelationshipDef, TableDef};
 
 use crate::{HydratedRow, HydrationKey};
 
@@ -8,18 +8,27 @@ use crate::{HydratedRow, HydrationKey};
 pub struct RelationshipNode {
     path: String,
     relationship: RelationshipDef,
+    primary_key_columns: Vec<String>,
     children: Vec<RelationshipNode>,
 }
 
 impl RelationshipNode {
+    /// Node keyed by the relationship's target field.
     pub fn new(path: impl Into<String>, relationship: RelationshipDef) -> Self {
+        let primary_key_columns = vec![relationship.target_field().to_string()];
         Self {
             path: path.into(),
             relationship,
+            primary_key_columns,
             children: Vec::new(),
         }
     }
 
+    pub fn composite_key(mut self, primary_key_columns: Vec<String>) -> Self {
+        self.primary_key_columns = primary_key_columns;
+        self
+    }
+
     pub fn with_children(mut self, children: Vec<RelationshipNode>) -> Self {
         self.children = children;
         self
@@ -33,6 +42,10 @@ impl RelationshipNode {
         &self.relationship
     }
 
+    pub fn primary_key_columns(&self) -> &[String] {
+        &self.primary_key_columns
+    }
+
     pub fn children(&self) -> &[RelationshipNode] {
         &self.children
     }
@@ -92,4 +105,120 @@ impl HydrationGraph {
         }
         output
     }
+
+    /// Flatten the graph into one plan per table path of a joined result.
+    ///
+    /// Paths come parents first, so walking them in reverse visits every
+    /// child before its parent. A path whose key columns are not all among
+    /// `aliases` gets no key indexes and never produces a record.
+    pub fn path_plans(&self, aliases: &[String]) -> Vec<GraphPathPlan> {
+        let parsed = aliases
+            .iter()
+            .map(|alias| ColumnAlias::parse(alias))
+            .collect::<Vec<_>>();
+        let mut plans = vec![GraphPathPlan::new(
+            self.root_table.name(),
+            None,
+            None,
+            &self.primary_key_columns,
+            &parsed,
+        )];
+        push_path_plans(&mut plans, 0, &self.relationships, &parsed);
+        plans
+    }
+}
+
+/// Columns and position of one table path within a joined result.
+#[derive(Debug, Clone, PartialEq, Eq)]
+pub struct GraphPathPlan {
+    path: String,
+    relationship: Option<RelationshipDef>,
+    parent: Option<usize>,
+    primary_key_indexes: Vec<usize>,
+    columns: Vec<(usize, String)>,
+    children: Vec<usize>,
+}
+
+impl GraphPathPlan {
+    fn new(
+        path: &str,
+        relationship: Option<&RelationshipDef>,
+        parent: Option<usize>,
+        primary_key_columns: &[String],
+        parsed: &[Option<ColumnAlias>],
+    ) -> Self {
+        let columns = parsed
+            .iter()
+            .enumerate()
+            .filter_map(|(index, alias)| {
+                let column = alias.as_ref()?.column_for_table(path)?;
+                (!column.is_empty()).then(|| (index, column.to_string()))
+            })
+            .collect::<Vec<_>>();
+        let primary_key_indexes = primary_key_columns
+            .iter()
+            .map(|key| {
+                columns
+                    .iter()
+                    .find(|(_, column)| column == key)
+                    .map(|(index, _)| *index)
+            })
+            .collect::<Option<Vec<_>>>()
+            .unwrap_or_default();
+        Self {
+            path: path.to_string(),
+            relationship: relationship.cloned(),
+            parent,
+            primary_key_indexes,
+            columns,
+            children: Vec::new(),
+        }
+    }
+
+    pub fn path(&self) -> &str {
+        &self.path
+    }
+
+    /// Relationship loaded into the parent path; `None` for the root.
+    pub fn relationship(&self) -> Option<&RelationshipDef> {
+        self.relationship.as_ref()
+    }
+
+    pub fn parent(&self) -> Option<usize> {
+        self.parent
+    }
+
+    pub fn primary_key_indexes(&self) -> &[usize] {
+        &self.primary_key_indexes
+    }
+
+    /// Result column index and column name of every column of this path.
+    pub fn columns(&self) -> &[(usize, String)] {
+        &self.columns
+    }
+
+    /// Plan indexes of the relationships loaded under this path.
+    pub fn children(&self) -> &[usize] {
+        &self.children
+    }
+}
+
+fn push_path_plans(
+    plans: &mut Vec<GraphPathPlan>,
+    parent: usize,
+    nodes: &[RelationshipNode],
+    parsed: &[Option<ColumnAlias>],
+) {
+    for node in nodes {
+        let index = plans.len();
+        plans.push(GraphPathPlan::new(
+            node.path(),
+            Some(node.relationship()),
+            Some(parent),
+            node.primary_key_columns(),
+            parsed,
+        ));
+        plans[parent].children.push(index);
+        push_path_plans(plans, index, node.children(), parsed);
+    }
 }
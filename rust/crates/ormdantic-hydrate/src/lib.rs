@@ -38,7 +38,9 @@ mod selectin;
 
 pub use columns::{ResultColumn, ResultShape};
 pub use flat::FlatHydrationPlan;
-pub use graph::{HydrationGraph, RelationshipNode};
+pub use graph::{GraphPathPlan, HydrationGraph, RelationshipNode};
 pub use keys::HydrationKey;
 pub use row::HydratedRow;
-pub use selectin::{merge_selectin_results, SelectInHydrationPlan};
+pub use selectin::{
+    group_selectin_children, merge_selectin_results, SelectInHydrationPlan, SelectInKey,
+};
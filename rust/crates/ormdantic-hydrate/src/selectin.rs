@@ -1,10 +1,21 @@
-use std::collections::{BTreeMap, HashSet};
+use std::collections::{BTreeMap, HashMap, HashSet};
 
 use ormdantic_schema::RelationshipDef;
 
 use crate::row::{format_collection, format_row, key_values, row_fingerprint};
 use crate::{HydratedRow, HydrationKey};
 
+/// Typed relationship key of a select-in parent or child.
+///
+/// Keys only match within the same type, so integer `1` and text `"1"` are
+/// different keys.
+#[derive(Debug, Clone, PartialEq, Eq, Hash)]
+pub enum SelectInKey {
+    Integer(i64),
+    Uuid(u128),
+    Text(String),
+}
+
 #[derive(Debug, Clone, PartialEq, Eq)]
 pub struct SelectInHydrationPlan {
     parent_key_columns: Vec<String>,
@@ -99,3 +110,28 @@ pub fn merge_selectin_results(
         })
         .collect()
 }
+
+/// Group child indexes under every parent whose key they reference.
+///
+/// Returns one list per parent with the matching child indexes in child
+/// order. Parents and children without a key are left unmatched.
+pub fn group_selectin_children(
+    parent_keys: &[Option<SelectInKey>],
+    child_keys: &[Option<SelectInKey>],
+) -> Vec<Vec<usize>> {
+    let mut children_by_key = HashMap::<&SelectInKey, Vec<usize>>::new();
+    for (index, key) in child_keys.iter().enumerate() {
+        if let Some(key) = key {
+            children_by_key.entry(key).or_default().push(index);
+        }
+    }
+    parent_keys
+        .iter()
+        .map(|key| {
+            key.as_ref()
+                .and_then(|key| children_by_key.get(key))
+                .cloned()
+                .unwrap_or_default()
+        })
+        .collect()
+}
@@ -60,3 +60,51 @@ fn hydration_graph_supports_composite_keys_and_relationships() {
     assert_eq!(graph.relationships().len(), 1);
     assert_eq!(graph.root_table().name(), "coffee");
 }
+
+#[test]
+fn hydration_graph_plans_paths_parents_first() {
+    let table = TableDef::new("coffee", "id", vec!["id".to_string()]);
+    let roast = RelationshipNode::new(
+        "coffee/flavors/roast",
+        RelationshipDef::new("roast", "roast", "id", RelationshipCardinality::One),
+    );
+    let graph = HydrationGraph::new(table).with_relationships(vec![
+        RelationshipNode::new("coffee/flavors", flavors_relationship()).with_children(vec![roast]),
+        RelationshipNode::new(
+            "coffee/supplier",
+            RelationshipDef::new("supplier", "supplier", "code", RelationshipCardinality::One),
+        ),
+    ]);
+
+    let plans = graph.path_plans(&[
+        "coffee\\id".to_string(),
+        "coffee\\name".to_string(),
+        "coffee/flavors\\name".to_string(),
+        "coffee/flavors\\id".to_string(),
+        "coffee/flavors/roast\\id".to_string(),
+        "coffee/supplier\\name".to_string(),
+    ]);
+
+    let paths = plans.iter().map(|plan| plan.path()).collect::<Vec<_>>();
+    assert_eq!(
+        paths,
+        vec![
+            "coffee",
+            "coffee/flavors",
+            "coffee/flavors/roast",
+            "coffee/supplier"
+        ]
+    );
+    assert_eq!(plans[0].relationship(), None);
+    assert_eq!(plans[0].children(), &[1, 3]);
+    assert_eq!(plans[0].primary_key_indexes(), &[0]);
+    assert_eq!(plans[1].parent(), Some(0));
+    assert_eq!(plans[1].relationship().unwrap().field(), "flavors");
+    assert_eq!(plans[1].primary_key_indexes(), &[3]);
+    assert_eq!(
+        plans[1].columns(),
+        &[(2, "name".to_string()), (3, "id".to_string())]
+    );
+    assert_eq!(plans[2].parent(), Some(1));
+    assert!(plans[3].primary_key_indexes().is_empty());
+}
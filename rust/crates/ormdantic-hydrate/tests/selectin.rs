@@ -1,4 +1,7 @@
-use ormdantic_hydrate::{merge_selectin_results, HydratedRow, SelectInHydrationPlan};
+use ormdantic_hydrate::{
+    group_selectin_children, merge_selectin_results, HydratedRow, SelectInHydrationPlan,
+    SelectInKey,
+};
 use ormdantic_schema::{RelationshipCardinality, RelationshipDef};
 
 fn row(values: &[(&str, &str)]) -> HydratedRow {
@@ -97,3 +100,28 @@ fn merge_selectin_results_skips_children_and_parents_with_missing_keys() {
         "coffee_id=1,id=11,name=mocha"
     );
 }
+
+#[test]
+fn groups_selectin_children_by_typed_key() {
+    let groups = group_selectin_children(
+        &[
+            Some(SelectInKey::Integer(1)),
+            Some(SelectInKey::Text("1".to_string())),
+            None,
+            Some(SelectInKey::Integer(1)),
+            Some(SelectInKey::Uuid(7)),
+        ],
+        &[
+            Some(SelectInKey::Integer(1)),
+            None,
+            Some(SelectInKey::Text("1".to_string())),
+            Some(SelectInKey::Integer(1)),
+            Some(SelectInKey::Integer(2)),
+        ],
+    );
+
+    assert_eq!(
+        groups,
+        vec![vec![0, 3], vec![2], Vec::new(), vec![0, 3], Vec::new()]
+    );
+}
@@ -110,7 +110,7 @@ fn bench_schema_hydration_payload_bridge(c: &mut Criterion) {
             validate_schema_tables: function(&module, "validate_schema_tables"),
             plan_result_shape: function(&module, "plan_result_shape"),
             hydrate_flat: function(&module, "hydrate_flat"),
-            hydrate_joined: function(&module, "hydrate_joined"),
+            hydrate_graph: function(&module, "hydrate_graph"),
             execute_selectin_load: function(&module, "execute_selectin_load"),
             schema_tables: vec![
                 (
@@ -156,12 +156,7 @@ fn bench_schema_hydration_payload_bridge(c: &mut Criterion) {
             .into_py_any(py)
             .expect("joined columns should convert"),
             joined_rows: joined_rows_payload(py),
-            path_pks: vec![
-                ("coffee".to_string(), "id".to_string()),
-                ("coffee/flavors".to_string(), "id".to_string()),
-            ]
-            .into_py_any(py)
-            .expect("path primary keys should convert"),
+            graph_nodes: graph_nodes_payload(py),
             array_paths: vec!["coffee/flavors"]
                 .into_py_any(py)
                 .expect("array paths should convert"),
@@ -211,13 +206,12 @@ fn bench_schema_hydration_payload_bridge(c: &mut Criterion) {
                 black_box(flat);
 
                 let joined = fixtures
-                    .hydrate_joined
+                    .hydrate_graph
                     .bind(py)
                     .call1((
                         fixtures.joined_columns.clone_ref(py),
                         fixtures.joined_rows.clone_ref(py),
-                        fixtures.path_pks.clone_ref(py),
-                        fixtures.array_paths.clone_ref(py),
+                        fixtures.graph_nodes.clone_ref(py),
                     ))
                     .expect("joined rows should hydrate");
                 black_box(joined);
@@ -257,7 +251,7 @@ struct SchemaHydrationFixtures {
     validate_schema_tables: Py<PyAny>,
     plan_result_shape: Py<PyAny>,
     hydrate_flat: Py<PyAny>,
-    hydrate_joined: Py<PyAny>,
+    hydrate_graph: Py<PyAny>,
     execute_selectin_load: Py<PyAny>,
     schema_tables: Py<PyAny>,
     shape_columns: Py<PyAny>,
@@ -265,7 +259,7 @@ struct SchemaHydrationFixtures {
     flat_rows: Py<PyAny>,
     joined_columns: Py<PyAny>,
     joined_rows: Py<PyAny>,
-    path_pks: Py<PyAny>,
+    graph_nodes: Py<PyAny>,
     array_paths: Py<PyAny>,
     parent_rows: Py<PyAny>,
     child_rows: Py<PyAny>,
@@ -461,6 +455,30 @@ fn joined_rows_payload(py: Python<'_>) -> Py<PyAny> {
     rows.into_any().unbind()
 }
 
+fn graph_nodes_payload(py: Python<'_>) -> Py<PyAny> {
+    // `dict` stands in for the model factories.
+    let factory = py.get_type::<PyDict>();
+    vec![
+        ("coffee", "coffee", "id", false, "coffee", factory.clone()),
+        ("coffee/flavors", "flavor", "id", true, "flavor", factory),
+    ]
+    .into_iter()
+    .map(|(path, tablename, pk, uselist, model, factory)| {
+        (
+            path,
+            tablename,
+            pk,
+            uselist,
+            model,
+            factory,
+            PyDict::new(py),
+        )
+    })
+    .collect::<Vec<_>>()
+    .into_py_any(py)
+    .expect("graph nodes should convert")
+}
+
 fn parent_rows_payload(py: Python<'_>) -> Py<PyAny> {
     let rows = PyList::empty(py);
     for index in 0..100 {
@@ -0,0 +1,507 @@
+//! Arrow PyCapsule export of native query results.
+//!
+//! Implements the producer side of the Arrow C data and C stream interfaces
+//! directly, so pyarrow, polars and other consumers import result buffers
+//! without copying and without an Arrow dependency in the extension.
+
+use ormdantic_engine::{ArrowColumn, ArrowTable, ArrowValues};
+use pyo3::exceptions::PyValueError;
+use pyo3::ffi;
+use pyo3::prelude::*;
+use std::ffi::{c_char, c_int, c_void, CStr, CString};
+use std::ptr;
+use std::sync::Arc;
+
+const ARROW_FLAG_NULLABLE: i64 = 2;
+/// The C stream interface reports failures as errno codes.
+const EINVAL: c_int = 22;
+
+#[repr(C)]
+struct FfiSchema {
+    format: *const c_char,
+    name: *const c_char,
+    metadata: *const c_char,
+    flags: i64,
+    n_children: i64,
+    children: *mut *mut FfiSchema,
+    dictionary: *mut FfiSchema,
+    release: Option<unsafe extern "C" fn(*mut FfiSchema)>,
+    private_data: *mut c_void,
+}
+
+#[repr(C)]
+struct FfiArray {
+    length: i64,
+    null_count: i64,
+    offset: i64,
+    n_buffers: i64,
+    n_children: i64,
+    buffers: *mut *const c_void,
+    children: *mut *mut FfiArray,
+    dictionary: *mut FfiArray,
+    release: Option<unsafe extern "C" fn(*mut FfiArray)>,
+    private_data: *mut c_void,
+}
+
+#[repr(C)]
+struct FfiArrayStream {
+    get_schema: Option<unsafe extern "C" fn(*mut FfiArrayStream, *mut FfiSchema) -> c_int>,
+    get_next: Option<unsafe extern "C" fn(*mut FfiArrayStream, *mut FfiArray) -> c_int>,
+    get_last_error: Option<unsafe extern "C" fn(*mut FfiArrayStream) -> *const c_char>,
+    release: Option<unsafe extern "C" fn(*mut FfiArrayStream)>,
+    private_data: *mut c_void,
+}
+
+/// Query result exported through the Arrow PyCapsule interface.
+///
+/// Buffers stay owned by the shared native table; every exported array keeps
+/// it alive until the consumer releases the array.
+#[pyclass]
+pub(crate) struct PyArrowTable {
+    table: Arc<ArrowTable>,
+}
+
+impl PyArrowTable {
+    pub(crate) fn new(table: ArrowTable) -> Self {
+        Self {
+            table: Arc::new(table),
+        }
+    }
+}
+
+#[pymethods]
+impl PyArrowTable {
+    #[getter]
+    fn num_rows(&self) -> usize {
+        self.table.num_rows()
+    }
+
+    #[getter]
+    fn num_batches(&self) -> usize {
+        self.table.batches().len()
+    }
+
+    #[getter]
+    fn column_names(&self) -> Vec<String> {
+        self.table
+            .fields()
+            .iter()
+            .map(|field| field.name().to_string())
+            .collect()
+    }
+
+    fn __arrow_c_schema__<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
+        into_capsule(py, table_schema(&self.table)?)
+    }
+
+    /// Export the single record batch; chunked results use `__arrow_c_stream__`.
+    #[pyo3(signature = (requested_schema=None))]
+    fn __arrow_c_array__<'py>(
+        &self,
+        py: Python<'py>,
+        requested_schema: Option<Bound<'py, PyAny>>,
+    ) -> PyResult<(Bound<'py, PyAny>, Bound<'py, PyAny>)> {
+        // Results are exported with their native schema; casting is left to
+        // the consumer, which the PyCapsule protocol allows.
+        let _ = requested_schema;
+        if self.table.batches().len() != 1 {
+            return Err(PyValueError::new_err(format!(
+                "result has {} record batches; read it through __arrow_c_stream__",
+                self.table.batches().len()
+            )));
+        }
+        Ok((
+            into_capsule(py, table_schema(&self.table)?)?,
+            into_capsule(py, batch_array(&self.table, 0))?,
+        ))
+    }
+
+    #[pyo3(signature = (requested_schema=None))]
+    fn __arrow_c_stream__<'py>(
+        &self,
+        py: Python<'py>,
+        requested_schema: Option<Bound<'py, PyAny>>,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let _ = requested_schema;
+        // Validate field names up front so `get_schema` cannot fail later.
+        let schema = table_schema(&self.table)?;
+        release_schema_value(schema);
+        let private = Box::new(StreamPrivate {
+            table: Arc::clone(&self.table),
+            next_batch: 0,
+        });
+        into_capsule(
+            py,
+            FfiArrayStream {
+                get_schema: Some(stream_get_schema),
+                get_next: Some(stream_get_next),
+                get_last_error: Some(stream_get_last_error),
+                release: Some(release_stream),
+                private_data: Box::into_raw(private).cast(),
+            },
+        )
+    }
+}
+
+/// Arrow C structs that can be handed out in a named PyCapsule.
+trait Exported {
+    const CAPSULE_NAME: &'static CStr;
+
+    /// Call the struct's release callback unless a consumer moved it out.
+    unsafe fn release(&mut self);
+}
+
+impl Exported for FfiSchema {
+    const CAPSULE_NAME: &'static CStr = c"arrow_schema";
+
+    unsafe fn release(&mut self) {
+        if let Some(release) = self.release {
+            release(self);
+        }
+    }
+}
+
+impl Exported for FfiArray {
+    const CAPSULE_NAME: &'static CStr = c"arrow_array";
+
+    unsafe fn release(&mut self) {
+        if let Some(release) = self.release {
+            release(self);
+        }
+    }
+}
+
+impl Exported for FfiArrayStream {
+    const CAPSULE_NAME: &'static CStr = c"arrow_array_stream";
+
+    unsafe fn release(&mut self) {
+        if let Some(release) = self.release {
+            release(self);
+        }
+    }
+}
+
+fn into_capsule<T: Exported>(py: Python<'_>, value: T) -> PyResult<Bound<'_, PyAny>> {
+    let pointer = Box::into_raw(Box::new(value));
+    // SAFETY: the capsule takes ownership of `pointer`; `drop_capsule` frees it.
+    let capsule = unsafe {
+        ffi::PyCapsule_New(
+            pointer.cast(),
+            T::CAPSULE_NAME.as_ptr(),
+            Some(drop_capsule::<T>),
+        )
+    };
+    if capsule.is_null() {
+        // SAFETY: capsule creation failed, so `pointer` is still exclusively ours.
+        unsafe {
+            let mut value = Box::from_raw(pointer);
+            value.release();
+        }
+    }
+    // SAFETY: `capsule` is a new reference or null with a Python error set.
+    unsafe { Bound::from_owned_ptr_or_err(py, capsule) }
+}
+
+unsafe extern "C" fn drop_capsule<T: Exported>(capsule: *mut ffi::PyObject) {
+    let pointer = ffi::PyCapsule_GetPointer(capsule, T::CAPSULE_NAME.as_ptr()).cast::<T>();
+    if pointer.is_null() {
+        ffi::PyErr_Clear();
+        return;
+    }
+    let mut value = Box::from_raw(pointer);
+    value.release();
+}
+
+struct SchemaPrivate {
+    format: CString,
+    name: CString,
+    children: Box<[*mut FfiSchema]>,
+}
+
+fn schema_node(
+    format: &str,
+    name: &str,
+    flags: i64,
+    children: Vec<FfiSchema>,
+) -> PyResult<FfiSchema> {
+    let name = CString::new(name).map_err(|_| {
+        PyValueError::new_err(format!(
+            "column name {name:?} contains a NUL byte and cannot be exported to Arrow"
+        ))
+    })?;
+    let format = CString::new(format).expect("Arrow format strings contain no NUL bytes");
+    let mut private = Box::new(SchemaPrivate {
+        children: children
+            .into_iter()
+            .map(|child| Box::into_raw(Box::new(child)))
+            .collect(),
+        format,
+        name,
+    });
+    Ok(FfiSchema {
+        format: private.format.as_ptr(),
+        name: private.name.as_ptr(),
+        metadata: ptr::null(),
+        flags,
+        n_children: private.children.len() as i64,
+        children: private.children.as_mut_ptr(),
+        dictionary: ptr::null_mut(),
+        release: Some(release_schema),
+        private_data: Box::into_raw(private).cast(),
+    })
+}
+
+unsafe extern "C" fn release_schema(schema: *mut FfiSchema) {
+    let Some(schema) = schema.as_mut() else {
+        return;
+    };
+    if !schema.private_data.is_null() {
+        let private = Box::from_raw(schema.private_data.cast::<SchemaPrivate>());
+        for child in private.children.iter() {
+            let mut child = Box::from_raw(*child);
+            child.release();
+        }
+    }
+    schema.private_data = ptr::null_mut();
+    schema.release = None;
+}
+
+fn release_schema_value(mut schema: FfiSchema) {
+    // SAFETY: `schema` was produced by `schema_node` and never exported.
+    unsafe { schema.release() }
+}
+
+fn table_schema(table: &ArrowTable) -> PyResult<FfiSchema> {
+    let fields = table
+        .fields()
+        .iter()
+        .map(|field| {
+            schema_node(
+                field.data_type().format(),
+                field.name(),
+                ARROW_FLAG_NULLABLE,
+                Vec::new(),
+            )
+        })
+        .collect::<PyResult<Vec<_>>>()?;
+    schema_node("+s", "", 0, fields)
+}
+
+struct ArrayPrivate {
+    _table: Arc<ArrowTable>,
+    buffers: Box<[*const c_void]>,
+    children: Box<[*mut FfiArray]>,
+}
+
+fn array_node(
+    table: &Arc<ArrowTable>,
+    length: usize,
+    null_count: usize,
+    buffers: Vec<*const c_void>,
+    children: Vec<FfiArray>,
+) -> FfiArray {
+    let mut private = Box::new(ArrayPrivate {
+        _table: Arc::clone(table),
+        buffers: buffers.into_boxed_slice(),
+        children: children
+            .into_iter()
+            .map(|child| Box::into_raw(Box::new(child)))
+            .collect(),
+    });
+    FfiArray {
+        length: length as i64,
+        null_count: null_count as i64,
+        offset: 0,
+        n_buffers: private.buffers.len() as i64,
+        n_children: private.children.len() as i64,
+        buffers: private.buffers.as_mut_ptr(),
+        children: private.children.as_mut_ptr(),
+        dictionary: ptr::null_mut(),
+        release: Some(release_array),
+        private_data: Box::into_raw(private).cast(),
+    }
+}
+
+unsafe extern "C" fn release_array(array: *mut FfiArray) {
+    let Some(array) = array.as_mut() else {
+        return;
+    };
+    if !array.private_data.is_null() {
+        let private = Box::from_raw(array.private_data.cast::<ArrayPrivate>());
+        for child in private.children.iter() {
+            let mut child = Box::from_raw(*child);
+            child.release();
+        }
+    }
+    array.private_data = ptr::null_mut();
+    array.release = None;
+}
+
+fn column_array(table: &Arc<ArrowTable>, column: &ArrowColumn, length: usize) -> FfiArray {
+    let validity = column
+        .validity()
+        .map_or(ptr::null(), |validity| validity.as_ptr().cast());
+    let buffers = match column.values() {
+        // The null layout has no buffers at all.
+        ArrowValues::Null => Vec::new(),
+        ArrowValues::Boolean(values) => vec![validity, values.as_ptr().cast()],
+        ArrowValues::Int64(values) => vec![validity, values.as_ptr().cast()],
+        ArrowValues::UInt64(values) => vec![validity, values.as_ptr().cast()],
+        ArrowValues::Float64(values) => vec![validity, values.as_ptr().cast()],
+        ArrowValues::LargeUtf8 { offsets, data } => {
+            vec![validity, offsets.as_ptr().cast(), data.as_ptr().cast()]
+        }
+    };
+    array_node(table, length, column.null_count(), buffers, Vec::new())
+}
+
+fn batch_array(table: &Arc<ArrowTable>, index: usize) -> FfiArray {
+    let batch = &table.batches()[index];
+    let children = batch
+        .columns()
+        .iter()
+        .map(|column| column_array(table, column, batch.num_rows()))
+        .collect();
+    array_node(table, batch.num_rows(), 0, vec![ptr::null()], children)
+}
+
+struct StreamPrivate {
+    table: Arc<ArrowTable>,
+    next_batch: usize,
+}
+
+unsafe extern "C" fn stream_get_schema(stream: *mut FfiArrayStream, out: *mut FfiSchema) -> c_int {
+    let private = &*(*stream).private_data.cast::<StreamPrivate>();
+    match table_schema(&private.table) {
+        Ok(schema) => {
+            ptr::write(out, schema);
+            0
+        }
+        // Names were validated when the stream was created.
+        Err(_) => EINVAL,
+    }
+}
+
+unsafe extern "C" fn stream_get_next(stream: *mut FfiArrayStream, out: *mut FfiArray) -> c_int {
+    let private = &mut *(*stream).private_data.cast::<StreamPrivate>();
+    if private.next_batch < private.table.batches().len() {
+        ptr::write(out, batch_array(&private.table, private.next_batch));
+        private.next_batch += 1;
+    } else {
+        // A released array marks the end of the stream.
+        ptr::write(
+            out,
+            FfiArray {
+                length: 0,
+                null_count: 0,
+                offset: 0,
+                n_buffers: 0,
+                n_children: 0,
+                buffers: ptr::null_mut(),
+                children: ptr::null_mut(),
+                dictionary: ptr::null_mut(),
+                release: None,
+                private_data: ptr::null_mut(),
+            },
+        );
+    }
+    0
+}
+
+unsafe extern "C" fn stream_get_last_error(_stream: *mut FfiArrayStream) -> *const c_char {
+    ptr::null()
+}
+
+unsafe extern "C" fn release_stream(stream: *mut FfiArrayStream) {
+    let Some(stream) = stream.as_mut() else {
+        return;
+    };
+    if !stream.private_data.is_null() {
+        drop(Box::from_raw(stream.private_data.cast::<StreamPrivate>()));
+    }
+    stream.private_data = ptr::null_mut();
+    stream.release = None;
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use ormdantic_engine::{DbValue, QueryResult};
+
+    fn table() -> Arc<ArrowTable> {
+        let result = QueryResult::new(
+            vec!["id".to_string(), "name".to_string()],
+            vec![
+                vec![DbValue::Integer(1), DbValue::Text("dark".to_string())],
+                vec![DbValue::Integer(2), DbValue::Null],
+                vec![DbValue::Integer(3), DbValue::Text("light".to_string())],
+            ],
+        );
+        Arc::new(ArrowTable::from_result(&result, Some(2)))
+    }
+
+    #[test]
+    fn exported_schema_describes_a_struct_of_nullable_fields() {
+        let mut schema = table_schema(&table()).unwrap();
+
+        unsafe {
+            assert_eq!(CStr::from_ptr(schema.format).to_str().unwrap(), "+s");
+            assert_eq!(schema.n_children, 2);
+            let name = &**schema.children.add(1);
+            assert_eq!(CStr::from_ptr(name.name).to_str().unwrap(), "name");
+            assert_eq!(CStr::from_ptr(name.format).to_str().unwrap(), "U");
+            assert_eq!(name.flags, ARROW_FLAG_NULLABLE);
+            schema.release();
+        }
+        assert!(schema.release.is_none());
+    }
+
+    #[test]
+    fn exported_arrays_point_into_shared_buffers_until_released() {
+        let table = table();
+        let mut array = batch_array(&table, 1);
+
+        assert_eq!(Arc::strong_count(&table), 4);
+        unsafe {
+            assert_eq!(array.length, 1);
+            let ids = &**array.children;
+            assert_eq!(*(*ids.buffers.add(1)).cast::<i64>(), 3);
+            let names = &**array.children.add(1);
+            assert_eq!(names.n_buffers, 3);
+            array.release();
+        }
+        assert_eq!(Arc::strong_count(&table), 1);
+    }
+
+    #[test]
+    fn stream_yields_each_batch_then_a_released_array() {
+        let mut stream = FfiArrayStream {
+            get_schema: Some(stream_get_schema),
+            get_next: Some(stream_get_next),
+            get_last_error: Some(stream_get_last_error),
+            release: Some(release_stream),
+            private_data: Box::into_raw(Box::new(StreamPrivate {
+                table: table(),
+                next_batch: 0,
+            }))
+            .cast(),
+        };
+        let mut lengths = Vec::new();
+        unsafe {
+            loop {
+                let mut array = std::mem::MaybeUninit::<FfiArray>::uninit();
+                assert_eq!(stream_get_next(&mut stream, array.as_mut_ptr()), 0);
+                let mut array = array.assume_init();
+                if array.release.is_none() {
+                    break;
+                }
+                lengths.push(array.length);
+                array.release();
+            }
+            stream.release();
+        }
+
+        assert_eq!(lengths, vec![2, 1]);
+        assert!(stream.private_data.is_null());
+    }
+}
@@ -1,6 +1,8 @@
+use crate::arrow::PyArrowTable;
 use crate::database::PyDatabase;
 use crate::events::PyEventBridge;
 use crate::session::PySessionRuntime;
+use crate::stream::PyRowStream;
 use crate::table_handle::PyTableHandle;
 use crate::transactions::PyTransactionOptions;
 use crate::{ddl, hydration, query, runtime, schema, utils};
@@ -11,11 +13,13 @@ pub(crate) fn register(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<runtime::PyNativeConnection>()?;
     m.add_class::<PyDatabase>()?;
     m.add_class::<PyTableHandle>()?;
+    m.add_class::<PyRowStream>()?;
+    m.add_class::<PyArrowTable>()?;
     m.add_class::<PyTransactionOptions>()?;
     m.add_class::<PySessionRuntime>()?;
     m.add_class::<PyEventBridge>()?;
     m.add_function(wrap_pyfunction!(hydration::hydrate_flat, m)?)?;
-    m.add_function(wrap_pyfunction!(hydration::hydrate_joined, m)?)?;
+    m.add_function(wrap_pyfunction!(hydration::hydrate_graph, m)?)?;
     m.add_function(wrap_pyfunction!(hydration::plan_result_shape, m)?)?;
     m.add_function(wrap_pyfunction!(schema::validate_schema_tables, m)?)?;
     m.add_function(wrap_pyfunction!(query::compile_select_pk, m)?)?;
@@ -33,6 +37,7 @@ pub(crate) fn register(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(runtime::reflect_schema, m)?)?;
     m.add_function(wrap_pyfunction!(query::compile_selectin_plan, m)?)?;
     m.add_function(wrap_pyfunction!(hydration::execute_selectin_load, m)?)?;
+    m.add_function(wrap_pyfunction!(hydration::merge_selectin, m)?)?;
     m.add_function(wrap_pyfunction!(runtime::execute_native, m)?)?;
     m.add_function(wrap_pyfunction!(query::normalize_filters, m)?)?;
     m.add_function(wrap_pyfunction!(utils::snake_case, m)?)?;
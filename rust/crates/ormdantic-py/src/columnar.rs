@@ -0,0 +1,163 @@
+use crate::runtime::db_value_to_py;
+use ormdantic_engine::{DbValue, QueryResult};
+use pyo3::prelude::*;
+use pyo3::types::{PyBytes, PyDict, PyList};
+
+/// Physical layout chosen for one result column.
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+enum ColumnType {
+    Int64,
+    Float64,
+    Bool,
+    Text,
+    Object,
+}
+
+impl ColumnType {
+    fn name(self) -> &'static str {
+        match self {
+            Self::Int64 => "int64",
+            Self::Float64 => "float64",
+            Self::Bool => "bool",
+            Self::Text => "text",
+            Self::Object => "object",
+        }
+    }
+}
+
+/// Convert a query result into column-major buffers.
+///
+/// Integer, float and boolean columns become native-endian `bytes` buffers
+/// that Python reads through `memoryview.cast`; text columns become Arrow-style
+/// `offsets` (int64) plus UTF-8 `data`. Nulls are reported through a one byte
+/// per row `validity` buffer. Columns mixing value types, and decimals, fall
+/// back to a list of Python objects.
+pub(crate) fn query_result_to_columns(py: Python<'_>, result: QueryResult) -> PyResult<Py<PyAny>> {
+    let output = PyDict::new(py);
+    output.set_item("layout", "columns")?;
+    output.set_item("columns", result.columns())?;
+    output.set_item("length", result.rows().len())?;
+    let data = PyList::empty(py);
+    for index in 0..result.columns().len() {
+        data.append(column_to_python(py, result.rows(), index)?)?;
+    }
+    output.set_item("data", data)?;
+    output.set_item("rowcount", result.row_count())?;
+    Ok(output.into_any().unbind())
+}
+
+fn column_type(rows: &[Vec<DbValue>], index: usize) -> ColumnType {
+    let mut column_type = None;
+    for value in rows.iter().map(|row| &row[index]) {
+        let value_type = match value {
+            DbValue::Null => continue,
+            DbValue::Integer(_) => ColumnType::Int64,
+            DbValue::Real(_) => ColumnType::Float64,
+            DbValue::Bool(_) => ColumnType::Bool,
+            DbValue::Text(_) => ColumnType::Text,
+            DbValue::UnsignedInteger(_) | DbValue::Decimal(_) => return ColumnType::Object,
+        };
+        match column_type {
+            None => column_type = Some(value_type),
+            Some(current) if current != value_type => return ColumnType::Object,
+            Some(_) => {}
+        }
+    }
+    column_type.unwrap_or(ColumnType::Object)
+}
+
+fn column_to_python<'py>(
+    py: Python<'py>,
+    rows: &[Vec<DbValue>],
+    index: usize,
+) -> PyResult<Bound<'py, PyDict>> {
+    let column_type = column_type(rows, index);
+    let output = PyDict::new(py);
+    output.set_item("type", column_type.name())?;
+    let values = rows.iter().map(|row| &row[index]);
+    let has_nulls = values.clone().any(|value| matches!(value, DbValue::Null));
+    match column_type {
+        ColumnType::Int64 => {
+            let mut buffer = Vec::with_capacity(rows.len() * 8);
+            for value in values {
+                let value = if let DbValue::Integer(value) = value {
+                    *value
+                } else {
+                    0
+                };
+                buffer.extend_from_slice(&value.to_ne_bytes());
+            }
+            output.set_item("values", PyBytes::new(py, &buffer))?;
+        }
+        ColumnType::Float64 => {
+            let mut buffer = Vec::with_capacity(rows.len() * 8);
+            for value in values {
+                let value = if let DbValue::Real(value) = value {
+                    *value
+                } else {
+                    0.0
+                };
+                buffer.extend_from_slice(&value.to_ne_bytes());
+            }
+            output.set_item("values", PyBytes::new(py, &buffer))?;
+        }
+        ColumnType::Bool => {
+            let buffer = values
+                .map(|value| u8::from(matches!(value, DbValue::Bool(true))))
+                .collect::<Vec<_>>();
+            output.set_item("values", PyBytes::new(py, &buffer))?;
+        }
+        ColumnType::Text => {
+            let mut offsets = Vec::with_capacity((rows.len() + 1) * 8);
+            let mut data = Vec::new();
+            offsets.extend_from_slice(&0_i64.to_ne_bytes());
+            for value in values {
+                if let DbValue::Text(value) = value {
+                    data.extend_from_slice(value.as_bytes());
+                }
+                offsets.extend_from_slice(&(data.len() as i64).to_ne_bytes());
+            }
+            output.set_item("offsets", PyBytes::new(py, &offsets))?;
+            output.set_item("data", PyBytes::new(py, &data))?;
+        }
+        ColumnType::Object => {
+            let objects = values
+                .map(|value| db_value_to_py(py, value))
+                .collect::<PyResult<Vec<_>>>()?;
+            output.set_item("values", PyList::new(py, objects)?)?;
+        }
+    }
+    // Object columns carry `None` inline.
+    if has_nulls && column_type != ColumnType::Object {
+        let validity = rows
+            .iter()
+            .map(|row| u8::from(!matches!(row[index], DbValue::Null)))
+            .collect::<Vec<_>>();
+        output.set_item("validity", PyBytes::new(py, &validity))?;
+    } else {
+        output.set_item("validity", py.None())?;
+    }
+    Ok(output)
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn column_type_falls_back_to_objects_for_mixed_values() {
+        let rows = vec![
+            vec![
+                DbValue::Integer(1),
+                DbValue::Null,
+                DbValue::Text("a".to_string()),
+            ],
+            vec![DbValue::Null, DbValue::Real(1.5), DbValue::Integer(2)],
+        ];
+
+        assert_eq!(column_type(&rows, 0), ColumnType::Int64);
+        assert_eq!(column_type(&rows, 1), ColumnType::Float64);
+        assert_eq!(column_type(&rows, 2), ColumnType::Object);
+        assert_eq!(column_type(&[], 0), ColumnType::Object);
+    }
+}
@@ -1,8 +1,13 @@
 use crate::ddl::{create_enum_type_sql, create_table_sql, drop_enum_type_sql, drop_table_sql};
+use crate::executor::NativeExecutor;
+use crate::metrics::{OperationSnapshot, QueryMetrics};
 use crate::migrations::{
     applied_revisions_sql, ensure_revision_table, py_operations_to_db, run_migration,
     MigrationDirection,
 };
+use crate::query_cache::{
+    DmlCache, SelectCache, DEFAULT_DML_CACHE_SIZE, DEFAULT_SELECT_CACHE_SIZE,
+};
 use crate::runtime::{
     columns_sql, db_value_to_bool, db_value_to_string, foreign_keys_sql, index_columns_sql,
     indexes_sql, table_names_sql,
@@ -11,17 +16,23 @@ use crate::schema::{runtime_table_specs_from_py, RuntimeEnumType};
 use crate::table_handle::{PyTableHandle, RuntimeTable};
 use crate::transactions::PyTransactionOptions;
 use ormdantic_dialects::AnyDialect;
-use ormdantic_engine::{DbValue, NativeConnection};
+use ormdantic_engine::{ConnectionPool, DbValue, PoolConfig, PooledConnection};
 use pyo3::exceptions::PyValueError;
 use pyo3::prelude::*;
 use pyo3::types::{PyDict, PyList};
 use std::collections::HashMap;
-use std::sync::{Arc, Mutex};
+use std::sync::{Arc, OnceLock};
+use std::time::Duration;
 
 #[pyclass]
 pub(crate) struct PyDatabase {
     url: String,
-    connection: Arc<Mutex<NativeConnection>>,
+    pool: Arc<ConnectionPool>,
+    executor: OnceLock<Arc<NativeExecutor>>,
+    transaction_executor: OnceLock<Arc<NativeExecutor>>,
+    select_cache: Arc<SelectCache>,
+    dml_cache: Arc<DmlCache>,
+    metrics: Arc<QueryMetrics>,
     tables: Arc<HashMap<String, RuntimeTable>>,
     table_order: Arc<Vec<String>>,
     enum_types: Arc<Vec<RuntimeEnumType>>,
@@ -30,12 +41,55 @@ pub(crate) struct PyDatabase {
 #[pymethods]
 impl PyDatabase {
     #[new]
-    #[pyo3(signature = (url, tables, enum_types=None))]
+    #[pyo3(signature = (
+        url,
+        tables,
+        enum_types=None,
+        *,
+        pool_min_size=None,
+        pool_max_size=None,
+        pool_timeout=None,
+        pool_idle_timeout=None,
+        pool_pre_ping=None,
+        statement_cache_size=None,
+        select_cache_size=None,
+    ))]
+    #[allow(clippy::too_many_arguments)]
     fn new(
         url: &str,
         tables: &Bound<'_, PyAny>,
         enum_types: Option<Vec<RuntimeEnumType>>,
+        pool_min_size: Option<usize>,
+        pool_max_size: Option<usize>,
+        pool_timeout: Option<f64>,
+        pool_idle_timeout: Option<f64>,
+        pool_pre_ping: Option<bool>,
+        statement_cache_size: Option<usize>,
+        select_cache_size: Option<usize>,
     ) -> PyResult<Self> {
+        let mut pool_config = PoolConfig::for_url(url);
+        if let Some(min_size) = pool_min_size {
+            pool_config = pool_config.with_min_size(min_size);
+        }
+        if let Some(max_size) = pool_max_size {
+            pool_config = pool_config.with_max_size(max_size);
+        }
+        if let Some(timeout) = pool_timeout {
+            pool_config = pool_config.with_acquire_timeout(seconds(timeout, "pool_timeout")?);
+        }
+        if let Some(idle_timeout) = pool_idle_timeout {
+            // Zero keeps idle connections open for the lifetime of the pool.
+            pool_config = pool_config.with_idle_timeout(
+                Some(seconds(idle_timeout, "pool_idle_timeout")?)
+                    .filter(|duration| !duration.is_zero()),
+            );
+        }
+        if let Some(pre_ping) = pool_pre_ping {
+            pool_config = pool_config.with_pre_ping(pre_ping);
+        }
+        if let Some(statement_cache_size) = statement_cache_size {
+            pool_config = pool_config.with_statement_cache_size(statement_cache_size);
+        }
         let mut table_order = Vec::new();
         let tables = runtime_table_specs_from_py(tables)?
             .into_iter()
@@ -153,29 +207,49 @@ impl PyDatabase {
             .collect::<HashMap<_, _>>();
         Ok(Self {
             url: url.to_string(),
-            connection: Arc::new(Mutex::new(
-                NativeConnection::open(url)
-                    .map_err(|error| PyValueError::new_err(error.to_string()))?,
+            pool: ConnectionPool::open(url, pool_config)
+                .map_err(|error| PyValueError::new_err(error.to_string()))?,
+            executor: OnceLock::new(),
+            transaction_executor: OnceLock::new(),
+            select_cache: Arc::new(SelectCache::new(
+                select_cache_size.unwrap_or(DEFAULT_SELECT_CACHE_SIZE),
             )),
+            dml_cache: Arc::new(DmlCache::new(DEFAULT_DML_CACHE_SIZE)),
+            metrics: Arc::new(QueryMetrics::default()),
             tables: Arc::new(tables),
             table_order: Arc::new(table_order),
             enum_types: Arc::new(enum_types.unwrap_or_default()),
         })
     }
 
-    fn table(&self, model_key: &str) -> PyResult<PyTableHandle> {
+    #[pyo3(signature = (model_key, awaitable=false))]
+    fn table(&self, model_key: &str, awaitable: bool) -> PyResult<PyTableHandle> {
         let table = self
             .tables
             .get(model_key)
             .or_else(|| self.tables.values().find(|table| table.table == model_key))
             .cloned()
             .ok_or_else(|| PyValueError::new_err(format!("unknown table '{model_key}'")))?;
+        let metrics = self.metrics.table(&table.qualified_table_name())?;
         Ok(PyTableHandle {
             url: self.url.clone(),
-            connection: Arc::clone(&self.connection),
+            pool: Arc::clone(&self.pool),
+            executor: if awaitable {
+                Some(self.native_executor()?)
+            } else {
+                None
+            },
+            transaction_executor: if awaitable {
+                Some(self.transaction_executor()?)
+            } else {
+                None
+            },
             tables: Arc::clone(&self.tables),
             table,
-            compiled_dml: Mutex::new(HashMap::new()),
+            compiled_dml: Arc::clone(&self.dml_cache),
+            select_cache: Arc::clone(&self.select_cache),
+            metrics,
+            pin: None,
         })
     }
 
@@ -242,19 +316,19 @@ impl PyDatabase {
                 statements.push(sql);
             }
         }
-        py.detach(|| -> Result<(), String> {
-            let mut connection = self
-                .connection
-                .lock()
-                .map_err(|_| "native connection lock poisoned".to_string())?;
-            for sql in statements {
-                connection
-                    .execute(&sql, &[])
-                    .map_err(|error| error.to_string())?;
-            }
-            Ok(())
-        })
-        .map_err(PyValueError::new_err)
+        let result = py
+            .detach(|| -> Result<(), String> {
+                let mut connection = self.pool.acquire().map_err(|error| error.to_string())?;
+                for sql in statements {
+                    connection
+                        .execute(&sql, &[])
+                        .map_err(|error| error.to_string())?;
+                }
+                Ok(())
+            })
+            .map_err(PyValueError::new_err);
+        self.invalidate_statements()?;
+        result
     }
 
     fn drop_all(&self, py: Python<'_>) -> PyResult<()> {
@@ -270,26 +344,23 @@ impl PyDatabase {
                 statements.push(sql);
             }
         }
-        py.detach(|| -> Result<(), String> {
-            let mut connection = self
-                .connection
-                .lock()
-                .map_err(|_| "native connection lock poisoned".to_string())?;
-            for sql in statements {
-                connection
-                    .execute(&sql, &[])
-                    .map_err(|error| error.to_string())?;
-            }
-            Ok(())
-        })
-        .map_err(PyValueError::new_err)
+        let result = py
+            .detach(|| -> Result<(), String> {
+                let mut connection = self.pool.acquire().map_err(|error| error.to_string())?;
+                for sql in statements {
+                    connection
+                        .execute(&sql, &[])
+                        .map_err(|error| error.to_string())?;
+                }
+                Ok(())
+            })
+            .map_err(PyValueError::new_err);
+        self.invalidate_statements()?;
+        result
     }
 
     fn table_names(&self, py: Python<'_>) -> PyResult<Py<PyAny>> {
-        let mut connection = self
-            .connection
-            .lock()
-            .map_err(|_| PyValueError::new_err("native connection lock poisoned"))?;
+        let mut connection = self.acquire()?;
         let dialect = AnyDialect::parse(connection.dialect())
             .map_err(|error| PyValueError::new_err(error.to_string()))?;
         let result = connection
@@ -305,10 +376,7 @@ impl PyDatabase {
     }
 
     fn columns(&self, py: Python<'_>, table: &str) -> PyResult<Py<PyAny>> {
-        let mut connection = self
-            .connection
-            .lock()
-            .map_err(|_| PyValueError::new_err("native connection lock poisoned"))?;
+        let mut connection = self.acquire()?;
         let dialect = AnyDialect::parse(connection.dialect())
             .map_err(|error| PyValueError::new_err(error.to_string()))?;
         let result = connection
@@ -337,10 +405,7 @@ impl PyDatabase {
         table: &str,
         include_autoindexes: bool,
     ) -> PyResult<Py<PyAny>> {
-        let mut connection = self
-            .connection
-            .lock()
-            .map_err(|_| PyValueError::new_err("native connection lock poisoned"))?;
+        let mut connection = self.acquire()?;
         let dialect = AnyDialect::parse(connection.dialect())
             .map_err(|error| PyValueError::new_err(error.to_string()))?;
         let result = connection
@@ -379,10 +444,7 @@ impl PyDatabase {
     }
 
     fn foreign_keys(&self, py: Python<'_>, table: &str) -> PyResult<Py<PyAny>> {
-        let mut connection = self
-            .connection
-            .lock()
-            .map_err(|_| PyValueError::new_err("native connection lock poisoned"))?;
+        let mut connection = self.acquire()?;
         let dialect = AnyDialect::parse(connection.dialect())
             .map_err(|error| PyValueError::new_err(error.to_string()))?;
         let result = connection
@@ -406,18 +468,12 @@ impl PyDatabase {
     }
 
     fn ensure_revision_table(&self) -> PyResult<()> {
-        let mut connection = self
-            .connection
-            .lock()
-            .map_err(|_| PyValueError::new_err("native connection lock poisoned"))?;
+        let mut connection = self.acquire()?;
         ensure_revision_table(&mut connection)
     }
 
     fn applied_revisions(&self, py: Python<'_>) -> PyResult<Py<PyAny>> {
-        let mut connection = self
-            .connection
-            .lock()
-            .map_err(|_| PyValueError::new_err("native connection lock poisoned"))?;
+        let mut connection = self.acquire()?;
         ensure_revision_table(&mut connection)?;
         let dialect = AnyDialect::parse(connection.dialect())
             .map_err(|error| PyValueError::new_err(error.to_string()))?;
@@ -440,16 +496,16 @@ impl PyDatabase {
         operations: Vec<(String, Vec<Py<PyAny>>)>,
     ) -> PyResult<()> {
         let operations = py_operations_to_db(py, operations)?;
-        let mut connection = self
-            .connection
-            .lock()
-            .map_err(|_| PyValueError::new_err("native connection lock poisoned"))?;
-        run_migration(
+        let mut connection = self.acquire()?;
+        let result = run_migration(
             &mut connection,
             revision,
             operations,
             MigrationDirection::Apply,
-        )
+        );
+        drop(connection);
+        self.invalidate_statements()?;
+        result
     }
 
     fn rollback_migration(
@@ -459,90 +515,237 @@ impl PyDatabase {
         operations: Vec<(String, Vec<Py<PyAny>>)>,
     ) -> PyResult<()> {
         let operations = py_operations_to_db(py, operations)?;
-        let mut connection = self
-            .connection
-            .lock()
-            .map_err(|_| PyValueError::new_err("native connection lock poisoned"))?;
-        run_migration(
+        let mut connection = self.acquire()?;
+        let result = run_migration(
             &mut connection,
             revision,
             operations,
             MigrationDirection::Rollback,
-        )
+        );
+        drop(connection);
+        self.invalidate_statements()?;
+        result
     }
 
+    /// Open a transaction on a pooled connection and return its pin token.
+    ///
+    /// Only table handles bound to the token (see
+    /// `PyTableHandle.in_transaction`) run on the transaction's connection.
     #[pyo3(signature = (options=None))]
-    fn begin(&self, py: Python<'_>, options: Option<PyTransactionOptions>) -> PyResult<()> {
+    fn begin(&self, py: Python<'_>, options: Option<PyTransactionOptions>) -> PyResult<u64> {
         let options = options
             .map(|options| options.to_rust_options())
             .transpose()?;
         py.detach(|| {
-            let mut connection = self
-                .connection
-                .lock()
-                .map_err(|_| "native connection lock poisoned".to_string())?;
-            match options {
-                Some(options) => connection
-                    .begin_with(options)
-                    .map_err(|error| error.to_string()),
-                None => connection.begin().map_err(|error| error.to_string()),
-            }
+            let mut connection = self.pool.acquire().map_err(|error| error.to_string())?;
+            let begun = match options {
+                Some(options) => connection.begin_with(options),
+                None => connection.begin(),
+            };
+            begun.map_err(|error| error.to_string())?;
+            // Checkouts made with the token reuse this connection until commit/rollback.
+            connection.pin().map_err(|error| error.to_string())
         })
         .map_err(PyValueError::new_err)
     }
 
-    fn commit(&self, py: Python<'_>) -> PyResult<()> {
+    fn commit(&self, py: Python<'_>, token: u64) -> PyResult<()> {
         py.detach(|| {
-            self.connection
-                .lock()
-                .map_err(|_| "native connection lock poisoned".to_string())?
-                .commit()
-                .map_err(|error| error.to_string())
+            let mut connection = self
+                .pool
+                .acquire_pinned(token)
+                .map_err(|error| error.to_string())?;
+            let result = connection.commit();
+            if result.is_err() {
+                // Never hand a connection with an open transaction back to the pool.
+                let _ = connection.rollback();
+            }
+            connection.unpin();
+            result.map_err(|error| error.to_string())
         })
         .map_err(PyValueError::new_err)
     }
 
-    fn rollback(&self, py: Python<'_>) -> PyResult<()> {
+    fn rollback(&self, py: Python<'_>, token: u64) -> PyResult<()> {
         py.detach(|| {
-            self.connection
-                .lock()
-                .map_err(|_| "native connection lock poisoned".to_string())?
-                .rollback()
-                .map_err(|error| error.to_string())
+            let mut connection = self
+                .pool
+                .acquire_pinned(token)
+                .map_err(|error| error.to_string())?;
+            let result = connection.rollback();
+            connection.unpin();
+            result.map_err(|error| error.to_string())
         })
         .map_err(PyValueError::new_err)
     }
 
-    fn savepoint(&self, py: Python<'_>, name: &str) -> PyResult<()> {
+    fn savepoint(&self, py: Python<'_>, token: u64, name: &str) -> PyResult<()> {
         py.detach(|| {
-            self.connection
-                .lock()
-                .map_err(|_| "native connection lock poisoned".to_string())?
+            self.pool
+                .acquire_pinned(token)
+                .map_err(|error| error.to_string())?
                 .savepoint(name)
                 .map_err(|error| error.to_string())
         })
         .map_err(PyValueError::new_err)
     }
 
-    fn rollback_to_savepoint(&self, py: Python<'_>, name: &str) -> PyResult<()> {
+    fn rollback_to_savepoint(&self, py: Python<'_>, token: u64, name: &str) -> PyResult<()> {
         py.detach(|| {
-            self.connection
-                .lock()
-                .map_err(|_| "native connection lock poisoned".to_string())?
+            self.pool
+                .acquire_pinned(token)
+                .map_err(|error| error.to_string())?
                 .rollback_to_savepoint(name)
                 .map_err(|error| error.to_string())
         })
         .map_err(PyValueError::new_err)
     }
 
-    fn release_savepoint(&self, py: Python<'_>, name: &str) -> PyResult<()> {
+    fn release_savepoint(&self, py: Python<'_>, token: u64, name: &str) -> PyResult<()> {
         py.detach(|| {
-            self.connection
-                .lock()
-                .map_err(|_| "native connection lock poisoned".to_string())?
+            self.pool
+                .acquire_pinned(token)
+                .map_err(|error| error.to_string())?
                 .release_savepoint(name)
                 .map_err(|error| error.to_string())
         })
         .map_err(PyValueError::new_err)
     }
+
+    /// Drop prepared statements on every pooled connection after external DDL.
+    fn invalidate_statements(&self) -> PyResult<()> {
+        self.pool
+            .invalidate_statements()
+            .map_err(|error| PyValueError::new_err(error.to_string()))
+    }
+
+    /// Run a blocking runtime call on a native worker and return an asyncio future.
+    ///
+    /// Calls on a pinned transaction's connection, such as COMMIT, pass
+    /// `pinned=True` so they run on the transaction workers.
+    #[pyo3(signature = (callable, pinned=false))]
+    fn spawn(&self, py: Python<'_>, callable: Py<PyAny>, pinned: bool) -> PyResult<Py<PyAny>> {
+        let executor = if pinned {
+            self.transaction_executor()?
+        } else {
+            self.native_executor()?
+        };
+        executor.submit_callable(py, callable)
+    }
+
+    fn pool_statistics(&self, py: Python<'_>) -> PyResult<Py<PyAny>> {
+        let statistics = self
+            .pool
+            .statistics()
+            .map_err(|error| PyValueError::new_err(error.to_string()))?;
+        let payload = PyDict::new(py);
+        payload.set_item("min_size", statistics.min_size)?;
+        payload.set_item("max_size", statistics.max_size)?;
+        payload.set_item("size", statistics.size)?;
+        payload.set_item("idle", statistics.idle)?;
+        payload.set_item("in_use", statistics.in_use)?;
+        payload.set_item("pinned", statistics.pinned)?;
+        payload.set_item("acquired", statistics.acquired)?;
+        payload.set_item("waited", statistics.waited)?;
+        payload.set_item("wait_time_ms", statistics.wait_time.as_secs_f64() * 1000.0)?;
+        payload.set_item(
+            "max_wait_time_ms",
+            statistics.max_wait_time.as_secs_f64() * 1000.0,
+        )?;
+        payload.set_item("timeouts", statistics.timeouts)?;
+        payload.set_item("created", statistics.created)?;
+        payload.set_item("closed", statistics.closed)?;
+        payload.set_item("health_check_failures", statistics.health_check_failures)?;
+        Ok(payload.into_any().unbind())
+    }
+
+    fn select_cache_statistics(&self, py: Python<'_>) -> PyResult<Py<PyAny>> {
+        let statistics = self.select_cache.statistics()?;
+        let payload = PyDict::new(py);
+        payload.set_item("capacity", statistics.capacity)?;
+        payload.set_item("size", statistics.size)?;
+        payload.set_item("hits", statistics.hits)?;
+        payload.set_item("misses", statistics.misses)?;
+        payload.set_item("evictions", statistics.evictions)?;
+        Ok(payload.into_any().unbind())
+    }
+
+    /// Per-table, per-operation latency, row, byte, and cache counters.
+    fn query_metrics(&self, py: Python<'_>) -> PyResult<Py<PyAny>> {
+        let payload = PyDict::new(py);
+        for (table, snapshot) in self.metrics.snapshot()? {
+            let operations = PyDict::new(py);
+            for (operation, metrics) in &snapshot.operations {
+                operations.set_item(*operation, operation_metrics(py, metrics)?)?;
+            }
+            let table_payload = PyDict::new(py);
+            table_payload.set_item("compile_cache_hits", snapshot.compile_cache_hits)?;
+            table_payload.set_item("compile_cache_misses", snapshot.compile_cache_misses)?;
+            table_payload.set_item("statement_cache_hits", snapshot.statement_cache_hits)?;
+            table_payload.set_item("statement_cache_misses", snapshot.statement_cache_misses)?;
+            table_payload.set_item("operations", operations)?;
+            payload.set_item(table, table_payload)?;
+        }
+        Ok(payload.into_any().unbind())
+    }
+}
+
+impl PyDatabase {
+    fn native_executor(&self) -> PyResult<Arc<NativeExecutor>> {
+        if let Some(executor) = self.executor.get() {
+            return Ok(Arc::clone(executor));
+        }
+        // Unpinned statements block in `acquire` only while another unpinned
+        // statement holds a connection, so one worker per connection suffices.
+        let executor = Arc::new(NativeExecutor::new(self.pool.config().max_size())?);
+        Ok(Arc::clone(self.executor.get_or_init(|| executor)))
+    }
+
+    /// Workers for statements on pinned transaction connections.
+    ///
+    /// Kept apart from the unpinned workers so a transaction's statements and
+    /// COMMIT never queue behind callers waiting for a free connection. At
+    /// most one transaction pins each connection, and a statement waiting for
+    /// its transaction's connection waits on one that is running, so one
+    /// worker per connection suffices here too.
+    fn transaction_executor(&self) -> PyResult<Arc<NativeExecutor>> {
+        if let Some(executor) = self.transaction_executor.get() {
+            return Ok(Arc::clone(executor));
+        }
+        let executor = Arc::new(NativeExecutor::new(self.pool.config().max_size())?);
+        Ok(Arc::clone(
+            self.transaction_executor.get_or_init(|| executor),
+        ))
+    }
+
+    fn acquire(&self) -> PyResult<PooledConnection> {
+        self.pool
+            .acquire()
+            .map_err(|error| PyValueError::new_err(error.to_string()))
+    }
+}
+
+fn operation_metrics<'py>(
+    py: Python<'py>,
+    metrics: &OperationSnapshot,
+) -> PyResult<Bound<'py, PyDict>> {
+    let milliseconds = |duration: Duration| duration.as_secs_f64() * 1000.0;
+    let payload = PyDict::new(py);
+    payload.set_item("calls", metrics.calls)?;
+    payload.set_item("errors", metrics.errors)?;
+    payload.set_item("rows", metrics.rows)?;
+    payload.set_item("bytes", metrics.bytes)?;
+    payload.set_item("pool_wait_ms", milliseconds(metrics.pool_wait))?;
+    payload.set_item("total_ms", milliseconds(metrics.total))?;
+    payload.set_item("max_ms", milliseconds(metrics.max))?;
+    payload.set_item("p50_ms", milliseconds(metrics.p50))?;
+    payload.set_item("p90_ms", milliseconds(metrics.p90))?;
+    payload.set_item("p99_ms", milliseconds(metrics.p99))?;
+    payload.set_item("buckets", metrics.buckets.clone())?;
+    Ok(payload)
+}
+
+fn seconds(value: f64, option: &str) -> PyResult<Duration> {
+    Duration::try_from_secs_f64(value)
+        .map_err(|_| PyValueError::new_err(format!("{option} must be a non-negative number")))
 }
@@ -0,0 +1,161 @@
+use pyo3::exceptions::PyValueError;
+use pyo3::prelude::*;
+use pyo3::sync::PyOnceLock;
+use pyo3::types::PyCFunction;
+use std::sync::mpsc::{channel, Sender};
+use std::sync::{Arc, Mutex};
+use std::thread;
+
+type Job = Box<dyn FnOnce() + Send + 'static>;
+
+static RESOLVE_FUTURE: PyOnceLock<Py<PyCFunction>> = PyOnceLock::new();
+
+/// Worker threads owned by the native runtime.
+///
+/// Jobs run without holding the GIL and complete asyncio futures through
+/// `loop.call_soon_threadsafe`, so database I/O never occupies the event
+/// loop's default executor.
+pub(crate) struct NativeExecutor {
+    sender: Sender<Job>,
+}
+
+impl NativeExecutor {
+    pub(crate) fn new(workers: usize) -> PyResult<Self> {
+        let (sender, receiver) = channel::<Job>();
+        let receiver = Arc::new(Mutex::new(receiver));
+        for index in 0..workers.max(1) {
+            let receiver = Arc::clone(&receiver);
+            thread::Builder::new()
+                .name(format!("ormdantic-native-{index}"))
+                .spawn(move || loop {
+                    let job = match receiver.lock() {
+                        Ok(receiver) => receiver.recv(),
+                        Err(_) => return,
+                    };
+                    match job {
+                        Ok(job) => job(),
+                        Err(_) => return,
+                    }
+                })
+                .map_err(|error| PyValueError::new_err(error.to_string()))?;
+        }
+        Ok(Self { sender })
+    }
+
+    /// Run `work` on a worker thread and return an asyncio future for its result.
+    ///
+    /// `work` runs detached from the interpreter; `finish` converts its output
+    /// to a Python object once the GIL is reacquired.
+    pub(crate) fn submit<T, W, F>(&self, py: Python<'_>, work: W, finish: F) -> PyResult<Py<PyAny>>
+    where
+        T: Send + 'static,
+        W: FnOnce() -> Result<T, String> + Send + 'static,
+        F: FnOnce(Python<'_>, T) -> PyResult<Py<PyAny>> + Send + 'static,
+    {
+        let event_loop = py
+            .import("asyncio")?
+            .call_method0("get_running_loop")?
+            .unbind();
+        let future = event_loop.call_method0(py, "create_future")?;
+        let pending = (event_loop, future.clone_ref(py));
+        self.sender
+            .send(Box::new(move || {
+                let output = work();
+                Python::attach(|py| {
+                    let (event_loop, future) = pending;
+                    let outcome = output
+                        .map_err(PyValueError::new_err)
+                        .and_then(|value| finish(py, value));
+                    let _ = resolve_on_loop(py, &event_loop, &future, outcome);
+                });
+            }))
+            .map_err(|_| PyValueError::new_err("native executor is shut down"))?;
+        Ok(future)
+    }
+
+    /// Call a Python callable on a worker thread and await it from asyncio.
+    pub(crate) fn submit_callable(
+        &self,
+        py: Python<'_>,
+        callable: Py<PyAny>,
+    ) -> PyResult<Py<PyAny>> {
+        let event_loop = py
+            .import("asyncio")?
+            .call_method0("get_running_loop")?
+            .unbind();
+        let future = event_loop.call_method0(py, "create_future")?;
+        let pending = (event_loop, future.clone_ref(py));
+        self.sender
+            .send(Box::new(move || {
+                Python::attach(|py| {
+                    let (event_loop, future) = pending;
+                    let outcome = callable.call0(py);
+                    let _ = resolve_on_loop(py, &event_loop, &future, outcome);
+                });
+            }))
+            .map_err(|_| PyValueError::new_err("native executor is shut down"))?;
+        Ok(future)
+    }
+}
+
+fn resolve_on_loop(
+    py: Python<'_>,
+    event_loop: &Py<PyAny>,
+    future: &Py<PyAny>,
+    outcome: PyResult<Py<PyAny>>,
+) -> PyResult<()> {
+    let resolve = RESOLVE_FUTURE.get_or_try_init(py, || {
+        wrap_pyfunction!(resolve_future, py).map(Bound::unbind)
+    })?;
+    let (value, error) = match outcome {
+        Ok(value) => (value, py.None()),
+        Err(error) => (py.None(), error.into_value(py).into_any()),
+    };
+    // The loop may already be closed when a caller abandons its future.
+    event_loop.call_method1(
+        py,
+        "call_soon_threadsafe",
+        (resolve.clone_ref(py), future.clone_ref(py), value, error),
+    )?;
+    Ok(())
+}
+
+#[pyfunction]
+fn resolve_future(
+    future: &Bound<'_, PyAny>,
+    value: Py<PyAny>,
+    error: &Bound<'_, PyAny>,
+) -> PyResult<()> {
+    if future.call_method0("done")?.is_truthy()? {
+        return Ok(());
+    }
+    if error.is_none() {
+        future.call_method1("set_result", (value,))?;
+    } else {
+        future.call_method1("set_exception", (error,))?;
+    }
+    Ok(())
+}
+
+#[cfg(test)]
+mod tests {
+    use super::NativeExecutor;
+    use std::sync::mpsc::channel;
+
+    #[test]
+    fn native_executor_runs_jobs_on_named_worker_threads() {
+        let executor = NativeExecutor::new(2).expect("executor should start");
+        let (sender, receiver) = channel();
+
+        executor
+            .sender
+            .send(Box::new(move || {
+                let name = std::thread::current().name().map(str::to_string);
+                sender.send(name).expect("test receiver should be alive");
+            }))
+            .expect("executor should accept jobs");
+
+        let name = receiver.recv().expect("job should run");
+        assert!(name.is_some_and(|name| name.starts_with("ormdantic-native-")));
+    }
+}
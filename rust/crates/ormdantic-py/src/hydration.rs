@@ -1,10 +1,12 @@
 use ormdantic_hydrate::{
-    merge_selectin_results, FlatHydrationPlan, HydratedRow, ResultShape, SelectInHydrationPlan,
+    group_selectin_children, merge_selectin_results, FlatHydrationPlan, HydratedRow,
+    HydrationGraph, RelationshipNode, ResultShape, SelectInHydrationPlan, SelectInKey,
 };
 use ormdantic_schema::{RelationshipCardinality, RelationshipDef, TableDef};
-use pyo3::exceptions::PyValueError;
+use pyo3::exceptions::{PyAttributeError, PyValueError};
 use pyo3::prelude::*;
-use pyo3::types::{PyDict, PyList};
+use pyo3::types::{PyBool, PyDict, PyInt, PyList, PyString, PyTuple};
+use std::cmp::Ordering;
 use std::collections::{BTreeMap, HashMap, HashSet};
 
 #[pyfunction]
@@ -48,88 +50,236 @@ pub(crate) fn hydrate_flat(
     Ok(PyList::new(py, records)?.into_any().unbind())
 }
 
+/// One table path of a joined load as Python describes it: path, table name,
+/// primary key, whether the relationship holds a list, identity token, model
+/// factory and column converters.
+type GraphNodeSpec = (
+    String,
+    String,
+    String,
+    bool,
+    Py<PyAny>,
+    Py<PyAny>,
+    HashMap<String, Py<PyAny>>,
+);
+
+struct GraphPath<'py> {
+    field: String,
+    uselist: bool,
+    slot: usize,
+    model: Bound<'py, PyAny>,
+    factory: Bound<'py, PyAny>,
+    columns: Vec<(usize, String, Option<Bound<'py, PyAny>>)>,
+    index: Bound<'py, PyDict>,
+    entries: Vec<GraphEntry<'py>>,
+    linked: HashSet<(usize, usize)>,
+}
+
+struct GraphEntry<'py> {
+    key: Bound<'py, PyAny>,
+    record: Bound<'py, PyDict>,
+    links: Vec<Vec<usize>>,
+}
+
+/// Hydrate joined rows straight into model graphs.
+///
+/// `nodes` lists the loaded paths parents first, the root path first. One
+/// pass over `rows` collects a converted record per path and primary key,
+/// plus the ordered children of each record. Models are then built children
+/// first: each factory receives its record with relationships already set,
+/// `None` for a missing single relationship and nothing for an empty list.
+/// Non-root models are shared by identity token and key; a model reached
+/// again through another path gets that path's relationships assigned.
 #[pyfunction]
-pub(crate) fn hydrate_joined(
+pub(crate) fn hydrate_graph(
     py: Python<'_>,
     columns: Vec<String>,
     rows: Vec<Vec<Py<PyAny>>>,
-    path_pks: Vec<(String, String)>,
-    array_paths: Vec<String>,
+    nodes: Vec<GraphNodeSpec>,
 ) -> PyResult<Py<PyAny>> {
-    let parsed_columns = columns
+    for alias in &columns {
+        split_alias(alias)?;
+    }
+    let Some((root_path, _, root_pk, ..)) = nodes.first() else {
+        return Err(PyValueError::new_err(
+            "joined hydration requires a root node",
+        ));
+    };
+    let graph = HydrationGraph::new(TableDef::new(
+        root_path.clone(),
+        root_pk.clone(),
+        Vec::new(),
+    ))
+    .with_relationships(relationship_nodes(&nodes[1..], root_path));
+    let plans = graph.path_plans(&columns);
+    let specs = nodes
         .iter()
-        .map(|alias| split_alias(alias))
-        .collect::<PyResult<Vec<_>>>()?;
-    let path_pk_map = path_pks.into_iter().collect::<HashMap<_, _>>();
-    let array_paths = array_paths.into_iter().collect::<HashSet<_>>();
-    let mut path_indexes = HashMap::new();
-    let mut path_plans: Vec<(String, Vec<(usize, String)>)> = Vec::new();
-    for (column_index, (path, column)) in parsed_columns.iter().enumerate() {
-        let plan_index = *path_indexes.entry(path.clone()).or_insert_with(|| {
-            path_plans.push((path.clone(), Vec::new()));
-            path_plans.len() - 1
+        .map(|node| (node.0.as_str(), node))
+        .collect::<HashMap<_, _>>();
+
+    let mut paths = Vec::with_capacity(plans.len());
+    for (position, plan) in plans.iter().enumerate() {
+        let Some((_, _, _, uselist, model, factory, converters)) = specs.get(plan.path()) else {
+            return Err(PyValueError::new_err(format!(
+                "no hydration node for path '{}'",
+                plan.path()
+            )));
+        };
+        paths.push(GraphPath {
+            field: plan
+                .relationship()
+                .map_or_else(String::new, |relationship| relationship.field().to_string()),
+            uselist: *uselist,
+            slot: plan
+                .parent()
+                .and_then(|parent| {
+                    plans[parent]
+                        .children()
+                        .iter()
+                        .position(|child| *child == position)
+                })
+                .unwrap_or_default(),
+            model: model.bind(py).clone(),
+            factory: factory.bind(py).clone(),
+            columns: plan
+                .columns()
+                .iter()
+                .map(|(index, column)| {
+                    (
+                        *index,
+                        column.clone(),
+                        converters
+                            .get(column)
+                            .map(|converter| converter.bind(py).clone()),
+                    )
+                })
+                .collect(),
+            index: PyDict::new(py),
+            entries: Vec::new(),
+            linked: HashSet::new(),
         });
-        if !column.is_empty() {
-            path_plans[plan_index]
-                .1
-                .push((column_index, column.clone()));
+    }
+
+    let mut row_entries = vec![None; plans.len()];
+    for row in &rows {
+        row_entries.fill(None);
+        for (position, plan) in plans.iter().enumerate() {
+            let parent_entry = match plan.parent() {
+                Some(parent) => match row_entries[parent] {
+                    Some(entry) => Some((parent, entry)),
+                    None => continue,
+                },
+                None => None,
+            };
+            let Some(key) = row_key(py, row, plan.primary_key_indexes())? else {
+                continue;
+            };
+            let path = &mut paths[position];
+            let entry = match path.index.get_item(&key)? {
+                Some(entry) => entry.extract::<usize>()?,
+                None => {
+                    let record = PyDict::new(py);
+                    for (index, column, converter) in &path.columns {
+                        let Some(value) = row.get(*index) else {
+                            continue;
+                        };
+                        let value = value.bind(py);
+                        match converter {
+                            Some(converter) => {
+                                record.set_item(column, converter.call1((value,))?)?
+                            }
+                            None => record.set_item(column, value)?,
+                        }
+                    }
+                    let entry = path.entries.len();
+                    path.index.set_item(&key, entry)?;
+                    path.entries.push(GraphEntry {
+                        key,
+                        record,
+                        links: vec![Vec::new(); plan.children().len()],
+                    });
+                    entry
+                }
+            };
+            row_entries[position] = Some(entry);
+            if let Some((parent, parent_entry)) = parent_entry {
+                if path.linked.insert((parent_entry, entry)) {
+                    let slot = path.slot;
+                    paths[parent].entries[parent_entry].links[slot].push(entry);
+                }
+            }
         }
     }
-    let root = PyDict::new(py);
 
-    for row in rows {
-        let row_pks = collect_row_pks(py, &row, &parsed_columns, &path_pk_map);
-        for (path, columns) in &path_plans {
-            let mut node = root.clone();
-            let mut current_path = String::new();
-            let mut should_set = true;
-            for (branch_idx, branch) in path.split('/').enumerate() {
-                if branch_idx == 0 {
-                    current_path.push_str(branch);
+    let set_attribute = py
+        .import("builtins")?
+        .getattr("object")?
+        .getattr("__setattr__")?;
+    let identities = PyDict::new(py);
+    let mut instances: Vec<Vec<Bound<'_, PyAny>>> = (0..plans.len()).map(|_| Vec::new()).collect();
+    for position in (0..plans.len()).rev() {
+        let plan = &plans[position];
+        let path = &paths[position];
+        let mut built = Vec::with_capacity(path.entries.len());
+        for entry in &path.entries {
+            let mut relationships = Vec::with_capacity(plan.children().len());
+            for (child, linked) in plan.children().iter().zip(&entry.links) {
+                let child_path = &paths[*child];
+                let value = if child_path.uselist {
+                    if linked.is_empty() {
+                        continue;
+                    }
+                    PyList::new(py, linked.iter().map(|item| &instances[*child][*item]))?.into_any()
                 } else {
-                    current_path.push('/');
-                    current_path.push_str(branch);
-                }
-                let Some(pk_value) = row_pks.get(&current_path) else {
-                    should_set = false;
-                    break;
+                    match linked.first() {
+                        Some(item) => instances[*child][*item].clone(),
+                        None => py.None().into_bound(py),
+                    }
                 };
-                if pk_value.bind(py).is_none() {
-                    should_set = false;
-                    break;
+                relationships.push((child_path.field.as_str(), value));
+            }
+
+            // Roots are never shared; they are the graphs being returned.
+            let identity = if position == 0 {
+                None
+            } else {
+                Some(PyTuple::new(py, [&path.model, &entry.key])?)
+            };
+            let shared = match &identity {
+                Some(identity) => identities
+                    .get_item(identity)?
+                    .map(|found| found.extract::<(Bound<'_, PyAny>, usize)>())
+                    .transpose()?
+                    .filter(|(_, origin)| !is_descendant(plans[*origin].path(), plan.path())),
+                None => None,
+            };
+            let instance = match shared {
+                Some((instance, _)) => {
+                    for (field, value) in &relationships {
+                        set_attribute.call1((&instance, *field, value))?;
+                    }
+                    instance
                 }
-                let branch_node = match node.get_item(branch)? {
-                    Some(branch_node) => branch_node.cast_into::<PyDict>()?,
-                    None => {
-                        let branch_node = PyDict::new(py);
-                        node.set_item(branch, &branch_node)?;
-                        branch_node
+                None => {
+                    for (field, value) in &relationships {
+                        entry.record.set_item(*field, value)?;
                     }
-                };
-                if array_paths.contains(&current_path) {
-                    node = match branch_node.get_item(pk_value.bind(py))? {
-                        Some(item) => item.cast_into::<PyDict>()?,
-                        None => {
-                            let item = PyDict::new(py);
-                            branch_node.set_item(pk_value.bind(py), &item)?;
-                            item
+                    let instance = path.factory.call1((&entry.record,))?;
+                    if let Some(identity) = identity {
+                        // A model nested under its own identity stays a copy.
+                        if !identities.contains(&identity)? {
+                            identities.set_item(identity, (&instance, position))?;
                         }
-                    };
-                } else {
-                    node = branch_node;
-                }
-            }
-            if should_set {
-                for (column_index, column) in columns {
-                    if let Some(value) = row.get(*column_index) {
-                        node.set_item(column, value.bind(py))?;
                     }
+                    instance
                 }
-            }
+            };
+            built.push(instance);
         }
+        instances[position] = built;
     }
 
-    Ok(root.into_any().unbind())
+    Ok(PyList::new(py, &instances[0])?.into_any().unbind())
 }
 
 #[pyfunction]
@@ -189,6 +339,145 @@ pub(crate) fn execute_selectin_load(
     hydrated_rows_to_python(py, merged)
 }
 
+/// Match select-in children to their parents by typed key.
+///
+/// `parent_keys` holds one key per parent and `child_keys` one key per child,
+/// both already normalized by the caller. Children failing `filter_by` are
+/// dropped and each collection is sorted by `order_by`, given as
+/// `(column, descending)` pairs. Returns, per parent, the list of child
+/// indexes (or, for scalar relationships, one index or `None`), plus every
+/// assigned child index in first-assignment order.
+#[pyfunction]
+#[pyo3(signature = (parent_keys, children, child_keys, uselist, filter_by=Vec::new(), order_by=Vec::new()))]
+pub(crate) fn merge_selectin(
+    py: Python<'_>,
+    parent_keys: Vec<Bound<'_, PyAny>>,
+    children: Vec<Bound<'_, PyAny>>,
+    child_keys: Vec<Bound<'_, PyAny>>,
+    uselist: bool,
+    filter_by: Vec<(String, Bound<'_, PyAny>)>,
+    order_by: Vec<(String, bool)>,
+) -> PyResult<(Py<PyAny>, Vec<usize>)> {
+    let uuid_type = py.import("uuid")?.getattr("UUID")?;
+    let parent_keys = parent_keys
+        .iter()
+        .map(|key| selectin_key(key, &uuid_type))
+        .collect::<PyResult<Vec<_>>>()?;
+    if child_keys.len() != children.len() {
+        return Err(PyValueError::new_err(
+            "merge_selectin needs one child key per child",
+        ));
+    }
+    let mut keys = Vec::with_capacity(children.len());
+    for (child, key) in children.iter().zip(&child_keys) {
+        keys.push(if matches_loader_filter(child, &filter_by)? {
+            selectin_key(key, &uuid_type)?
+        } else {
+            None
+        });
+    }
+    let assignments = PyList::empty(py);
+    let mut assigned = Vec::new();
+    let mut seen = HashSet::new();
+    for mut group in group_selectin_children(&parent_keys, &keys) {
+        if uselist {
+            order_selectin_group(&children, &mut group, &order_by)?;
+        } else {
+            group.truncate(1);
+        }
+        assigned.extend(group.iter().copied().filter(|index| seen.insert(*index)));
+        if uselist {
+            assignments.append(PyList::new(py, group)?)?;
+        } else {
+            assignments.append(group.first().copied())?;
+        }
+    }
+    Ok((assignments.into_any().unbind(), assigned))
+}
+
+/// Convert a Python key to its typed form; `None` has no key.
+///
+/// Strings, integers and UUIDs keep their type. Other values are keyed by
+/// their string form.
+fn selectin_key(
+    value: &Bound<'_, PyAny>,
+    uuid_type: &Bound<'_, PyAny>,
+) -> PyResult<Option<SelectInKey>> {
+    if value.is_none() {
+        return Ok(None);
+    }
+    if let Ok(text) = value.cast::<PyString>() {
+        return Ok(Some(SelectInKey::Text(text.to_str()?.to_string())));
+    }
+    if value.is_instance_of::<PyInt>() && !value.is_instance_of::<PyBool>() {
+        if let Ok(integer) = value.extract::<i64>() {
+            return Ok(Some(SelectInKey::Integer(integer)));
+        }
+    }
+    if value.is_instance(uuid_type)? {
+        return Ok(Some(SelectInKey::Uuid(value.getattr("int")?.extract()?)));
+    }
+    Ok(Some(SelectInKey::Text(value.str()?.to_str()?.to_string())))
+}
+
+fn matches_loader_filter(
+    child: &Bound<'_, PyAny>,
+    filter_by: &[(String, Bound<'_, PyAny>)],
+) -> PyResult<bool> {
+    for (column, expected) in filter_by {
+        let actual = optional_attribute(child, column)?;
+        if !actual.eq(expected)? && actual.str()?.to_str()? != expected.str()?.to_str()? {
+            return Ok(false);
+        }
+    }
+    Ok(true)
+}
+
+/// Stable-sort one collection by each column in turn, last column first, with
+/// `None` values after all others.
+fn order_selectin_group(
+    children: &[Bound<'_, PyAny>],
+    group: &mut [usize],
+    order_by: &[(String, bool)],
+) -> PyResult<()> {
+    for (column, descending) in order_by.iter().rev() {
+        let mut values = HashMap::with_capacity(group.len());
+        for &index in group.iter() {
+            let value = optional_attribute(&children[index], column)?;
+            values.insert(index, (!value.is_none()).then_some(value));
+        }
+        let mut error = None;
+        group.sort_by(|left, right| {
+            let (left, right) = if *descending {
+                (&values[right], &values[left])
+            } else {
+                (&values[left], &values[right])
+            };
+            match (left, right) {
+                (Some(left), Some(right)) => left.compare(right).unwrap_or_else(|err| {
+                    error.get_or_insert(err);
+                    Ordering::Equal
+                }),
+                (left, right) => left.is_none().cmp(&right.is_none()),
+            }
+        });
+        if let Some(error) = error {
+            return Err(error);
+        }
+    }
+    Ok(())
+}
+
+fn optional_attribute<'py>(value: &Bound<'py, PyAny>, name: &str) -> PyResult<Bound<'py, PyAny>> {
+    match value.getattr(name) {
+        Ok(attribute) => Ok(attribute),
+        Err(error) if error.is_instance_of::<PyAttributeError>(value.py()) => {
+            Ok(value.py().None().into_bound(value.py()))
+        }
+        Err(error) => Err(error),
+    }
+}
+
 fn split_alias(alias: &str) -> PyResult<(String, String)> {
     alias.split_once('\\').map_or_else(
         || {
@@ -200,21 +489,50 @@ fn split_alias(alias: &str) -> PyResult<(String, String)> {
     )
 }
 
-fn collect_row_pks(
-    py: Python<'_>,
+fn relationship_nodes(nodes: &[GraphNodeSpec], parent: &str) -> Vec<RelationshipNode> {
+    nodes
+        .iter()
+        .filter(|(path, ..)| path.rsplit_once('/').map(|(prefix, _)| prefix) == Some(parent))
+        .map(|(path, tablename, pk, uselist, ..)| {
+            let field = path
+                .rsplit_once('/')
+                .map_or(path.as_str(), |(_, field)| field);
+            let cardinality = if *uselist {
+                RelationshipCardinality::Many
+            } else {
+                RelationshipCardinality::One
+            };
+            let relationship =
+                RelationshipDef::new(field, tablename.clone(), pk.clone(), cardinality)
+                    .uselist(*uselist);
+            RelationshipNode::new(path.clone(), relationship)
+                .with_children(relationship_nodes(nodes, path))
+        })
+        .collect()
+}
+
+fn row_key<'py>(
+    py: Python<'py>,
     row: &[Py<PyAny>],
-    parsed_columns: &[(String, String)],
-    path_pk_map: &HashMap<String, String>,
-) -> HashMap<String, Py<PyAny>> {
-    let mut row_pks = HashMap::new();
-    for (idx, (path, column)) in parsed_columns.iter().enumerate() {
-        if path_pk_map.get(path) == Some(column) {
-            if let Some(value) = row.get(idx) {
-                row_pks.insert(path.clone(), value.clone_ref(py));
-            }
+    indexes: &[usize],
+) -> PyResult<Option<Bound<'py, PyAny>>> {
+    let mut values = Vec::with_capacity(indexes.len());
+    for index in indexes {
+        match row.get(*index).map(|value| value.bind(py)) {
+            Some(value) if !value.is_none() => values.push(value.clone()),
+            _ => return Ok(None),
         }
     }
-    row_pks
+    match values.len() {
+        0 => Ok(None),
+        1 => Ok(values.pop()),
+        _ => Ok(Some(PyTuple::new(py, values)?.into_any())),
+    }
+}
+
+fn is_descendant(path: &str, ancestor: &str) -> bool {
+    path.strip_prefix(ancestor)
+        .is_some_and(|rest| rest.starts_with('/'))
 }
 
 fn hash_to_hydrated_row(row: HashMap<String, String>) -> HydratedRow {
@@ -268,6 +586,35 @@ mod tests {
         assert!(split_alias("id").is_err());
     }
 
+    #[test]
+    fn is_descendant_requires_a_path_separator() {
+        assert!(is_descendant("coffee/flavor/coffee", "coffee/flavor"));
+        assert!(!is_descendant("coffee/flavors", "coffee/flavor"));
+        assert!(!is_descendant("coffee/flavor", "coffee/flavor"));
+    }
+
+    #[test]
+    fn selectin_keys_keep_python_types_apart() {
+        Python::attach(|py| {
+            let uuid_type = py.import("uuid").unwrap().getattr("UUID").unwrap();
+            let key = |value: Bound<'_, PyAny>| selectin_key(&value, &uuid_type).unwrap();
+
+            assert_eq!(
+                key(1_i64.into_pyobject(py).unwrap().into_any()),
+                Some(SelectInKey::Integer(1))
+            );
+            assert_eq!(
+                key(PyString::new(py, "1").into_any()),
+                Some(SelectInKey::Text("1".to_string()))
+            );
+            assert_eq!(
+                key(PyBool::new(py, true).to_owned().into_any()),
+                Some(SelectInKey::Text("True".to_string()))
+            );
+            assert_eq!(key(py.None().into_bound(py)), None);
+        });
+    }
+
     #[test]
     fn hash_to_hydrated_row_orders_keys() {
         let row = HashMap::from([
@@ -0,0 +1,328 @@
+use crate::runtime::{db_value_to_bool, db_value_to_py};
+use ormdantic_engine::{DbValue, QueryResult};
+use pyo3::exceptions::PyValueError;
+use pyo3::prelude::*;
+use pyo3::types::PyBytes;
+
+/// One serialized model field: output key, source column, value kind, the
+/// JSON written when the column is absent (or null for `"raw"` fields), and
+/// the encoder of `"python"` fields.
+pub(crate) type JsonFieldSpec = (String, Option<String>, String, String, Option<Py<PyAny>>);
+
+#[derive(Debug)]
+enum JsonKind {
+    /// Numbers and booleans as they are; text as a string.
+    Value,
+    /// Booleans, including integer `0`/`1` cells.
+    Bool,
+    /// Floats; integer cells are written with a fractional part.
+    Float,
+    /// Strings; other cells are written in their text form.
+    String,
+    /// JSON documents stored as text, embedded unchanged.
+    Raw,
+    /// Cells passed to a Python callable that returns JSON bytes.
+    Python(Py<PyAny>),
+}
+
+#[derive(Debug)]
+struct JsonField {
+    key: Vec<u8>,
+    column: Option<String>,
+    kind: JsonKind,
+    default: String,
+}
+
+/// Writes flat query rows as a JSON array of objects.
+#[derive(Debug)]
+pub(crate) struct JsonRowWriter {
+    fields: Vec<JsonField>,
+}
+
+impl JsonRowWriter {
+    pub(crate) fn new(specs: Vec<JsonFieldSpec>) -> PyResult<Self> {
+        let fields = specs
+            .into_iter()
+            .map(|(key, column, kind, default, encoder)| {
+                let kind = match (kind.as_str(), encoder) {
+                    ("value", _) => JsonKind::Value,
+                    ("bool", _) => JsonKind::Bool,
+                    ("float", _) => JsonKind::Float,
+                    ("string", _) => JsonKind::String,
+                    ("raw", _) => JsonKind::Raw,
+                    ("python", Some(encoder)) => JsonKind::Python(encoder),
+                    (kind, _) => {
+                        return Err(PyValueError::new_err(format!(
+                            "unsupported JSON field kind '{kind}'"
+                        )))
+                    }
+                };
+                let mut encoded_key = Vec::with_capacity(key.len() + 3);
+                write_string(&mut encoded_key, &key);
+                encoded_key.push(b':');
+                Ok(JsonField {
+                    key: encoded_key,
+                    column,
+                    kind,
+                    default,
+                })
+            })
+            .collect::<PyResult<Vec<_>>>()?;
+        Ok(Self { fields })
+    }
+
+    /// Serialize `result` right away unless a field needs a Python encoder.
+    ///
+    /// Runs on the worker thread, so plain rows are written without the GIL.
+    pub(crate) fn prepare(self, result: QueryResult) -> PreparedJson {
+        if self
+            .fields
+            .iter()
+            .any(|field| matches!(field.kind, JsonKind::Python(_)))
+        {
+            return PreparedJson::Pending(self, result);
+        }
+        let mut output = Vec::new();
+        self.write(&result, &mut output, |_, _, _| {
+            unreachable!("no field needs a Python encoder")
+        })
+        .expect("plain fields are written without errors");
+        PreparedJson::Written(output)
+    }
+
+    fn write<E>(&self, result: &QueryResult, output: &mut Vec<u8>, mut encode: E) -> PyResult<()>
+    where
+        E: FnMut(&Py<PyAny>, &DbValue, &mut Vec<u8>) -> PyResult<()>,
+    {
+        let indexes = self
+            .fields
+            .iter()
+            .map(|field| {
+                let column = field.column.as_deref()?;
+                result
+                    .columns()
+                    .iter()
+                    .position(|name| name.rsplit('\\').next() == Some(column))
+            })
+            .collect::<Vec<_>>();
+        output.push(b'[');
+        for (row_index, row) in result.rows().iter().enumerate() {
+            if row_index > 0 {
+                output.push(b',');
+            }
+            output.push(b'{');
+            for (field_index, (field, index)) in self.fields.iter().zip(&indexes).enumerate() {
+                if field_index > 0 {
+                    output.push(b',');
+                }
+                output.extend_from_slice(&field.key);
+                let Some(value) = index.map(|index| &row[index]) else {
+                    output.extend_from_slice(field.default.as_bytes());
+                    continue;
+                };
+                match (&field.kind, value) {
+                    (JsonKind::Python(encoder), value) => encode(encoder, value, output)?,
+                    (JsonKind::Raw, DbValue::Null) => {
+                        output.extend_from_slice(field.default.as_bytes())
+                    }
+                    (kind, value) => write_value(output, kind, value),
+                }
+            }
+            output.push(b'}');
+        }
+        output.push(b']');
+        Ok(())
+    }
+}
+
+/// Rows serialized on the worker thread, or kept for the Python encoders.
+pub(crate) enum PreparedJson {
+    Written(Vec<u8>),
+    Pending(JsonRowWriter, QueryResult),
+}
+
+impl PreparedJson {
+    pub(crate) fn into_bytes(self, py: Python<'_>) -> PyResult<Py<PyAny>> {
+        let output = match self {
+            Self::Written(output) => output,
+            Self::Pending(writer, result) => {
+                let mut output = Vec::new();
+                writer.write(&result, &mut output, |encoder, value, output| {
+                    let encoded = encoder.call1(py, (db_value_to_py(py, value)?,))?;
+                    output.extend_from_slice(encoded.bind(py).cast::<PyBytes>()?.as_bytes());
+                    Ok(())
+                })?;
+                output
+            }
+        };
+        Ok(PyBytes::new(py, &output).into_any().unbind())
+    }
+}
+
+fn write_value(output: &mut Vec<u8>, kind: &JsonKind, value: &DbValue) {
+    match (kind, value) {
+        (_, DbValue::Null) => output.extend_from_slice(b"null"),
+        (JsonKind::Bool, value) => {
+            let value: &[u8] = if db_value_to_bool(value) {
+                b"true"
+            } else {
+                b"false"
+            };
+            output.extend_from_slice(value)
+        }
+        (JsonKind::String, DbValue::Text(value) | DbValue::Decimal(value)) => {
+            write_string(output, value)
+        }
+        (JsonKind::String, value) => write_string(output, &text_form(value)),
+        (JsonKind::Raw, DbValue::Text(value)) => output.extend_from_slice(value.as_bytes()),
+        (JsonKind::Float, DbValue::Integer(value)) => {
+            output.extend_from_slice(format!("{value}.0").as_bytes())
+        }
+        (JsonKind::Float, DbValue::UnsignedInteger(value)) => {
+            output.extend_from_slice(format!("{value}.0").as_bytes())
+        }
+        (JsonKind::Float, DbValue::Decimal(text) | DbValue::Text(text)) => {
+            match text.parse::<f64>() {
+                Ok(value) => write_float(output, value),
+                Err(_) => write_string(output, text),
+            }
+        }
+        (_, DbValue::Integer(value)) => output.extend_from_slice(value.to_string().as_bytes()),
+        (_, DbValue::UnsignedInteger(value)) => {
+            output.extend_from_slice(value.to_string().as_bytes())
+        }
+        (_, DbValue::Real(value)) => write_float(output, *value),
+        (_, DbValue::Bool(value)) => output.extend_from_slice(value.to_string().as_bytes()),
+        (_, DbValue::Text(value) | DbValue::Decimal(value)) => write_string(output, value),
+    }
+}
+
+fn text_form(value: &DbValue) -> String {
+    match value {
+        DbValue::Null => String::new(),
+        DbValue::Integer(value) => value.to_string(),
+        DbValue::UnsignedInteger(value) => value.to_string(),
+        DbValue::Real(value) => value.to_string(),
+        DbValue::Bool(value) => value.to_string(),
+        DbValue::Text(value) | DbValue::Decimal(value) => value.clone(),
+    }
+}
+
+/// Write a float the way Pydantic does: shortest round-trip digits with a
+/// fractional part, and `null` for infinities and NaN.
+fn write_float(output: &mut Vec<u8>, value: f64) {
+    if value.is_finite() {
+        output.extend_from_slice(format!("{value:?}").as_bytes());
+    } else {
+        output.extend_from_slice(b"null");
+    }
+}
+
+/// Write `value` as a JSON string, escaping only what JSON requires.
+fn write_string(output: &mut Vec<u8>, value: &str) {
+    const HEX: &[u8; 16] = b"0123456789abcdef";
+    let mut unicode = *b"\\u0000";
+    output.push(b'"');
+    let bytes = value.as_bytes();
+    let mut start = 0;
+    for (index, &byte) in bytes.iter().enumerate() {
+        let escape: &[u8] = match byte {
+            b'"' => b"\\\"",
+            b'\\' => b"\\\\",
+            b'\n' => b"\\n",
+            b'\r' => b"\\r",
+            b'\t' => b"\\t",
+            0x08 => b"\\b",
+            0x0c => b"\\f",
+            0x00..=0x1f => {
+                unicode[4] = HEX[(byte >> 4) as usize];
+                unicode[5] = HEX[(byte & 0xf) as usize];
+                &unicode
+            }
+            _ => continue,
+        };
+        output.extend_from_slice(&bytes[start..index]);
+        output.extend_from_slice(escape);
+        start = index + 1;
+    }
+    output.extend_from_slice(&bytes[start..]);
+    output.push(b'"');
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn spec(key: &str, column: Option<&str>, kind: &str, default: &str) -> JsonFieldSpec {
+        (
+            key.to_string(),
+            column.map(str::to_string),
+            kind.to_string(),
+            default.to_string(),
+            None,
+        )
+    }
+
+    fn written(writer: JsonRowWriter, result: QueryResult) -> String {
+        match writer.prepare(result) {
+            PreparedJson::Written(output) => String::from_utf8(output).unwrap(),
+            PreparedJson::Pending(..) => panic!("rows should not need Python"),
+        }
+    }
+
+    #[test]
+    fn rows_are_written_in_field_order_with_kind_conversions() {
+        let writer = JsonRowWriter::new(vec![
+            spec("id", Some("id"), "value", "null"),
+            spec("active", Some("active"), "bool", "null"),
+            spec("score", Some("score"), "float", "null"),
+            spec("tags", Some("tags"), "raw", "[]"),
+            spec("items", None, "value", "[]"),
+        ])
+        .unwrap();
+        let result = QueryResult::new(
+            vec![
+                "flavors\\score".to_string(),
+                "flavors\\id".to_string(),
+                "flavors\\active".to_string(),
+                "flavors\\tags".to_string(),
+            ],
+            vec![
+                vec![
+                    DbValue::Integer(2),
+                    DbValue::Integer(1),
+                    DbValue::Integer(1),
+                    DbValue::Text("[\"a\"]".to_string()),
+                ],
+                vec![
+                    DbValue::Real(f64::NAN),
+                    DbValue::Integer(2),
+                    DbValue::Bool(false),
+                    DbValue::Null,
+                ],
+            ],
+        );
+
+        assert_eq!(
+            written(writer, result),
+            "[{\"id\":1,\"active\":true,\"score\":2.0,\"tags\":[\"a\"],\"items\":[]},\
+             {\"id\":2,\"active\":false,\"score\":null,\"tags\":[],\"items\":[]}]"
+        );
+    }
+
+    #[test]
+    fn strings_escape_quotes_and_control_characters_only() {
+        let mut output = Vec::new();
+        write_string(&mut output, "a\"b\\c\nd\u{1}é/");
+
+        assert_eq!(
+            String::from_utf8(output).unwrap(),
+            "\"a\\\"b\\\\c\\nd\\u0001é/\""
+        );
+    }
+
+    #[test]
+    fn python_fields_require_an_encoder() {
+        assert!(JsonRowWriter::new(vec![spec("id", Some("id"), "python", "null")]).is_err());
+    }
+}
@@ -1,13 +1,20 @@
+mod arrow;
 mod bindings;
+mod columnar;
 mod database;
 mod ddl;
 mod events;
+mod executor;
 mod hydration;
+mod json;
+mod metrics;
 mod migrations;
 mod query;
+mod query_cache;
 mod runtime;
 mod schema;
 mod session;
+mod stream;
 mod table_handle;
 mod transactions;
 mod utils;
@@ -0,0 +1,485 @@
+use ormdantic_core::OrmdanticResult;
+use ormdantic_engine::{ConnectionPool, DbValue, PooledConnection, QueryResult};
+use pyo3::exceptions::PyValueError;
+use pyo3::prelude::*;
+use std::collections::BTreeMap;
+use std::sync::atomic::{AtomicU64, Ordering};
+use std::sync::{Arc, Mutex, MutexGuard, OnceLock};
+use std::time::{Duration, Instant};
+
+/// Sub-buckets per power of two; recorded latencies are within 1/8 of the
+/// value they report.
+const SUB_BUCKET_BITS: u32 = 3;
+const SUB_BUCKETS: u64 = 1 << SUB_BUCKET_BITS;
+/// Latencies are recorded in microseconds and clamped to about twelve days.
+const MAX_EXPONENT: u32 = 40;
+const MAX_MICROS: u64 = (1 << MAX_EXPONENT) - 1;
+const BUCKETS: usize = ((MAX_EXPONENT - SUB_BUCKET_BITS + 1) as usize) << SUB_BUCKET_BITS;
+
+/// Upper bounds, in seconds, of the cumulative latency buckets reported per operation.
+const REPORTED_BUCKETS: [f64; 14] = [
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+];
+
+/// Table handle calls measured separately.
+///
+/// Variants of a call that only change the result format share a slot, e.g.
+/// `find_many_json` is measured as `find_many`.
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+pub(crate) enum MetricOperation {
+    Insert,
+    InsertMany,
+    UpsertMany,
+    CopyRows,
+    Update,
+    UpdateMany,
+    Upsert,
+    Delete,
+    DeleteMany,
+    FindOne,
+    FindMany,
+    Count,
+    Select,
+    UpdateExpression,
+    DeleteExpression,
+}
+
+const OPERATIONS: usize = 15;
+
+impl MetricOperation {
+    const ALL: [Self; OPERATIONS] = [
+        Self::Insert,
+        Self::InsertMany,
+        Self::UpsertMany,
+        Self::CopyRows,
+        Self::Update,
+        Self::UpdateMany,
+        Self::Upsert,
+        Self::Delete,
+        Self::DeleteMany,
+        Self::FindOne,
+        Self::FindMany,
+        Self::Count,
+        Self::Select,
+        Self::UpdateExpression,
+        Self::DeleteExpression,
+    ];
+
+    pub(crate) fn name(self) -> &'static str {
+        match self {
+            Self::Insert => "insert",
+            Self::InsertMany => "insert_many",
+            Self::UpsertMany => "upsert_many",
+            Self::CopyRows => "copy_rows",
+            Self::Update => "update",
+            Self::UpdateMany => "update_many",
+            Self::Upsert => "upsert",
+            Self::Delete => "delete",
+            Self::DeleteMany => "delete_many",
+            Self::FindOne => "find_one",
+            Self::FindMany => "find_many",
+            Self::Count => "count",
+            Self::Select => "select",
+            Self::UpdateExpression => "update_expression",
+            Self::DeleteExpression => "delete_expression",
+        }
+    }
+}
+
+/// Log-linear latency histogram with lock-free recording.
+///
+/// Values below 16µs get exact buckets; above that every power of two is
+/// split into eight buckets, like an HDR histogram with three bits of
+/// sub-bucket precision.
+struct LatencyHistogram {
+    buckets: Box<[AtomicU64]>,
+}
+
+impl LatencyHistogram {
+    fn new() -> Self {
+        Self {
+            buckets: (0..BUCKETS).map(|_| AtomicU64::new(0)).collect(),
+        }
+    }
+
+    fn record(&self, micros: u64) {
+        self.buckets[bucket_index(micros)].fetch_add(1, Ordering::Relaxed);
+    }
+
+    fn counts(&self) -> Vec<u64> {
+        self.buckets
+            .iter()
+            .map(|bucket| bucket.load(Ordering::Relaxed))
+            .collect()
+    }
+}
+
+fn bucket_index(micros: u64) -> usize {
+    let micros = micros.min(MAX_MICROS);
+    if micros < SUB_BUCKETS {
+        return micros as usize;
+    }
+    let shift = 63 - micros.leading_zeros() - SUB_BUCKET_BITS;
+    let sub_bucket = (micros >> shift) & (SUB_BUCKETS - 1);
+    (((shift + 1) as usize) << SUB_BUCKET_BITS) + sub_bucket as usize
+}
+
+/// Highest value, in microseconds, recorded into bucket `index`.
+fn bucket_highest(index: usize) -> u64 {
+    if (index as u64) < SUB_BUCKETS {
+        return index as u64;
+    }
+    let shift = (index >> SUB_BUCKET_BITS) as u32 - 1;
+    let sub_bucket = index as u64 & (SUB_BUCKETS - 1);
+    ((SUB_BUCKETS + sub_bucket + 1) << shift) - 1
+}
+
+/// Highest recorded value at or below which `fraction` of the samples fall.
+fn quantile(counts: &[u64], fraction: f64) -> u64 {
+    let total = counts.iter().sum::<u64>();
+    let rank = ((fraction * total as f64).ceil() as u64).max(1);
+    let mut seen = 0;
+    for (index, count) in counts.iter().enumerate() {
+        seen += count;
+        if seen >= rank {
+            return bucket_highest(index);
+        }
+    }
+    0
+}
+
+struct OperationMetrics {
+    latency: LatencyHistogram,
+    calls: AtomicU64,
+    errors: AtomicU64,
+    rows: AtomicU64,
+    bytes: AtomicU64,
+    total_micros: AtomicU64,
+    max_micros: AtomicU64,
+    pool_wait_micros: AtomicU64,
+}
+
+impl OperationMetrics {
+    fn new() -> Self {
+        Self {
+            latency: LatencyHistogram::new(),
+            calls: AtomicU64::new(0),
+            errors: AtomicU64::new(0),
+            rows: AtomicU64::new(0),
+            bytes: AtomicU64::new(0),
+            total_micros: AtomicU64::new(0),
+            max_micros: AtomicU64::new(0),
+            pool_wait_micros: AtomicU64::new(0),
+        }
+    }
+
+    fn record_latency(&self, elapsed: Duration) {
+        let micros = micros(elapsed);
+        self.latency.record(micros);
+        self.total_micros.fetch_add(micros, Ordering::Relaxed);
+        self.max_micros.fetch_max(micros, Ordering::Relaxed);
+    }
+
+    fn snapshot(&self) -> OperationSnapshot {
+        let counts = self.latency.counts();
+        let max_micros = self.max_micros.load(Ordering::Relaxed);
+        let percentile = |value: f64| quantile(&counts, value).min(max_micros);
+        let mut cumulative = 0;
+        let mut next_bucket = 0;
+        let mut buckets = Vec::with_capacity(REPORTED_BUCKETS.len() + 1);
+        for upper in REPORTED_BUCKETS {
+            let upper_micros = (upper * 1_000_000.0).round() as u64;
+            while next_bucket < counts.len() && bucket_highest(next_bucket) <= upper_micros {
+                cumulative += counts[next_bucket];
+                next_bucket += 1;
+            }
+            buckets.push((upper, cumulative));
+        }
+        buckets.push((f64::INFINITY, counts.iter().sum()));
+        OperationSnapshot {
+            calls: self.calls.load(Ordering::Relaxed),
+            errors: self.errors.load(Ordering::Relaxed),
+            rows: self.rows.load(Ordering::Relaxed),
+            bytes: self.bytes.load(Ordering::Relaxed),
+            pool_wait: Duration::from_micros(self.pool_wait_micros.load(Ordering::Relaxed)),
+            total: Duration::from_micros(self.total_micros.load(Ordering::Relaxed)),
+            max: Duration::from_micros(max_micros),
+            p50: Duration::from_micros(percentile(0.5)),
+            p90: Duration::from_micros(percentile(0.9)),
+            p99: Duration::from_micros(percentile(0.99)),
+            buckets,
+        }
+    }
+}
+
+#[derive(Debug, Clone, Default, PartialEq)]
+pub(crate) struct OperationSnapshot {
+    pub(crate) calls: u64,
+    pub(crate) errors: u64,
+    pub(crate) rows: u64,
+    pub(crate) bytes: u64,
+    pub(crate) pool_wait: Duration,
+    pub(crate) total: Duration,
+    pub(crate) max: Duration,
+    pub(crate) p50: Duration,
+    pub(crate) p90: Duration,
+    pub(crate) p99: Duration,
+    /// Cumulative `(upper bound in seconds, samples)` pairs ending at infinity.
+    pub(crate) buckets: Vec<(f64, u64)>,
+}
+
+#[derive(Debug, Clone, Default, PartialEq)]
+pub(crate) struct TableSnapshot {
+    pub(crate) compile_cache_hits: u64,
+    pub(crate) compile_cache_misses: u64,
+    pub(crate) statement_cache_hits: u64,
+    pub(crate) statement_cache_misses: u64,
+    pub(crate) operations: Vec<(&'static str, OperationSnapshot)>,
+}
+
+/// Counters for every native call made through one table's handles.
+///
+/// Per-operation storage is allocated on first use, and recording only
+/// touches atomics, so measuring a call costs two clock reads and a few
+/// relaxed additions.
+pub(crate) struct TableMetrics {
+    operations: [OnceLock<OperationMetrics>; OPERATIONS],
+    compile_cache_hits: AtomicU64,
+    compile_cache_misses: AtomicU64,
+    statement_cache_hits: AtomicU64,
+    statement_cache_misses: AtomicU64,
+}
+
+impl TableMetrics {
+    fn new() -> Self {
+        Self {
+            operations: std::array::from_fn(|_| OnceLock::new()),
+            compile_cache_hits: AtomicU64::new(0),
+            compile_cache_misses: AtomicU64::new(0),
+            statement_cache_hits: AtomicU64::new(0),
+            statement_cache_misses: AtomicU64::new(0),
+        }
+    }
+
+    /// Count a lookup in one of the table's compiled statement caches.
+    pub(crate) fn record_compile(&self, hit: bool) {
+        let counter = if hit {
+            &self.compile_cache_hits
+        } else {
+            &self.compile_cache_misses
+        };
+        counter.fetch_add(1, Ordering::Relaxed);
+    }
+
+    /// Acquire a connection from `pool`, run `work` on it, and record the call.
+    ///
+    /// With a `pin` token the call runs on that transaction's connection.
+    ///
+    /// Latency covers `work` only; time spent waiting for the connection is
+    /// recorded as pool wait. `measure` returns the rows and received bytes of
+    /// a successful output, and `sent` is the size of the bound values.
+    pub(crate) fn observe<T>(
+        &self,
+        operation: MetricOperation,
+        pool: &Arc<ConnectionPool>,
+        pin: Option<u64>,
+        sent: u64,
+        work: impl FnOnce(&mut PooledConnection) -> OrmdanticResult<T>,
+        measure: impl FnOnce(&T) -> (u64, u64),
+    ) -> OrmdanticResult<T> {
+        let metrics = self.operation(operation);
+        metrics.calls.fetch_add(1, Ordering::Relaxed);
+        let requested = Instant::now();
+        let acquired = pool.acquire_for(pin);
+        let started = Instant::now();
+        metrics
+            .pool_wait_micros
+            .fetch_add(micros(started - requested), Ordering::Relaxed);
+        let mut connection = match acquired {
+            Ok(connection) => connection,
+            Err(error) => {
+                metrics.errors.fetch_add(1, Ordering::Relaxed);
+                return Err(error);
+            }
+        };
+        // Drop lookups made by statements issued outside this table.
+        connection.take_statement_cache_counts();
+        let output = work(&mut connection);
+        metrics.record_latency(started.elapsed());
+        let (hits, misses) = connection.take_statement_cache_counts();
+        self.statement_cache_hits.fetch_add(hits, Ordering::Relaxed);
+        self.statement_cache_misses
+            .fetch_add(misses, Ordering::Relaxed);
+        match &output {
+            Ok(output) => {
+                let (rows, received) = measure(output);
+                metrics.rows.fetch_add(rows, Ordering::Relaxed);
+                metrics.bytes.fetch_add(sent + received, Ordering::Relaxed);
+            }
+            Err(_) => {
+                metrics.errors.fetch_add(1, Ordering::Relaxed);
+            }
+        }
+        output
+    }
+
+    fn operation(&self, operation: MetricOperation) -> &OperationMetrics {
+        self.operations[operation as usize].get_or_init(OperationMetrics::new)
+    }
+
+    fn snapshot(&self) -> TableSnapshot {
+        TableSnapshot {
+            compile_cache_hits: self.compile_cache_hits.load(Ordering::Relaxed),
+            compile_cache_misses: self.compile_cache_misses.load(Ordering::Relaxed),
+            statement_cache_hits: self.statement_cache_hits.load(Ordering::Relaxed),
+            statement_cache_misses: self.statement_cache_misses.load(Ordering::Relaxed),
+            operations: MetricOperation::ALL
+                .into_iter()
+                .filter_map(|operation| {
+                    let metrics = self.operations[operation as usize].get()?;
+                    Some((operation.name(), metrics.snapshot()))
+                })
+                .collect(),
+        }
+    }
+}
+
+/// Per-table query metrics shared by every handle of a database.
+#[derive(Default)]
+pub(crate) struct QueryMetrics {
+    tables: Mutex<BTreeMap<String, Arc<TableMetrics>>>,
+}
+
+impl QueryMetrics {
+    pub(crate) fn table(&self, name: &str) -> PyResult<Arc<TableMetrics>> {
+        let mut tables = self.lock()?;
+        let metrics = tables
+            .entry(name.to_string())
+            .or_insert_with(|| Arc::new(TableMetrics::new()));
+        Ok(Arc::clone(metrics))
+    }
+
+    pub(crate) fn snapshot(&self) -> PyResult<Vec<(String, TableSnapshot)>> {
+        Ok(self
+            .lock()?
+            .iter()
+            .map(|(name, metrics)| (name.clone(), metrics.snapshot()))
+            .collect())
+    }
+
+    fn lock(&self) -> PyResult<MutexGuard<'_, BTreeMap<String, Arc<TableMetrics>>>> {
+        self.tables
+            .lock()
+            .map_err(|_| PyValueError::new_err("query metrics lock poisoned"))
+    }
+}
+
+/// Approximate wire size of bound or decoded values.
+pub(crate) fn values_bytes(values: &[DbValue]) -> u64 {
+    values
+        .iter()
+        .map(|value| match value {
+            DbValue::Null => 0,
+            DbValue::Bool(_) => 1,
+            DbValue::Integer(_) | DbValue::UnsignedInteger(_) | DbValue::Real(_) => 8,
+            DbValue::Decimal(text) | DbValue::Text(text) => text.len() as u64,
+        })
+        .sum()
+}
+
+/// Rows returned, or affected for statements without a result set, and their size.
+pub(crate) fn result_size(result: &QueryResult) -> (u64, u64) {
+    if result.columns().is_empty() {
+        return (result.row_count().unwrap_or(0), 0);
+    }
+    let bytes = result.rows().iter().map(|row| values_bytes(row)).sum();
+    (result.rows().len() as u64, bytes)
+}
+
+fn micros(duration: Duration) -> u64 {
+    u64::try_from(duration.as_micros()).unwrap_or(u64::MAX)
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn latency_buckets_are_exact_for_small_values_and_bounded_above() {
+        for micros in 0..16 {
+            assert_eq!(bucket_highest(bucket_index(micros)), micros);
+        }
+        assert_eq!(bucket_index(16), 16);
+        assert_eq!(bucket_highest(bucket_index(16)), 17);
+        assert_eq!(bucket_index(MAX_MICROS), BUCKETS - 1);
+        assert_eq!(bucket_index(u64::MAX), BUCKETS - 1);
+        for micros in [100, 1_234, 98_765, 5_000_000] {
+            let highest = bucket_highest(bucket_index(micros));
+            assert!(highest >= micros);
+            assert!(highest - micros <= micros / SUB_BUCKETS);
+        }
+    }
+
+    #[test]
+    fn operation_snapshot_reports_percentiles_and_cumulative_buckets() {
+        let metrics = OperationMetrics::new();
+        for millis in 1..=100 {
+            metrics.record_latency(Duration::from_millis(millis));
+        }
+
+        let snapshot = metrics.snapshot();
+
+        assert_eq!(snapshot.max, Duration::from_millis(100));
+        assert_eq!(snapshot.total, Duration::from_millis(5_050));
+        assert!(snapshot.p50 >= Duration::from_millis(50));
+        assert!(snapshot.p50 <= Duration::from_micros(50_000 * 9 / 8));
+        assert!(snapshot.p99 >= Duration::from_millis(99));
+        assert!(snapshot.p99 <= snapshot.max);
+        assert_eq!(snapshot.buckets.first(), Some(&(0.0005, 0)));
+        // Samples near a bound share a bucket with values just above it.
+        let (upper, within_50ms) = snapshot.buckets[6];
+        assert_eq!(upper, 0.05);
+        assert!((44..=50).contains(&within_50ms));
+        assert_eq!(snapshot.buckets[10], (1.0, 100));
+        assert_eq!(snapshot.buckets.last(), Some(&(f64::INFINITY, 100)));
+        assert!(snapshot
+            .buckets
+            .windows(2)
+            .all(|pair| pair[0].1 <= pair[1].1));
+    }
+
+    #[test]
+    fn table_metrics_allocate_operations_on_first_use() {
+        let metrics = QueryMetrics::default();
+        let table = metrics.table("user").unwrap();
+        table.record_compile(true);
+        table.record_compile(false);
+        table
+            .operation(MetricOperation::Count)
+            .calls
+            .fetch_add(1, Ordering::Relaxed);
+
+        let snapshot = metrics.snapshot().unwrap();
+
+        assert!(Arc::ptr_eq(&table, &metrics.table("user").unwrap()));
+        assert_eq!(snapshot.len(), 1);
+        assert_eq!(snapshot[0].1.compile_cache_hits, 1);
+        assert_eq!(snapshot[0].1.compile_cache_misses, 1);
+        assert_eq!(snapshot[0].1.operations.len(), 1);
+        assert_eq!(snapshot[0].1.operations[0].0, "count");
+    }
+
+    #[test]
+    fn result_size_counts_rows_or_affected_rows() {
+        assert_eq!(result_size(&QueryResult::affected(3)), (3, 0));
+        assert_eq!(
+            values_bytes(&[
+                DbValue::Null,
+                DbValue::Integer(1),
+                DbValue::Text("abc".to_string()),
+                DbValue::Bool(true),
+            ]),
+            12
+        );
+    }
+}
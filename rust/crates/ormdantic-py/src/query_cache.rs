@@ -0,0 +1,280 @@
+use crate::query::{RuntimeJoinedFilter, RuntimeJoinedOrder};
+use ormdantic_dialects::Dialect;
+use ormdantic_engine::DbValue;
+use ormdantic_sql::{CompiledQuery, Filter, QueryOperation, SortDirection};
+use pyo3::exceptions::PyValueError;
+use pyo3::prelude::*;
+use std::collections::HashMap;
+use std::hash::Hash;
+use std::sync::Mutex;
+
+pub(crate) const DEFAULT_SELECT_CACHE_SIZE: usize = 256;
+pub(crate) const DEFAULT_DML_CACHE_SIZE: usize = 256;
+
+/// Structure of a read query, without bind values or pagination.
+///
+/// Two requests with the same shape render identical SQL; pagination is
+/// appended per call as bound `LIMIT`/`OFFSET` parameters.
+#[derive(Debug, Clone, PartialEq, Eq, Hash)]
+pub(crate) enum SelectShape {
+    FindOne {
+        depth: usize,
+    },
+    FindOneWithPaths {
+        paths: Vec<String>,
+        relationship_filters: Vec<RuntimeJoinedFilter>,
+        relationship_order_by: Vec<RuntimeJoinedOrder>,
+    },
+    FindMany {
+        filters: Vec<Filter>,
+        order_by: Vec<String>,
+        direction: SortDirection,
+        depth: usize,
+    },
+    FindManyWithPaths {
+        filters: Vec<Filter>,
+        order_by: Vec<String>,
+        direction: SortDirection,
+        paths: Vec<String>,
+        relationship_filters: Vec<RuntimeJoinedFilter>,
+        relationship_order_by: Vec<RuntimeJoinedOrder>,
+    },
+    Count {
+        filters: Vec<Filter>,
+    },
+}
+
+/// Structure of a DML statement: the operation plus the columns and row count
+/// it binds.
+pub(crate) type DmlShape = (QueryOperation, Vec<String>);
+
+/// Bounded cache of compiled SELECT statements, shared by every table handle
+/// of a database.
+pub(crate) type SelectCache = StatementCache<SelectShape>;
+
+/// Bounded cache of compiled INSERT, UPDATE, and DELETE statements, shared by
+/// every table handle of a database.
+pub(crate) type DmlCache = StatementCache<DmlShape>;
+
+#[derive(Debug, Clone, Copy, Default, PartialEq, Eq)]
+pub(crate) struct SelectCacheStatistics {
+    pub(crate) capacity: usize,
+    pub(crate) size: usize,
+    pub(crate) hits: u64,
+    pub(crate) misses: u64,
+    pub(crate) evictions: u64,
+}
+
+/// Bounded least-recently-used cache of compiled statements.
+///
+/// Keys are the qualified table name plus the statement shape.
+pub(crate) struct StatementCache<S> {
+    state: Mutex<StatementCacheState<S>>,
+}
+
+struct StatementCacheState<S> {
+    capacity: usize,
+    entries: HashMap<(String, S), (CompiledQuery, u64)>,
+    tick: u64,
+    hits: u64,
+    misses: u64,
+    evictions: u64,
+}
+
+impl<S: Clone + Eq + Hash> StatementCache<S> {
+    pub(crate) fn new(capacity: usize) -> Self {
+        Self {
+            state: Mutex::new(StatementCacheState {
+                capacity,
+                entries: HashMap::new(),
+                tick: 0,
+                hits: 0,
+                misses: 0,
+                evictions: 0,
+            }),
+        }
+    }
+
+    /// Return the cached statement for `table` and `shape`, compiling on a miss.
+    ///
+    /// Compilation runs outside the lock; concurrent misses for one shape may
+    /// both compile, and the last insert wins.
+    pub(crate) fn get_or_compile(
+        &self,
+        table: &str,
+        shape: S,
+        compile: impl FnOnce() -> PyResult<CompiledQuery>,
+    ) -> PyResult<CompiledQuery> {
+        let key = (table.to_string(), shape);
+        {
+            let mut state = self.lock()?;
+            state.tick += 1;
+            let tick = state.tick;
+            if let Some((compiled, last_used)) = state.entries.get_mut(&key) {
+                *last_used = tick;
+                let compiled = compiled.clone();
+                state.hits += 1;
+                return Ok(compiled);
+            }
+            state.misses += 1;
+        }
+        let compiled = compile()?;
+        let mut state = self.lock()?;
+        if state.capacity == 0 {
+            return Ok(compiled);
+        }
+        if state.entries.len() >= state.capacity && !state.entries.contains_key(&key) {
+            let oldest = state
+                .entries
+                .iter()
+                .min_by_key(|(_, (_, last_used))| *last_used)
+                .map(|(key, _)| key.clone());
+            if let Some(oldest) = oldest {
+                state.entries.remove(&oldest);
+                state.evictions += 1;
+            }
+        }
+        state.tick += 1;
+        let tick = state.tick;
+        state.entries.insert(key, (compiled.clone(), tick));
+        Ok(compiled)
+    }
+
+    pub(crate) fn statistics(&self) -> PyResult<SelectCacheStatistics> {
+        let state = self.lock()?;
+        Ok(SelectCacheStatistics {
+            capacity: state.capacity,
+            size: state.entries.len(),
+            hits: state.hits,
+            misses: state.misses,
+            evictions: state.evictions,
+        })
+    }
+
+    fn lock(&self) -> PyResult<std::sync::MutexGuard<'_, StatementCacheState<S>>> {
+        self.state
+            .lock()
+            .map_err(|_| PyValueError::new_err("compiled statement cache lock poisoned"))
+    }
+}
+
+/// Append per-call pagination to a cached statement as bound parameters.
+///
+/// Every page of a query renders the same SQL, so backends reuse one
+/// prepared statement. Returns the statement and the pagination values to
+/// bind after the statement's own parameters.
+pub(crate) fn with_pagination(
+    dialect: &impl Dialect,
+    compiled: CompiledQuery,
+    limit: Option<usize>,
+    offset: Option<usize>,
+) -> (CompiledQuery, Vec<DbValue>) {
+    if limit.is_none() && offset.is_none() {
+        return (compiled, Vec::new());
+    }
+    let mut sql = compiled.sql().to_string();
+    let mut values = Vec::new();
+    for (keyword, value) in [("LIMIT", limit), ("OFFSET", offset)] {
+        if let Some(value) = value {
+            let index = compiled.params().len() + values.len() + 1;
+            sql.push_str(&format!(" {keyword} {}", dialect.placeholder(index)));
+            values.push(DbValue::Integer(i64::try_from(value).unwrap_or(i64::MAX)));
+        }
+    }
+    (
+        CompiledQuery::new(
+            sql,
+            compiled.params().to_vec(),
+            compiled.operation().clone(),
+        ),
+        values,
+    )
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use ormdantic_dialects::AnyDialect;
+
+    fn compiled(sql: &str) -> CompiledQuery {
+        CompiledQuery::new(
+            sql.to_string(),
+            vec!["id".to_string()],
+            QueryOperation::Select,
+        )
+    }
+
+    #[test]
+    fn select_cache_counts_hits_and_misses_per_table_and_shape() {
+        let cache = SelectCache::new(8);
+        let mut compile_count = 0;
+        for table in ["flavors", "flavors", "coffees"] {
+            cache
+                .get_or_compile(table, SelectShape::FindOne { depth: 0 }, || {
+                    compile_count += 1;
+                    Ok(compiled("SELECT"))
+                })
+                .unwrap();
+        }
+
+        let statistics = cache.statistics().unwrap();
+        assert_eq!(compile_count, 2);
+        assert_eq!(statistics.hits, 1);
+        assert_eq!(statistics.misses, 2);
+        assert_eq!(statistics.size, 2);
+    }
+
+    #[test]
+    fn select_cache_evicts_least_recently_used_shape() {
+        let cache = SelectCache::new(2);
+        let shape = |depth| SelectShape::FindOne { depth };
+        cache
+            .get_or_compile("t", shape(0), || Ok(compiled("a")))
+            .unwrap();
+        cache
+            .get_or_compile("t", shape(1), || Ok(compiled("b")))
+            .unwrap();
+        cache
+            .get_or_compile("t", shape(0), || Ok(compiled("unused")))
+            .unwrap();
+        cache
+            .get_or_compile("t", shape(2), || Ok(compiled("c")))
+            .unwrap();
+
+        let recompiled = cache
+            .get_or_compile("t", shape(1), || Ok(compiled("b2")))
+            .unwrap();
+        let kept = cache
+            .get_or_compile("t", shape(2), || Ok(compiled("unused")))
+            .unwrap();
+
+        assert_eq!(recompiled.sql(), "b2");
+        assert_eq!(kept.sql(), "c");
+        assert_eq!(cache.statistics().unwrap().evictions, 2);
+    }
+
+    #[test]
+    fn with_pagination_binds_limit_and_offset_after_statement_params() {
+        let postgres = AnyDialect::parse("postgres://localhost/db").unwrap();
+        let (paged, values) = with_pagination(
+            &postgres,
+            compiled("SELECT * FROM t WHERE id = $1"),
+            Some(10),
+            Some(20),
+        );
+        let (next_page, _) = with_pagination(
+            &postgres,
+            compiled("SELECT * FROM t WHERE id = $1"),
+            Some(10),
+            Some(30),
+        );
+
+        assert_eq!(
+            paged.sql(),
+            "SELECT * FROM t WHERE id = $1 LIMIT $2 OFFSET $3"
+        );
+        assert_eq!(paged.sql(), next_page.sql());
+        assert_eq!(paged.params(), ["id".to_string()]);
+        assert_eq!(values, vec![DbValue::Integer(10), DbValue::Integer(20)]);
+    }
+}
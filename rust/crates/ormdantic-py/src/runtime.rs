@@ -1,17 +1,20 @@
+use crate::arrow::PyArrowTable;
+use crate::executor::NativeExecutor;
 use crate::transactions::PyTransactionOptions;
 use ormdantic_dialects::{AnyDialect, Dialect, ReflectionScope};
 use ormdantic_engine::{
-    execute_url, runtime_capabilities as engine_runtime_capabilities, DbValue, NativeConnection,
-    QueryResult, Reflector,
+    execute_url, runtime_capabilities as engine_runtime_capabilities, ArrowTable, DbValue,
+    NativeConnection, QueryResult, Reflector,
 };
 use pyo3::prelude::*;
 use pyo3::types::{PyDict, PyList};
 use pyo3::{exceptions::PyValueError, IntoPyObjectExt};
-use std::sync::Mutex;
+use std::sync::{Mutex, OnceLock};
 
 #[pyclass]
 pub(crate) struct PyNativeConnection {
     inner: Mutex<NativeConnection>,
+    executor: OnceLock<NativeExecutor>,
 }
 
 #[pyfunction]
@@ -40,6 +43,7 @@ impl PyNativeConnection {
                 NativeConnection::open(url)
                     .map_err(|error| PyValueError::new_err(error.to_string()))?,
             ),
+            executor: OnceLock::new(),
         })
     }
 
@@ -60,6 +64,40 @@ impl PyNativeConnection {
         query_result_to_python(py, result)
     }
 
+    /// Execute SQL and export the rows as Arrow record batches.
+    #[pyo3(signature = (sql, params, batch_size=None))]
+    fn execute_arrow(
+        &self,
+        py: Python<'_>,
+        sql: &str,
+        params: Vec<Py<PyAny>>,
+        batch_size: Option<usize>,
+    ) -> PyResult<PyArrowTable> {
+        if batch_size == Some(0) {
+            return Err(PyValueError::new_err("batch_size must be at least 1"));
+        }
+        let values = params
+            .into_iter()
+            .map(|value| py_to_db_value(py, value))
+            .collect::<PyResult<Vec<_>>>()?;
+        let table = py
+            .detach(|| {
+                self.inner
+                    .lock()
+                    .map_err(|_| "native connection lock poisoned".to_string())?
+                    .execute(sql, &values)
+                    .map(|result| ArrowTable::from_result(&result, batch_size))
+                    .map_err(|error| error.to_string())
+            })
+            .map_err(PyValueError::new_err)?;
+        Ok(PyArrowTable::new(table))
+    }
+
+    /// Run a blocking connection call on a native worker and return an asyncio future.
+    fn spawn(&self, py: Python<'_>, callable: Py<PyAny>) -> PyResult<Py<PyAny>> {
+        self.executor()?.submit_callable(py, callable)
+    }
+
     #[pyo3(signature = (options=None))]
     fn begin(&self, options: Option<PyTransactionOptions>) -> PyResult<()> {
         let mut connection = self
@@ -93,6 +131,17 @@ impl PyNativeConnection {
     }
 }
 
+impl PyNativeConnection {
+    fn executor(&self) -> PyResult<&NativeExecutor> {
+        if let Some(executor) = self.executor.get() {
+            return Ok(executor);
+        }
+        // A single connection serializes statements, so one worker suffices.
+        let executor = NativeExecutor::new(1)?;
+        Ok(self.executor.get_or_init(|| executor))
+    }
+}
+
 pub(crate) fn query_result_to_python(py: Python<'_>, result: QueryResult) -> PyResult<Py<PyAny>> {
     let output = PyDict::new(py);
     output.set_item("columns", result.columns())?;
@@ -290,7 +339,7 @@ pub(crate) fn py_to_db_value(py: Python<'_>, value: Py<PyAny>) -> PyResult<DbVal
     Ok(DbValue::Text(value.str()?.to_string()))
 }
 
-fn db_value_to_py(py: Python<'_>, value: &DbValue) -> PyResult<Py<PyAny>> {
+pub(crate) fn db_value_to_py(py: Python<'_>, value: &DbValue) -> PyResult<Py<PyAny>> {
     match value {
         DbValue::Null => Ok(py.None()),
         DbValue::Integer(value) => Ok(value.into_pyobject(py)?.into_any().unbind()),
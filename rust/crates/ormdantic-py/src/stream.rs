@@ -0,0 +1,171 @@
+use crate::executor::NativeExecutor;
+use crate::runtime::query_result_to_python;
+use ormdantic_engine::{ConnectionPool, DbValue, QueryResult};
+use ormdantic_sql::CompiledQuery;
+use pyo3::exceptions::PyValueError;
+use pyo3::prelude::*;
+use std::sync::atomic::{AtomicBool, Ordering};
+use std::sync::mpsc::{sync_channel, Receiver};
+use std::sync::{Arc, Mutex};
+use std::thread;
+
+type Chunk = Result<QueryResult, String>;
+
+/// Consumer end of a stream's chunk channel.
+///
+/// `next_chunk` holds the receiver lock while it blocks on the producer, so
+/// closing never waits for that lock: it raises `closed`, and whichever side
+/// holds the receiver next drops it, which stops the producer at its next send.
+struct ChunkReceiver {
+    receiver: Mutex<Option<Receiver<Chunk>>>,
+    closed: AtomicBool,
+}
+
+impl ChunkReceiver {
+    fn new(receiver: Receiver<Chunk>) -> Self {
+        Self {
+            receiver: Mutex::new(Some(receiver)),
+            closed: AtomicBool::new(false),
+        }
+    }
+
+    fn receive(&self) -> Result<Option<QueryResult>, String> {
+        let mut receiver = self
+            .receiver
+            .lock()
+            .map_err(|_| "row stream lock poisoned".to_string())?;
+        if self.closed.load(Ordering::Acquire) {
+            receiver.take();
+            return Ok(None);
+        }
+        let chunk = receiver.as_ref().map(Receiver::recv);
+        if self.closed.load(Ordering::Acquire) {
+            // Closed while waiting: discard the chunk and release the producer.
+            receiver.take();
+            return Ok(None);
+        }
+        match chunk {
+            Some(Ok(chunk)) => chunk.map(Some),
+            // The producer finished, or the stream was closed.
+            Some(Err(_)) | None => Ok(None),
+        }
+    }
+
+    fn close(&self) {
+        self.closed.store(true, Ordering::Release);
+        // A receive in progress drops the receiver itself once it wakes.
+        if let Ok(mut receiver) = self.receiver.try_lock() {
+            receiver.take();
+        }
+    }
+}
+
+/// Rows of one query delivered in bounded chunks.
+///
+/// A producer thread owns a pooled connection for the lifetime of the stream
+/// and decodes at most one chunk ahead of the consumer, so memory depends on
+/// the chunk size instead of the result size. Statements that could only run
+/// on the stream's connection, such as others in the same transaction or any
+/// on a one-connection pool, fail immediately while the stream is open.
+#[pyclass]
+pub(crate) struct PyRowStream {
+    receiver: Arc<ChunkReceiver>,
+    executor: Option<Arc<NativeExecutor>>,
+}
+
+impl PyRowStream {
+    pub(crate) fn open(
+        pool: Arc<ConnectionPool>,
+        pin: Option<u64>,
+        executor: Option<Arc<NativeExecutor>>,
+        compiled: CompiledQuery,
+        values: Vec<DbValue>,
+        chunk_size: usize,
+    ) -> PyResult<Self> {
+        let (sender, receiver) = sync_channel::<Chunk>(1);
+        thread::Builder::new()
+            .name("ormdantic-stream".to_string())
+            .spawn(move || {
+                let streamed = pool.acquire_stream(pin).and_then(|mut connection| {
+                    connection.query_chunks(
+                        compiled.sql(),
+                        &values,
+                        chunk_size,
+                        // A closed receiver means the consumer stopped early.
+                        &mut |chunk| Ok(sender.send(Ok(chunk)).is_ok()),
+                    )
+                });
+                if let Err(error) = streamed {
+                    let _ = sender.send(Err(error.to_string()));
+                }
+            })
+            .map_err(|error| PyValueError::new_err(error.to_string()))?;
+        Ok(Self {
+            receiver: Arc::new(ChunkReceiver::new(receiver)),
+            executor,
+        })
+    }
+}
+
+#[pymethods]
+impl PyRowStream {
+    /// Return the next chunk, or `None` once the query is exhausted.
+    ///
+    /// Streams opened from awaitable table handles return an asyncio future.
+    fn next_chunk(&self, py: Python<'_>) -> PyResult<Py<PyAny>> {
+        let receiver = Arc::clone(&self.receiver);
+        if let Some(executor) = &self.executor {
+            return executor.submit(py, move || receiver.receive(), chunk_to_python);
+        }
+        let chunk = py
+            .detach(|| receiver.receive())
+            .map_err(PyValueError::new_err)?;
+        chunk_to_python(py, chunk)
+    }
+
+    /// Stop reading and return the connection to the pool.
+    ///
+    /// Never blocks, even while a `next_chunk` call is waiting for rows.
+    fn close(&self) {
+        self.receiver.close();
+    }
+}
+
+fn chunk_to_python(py: Python<'_>, chunk: Option<QueryResult>) -> PyResult<Py<PyAny>> {
+    match chunk {
+        Some(result) => query_result_to_python(py, result),
+        None => Ok(py.None()),
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::{Chunk, ChunkReceiver};
+    use ormdantic_engine::QueryResult;
+    use std::sync::mpsc::sync_channel;
+    use std::sync::Arc;
+    use std::thread;
+    use std::time::{Duration, Instant};
+
+    #[test]
+    fn close_does_not_wait_for_a_pending_receive() {
+        let (sender, receiver) = sync_channel::<Chunk>(1);
+        let receiver = Arc::new(ChunkReceiver::new(receiver));
+        let pending = {
+            let receiver = Arc::clone(&receiver);
+            thread::spawn(move || receiver.receive())
+        };
+        // Let the receive take the lock and block on the empty channel.
+        thread::sleep(Duration::from_millis(50));
+
+        let started = Instant::now();
+        receiver.close();
+        assert!(started.elapsed() < Duration::from_secs(1));
+
+        // The producer's next chunk wakes the receive, which ends the stream.
+        let _ = sender.send(Ok(QueryResult::affected(0)));
+        assert!(pending.join().unwrap().unwrap().is_none());
+        assert!(sender.send(Ok(QueryResult::affected(0))).is_err());
+        assert!(receiver.receive().unwrap().is_none());
+    }
+}
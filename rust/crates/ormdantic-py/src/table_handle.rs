@@ -1,15 +1,25 @@
+use crate::arrow::PyArrowTable;
+use crate::columnar::query_result_to_columns;
+use crate::executor::NativeExecutor;
+use crate::json::{JsonFieldSpec, JsonRowWriter};
+use crate::metrics::{result_size, values_bytes, MetricOperation, TableMetrics};
 use crate::query::{
     bind_select_columns as select_columns, delete_ast_from_payload, joined_filters,
     joined_order_by, parse_filter_input, parse_sort_direction, select_ast_from_payload,
     update_ast_from_payload, RuntimeJoinedFilter, RuntimeJoinedOrder, RuntimeJoinedQuery,
 };
+use crate::query_cache::{with_pagination, DmlCache, SelectCache, SelectShape};
 use crate::runtime::{py_to_db_value, query_result_to_python};
 use crate::schema::{
     RuntimeColumn, RuntimeExclusionConstraint, RuntimeForeignKeyConstraint, RuntimeIndex,
     RuntimeRelationship, RuntimeTableCheck, RuntimeUniqueConstraint,
 };
+use crate::stream::PyRowStream;
+use ormdantic_core::OrmdanticResult;
 use ormdantic_dialects::{AnyDialect, Dialect, DialectKind};
-use ormdantic_engine::{DbValue, NativeConnection};
+use ormdantic_engine::{
+    ArrowTable, ConnectionPool, DbValue, NativeConnection, PooledConnection, QueryResult,
+};
 use ormdantic_sql::{
     CompiledQuery, DmlAst, Expr, Filter, JoinSpec, JoinedFilter, JoinedOrderBy, JoinedSelectColumn,
     OrderBy, QueryAst, QueryOperation, SortDirection, TableRef, TableSource,
@@ -17,8 +27,9 @@ use ormdantic_sql::{
 use pyo3::exceptions::PyValueError;
 use pyo3::prelude::*;
 use pyo3::types::PyDict;
+use pyo3::IntoPyObjectExt;
 use std::collections::{HashMap, HashSet};
-use std::sync::{Arc, Mutex};
+use std::sync::Arc;
 
 #[derive(Clone)]
 pub(crate) struct RuntimeTable {
@@ -72,6 +83,11 @@ pub(crate) struct RuntimeTable {
     pub(crate) relationships: Vec<RuntimeRelationship>,
 }
 
+/// Conversion of a native result into the Python payload a caller asked for.
+type ResultConverter = fn(Python<'_>, QueryResult) -> PyResult<Py<PyAny>>;
+
+const MAX_ROWS_PER_STATEMENT: usize = 1_000;
+
 struct JoinedQueryInput {
     filters: Vec<Filter>,
     order_by: Vec<String>,
@@ -100,14 +116,38 @@ impl RuntimeTable {
 #[pyclass]
 pub(crate) struct PyTableHandle {
     pub(crate) url: String,
-    pub(crate) connection: Arc<Mutex<NativeConnection>>,
+    pub(crate) pool: Arc<ConnectionPool>,
+    pub(crate) executor: Option<Arc<NativeExecutor>>,
+    /// Workers reserved for statements of pinned transactions.
+    pub(crate) transaction_executor: Option<Arc<NativeExecutor>>,
     pub(crate) tables: Arc<HashMap<String, RuntimeTable>>,
     pub(crate) table: RuntimeTable,
-    pub(crate) compiled_dml: Mutex<HashMap<(QueryOperation, Vec<String>), CompiledQuery>>,
+    pub(crate) compiled_dml: Arc<DmlCache>,
+    pub(crate) select_cache: Arc<SelectCache>,
+    pub(crate) metrics: Arc<TableMetrics>,
+    /// Pin token of the transaction this handle's statements run in.
+    pub(crate) pin: Option<u64>,
 }
 
 #[pymethods]
 impl PyTableHandle {
+    /// Return a handle whose statements run in the transaction pinned under
+    /// `token` instead of on free pooled connections.
+    fn in_transaction(&self, token: Option<u64>) -> PyTableHandle {
+        PyTableHandle {
+            url: self.url.clone(),
+            pool: Arc::clone(&self.pool),
+            executor: self.executor.clone(),
+            transaction_executor: self.transaction_executor.clone(),
+            tables: Arc::clone(&self.tables),
+            table: self.table.clone(),
+            compiled_dml: Arc::clone(&self.compiled_dml),
+            select_cache: Arc::clone(&self.select_cache),
+            metrics: Arc::clone(&self.metrics),
+            pin: token,
+        }
+    }
+
     fn insert(&self, py: Python<'_>, payload: &Bound<'_, PyDict>) -> PyResult<Py<PyAny>> {
         self.execute_write(py, QueryOperation::Insert, payload)
     }
@@ -120,6 +160,178 @@ impl PyTableHandle {
         self.execute_many_write(py, QueryOperation::Upsert, payloads)
     }
 
+    /// Bulk load `rows` (one sequence per row, ordered like `columns`).
+    ///
+    /// Values are converted while holding the GIL, then the whole load runs
+    /// through the backend's bulk path inside one transaction, or inside the
+    /// caller's transaction when one is active. Returns the inserted row count.
+    fn copy_rows(
+        &self,
+        py: Python<'_>,
+        columns: Vec<String>,
+        rows: Vec<Vec<Py<PyAny>>>,
+    ) -> PyResult<Py<PyAny>> {
+        let rows = rows
+            .into_iter()
+            .map(|row| {
+                row.into_iter()
+                    .map(|value| py_to_db_value(py, value))
+                    .collect::<PyResult<Vec<_>>>()
+            })
+            .collect::<PyResult<Vec<_>>>()?;
+        let table = self.table.qualified_table_name();
+        let sent = rows.iter().map(|row| values_bytes(row)).sum();
+        self.run_atomically(
+            py,
+            MetricOperation::CopyRows,
+            sent,
+            move |connection| connection.bulk_insert(&table, &columns, &rows),
+            |inserted| (*inserted, 0),
+            |py, inserted: u64| inserted.into_py_any(py),
+        )
+    }
+
+    /// Update rows sharing one payload shape with a few multi-row statements.
+    ///
+    /// Every statement covers as many rows as the bind parameter limit allows
+    /// and assigns `CASE WHEN pk = ? THEN ? ... ELSE column END` per column.
+    /// Short batches are padded to a few fixed row counts so the compiled
+    /// statements stay bounded. All statements run over one connection inside one transaction, or the
+    /// caller's transaction when one is active.
+    #[pyo3(signature = (payloads, batch_size=None))]
+    fn update_many(
+        &self,
+        py: Python<'_>,
+        payloads: Vec<Py<PyDict>>,
+        batch_size: Option<usize>,
+    ) -> PyResult<Py<PyAny>> {
+        let first = payloads
+            .first()
+            .ok_or_else(|| PyValueError::new_err("update_many requires at least one payload"))?;
+        let columns = payload_columns(first.bind(py))?;
+        let primary_key = &self.table.primary_key;
+        let Some(pk_index) = columns.iter().position(|column| column == primary_key) else {
+            return Err(PyValueError::new_err(format!(
+                "update_many payloads must include primary key '{primary_key}'"
+            )));
+        };
+        let rows = payloads
+            .iter()
+            .map(|payload| payload_row(py, payload.bind(py), &columns, "update_many"))
+            .collect::<PyResult<Vec<_>>>()?;
+        let assigned = columns
+            .iter()
+            .enumerate()
+            .filter(|(index, _)| *index != pk_index)
+            .collect::<Vec<_>>();
+        if assigned.is_empty() {
+            // Nothing to write, but awaitable handles still answer with a future.
+            if let Some(executor) = self.executor() {
+                return executor.submit(
+                    py,
+                    || Ok(QueryResult::affected(0)),
+                    query_result_to_python,
+                );
+            }
+            return query_result_to_python(py, QueryResult::affected(0));
+        }
+        let dialect = self.dialect()?;
+        let rows_per_statement = rows_per_statement(&dialect, 2 * assigned.len() + 1, batch_size);
+        let mut statements = Vec::new();
+        for chunk in rows.chunks(rows_per_statement) {
+            let chunk = padded_rows(chunk, rows_per_statement);
+            let chunk = chunk.as_slice();
+            let mut shape = columns.clone();
+            shape.push(format!("{} rows", chunk.len()));
+            let compiled = self.cached_dml((QueryOperation::Update, shape), || {
+                let pk = |row: usize| {
+                    Expr::eq(
+                        Expr::column(primary_key.clone()),
+                        Expr::param(format!("row_{row}__{primary_key}")),
+                    )
+                };
+                let assignments = assigned
+                    .iter()
+                    .map(|(_, column)| {
+                        let whens = (0..chunk.len())
+                            .map(|row| (pk(row), Expr::param(format!("row_{row}__{column}"))))
+                            .collect();
+                        let case = Expr::Case {
+                            whens,
+                            else_expr: Some(Box::new(Expr::column((*column).clone()))),
+                        };
+                        ((*column).clone(), case)
+                    })
+                    .collect();
+                let where_expr = Expr::InList {
+                    expr: Box::new(Expr::column(primary_key.clone())),
+                    values: (0..chunk.len())
+                        .map(|row| Expr::param(format!("row_{row}__{primary_key}")))
+                        .collect(),
+                    negated: false,
+                };
+                DmlAst::Update {
+                    table: TableSource::table(self.table.qualified_table_name()),
+                    assignments,
+                    where_expr: Some(where_expr),
+                    returning: Vec::new(),
+                }
+                .compile(&dialect)
+                .map_err(|error| PyValueError::new_err(error.to_string()))
+            })?;
+            // Bind in render order: each CASE, then the IN list.
+            let mut values = Vec::with_capacity(chunk.len() * (2 * assigned.len() + 1));
+            for (index, _) in &assigned {
+                for row in chunk {
+                    values.push(row[pk_index].clone());
+                    values.push(row[*index].clone());
+                }
+            }
+            values.extend(chunk.iter().map(|row| row[pk_index].clone()));
+            statements.push((compiled, values));
+        }
+        self.execute_statements(py, MetricOperation::UpdateMany, statements)
+    }
+
+    /// Delete rows by primary key with `DELETE ... WHERE pk IN (...)` batches.
+    #[pyo3(signature = (primary_keys, batch_size=None))]
+    fn delete_many(
+        &self,
+        py: Python<'_>,
+        primary_keys: Vec<Py<PyAny>>,
+        batch_size: Option<usize>,
+    ) -> PyResult<Py<PyAny>> {
+        let keys = primary_keys
+            .into_iter()
+            .map(|key| py_to_db_value(py, key))
+            .collect::<PyResult<Vec<_>>>()?;
+        let dialect = self.dialect()?;
+        let primary_key = &self.table.primary_key;
+        let mut statements = Vec::new();
+        let rows_per_statement = rows_per_statement(&dialect, 1, batch_size);
+        for chunk in keys.chunks(rows_per_statement) {
+            let chunk = padded_rows(chunk, rows_per_statement);
+            let shape = vec![primary_key.clone(), format!("{} rows", chunk.len())];
+            let compiled = self.cached_dml((QueryOperation::Delete, shape), || {
+                DmlAst::Delete {
+                    table: TableSource::table(self.table.qualified_table_name()),
+                    where_expr: Some(Expr::InList {
+                        expr: Box::new(Expr::column(primary_key.clone())),
+                        values: (0..chunk.len())
+                            .map(|row| Expr::param(format!("row_{row}__{primary_key}")))
+                            .collect(),
+                        negated: false,
+                    }),
+                    returning: Vec::new(),
+                }
+                .compile(&dialect)
+                .map_err(|error| PyValueError::new_err(error.to_string()))
+            })?;
+            statements.push((compiled, chunk));
+        }
+        self.execute_statements(py, MetricOperation::DeleteMany, statements)
+    }
+
     fn update(&self, py: Python<'_>, payload: &Bound<'_, PyDict>) -> PyResult<Py<PyAny>> {
         self.execute_write(py, QueryOperation::Update, payload)
     }
@@ -130,7 +342,7 @@ impl PyTableHandle {
 
     fn delete(&self, py: Python<'_>, primary_key: Py<PyAny>) -> PyResult<Py<PyAny>> {
         let key = (QueryOperation::Delete, vec![self.table.primary_key.clone()]);
-        let compiled = cached_or_compile(&self.compiled_dml, key, || {
+        let compiled = self.cached_dml(key, || {
             QueryAst::Delete {
                 table: TableRef::new(self.table.qualified_table_name()),
                 pk: self.table.primary_key.clone(),
@@ -138,7 +350,12 @@ impl PyTableHandle {
             .compile(&self.dialect()?)
             .map_err(|error| PyValueError::new_err(error.to_string()))
         })?;
-        self.execute_compiled(py, compiled, vec![py_to_db_value(py, primary_key)?])
+        self.execute_compiled(
+            py,
+            MetricOperation::Delete,
+            compiled,
+            vec![py_to_db_value(py, primary_key)?],
+        )
     }
 
     #[pyo3(signature = (primary_key, depth=0))]
@@ -148,53 +365,39 @@ impl PyTableHandle {
         primary_key: Py<PyAny>,
         depth: usize,
     ) -> PyResult<Py<PyAny>> {
-        let dialect = self.dialect()?;
-        let columns = if depth == 0 {
-            self.flat_select_columns()
-        } else {
-            Vec::new()
-        };
-        let aliases = if depth == 0 {
-            Some(self.flat_aliases())
-        } else {
-            None
-        };
-        let query = if depth == 0 {
-            QueryAst::Select {
-                table: TableRef::new(self.table.qualified_table_name()),
-                columns: select_columns(columns, aliases)?,
-                filters: sqlite_decimal_filters(
-                    vec![Filter::Eq {
-                        column: self.table.primary_key.clone(),
-                        param: self.table.primary_key.clone(),
-                    }],
-                    &self.table,
-                    &dialect,
-                ),
-                order_by: Vec::new(),
-                limit: None,
-                offset: None,
+        let compiled = self.cached_select(SelectShape::FindOne { depth }, |dialect| {
+            let pk_filter = vec![Filter::Eq {
+                column: self.table.primary_key.clone(),
+                param: self.table.primary_key.clone(),
+            }];
+            if depth == 0 {
+                return Ok(QueryAst::Select {
+                    table: TableRef::new(self.table.qualified_table_name()),
+                    columns: select_columns(self.flat_select_columns(), Some(self.flat_aliases()))?,
+                    filters: sqlite_decimal_filters(pk_filter, &self.table, dialect),
+                    order_by: Vec::new(),
+                    limit: None,
+                    offset: None,
+                });
             }
-        } else {
             self.joined_query(
                 JoinedQueryInput {
-                    filters: vec![Filter::Eq {
-                        column: self.table.primary_key.clone(),
-                        param: self.table.primary_key.clone(),
-                    }],
+                    filters: pk_filter,
                     order_by: Vec::new(),
                     direction: SortDirection::Asc,
                     limit: None,
                     offset: None,
                     depth,
                 },
-                &dialect,
-            )?
-        };
-        let compiled = query
-            .compile(&dialect)
-            .map_err(|error| PyValueError::new_err(error.to_string()))?;
-        self.execute_compiled(py, compiled, vec![py_to_db_value(py, primary_key)?])
+                dialect,
+            )
+        })?;
+        self.execute_compiled(
+            py,
+            MetricOperation::FindOne,
+            compiled,
+            vec![py_to_db_value(py, primary_key)?],
+        )
     }
 
     fn find_one_with_paths(
@@ -205,28 +408,31 @@ impl PyTableHandle {
         relationship_filters: Vec<RuntimeJoinedFilter>,
         relationship_order_by: Vec<RuntimeJoinedOrder>,
     ) -> PyResult<Py<PyAny>> {
-        let dialect = self.dialect()?;
-        let query = self.joined_query_for_paths(
-            RuntimeJoinedQuery {
-                filters: vec![Filter::Eq {
-                    column: self.table.primary_key.clone(),
-                    param: self.table.primary_key.clone(),
-                }],
-                order_by: Vec::new(),
-                direction: SortDirection::Asc,
-                limit: None,
-                offset: None,
-                paths,
-                relationship_filters,
-                relationship_order_by,
-            },
-            &dialect,
-        )?;
-        let compiled = query
-            .compile(&dialect)
-            .map_err(|error| PyValueError::new_err(error.to_string()))?;
+        let shape = SelectShape::FindOneWithPaths {
+            paths: paths.clone(),
+            relationship_filters: relationship_filters.clone(),
+            relationship_order_by: relationship_order_by.clone(),
+        };
+        let compiled = self.cached_select(shape, |dialect| {
+            self.joined_query_for_paths(
+                RuntimeJoinedQuery {
+                    filters: vec![Filter::Eq {
+                        column: self.table.primary_key.clone(),
+                        param: self.table.primary_key.clone(),
+                    }],
+                    order_by: Vec::new(),
+                    direction: SortDirection::Asc,
+                    limit: None,
+                    offset: None,
+                    paths,
+                    relationship_filters,
+                    relationship_order_by,
+                },
+                dialect,
+            )
+        })?;
         let params = bind_values(py, compiled.params(), values)?;
-        self.execute_compiled(py, compiled, params)
+        self.execute_compiled(py, MetricOperation::FindOne, compiled, params)
     }
 
     #[pyo3(signature = (filters, values, order_by, order_direction, limit=None, offset=None, depth=0))]
@@ -242,41 +448,69 @@ impl PyTableHandle {
         offset: Option<usize>,
         depth: usize,
     ) -> PyResult<Py<PyAny>> {
-        let dialect = self.dialect()?;
-        let direction = parse_sort_direction(order_direction)?;
-        let filter_params = parse_filter_input(filters)?;
-        let query = if depth == 0 {
-            QueryAst::Select {
-                table: TableRef::new(self.table.qualified_table_name()),
-                columns: select_columns(self.flat_select_columns(), Some(self.flat_aliases()))?,
-                filters: sqlite_decimal_filters(filter_params, &self.table, &dialect),
-                order_by: order_by
-                    .into_iter()
-                    .map(|column| {
-                        sqlite_decimal_order_by(column, direction.clone(), &self.table, &dialect)
-                    })
-                    .collect(),
-                limit,
-                offset,
-            }
-        } else {
-            self.joined_query(
-                JoinedQueryInput {
-                    filters: filter_params,
-                    order_by,
-                    direction,
-                    limit,
-                    offset,
-                    depth,
-                },
-                &dialect,
-            )?
-        };
-        let compiled = query
-            .compile(&dialect)
-            .map_err(|error| PyValueError::new_err(error.to_string()))?;
+        let compiled = self.compiled_find_many(filters, order_by, order_direction, depth)?;
+        let (compiled, page) = with_pagination(&self.dialect()?, compiled, limit, offset);
+        let mut params = bind_values(py, compiled.params(), values)?;
+        params.extend(page);
+        self.execute_compiled(py, MetricOperation::FindMany, compiled, params)
+    }
+
+    /// Run a flat `find_many` and serialize the rows straight to JSON bytes.
+    ///
+    /// `fields` describes the output objects in order; no Python object is
+    /// created per row unless a field needs a Python encoder.
+    #[pyo3(signature = (filters, values, order_by, order_direction, fields, limit=None, offset=None))]
+    #[allow(clippy::too_many_arguments)]
+    fn find_many_json(
+        &self,
+        py: Python<'_>,
+        filters: &Bound<'_, PyAny>,
+        values: &Bound<'_, PyDict>,
+        order_by: Vec<String>,
+        order_direction: &str,
+        fields: Vec<JsonFieldSpec>,
+        limit: Option<usize>,
+        offset: Option<usize>,
+    ) -> PyResult<Py<PyAny>> {
+        let writer = JsonRowWriter::new(fields)?;
+        let compiled = self.compiled_find_many(filters, order_by, order_direction, 0)?;
+        let (compiled, page) = with_pagination(&self.dialect()?, compiled, limit, offset);
+        let mut params = bind_values(py, compiled.params(), values)?;
+        params.extend(page);
+        self.execute_compiled_with(
+            py,
+            MetricOperation::FindMany,
+            compiled,
+            params,
+            move |result| writer.prepare(result),
+            |py, prepared| prepared.into_bytes(py),
+        )
+    }
+
+    /// Open a flat `find_many` query that yields rows in chunks of `chunk_size`.
+    #[pyo3(signature = (filters, values, order_by, order_direction, chunk_size=1000))]
+    fn stream(
+        &self,
+        py: Python<'_>,
+        filters: &Bound<'_, PyAny>,
+        values: &Bound<'_, PyDict>,
+        order_by: Vec<String>,
+        order_direction: &str,
+        chunk_size: usize,
+    ) -> PyResult<PyRowStream> {
+        if chunk_size == 0 {
+            return Err(PyValueError::new_err("chunk_size must be at least 1"));
+        }
+        let compiled = self.compiled_find_many(filters, order_by, order_direction, 0)?;
         let params = bind_values(py, compiled.params(), values)?;
-        self.execute_compiled(py, compiled, params)
+        PyRowStream::open(
+            Arc::clone(&self.pool),
+            self.pin,
+            self.executor().cloned(),
+            compiled,
+            params,
+            chunk_size,
+        )
     }
 
     #[pyo3(signature = (
@@ -304,27 +538,35 @@ impl PyTableHandle {
         relationship_filters: Vec<RuntimeJoinedFilter>,
         relationship_order_by: Vec<RuntimeJoinedOrder>,
     ) -> PyResult<Py<PyAny>> {
-        let dialect = self.dialect()?;
         let direction = parse_sort_direction(order_direction)?;
         let filter_params = parse_filter_input(filters)?;
-        let query = self.joined_query_for_paths(
-            RuntimeJoinedQuery {
-                filters: filter_params,
-                order_by,
-                direction,
-                limit,
-                offset,
-                paths,
-                relationship_filters,
-                relationship_order_by,
-            },
-            &dialect,
-        )?;
-        let compiled = query
-            .compile(&dialect)
-            .map_err(|error| PyValueError::new_err(error.to_string()))?;
-        let params = bind_values(py, compiled.params(), values)?;
-        self.execute_compiled(py, compiled, params)
+        let shape = SelectShape::FindManyWithPaths {
+            filters: filter_params.clone(),
+            order_by: order_by.clone(),
+            direction: direction.clone(),
+            paths: paths.clone(),
+            relationship_filters: relationship_filters.clone(),
+            relationship_order_by: relationship_order_by.clone(),
+        };
+        let compiled = self.cached_select(shape, |dialect| {
+            self.joined_query_for_paths(
+                RuntimeJoinedQuery {
+                    filters: filter_params,
+                    order_by,
+                    direction,
+                    limit: None,
+                    offset: None,
+                    paths,
+                    relationship_filters,
+                    relationship_order_by,
+                },
+                dialect,
+            )
+        })?;
+        let (compiled, page) = with_pagination(&self.dialect()?, compiled, limit, offset);
+        let mut params = bind_values(py, compiled.params(), values)?;
+        params.extend(page);
+        self.execute_compiled(py, MetricOperation::FindMany, compiled, params)
     }
 
     fn count(
@@ -333,37 +575,60 @@ impl PyTableHandle {
         filters: &Bound<'_, PyAny>,
         values: &Bound<'_, PyDict>,
     ) -> PyResult<Py<PyAny>> {
-        let dialect = self.dialect()?;
-        let compiled = QueryAst::Count {
-            table: TableRef::new(self.table.qualified_table_name()),
-            filters: sqlite_decimal_filters(parse_filter_input(filters)?, &self.table, &dialect),
-        }
-        .compile(&dialect)
-        .map_err(|error| PyValueError::new_err(error.to_string()))?;
+        let filter_params = parse_filter_input(filters)?;
+        let shape = SelectShape::Count {
+            filters: filter_params.clone(),
+        };
+        let compiled = self.cached_select(shape, |dialect| {
+            Ok(QueryAst::Count {
+                table: TableRef::new(self.table.qualified_table_name()),
+                filters: sqlite_decimal_filters(filter_params, &self.table, dialect),
+            })
+        })?;
         let params = bind_values(py, compiled.params(), values)?;
-        self.execute_compiled(py, compiled, params)
+        self.execute_compiled(py, MetricOperation::Count, compiled, params)
     }
 
-    fn select_expression(&self, py: Python<'_>, query: &Bound<'_, PyAny>) -> PyResult<Py<PyAny>> {
-        let query = query.cast::<PyDict>()?;
-        let dialect = self.dialect()?;
-        let mut ast = select_ast_from_payload(py, query)?;
-        if dialect.kind() == DialectKind::Sqlite {
-            ast = ast.rewrite_sqlite_decimal_columns(
-                &decimal_columns(&self.table),
-                &runtime_table_names(&self.table),
-            );
+    #[pyo3(signature = (query, columnar=false))]
+    fn select_expression(
+        &self,
+        py: Python<'_>,
+        query: &Bound<'_, PyAny>,
+        columnar: bool,
+    ) -> PyResult<Py<PyAny>> {
+        let (compiled, params) = self.compiled_select_expression(py, query)?;
+        self.execute_compiled_as(
+            py,
+            MetricOperation::Select,
+            compiled,
+            params,
+            result_converter(columnar),
+        )
+    }
+
+    /// Run a typed SELECT and export the rows as Arrow record batches.
+    ///
+    /// The batches are built on the worker thread, so no Python object is
+    /// created per cell.
+    #[pyo3(signature = (query, batch_size=None))]
+    fn select_expression_arrow(
+        &self,
+        py: Python<'_>,
+        query: &Bound<'_, PyAny>,
+        batch_size: Option<usize>,
+    ) -> PyResult<Py<PyAny>> {
+        if batch_size == Some(0) {
+            return Err(PyValueError::new_err("batch_size must be at least 1"));
         }
-        let compiled = ast
-            .compile(&dialect)
-            .map_err(|error| PyValueError::new_err(error.to_string()))?;
-        let empty_values = PyDict::new(py);
-        let values = match query.get_item("values")? {
-            Some(values) => values.cast::<PyDict>()?.clone(),
-            None => empty_values,
-        };
-        let params = bind_values(py, compiled.params(), &values)?;
-        self.execute_compiled(py, compiled, params)
+        let (compiled, params) = self.compiled_select_expression(py, query)?;
+        self.execute_compiled_with(
+            py,
+            MetricOperation::Select,
+            compiled,
+            params,
+            move |result| ArrowTable::from_result(&result, batch_size),
+            |py, table| PyArrowTable::new(table).into_py_any(py),
+        )
     }
 
     fn update_expression(&self, py: Python<'_>, query: &Bound<'_, PyAny>) -> PyResult<Py<PyAny>> {
@@ -385,7 +650,7 @@ impl PyTableHandle {
             None => empty_values,
         };
         let params = bind_values(py, compiled.params(), &values)?;
-        self.execute_compiled(py, compiled, params)
+        self.execute_compiled(py, MetricOperation::UpdateExpression, compiled, params)
     }
 
     fn delete_expression(&self, py: Python<'_>, query: &Bound<'_, PyAny>) -> PyResult<Py<PyAny>> {
@@ -407,7 +672,19 @@ impl PyTableHandle {
             None => empty_values,
         };
         let params = bind_values(py, compiled.params(), &values)?;
-        self.execute_compiled(py, compiled, params)
+        self.execute_compiled(py, MetricOperation::DeleteExpression, compiled, params)
+    }
+
+    /// Whether query methods return asyncio futures completed by native workers.
+    #[getter]
+    fn awaitable(&self) -> bool {
+        self.executor.is_some()
+    }
+
+    /// Whether `select_expression` accepts `columnar=True`.
+    #[getter]
+    fn columnar_results(&self) -> bool {
+        true
     }
 
     fn max_bind_parameters(&self) -> PyResult<Option<usize>> {
@@ -416,6 +693,18 @@ impl PyTableHandle {
 }
 
 impl PyTableHandle {
+    /// Workers that run this handle's statements.
+    ///
+    /// Statements of a pinned transaction never queue behind unpinned
+    /// statements waiting for a free connection, so the transaction can always
+    /// reach COMMIT and release its connection.
+    fn executor(&self) -> Option<&Arc<NativeExecutor>> {
+        match self.pin {
+            Some(_) => self.transaction_executor.as_ref(),
+            None => self.executor.as_ref(),
+        }
+    }
+
     fn dialect(&self) -> PyResult<AnyDialect> {
         AnyDialect::parse(&self.url).map_err(|error| PyValueError::new_err(error.to_string()))
     }
@@ -426,9 +715,9 @@ impl PyTableHandle {
         operation: QueryOperation,
         payloads: Vec<Py<PyDict>>,
     ) -> PyResult<Py<PyAny>> {
-        let operation_name = match operation {
-            QueryOperation::Insert => "insert_many",
-            QueryOperation::Upsert => "upsert_many",
+        let (operation_name, metric) = match operation {
+            QueryOperation::Insert => ("insert_many", MetricOperation::InsertMany),
+            QueryOperation::Upsert => ("upsert_many", MetricOperation::UpsertMany),
             _ => {
                 return Err(PyValueError::new_err(
                     "bulk table writes support insert and upsert only",
@@ -470,22 +759,92 @@ impl PyTableHandle {
             .map_err(|error| PyValueError::new_err(error.to_string()))?;
         let mut values = Vec::with_capacity(payloads.len() * columns.len());
         for payload in payloads {
-            let payload = payload.bind(py);
-            if payload_columns(payload)? != columns {
-                return Err(PyValueError::new_err(format!(
-                    "{operation_name} payloads must use the same ordered columns"
-                )));
-            }
-            for column in &columns {
-                let value = payload.get_item(column)?.ok_or_else(|| {
-                    PyValueError::new_err(format!(
-                        "{operation_name} payload is missing column '{column}'"
-                    ))
-                })?;
-                values.push(py_to_db_value(py, value.unbind())?);
-            }
+            values.extend(payload_row(py, payload.bind(py), &columns, operation_name)?);
+        }
+        self.execute_compiled(py, metric, compiled, values)
+    }
+
+    /// Run compiled statements in order over one connection and sum their row counts.
+    fn execute_statements(
+        &self,
+        py: Python<'_>,
+        operation: MetricOperation,
+        statements: Vec<(CompiledQuery, Vec<DbValue>)>,
+    ) -> PyResult<Py<PyAny>> {
+        let sent = statements
+            .iter()
+            .map(|(_, values)| values_bytes(values))
+            .sum();
+        self.run_atomically(
+            py,
+            operation,
+            sent,
+            move |connection| {
+                let mut affected = 0;
+                for (compiled, values) in &statements {
+                    let result = connection.execute(compiled.sql(), values)?;
+                    affected += result.row_count().unwrap_or(0);
+                }
+                Ok(QueryResult::affected(affected))
+            },
+            result_size,
+            query_result_to_python,
+        )
+    }
+
+    /// Run `work` on one pooled connection inside a transaction.
+    ///
+    /// Work joins the caller's transaction when one is pinned; otherwise it is
+    /// committed on success and rolled back on error.
+    fn run_atomically<T, W, M, C>(
+        &self,
+        py: Python<'_>,
+        operation: MetricOperation,
+        sent: u64,
+        work: W,
+        measure: M,
+        convert: C,
+    ) -> PyResult<Py<PyAny>>
+    where
+        T: Send + 'static,
+        W: FnOnce(&mut NativeConnection) -> OrmdanticResult<T> + Send + 'static,
+        M: FnOnce(&T) -> (u64, u64) + Send + 'static,
+        C: FnOnce(Python<'_>, T) -> PyResult<Py<PyAny>> + Send + 'static,
+    {
+        if let Some(executor) = self.executor() {
+            let pool = Arc::clone(&self.pool);
+            let pin = self.pin;
+            let metrics = Arc::clone(&self.metrics);
+            return executor.submit(
+                py,
+                move || {
+                    metrics
+                        .observe(
+                            operation,
+                            &pool,
+                            pin,
+                            sent,
+                            |connection| atomically(connection, work),
+                            measure,
+                        )
+                        .map_err(|error| error.to_string())
+                },
+                convert,
+            );
         }
-        self.execute_compiled(py, compiled, values)
+        let output = py
+            .detach(|| {
+                self.metrics.observe(
+                    operation,
+                    &self.pool,
+                    self.pin,
+                    sent,
+                    |connection| atomically(connection, work),
+                    measure,
+                )
+            })
+            .map_err(|error| PyValueError::new_err(error.to_string()))?;
+        convert(py, output)
     }
 
     fn execute_write(
@@ -495,6 +854,11 @@ impl PyTableHandle {
         payload: &Bound<'_, PyDict>,
     ) -> PyResult<Py<PyAny>> {
         let payload_columns = payload_columns(payload)?;
+        let metric = match operation {
+            QueryOperation::Insert => MetricOperation::Insert,
+            QueryOperation::Update => MetricOperation::Update,
+            _ => MetricOperation::Upsert,
+        };
         let query = match operation {
             QueryOperation::Insert => QueryAst::Insert {
                 table: TableRef::new(self.table.qualified_table_name()),
@@ -521,31 +885,198 @@ impl PyTableHandle {
             }
         };
         let key = (operation, payload_columns);
-        let compiled = cached_or_compile(&self.compiled_dml, key, || {
+        let compiled = self.cached_dml(key, || {
             query
                 .compile(&self.dialect()?)
                 .map_err(|error| PyValueError::new_err(error.to_string()))
         })?;
         let params = bind_values(py, compiled.params(), payload)?;
-        self.execute_compiled(py, compiled, params)
+        self.execute_compiled(py, metric, compiled, params)
     }
 
     fn execute_compiled(
         &self,
         py: Python<'_>,
+        operation: MetricOperation,
         compiled: CompiledQuery,
         values: Vec<DbValue>,
     ) -> PyResult<Py<PyAny>> {
-        let result = py
+        self.execute_compiled_as(py, operation, compiled, values, query_result_to_python)
+    }
+
+    fn execute_compiled_as(
+        &self,
+        py: Python<'_>,
+        operation: MetricOperation,
+        compiled: CompiledQuery,
+        values: Vec<DbValue>,
+        convert: ResultConverter,
+    ) -> PyResult<Py<PyAny>> {
+        self.execute_compiled_with(py, operation, compiled, values, |result| result, convert)
+    }
+
+    /// Execute `compiled`, running `prepare` on the result before the GIL is
+    /// taken and `convert` with it.
+    fn execute_compiled_with<T, P, C>(
+        &self,
+        py: Python<'_>,
+        operation: MetricOperation,
+        compiled: CompiledQuery,
+        values: Vec<DbValue>,
+        prepare: P,
+        convert: C,
+    ) -> PyResult<Py<PyAny>>
+    where
+        T: Send + 'static,
+        P: FnOnce(QueryResult) -> T + Send + 'static,
+        C: FnOnce(Python<'_>, T) -> PyResult<Py<PyAny>> + Send + 'static,
+    {
+        let sent = values_bytes(&values);
+        if let Some(executor) = self.executor() {
+            let pool = Arc::clone(&self.pool);
+            let pin = self.pin;
+            let metrics = Arc::clone(&self.metrics);
+            return executor.submit(
+                py,
+                move || {
+                    metrics
+                        .observe(
+                            operation,
+                            &pool,
+                            pin,
+                            sent,
+                            |connection| connection.execute(compiled.sql(), &values),
+                            result_size,
+                        )
+                        .map(prepare)
+                        .map_err(|error| error.to_string())
+                },
+                convert,
+            );
+        }
+        let prepared = py
             .detach(|| {
-                self.connection
-                    .lock()
-                    .map_err(|_| "native connection lock poisoned".to_string())?
-                    .execute(compiled.sql(), &values)
+                self.metrics
+                    .observe(
+                        operation,
+                        &self.pool,
+                        self.pin,
+                        sent,
+                        |connection| connection.execute(compiled.sql(), &values),
+                        result_size,
+                    )
+                    .map(prepare)
                     .map_err(|error| error.to_string())
             })
             .map_err(PyValueError::new_err)?;
-        query_result_to_python(py, result)
+        convert(py, prepared)
+    }
+
+    fn compiled_select_expression(
+        &self,
+        py: Python<'_>,
+        query: &Bound<'_, PyAny>,
+    ) -> PyResult<(CompiledQuery, Vec<DbValue>)> {
+        let query = query.cast::<PyDict>()?;
+        let dialect = self.dialect()?;
+        let mut ast = select_ast_from_payload(py, query)?;
+        if dialect.kind() == DialectKind::Sqlite {
+            ast = ast.rewrite_sqlite_decimal_columns(
+                &decimal_columns(&self.table),
+                &runtime_table_names(&self.table),
+            );
+        }
+        let compiled = ast
+            .compile(&dialect)
+            .map_err(|error| PyValueError::new_err(error.to_string()))?;
+        let empty_values = PyDict::new(py);
+        let values = match query.get_item("values")? {
+            Some(values) => values.cast::<PyDict>()?.clone(),
+            None => empty_values,
+        };
+        let params = bind_values(py, compiled.params(), &values)?;
+        Ok((compiled, params))
+    }
+
+    fn compiled_find_many(
+        &self,
+        filters: &Bound<'_, PyAny>,
+        order_by: Vec<String>,
+        order_direction: &str,
+        depth: usize,
+    ) -> PyResult<CompiledQuery> {
+        let direction = parse_sort_direction(order_direction)?;
+        let filter_params = parse_filter_input(filters)?;
+        let shape = SelectShape::FindMany {
+            filters: filter_params.clone(),
+            order_by: order_by.clone(),
+            direction: direction.clone(),
+            depth,
+        };
+        self.cached_select(shape, |dialect| {
+            if depth == 0 {
+                return Ok(QueryAst::Select {
+                    table: TableRef::new(self.table.qualified_table_name()),
+                    columns: select_columns(self.flat_select_columns(), Some(self.flat_aliases()))?,
+                    filters: sqlite_decimal_filters(filter_params, &self.table, dialect),
+                    order_by: order_by
+                        .into_iter()
+                        .map(|column| {
+                            sqlite_decimal_order_by(column, direction.clone(), &self.table, dialect)
+                        })
+                        .collect(),
+                    limit: None,
+                    offset: None,
+                });
+            }
+            self.joined_query(
+                JoinedQueryInput {
+                    filters: filter_params,
+                    order_by,
+                    direction,
+                    limit: None,
+                    offset: None,
+                    depth,
+                },
+                dialect,
+            )
+        })
+    }
+
+    fn cached_select(
+        &self,
+        shape: SelectShape,
+        build: impl FnOnce(&AnyDialect) -> PyResult<QueryAst>,
+    ) -> PyResult<CompiledQuery> {
+        let mut compiled_now = false;
+        let compiled =
+            self.select_cache
+                .get_or_compile(&self.table.qualified_table_name(), shape, || {
+                    compiled_now = true;
+                    let dialect = self.dialect()?;
+                    build(&dialect)?
+                        .compile(&dialect)
+                        .map_err(|error| PyValueError::new_err(error.to_string()))
+                })?;
+        self.metrics.record_compile(!compiled_now);
+        Ok(compiled)
+    }
+
+    /// Look up or compile a DML statement, counting the lookup in the table's metrics.
+    fn cached_dml(
+        &self,
+        key: (QueryOperation, Vec<String>),
+        compile: impl FnOnce() -> PyResult<CompiledQuery>,
+    ) -> PyResult<CompiledQuery> {
+        let mut compiled_now = false;
+        let compiled =
+            self.compiled_dml
+                .get_or_compile(&self.table.qualified_table_name(), key, || {
+                    compiled_now = true;
+                    compile()
+                })?;
+        self.metrics.record_compile(!compiled_now);
+        Ok(compiled)
     }
 
     fn flat_select_columns(&self) -> Vec<String> {
@@ -1025,6 +1556,14 @@ fn payload_columns(payload: &Bound<'_, PyDict>) -> PyResult<Vec<String>> {
         .collect::<PyResult<Vec<_>>>()
 }
 
+fn result_converter(columnar: bool) -> ResultConverter {
+    if columnar {
+        query_result_to_columns
+    } else {
+        query_result_to_python
+    }
+}
+
 fn bind_values(
     py: Python<'_>,
     param_names: &[String],
@@ -1041,20 +1580,81 @@ fn bind_values(
         .collect()
 }
 
-fn cached_or_compile(
-    cache: &Mutex<HashMap<(QueryOperation, Vec<String>), CompiledQuery>>,
-    key: (QueryOperation, Vec<String>),
-    compile: impl FnOnce() -> PyResult<CompiledQuery>,
-) -> PyResult<CompiledQuery> {
-    let mut cache = cache
-        .lock()
-        .map_err(|_| PyValueError::new_err("compiled DML cache lock poisoned"))?;
-    if let Some(compiled) = cache.get(&key) {
-        return Ok(compiled.clone());
-    }
-    let compiled = compile()?;
-    cache.insert(key, compiled.clone());
-    Ok(compiled)
+fn atomically<T>(
+    connection: &mut PooledConnection,
+    work: impl FnOnce(&mut NativeConnection) -> OrmdanticResult<T>,
+) -> OrmdanticResult<T> {
+    if connection.is_pinned() {
+        return work(connection);
+    }
+    connection.begin()?;
+    match work(connection) {
+        Ok(output) => {
+            connection.commit()?;
+            Ok(output)
+        }
+        Err(error) => {
+            // Surface the work error; a failed rollback leaves nothing to undo.
+            let _ = connection.rollback();
+            Err(error)
+        }
+    }
+}
+
+/// Rows per batched statement, bounded by the bind limit and Oracle's
+/// 1,000-expression IN list limit.
+fn rows_per_statement(
+    dialect: &AnyDialect,
+    params_per_row: usize,
+    batch_size: Option<usize>,
+) -> usize {
+    let safe = dialect
+        .max_bind_parameters()
+        .map_or(MAX_ROWS_PER_STATEMENT, |limit| limit / params_per_row)
+        .clamp(1, MAX_ROWS_PER_STATEMENT);
+    batch_size.map_or(safe, |requested| requested.clamp(1, safe))
+}
+
+fn payload_row(
+    py: Python<'_>,
+    payload: &Bound<'_, PyDict>,
+    columns: &[String],
+    operation_name: &str,
+) -> PyResult<Vec<DbValue>> {
+    if payload_columns(payload)? != columns {
+        return Err(PyValueError::new_err(format!(
+            "{operation_name} payloads must use the same ordered columns"
+        )));
+    }
+    columns
+        .iter()
+        .map(|column| {
+            let value = payload.get_item(column)?.ok_or_else(|| {
+                PyValueError::new_err(format!(
+                    "{operation_name} payload is missing column '{column}'"
+                ))
+            })?;
+            py_to_db_value(py, value.unbind())
+        })
+        .collect()
+}
+
+/// Pad `chunk` by repeating its last row up to the row count its statement renders.
+///
+/// Batch statements only render power-of-two row counts, capped at
+/// `max_rows`, so a table compiles a handful of statements per column set
+/// however callers size their batches. A repeated row binds the same key and
+/// values again, so it matches no additional rows.
+fn padded_rows<T: Clone>(chunk: &[T], max_rows: usize) -> Vec<T> {
+    let mut rows = chunk.to_vec();
+    if let Some(last) = chunk.last() {
+        let size = chunk
+            .len()
+            .next_power_of_two()
+            .min(max_rows.max(chunk.len()));
+        rows.resize(size, last.clone());
+    }
+    rows
 }
 
 #[cfg(test)]
@@ -1085,11 +1685,11 @@ mod tests {
 
     #[test]
     fn compiled_dml_cache_reuses_shapes_and_separates_other_shapes() {
-        let cache = Mutex::new(HashMap::new());
+        let cache = DmlCache::new(8);
         let mut compile_count = 0;
         let mut compile = |columns: Vec<String>| {
-            cached_or_compile(
-                &cache,
+            cache.get_or_compile(
+                "flavors",
                 (QueryOperation::Insert, columns),
                 || -> PyResult<CompiledQuery> {
                     compile_count += 1;
@@ -1108,4 +1708,26 @@ mod tests {
 
         assert_eq!(compile_count, 2);
     }
+
+    #[test]
+    fn padded_rows_render_few_distinct_batch_sizes() {
+        let sizes = (1..=200)
+            .map(|count| padded_rows(&vec![count; count], 200).len())
+            .collect::<HashSet<_>>();
+
+        assert_eq!(sizes, HashSet::from([1, 2, 4, 8, 16, 32, 64, 128, 200]));
+        assert_eq!(padded_rows(&[1, 2, 3], 200), vec![1, 2, 3, 3]);
+        assert!(padded_rows::<i32>(&[], 200).is_empty());
+    }
+
+    #[test]
+    fn rows_per_statement_respects_bind_and_in_list_limits() {
+        let mssql = AnyDialect::parse("mssql").unwrap();
+        let sqlite = AnyDialect::parse("sqlite").unwrap();
+
+        assert_eq!(rows_per_statement(&mssql, 9, None), 233);
+        assert_eq!(rows_per_statement(&sqlite, 1, None), MAX_ROWS_PER_STATEMENT);
+        assert_eq!(rows_per_statement(&sqlite, 9, Some(50)), 50);
+        assert_eq!(rows_per_statement(&mssql, 5_000, Some(10)), 1);
+    }
 }
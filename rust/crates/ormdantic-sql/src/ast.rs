@@ -94,7 +94,7 @@ impl SelectColumn {
     }
 }
 
-#[derive(Debug, Clone, PartialEq, Eq)]
+#[derive(Debug, Clone, PartialEq, Eq, Hash)]
 pub enum SortDirection {
     Asc,
     Desc,
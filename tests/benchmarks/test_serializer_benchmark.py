@@ -20,6 +20,7 @@ from ormdantic.migrations import (
 )
 from ormdantic.models import Map, OrmTable, Relationship
 from ormdantic.serializer import OrmSerializer
+from ormdantic.session import Session
 
 pytest.importorskip("pytest_benchmark")
 
@@ -762,3 +763,30 @@ def test_migration_diff_planning_benchmark(benchmark: Any) -> None:
 
     assert change_count == 150
     assert has_unsafe_operations is False
+
+
+@dataclass
+class _SessionBenchDatabase:
+    _table_map: Map
+
+
+def _stage_session(models: list[_BenchFlavor]) -> Session:
+    table = _flat_table()
+    table_map = Map(name_to_data={table.tablename: table}, model_to_data={})
+    table_map.model_to_data = {_BenchFlavor: table}
+    session = Session(_SessionBenchDatabase(table_map))
+    for model in models:
+        session.add(model)
+    for model in models[::10]:
+        session.delete(model)
+    return session
+
+
+def test_session_staging_benchmark(benchmark: Any) -> None:
+    models = [
+        _BenchFlavor(name=f"flavor-{index}", strength=index) for index in range(100_000)
+    ]
+
+    session = benchmark(_stage_session, models)
+
+    assert len(session._new) == 90_000
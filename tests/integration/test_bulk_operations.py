@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import pytest
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from ormdantic import Ormdantic, TableColumn, column
 
@@ -188,3 +188,118 @@ async def test_delete_where_requires_explicit_full_table_permission(tmp_path) ->
         await db[Item].delete_where()
     assert await db[Item].delete_where(allow_all=True) == 2
     assert await db[Item].count() == 0
+
+
+async def test_copy_from_round_trips_models_and_column_mappings(tmp_path) -> None:
+    db = Ormdantic(f"sqlite:///{tmp_path / 'bulk_copy.sqlite3'}")
+
+    @db.table("bulk_records", pk="id")
+    class Record(BaseModel):
+        id: str
+        score: float | None = None
+        note: str | None = None
+        active: bool = True
+        tags: list[str] = Field(default_factory=list)
+        meta: dict[str, int] = Field(default_factory=dict)
+
+    await db.init()
+    assert await db[Record].copy_from([]) == 0
+
+    models = [
+        Record(
+            id=str(index),
+            score=None if index % 2 else index / 2,
+            note=None if index % 3 else f"note {index}",
+            active=index % 2 == 0,
+            tags=[f"tag-{index}"] if index % 4 else [],
+            meta={"index": index} if index % 5 else {},
+        )
+        for index in range(9)
+    ]
+    loaded = await db[Record].copy_from(
+        [
+            *models,
+            {"id": "m1", "score": 1.5, "active": True, "tags": ["raw"], "meta": {}},
+            {"id": "m2", "active": False, "tags": [], "meta": {"raw": 1}},
+        ],
+        batch_size=4,
+    )
+
+    assert loaded == 11
+    stored = await db[Record].find_many(order_by=["id"])
+    assert stored.data == [
+        *models,
+        Record(id="m1", score=1.5, tags=["raw"]),
+        Record(id="m2", active=False, meta={"raw": 1}),
+    ]
+
+    with pytest.raises(RuntimeError, match="roll back"):
+        async with db.transaction():
+            assert await db[Record].copy_from([Record(id="t1"), {"id": "t2"}]) == 2
+            assert await db[Record].count() == 13
+            raise RuntimeError("roll back")
+    assert await db[Record].count() == 11
+
+
+async def test_update_many_and_delete_many_round_trip_rows(tmp_path) -> None:
+    db = Ormdantic(f"sqlite:///{tmp_path / 'bulk_update_delete.sqlite3'}")
+
+    @db.table("bulk_records", pk="id")
+    class Record(BaseModel):
+        id: str
+        score: float | None = None
+        note: str | None = None
+        tags: list[str] = Field(default_factory=list)
+        meta: dict[str, int] = Field(default_factory=dict)
+
+    await db.init()
+    assert await db[Record].update_many([]) == []
+    assert await db[Record].delete_many([]) == 0
+
+    records = [
+        Record(id=str(index), score=index / 2, note=f"note {index}")
+        for index in range(9)
+    ]
+    await db[Record].insert_many(records)
+    changed = [
+        record.model_copy(
+            update={
+                "score": None if index % 2 else index * 10.0,
+                "note": None if index % 3 == 0 else f"changed {index}",
+                "tags": [f"tag-{index}", "shared"],
+                "meta": {"index": index},
+            }
+        )
+        for index, record in enumerate(records[:7])
+    ]
+
+    assert await db[Record].update_many(changed, batch_size=3) == changed
+    stored = await db[Record].find_many(order_by=["id"])
+    assert stored.data == [*changed, *records[7:]]
+
+    renamed = [
+        record.model_copy(update={"note": "renamed", "score": -1.0})
+        for record in changed[:3]
+    ]
+    await db[Record].update_many(renamed, columns=["note"])
+    for record in changed[:3]:
+        assert await db[Record].find_one(record.id) == record.model_copy(
+            update={"note": "renamed"}
+        )
+
+    with pytest.raises(RuntimeError, match="roll back"):
+        async with db.transaction():
+            assert await db[Record].delete_many(["0", "1"]) == 2
+            await db[Record].update_many(
+                [records[8].model_copy(update={"note": "discarded"})]
+            )
+            raise RuntimeError("roll back")
+    assert await db[Record].count() == 9
+    assert await db[Record].find_one("8") == records[8]
+
+    deleted = await db[Record].delete_many(
+        ["0", "2", "4", "6", "missing"], batch_size=2
+    )
+    assert deleted == 4
+    remaining = await db[Record].find_many(order_by=["id"])
+    assert [record.id for record in remaining.data] == ["1", "3", "5", "7", "8"]
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import json
+from enum import Enum
+
+import pytest
+from pydantic import BaseModel, Field
+
+from ormdantic import Ormdantic
+
+
+class Flavor(str, Enum):
+    sweet = "sweet"
+    bitter = "bitter"
+
+
+async def test_find_many_json_matches_model_serialization(tmp_path) -> None:
+    db = Ormdantic(f"sqlite:///{tmp_path / 'find_many_json.sqlite3'}")
+
+    @db.table("json_records", pk="id")
+    class Record(BaseModel):
+        id: int
+        label: str = Field(serialization_alias="displayLabel")
+        flavor: Flavor
+        score: float | None = None
+        active: bool = True
+        note: str | None = None
+        tags: list[str] = Field(default_factory=list)
+        meta: dict[str, int] = Field(default_factory=dict)
+
+    await db.init()
+    table = db[Record]
+    assert json.loads(await table.find_many_json()) == {
+        "offset": 0,
+        "limit": 0,
+        "data": [],
+    }
+
+    await table.insert_many(
+        [
+            Record(
+                id=index,
+                label=f'record "{index}" ünïcode',
+                flavor=Flavor.sweet if index % 2 else Flavor.bitter,
+                score=None if index % 3 == 0 else index / 4,
+                active=index % 2 == 0,
+                note=None if index % 2 else f"note\n{index}",
+                tags=[f"tag-{index}", "shared"] if index % 4 else [],
+                meta={"index": index} if index % 5 else {},
+            )
+            for index in range(12)
+        ]
+    )
+
+    for arguments in (
+        {"order_by": ["id"]},
+        {"where": {"active": True}, "order_by": ["id"]},
+        {"order_by": ["id"], "limit": 5, "offset": 3},
+        {"order_by": ["id"], "by_alias": True},
+    ):
+        by_alias = bool(arguments.pop("by_alias", False))
+        expected = (await table.find_many(**arguments)).to_json_bytes(by_alias=by_alias)
+        assert json.loads(
+            await table.find_many_json(**arguments, by_alias=by_alias)
+        ) == json.loads(expected)
+
+
+async def test_find_many_json_reads_uncommitted_rows_in_a_transaction(
+    tmp_path,
+) -> None:
+    db = Ormdantic(f"sqlite:///{tmp_path / 'find_many_json_transaction.sqlite3'}")
+
+    @db.table("json_records", pk="id")
+    class Record(BaseModel):
+        id: int
+        tags: list[str] = Field(default_factory=list)
+
+    await db.init()
+
+    with pytest.raises(RuntimeError, match="roll back"):
+        async with db.transaction():
+            await db[Record].insert(Record(id=1, tags=["pending"]))
+            inside = json.loads(await db[Record].find_many_json())
+            assert inside["data"] == [{"id": 1, "tags": ["pending"]}]
+            raise RuntimeError("roll back")
+
+    assert json.loads(await db[Record].find_many_json())["data"] == []
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+from pydantic import BaseModel, Field
+
+from ormdantic import Ormdantic, column
+
+
+def _register_reading(db: Ormdantic) -> type[BaseModel]:
+    @db.table("select_readings", pk="id")
+    class Reading(BaseModel):
+        id: int
+        label: str
+        score: float | None = None
+        note: str | None = None
+        tags: list[str] = Field(default_factory=list)
+
+    return Reading
+
+
+def _readings(reading: type[BaseModel]) -> list[BaseModel]:
+    return [
+        reading(
+            id=index,
+            label=f"reading-{index}",
+            score=None if index % 3 == 0 else index / 4,
+            note=None if index % 2 else f"nöte {index}",
+            tags=[f"tag-{index}"] if index % 4 else [],
+        )
+        for index in range(10)
+    ]
+
+
+async def test_select_columns_matches_row_results(tmp_path) -> None:
+    db = Ormdantic(f"sqlite:///{tmp_path / 'select_columns.sqlite3'}")
+    Reading = _register_reading(db)
+    await db.init()
+    projections = (
+        column("id"),
+        column("label"),
+        column("score"),
+        column("note"),
+        column("tags"),
+    )
+
+    empty = await db[Reading].select(*projections, result_format="columns")
+    assert len(empty) == 0
+    assert empty.rows() == []
+
+    readings = _readings(Reading)
+    await db[Reading].insert_many(readings)
+    order_by = [column("id").asc()]
+    rows = await db[Reading].select(*projections, order_by=order_by)
+    columns = await db[Reading].select(
+        *projections, order_by=order_by, result_format="columns"
+    )
+
+    assert columns.columns == ["id", "label", "score", "note", "tags"]
+    assert len(columns) == 10
+    assert columns.rows() == list(rows)
+    assert columns.column("id") == [reading.id for reading in readings]
+    assert columns.column("label") == [reading.label for reading in readings]
+    assert columns.column("score") == [reading.score for reading in readings]
+    assert columns.column("note") == [reading.note for reading in readings]
+    assert [json.loads(tags) for tags in columns.column("tags")] == [
+        reading.tags for reading in readings
+    ]
+    assert columns.column_type("id") == "int64"
+    assert columns.column_type("label") == "text"
+
+    filtered = await db[Reading].select(
+        column("id"), where=column("score").is_null(), result_format="columns"
+    )
+    assert sorted(filtered.column("id")) == [0, 3, 6, 9]
+
+
+async def test_select_columns_reads_uncommitted_rows_in_a_transaction(
+    tmp_path,
+) -> None:
+    db = Ormdantic(f"sqlite:///{tmp_path / 'select_columns_transaction.sqlite3'}")
+    Reading = _register_reading(db)
+    await db.init()
+
+    with pytest.raises(RuntimeError, match="roll back"):
+        async with db.transaction():
+            await db[Reading].insert_many(_readings(Reading))
+            inside = await db[Reading].select(column("id"), result_format="columns")
+            assert len(inside) == 10
+            raise RuntimeError("roll back")
+
+    after = await db[Reading].select(column("id"), result_format="columns")
+    assert after.rows() == []
+
+
+async def test_select_arrow_round_trips_rows(tmp_path) -> None:
+    db = Ormdantic(f"sqlite:///{tmp_path / 'select_arrow.sqlite3'}")
+    Reading = _register_reading(db)
+    await db.init()
+    projections = (column("id"), column("label"), column("score"), column("note"))
+
+    empty = await db[Reading].select_arrow(*projections)
+    assert empty.num_rows == 0
+
+    readings = _readings(Reading)
+    with pytest.raises(RuntimeError, match="roll back"):
+        async with db.transaction():
+            await db[Reading].insert_many(readings)
+            inside = await db[Reading].select_arrow(column("id"))
+            assert inside.num_rows == 10
+            raise RuntimeError("roll back")
+    assert (await db[Reading].select_arrow(column("id"))).num_rows == 0
+
+    await db[Reading].insert_many(readings)
+    result = await db[Reading].select_arrow(
+        *projections, order_by=[column("id").asc()], batch_size=4
+    )
+
+    assert result.columns == ["id", "label", "score", "note"]
+    assert result.num_rows == 10
+    assert result.num_batches == 3
+    pyarrow = pytest.importorskip("pyarrow")
+    table = pyarrow.table(result)
+    assert table.column("id").type == pyarrow.int64()
+    assert table.to_pydict() == {
+        "id": [reading.id for reading in readings],
+        "label": [reading.label for reading in readings],
+        "score": [reading.score for reading in readings],
+        "note": [reading.note for reading in readings],
+    }
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import asyncio
+from contextlib import aclosing
+
+import pytest
+from pydantic import BaseModel, Field
+
+from ormdantic import Order, Ormdantic
+
+
+async def _wait_for_idle_pool(db: Ormdantic) -> None:
+    # The producer thread returns the stream's connection once it notices.
+    for _ in range(500):
+        if db.runtime_diagnostics()["pool"]["in_use"] == 0:
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("the stream's connection was not returned to the pool")
+
+
+async def test_cancelled_stream_releases_its_connection(tmp_path) -> None:
+    db = Ormdantic(f"sqlite:///{tmp_path / 'stream_cancel.sqlite3'}")
+
+    @db.table("stream_items", pk="id")
+    class Item(BaseModel):
+        id: int
+        name: str
+
+    await db.init()
+    await db[Item].insert_many(
+        [Item(id=index, name=f"item-{index}") for index in range(50)]
+    )
+    first_batch = asyncio.Event()
+
+    async def consume() -> None:
+        async for _batch in db[Item].stream(chunk_size=5):
+            first_batch.set()
+            await asyncio.sleep(3600)
+
+    consumer = asyncio.create_task(consume())
+    await first_batch.wait()
+    consumer.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.wait_for(consumer, timeout=5)
+
+    await _wait_for_idle_pool(db)
+    assert await db[Item].count() == 50
+
+
+def _readings(count: int, reading: type[BaseModel]) -> list[BaseModel]:
+    return [
+        reading(
+            id=index,
+            label=f"reading-{index}",
+            score=None if index % 3 == 0 else index / 4,
+            active=index % 2 == 0,
+            note=None if index % 2 else f"note {index}",
+            tags=[f"tag-{index}", "shared"] if index % 4 else [],
+            meta={"index": index} if index % 5 else {},
+        )
+        for index in range(count)
+    ]
+
+
+async def test_stream_and_find_iter_round_trip_rows(tmp_path) -> None:
+    db = Ormdantic(f"sqlite:///{tmp_path / 'stream_round_trip.sqlite3'}")
+
+    @db.table("stream_readings", pk="id")
+    class Reading(BaseModel):
+        id: int
+        label: str
+        score: float | None = None
+        active: bool = True
+        note: str | None = None
+        tags: list[str] = Field(default_factory=list)
+        meta: dict[str, int] = Field(default_factory=dict)
+
+    await db.init()
+    assert [batch async for batch in db[Reading].stream()] == []
+    assert [reading async for reading in db[Reading].find_iter()] == []
+
+    readings = _readings(23, Reading)
+    await db[Reading].insert_many(readings)
+
+    batches = [
+        batch async for batch in db[Reading].stream(order_by=["id"], chunk_size=5)
+    ]
+    assert [len(batch) for batch in batches] == [5, 5, 5, 5, 3]
+    assert [reading for batch in batches for reading in batch] == readings
+
+    descending = [
+        reading
+        async for reading in db[Reading].find_iter(
+            {"active": True}, order_by=["id"], order=Order.desc, chunk_size=4
+        )
+    ]
+    assert descending == [reading for reading in reversed(readings) if reading.active]
+
+    async with aclosing(db[Reading].find_iter(order_by=["id"], chunk_size=2)) as rows:
+        async for reading in rows:
+            assert reading == readings[0]
+            break
+    assert await db[Reading].count() == 23
+
+
+async def test_stream_inside_a_transaction_reads_its_uncommitted_rows(
+    tmp_path,
+) -> None:
+    db = Ormdantic(f"sqlite:///{tmp_path / 'stream_transaction.sqlite3'}")
+
+    @db.table("stream_readings", pk="id")
+    class Reading(BaseModel):
+        id: int
+        label: str
+        score: float | None = None
+        active: bool = True
+        note: str | None = None
+        tags: list[str] = Field(default_factory=list)
+        meta: dict[str, int] = Field(default_factory=dict)
+
+    await db.init()
+    readings = _readings(7, Reading)
+
+    with pytest.raises(RuntimeError, match="roll back"):
+        async with db.transaction():
+            await db[Reading].insert_many(readings)
+            streamed = [
+                reading
+                async for reading in db[Reading].find_iter(
+                    order_by=["id"], chunk_size=3
+                )
+            ]
+            assert streamed == readings
+            raise RuntimeError("roll back")
+
+    assert [batch async for batch in db[Reading].stream()] == []
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import asyncio
+from time import perf_counter
+
 import pytest
 from pydantic import BaseModel
 
-from ormdantic import Ormdantic
+from ormdantic import DatabaseConnectionError, Ormdantic
 
 
 @pytest.mark.asyncio
@@ -44,3 +47,38 @@ async def test_transaction_rolls_back(tmp_path) -> None:
             raise RuntimeError("boom")
 
     assert (await db[Flavor].count()) == 0
+
+
+@pytest.mark.asyncio
+async def test_outside_query_does_not_stall_an_open_transaction(tmp_path) -> None:
+    db = Ormdantic(f"sqlite:///{tmp_path / 'tx_concurrent.sqlite3'}")
+
+    @db.table(pk="id")
+    class Flavor(BaseModel):
+        id: str
+        name: str
+
+    await db.init()
+    await db.drop_all()
+    await db.create_all()
+    await db[Flavor].insert(Flavor(id="1", name="mocha"))
+    opened = asyncio.Event()
+
+    async def read_outside_transaction() -> object:
+        await opened.wait()
+        return await db[Flavor].find_many()
+
+    # Created before the transaction, so the reader does not share its connection.
+    reader = asyncio.create_task(read_outside_transaction())
+    started = perf_counter()
+    async with db.transaction():
+        await db[Flavor].insert(Flavor(id="2", name="vanilla"))
+        opened.set()
+        # SQLite's single connection is pinned, so the reader fails at once.
+        with pytest.raises(DatabaseConnectionError, match="open transactions"):
+            await reader
+        assert (await db[Flavor].count()) == 2
+
+    assert perf_counter() - started < 5
+    flavors = (await db[Flavor].find_many()).data
+    assert sorted(flavor.id for flavor in flavors) == ["1", "2"]
@@ -34,7 +34,9 @@ def test_case_matrix_covers_required_workload_categories() -> None:
         "paginated find_many",
         "ordered find_many",
         "hydrate flat rows",
+        "hydrate flat rows, trusted",
         "serialize simple payloads",
+        "serialize rows to JSON",
         "serialize nested payloads",
         "one-to-many relationship loading",
         "many-to-one relationship loading",
@@ -79,5 +81,6 @@ def test_non_equivalent_serialization_cases_are_diagnostic() -> None:
     cases = {case.name: case for case in case_matrix()}
 
     assert cases["serialize simple payloads"].comparable is False
+    assert cases["serialize rows to JSON"].comparable is False
     assert cases["serialize nested payloads"].comparable is False
     assert cases["orm insert models"].comparable is True
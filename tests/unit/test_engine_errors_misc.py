@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import inspect
+from array import array
 from types import SimpleNamespace
 
 import pytest
@@ -9,7 +11,12 @@ import ormdantic.engine as engine_module
 import ormdantic.naming as naming_module
 from ormdantic import cli as root_cli
 from ormdantic.association import association_proxy, hybrid_property
-from ormdantic.engine import NativeEngine, NativeResult, runtime_capabilities
+from ormdantic.engine import (
+    ColumnarResult,
+    NativeEngine,
+    NativeResult,
+    runtime_capabilities,
+)
 from ormdantic.errors import (
     REDACTED_VALUE,
     ConfigurationError,
@@ -43,6 +50,15 @@ from ormdantic.loaders import (
 from ormdantic.naming import _split_words_on_regex, get_words, snake_case
 
 
+class FakeArrowTable:
+    num_rows = 3
+    num_batches = 2
+    column_names = ["id", "name"]
+
+    def __arrow_c_stream__(self, requested_schema: object = None) -> str:
+        return "arrow_array_stream"
+
+
 class FakeConnection:
     fail_on: str | None = None
     instances: list["FakeConnection"] = []
@@ -60,6 +76,14 @@ class FakeConnection:
             raise RuntimeError("unsupported filter compile failed")
         return {"columns": ["id", "name"], "rows": [(1, "dark")]}
 
+    def execute_arrow(
+        self, sql: str, values: list[object], batch_size: int | None = None
+    ) -> FakeArrowTable:
+        self.calls.append(("execute_arrow", sql, batch_size))
+        if self.fail_on == "execute":
+            raise RuntimeError("unsupported filter compile failed")
+        return FakeArrowTable()
+
     def begin(self) -> None:
         self.calls.append(("begin", None))
         if self.fail_on == "begin":
@@ -112,6 +136,54 @@ def test_runtime_capabilities_and_native_result(
     assert NativeResult(["id"], [()]).scalar() is None
 
 
+def test_columnar_result_decodes_packed_buffers() -> None:
+    def int64s(*values: int) -> bytes:
+        return array("q", values).tobytes()
+
+    result = ColumnarResult(
+        {
+            "layout": "columns",
+            "columns": ["id", "score", "name", "active", "price"],
+            "length": 3,
+            "data": [
+                {"type": "int64", "values": int64s(1, 2, 3), "validity": None},
+                {
+                    "type": "float64",
+                    "values": array("d", [1.5, 0.0, 2.5]).tobytes(),
+                    "validity": bytes([1, 0, 1]),
+                },
+                {
+                    "type": "text",
+                    "offsets": int64s(0, 4, 4, 10),
+                    "data": "darkcrème".encode(),
+                    "validity": bytes([1, 0, 1]),
+                },
+                {"type": "bool", "values": bytes([1, 0, 1]), "validity": None},
+                {"type": "object", "values": [None, "1.10", None], "validity": None},
+            ],
+            "rowcount": None,
+        }
+    )
+
+    assert len(result) == 3
+    assert result.column_type("name") == "text"
+    assert result.column("score") == [1.5, None, 2.5]
+    assert result.rows() == [
+        (1, 1.5, "dark", True, None),
+        (2, None, None, False, "1.10"),
+        (3, 2.5, "crème", True, None),
+    ]
+    assert result.buffers("id")["values"].tolist() == [1, 2, 3]
+    assert result.scalar() == 1
+    assert list(result.to_native_result()) == result.rows()
+    with pytest.raises(KeyError):
+        result.column("missing")
+
+    fallback = ColumnarResult.from_rows(["id"], [(1,), (2,)])
+    assert fallback.column_type("id") == "object"
+    assert fallback.column("id") == [1, 2]
+
+
 def test_native_engine_initialization_errors(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(engine_module, "_ormdantic", object())
     with pytest.raises(NativeExtensionError):
@@ -175,6 +247,41 @@ async def test_native_engine_wraps_execution_and_transaction_errors(
         assert exc_info.value.context["operation"] == operation
 
 
+@pytest.mark.asyncio
+async def test_native_engine_exports_arrow_batches(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    install_fake_native(monkeypatch)
+    engine = NativeEngine("sqlite:///db.sqlite3")
+
+    result = await engine.execute_arrow("SELECT id, name FROM t", (), batch_size=2)
+
+    assert ("execute_arrow", "SELECT id, name FROM t", 2) in FakeConnection.instances[
+        -1
+    ].calls
+    assert (result.num_rows, result.num_batches) == (3, 2)
+    assert result.columns == ["id", "name"]
+    assert result.__arrow_c_stream__() == "arrow_array_stream"
+    with pytest.raises(ValueError, match="batch_size"):
+        await engine.execute_arrow("SELECT 1", (), batch_size=0)
+
+    def missing(name: str) -> None:
+        raise ImportError(name)
+
+    monkeypatch.setattr(engine_module, "import_module", missing)
+    with pytest.raises(ConfigurationError, match="pip install pyarrow"):
+        result.to_arrow()
+    with pytest.raises(ConfigurationError, match="pip install polars"):
+        result.to_polars()
+    with pytest.raises(ConfigurationError):
+        NativeResult(["id"], [(1,)]).to_arrow()
+
+    FakeConnection.fail_on = "execute"
+    failing_engine = NativeEngine("sqlite:///db.sqlite3")
+    with pytest.raises(QueryCompilationError):
+        await failing_engine.execute_arrow("SELECT * FROM t", ())
+
+
 def test_error_context_redaction_and_classification() -> None:
     assert is_sensitive_parameter("api-key")
     assert not is_sensitive_parameter("flavor")
@@ -371,6 +478,28 @@ async def test_event_registry_clear_off_and_async_dispatch() -> None:
     registry.clear()
 
 
+@pytest.mark.asyncio
+async def test_event_registry_dispatch_runs_handlers_when_awaited() -> None:
+    registry = EventRegistry()
+    seen: list[str] = []
+
+    assert inspect.iscoroutinefunction(registry.dispatch)
+    await registry.dispatch("created", value=1)
+
+    async def async_handler(value: int) -> None:
+        seen.append(f"async {value}")
+
+    registry.on("created", lambda value: seen.append(f"sync {value}"))
+    registry.on("created", async_handler)
+    registry.on("created", lambda value: seen.append(f"after {value}"))
+    pending = registry.dispatch("created", value=2)
+    assert seen == []
+    await pending
+    assert seen == ["sync 2", "async 2", "after 2"]
+    assert registry.has_handlers("updated", "created")
+    assert not registry.has_handlers("updated", "deleted")
+
+
 def test_root_cli_main_maps_runtime_exceptions(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(root_cli, "app", lambda **_kwargs: 7)
     assert root_cli.main(["anything"]) == 7
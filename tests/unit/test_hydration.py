@@ -4,13 +4,17 @@ from dataclasses import dataclass
 from typing import Any, Iterator, Literal
 from uuid import UUID, uuid4
 
-import pytest
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_serializer
 
 from ormdantic.hydration import hydrate_flat_payload
 from ormdantic.loaders import LoaderOption
-from ormdantic.models import Map, OrmTable, Relationship
-from ormdantic.serializer import OrmSerializer, ResultSchema
+from ormdantic.models import LazyResult, Map, OrmTable, Relationship
+from ormdantic.serializer import (
+    OrmSerializer,
+    ResultSchema,
+    RowHydrator,
+    row_hydrator,
+)
 
 
 class HydratedFlavor(BaseModel):
@@ -30,6 +34,13 @@ class HydratedNote(BaseModel):
     children: list["HydratedNote"] = Field(default_factory=list)
 
 
+class TrustedFlavor(BaseModel):
+    id: UUID
+    name: str = Field(max_length=3)
+    active: bool
+    tags: list[str] = Field(default_factory=list)
+
+
 class LiteralHydratedNote(BaseModel):
     id: int
     kind: Literal["keep"]
@@ -202,7 +213,7 @@ def test_serializer_flat_path_deduplicates_and_literal_annotation_is_safe() -> N
     ).deserialize()
 
     assert [item.name for item in hydrated] == ["first"]
-    assert OrmSerializer._requires_preparation(LiteralHydratedNote, "kind") is False
+    assert "kind" not in RowHydrator(LiteralHydratedNote).flat_converters
     assert serializer_for_notes()._prep_flat_result({"id": 1}) == {"id": 1}
 
 
@@ -226,9 +237,8 @@ def test_serializer_schema_path_and_identity_edge_branches() -> None:
         "children": {"child": {}},
         "child": {},
     }
-    assert serializer._identity_for({"label": "missing id"}, table) is None
     assert (
-        serializer._path_pks(
+        serializer._graph_nodes(
             ResultSchema(
                 is_array=False,
                 references={"missing": ResultSchema(is_array=False)},
@@ -236,12 +246,6 @@ def test_serializer_schema_path_and_identity_edge_branches() -> None:
         )
         == []
     )
-    assert serializer._prep_result({"raw": "value"}, ResultSchema(is_array=False)) == {
-        "raw": "value"
-    }
-
-    with pytest.raises(ValueError, match="missing table metadata"):
-        serializer._build_model({"id": 1}, ResultSchema(is_array=False))
 
     fallback = serializer_for_notes(depth=-1)
     assert fallback._result_schema.references["hydrated_notes"].table_data is table or (
@@ -249,6 +253,55 @@ def test_serializer_schema_path_and_identity_edge_branches() -> None:
     )
 
 
+def test_joined_hydration_returns_shared_model_graphs() -> None:
+    table = note_table(
+        relationships={
+            "child": Relationship(foreign_table="hydrated_notes"),
+            "children": Relationship(
+                foreign_table="hydrated_notes",
+                back_references="parent",
+            ),
+        }
+    )
+    result = FakeResult(
+        [
+            "hydrated_notes\\id",
+            "hydrated_notes\\label",
+            "hydrated_notes/child\\id",
+            "hydrated_notes/child\\label",
+            "hydrated_notes/children\\id",
+            "hydrated_notes/children\\label",
+            "hydrated_notes/children\\tags",
+        ],
+        [
+            (1, "a", 7, "shared", 2, "x", '["t"]'),
+            (1, "a", 7, "shared", 3, "y", None),
+            (1, "a", 7, "shared", 2, "x", '["t"]'),
+            (4, "b", 7, "shared", None, None, None),
+            (5, "c", None, None, None, None, None),
+        ],
+    )
+
+    for validate in (True, False):
+        roots = OrmSerializer[list[HydratedNote]](
+            table_data=table,
+            table_map=Map(name_to_data={table.tablename: table}, model_to_data={}),
+            result_set=result,
+            is_array=True,
+            depth=1,
+            load_paths=("child", "children"),
+            validate=validate,
+        ).deserialize()
+
+        assert [root.id for root in roots] == [1, 4, 5]
+        assert roots[0].child is roots[1].child
+        assert roots[0].child.label == "shared"
+        assert [child.id for child in roots[0].children] == [2, 3]
+        assert [child.tags for child in roots[0].children] == [["t"], []]
+        assert roots[1].children == []
+        assert roots[2].child is None
+
+
 def test_serializer_loader_options_filter_order_and_nested_none() -> None:
     serializer = serializer_for_notes(
         load_options=(
@@ -298,12 +351,141 @@ def test_serializer_loader_options_filter_order_and_nested_none() -> None:
     )
 
 
-def test_serializer_sql_type_conversion_edges() -> None:
-    assert OrmSerializer._sql_type_to_py(HydratedNote, "meta", None) == {}
-    assert OrmSerializer._sql_type_to_py(HydratedNote, "meta", '{"a": 1}') == {"a": 1}
-    assert OrmSerializer._sql_type_to_py(HydratedNote, "tags", None) == []
-    assert OrmSerializer._sql_type_to_py(HydratedNote, "tags", '["x"]') == ["x"]
-    assert OrmSerializer._sql_type_to_py(HydratedNote, "maybe_count", "5") == 5
+def test_row_hydrator_column_conversion_edges() -> None:
+    notes = RowHydrator(HydratedNote)
+    assert notes.convert("meta", None) == {}
+    assert notes.convert("meta", '{"a": 1}') == {"a": 1}
+    assert notes.convert("tags", None) == []
+    assert notes.convert("tags", '["x"]') == ["x"]
+    assert notes.convert("maybe_count", "5") == 5
     marker = object()
-    assert OrmSerializer._sql_type_to_py(HydratedNote, "flexible", marker) is marker
-    assert OrmSerializer._sql_type_to_py(LiteralHydratedNote, "kind", "drop") == "drop"
+    assert notes.convert("flexible", marker) is marker
+    assert RowHydrator(LiteralHydratedNote).convert("kind", "drop") == "drop"
+
+
+def test_row_hydrator_is_compiled_once_per_table() -> None:
+    table = note_table()
+
+    hydrator = row_hydrator(table)
+
+    assert row_hydrator(table) is hydrator
+    assert set(hydrator.converters) == {
+        "meta",
+        "tags",
+        "maybe_count",
+        "child",
+        "children",
+    }
+    assert set(hydrator.flat_converters) == {"meta", "tags", "child", "children"}
+    assert hydrator.convert("meta", '{"a": 1}') == {"a": 1}
+    assert hydrator.convert("maybe_count", "5") == 5
+    assert hydrator.convert("label", None) is None
+    assert row_hydrator(flavor_table()).converters == {}
+
+
+def test_trusted_hydration_coerces_db_values_without_validating() -> None:
+    table = OrmTable[TrustedFlavor](
+        model=TrustedFlavor,
+        tablename="trusted_flavors",
+        pk="id",
+        indexed=[],
+        unique=[],
+        unique_constraints=[],
+        columns=["id", "name", "active"],
+        relationships={},
+        back_references={},
+    )
+    flavor_id = uuid4()
+    result = FakeResult(
+        [
+            "trusted_flavors\\id",
+            "trusted_flavors\\name",
+            "trusted_flavors\\active",
+        ],
+        [(str(flavor_id), "vanilla", 1)],
+    )
+
+    hydrated = OrmSerializer[list[TrustedFlavor]](
+        table_data=table,
+        table_map=Map(name_to_data={table.tablename: table}, model_to_data={}),
+        result_set=result,
+        is_array=True,
+        depth=0,
+        validate=False,
+    ).deserialize()
+
+    assert hydrated == [
+        TrustedFlavor.model_construct(id=flavor_id, name="vanilla", active=True)
+    ]
+    assert hydrated[0].model_fields_set == {"id", "name", "active"}
+    assert hydrated[0].tags == []
+    constructed = row_hydrator(table).construct({"id": str(flavor_id), "name": "x"})
+    assert constructed.id == flavor_id
+    assert constructed.tags == []
+    assert constructed.model_fields_set == {"id", "name"}
+
+
+def test_lazy_results_build_models_on_first_access() -> None:
+    table = flavor_table()
+    ids = [uuid4() for _ in range(3)]
+    result = FakeResult(
+        [
+            "hydrated_flavors\\id",
+            "hydrated_flavors\\name",
+            "hydrated_flavors\\strength",
+        ],
+        [
+            (ids[0], "mocha", 1),
+            (ids[1], "latte", 2),
+            (ids[0], "mocha", 1),
+            (ids[2], "flat white", 3),
+        ],
+    )
+    lazy = OrmSerializer[Any](
+        table_data=table,
+        table_map=Map(name_to_data={table.tablename: table}, model_to_data={}),
+        result_set=result,
+        is_array=True,
+        depth=0,
+    ).deserialize_lazy()
+    source = lazy._source
+
+    assert len(lazy) == 3
+    assert lazy.rows()[1] == (ids[1], "latte", 2)
+    tail = lazy[1:]
+    assert len(tail) == 2
+    assert source._built == [None, None, None]
+
+    assert tail[-1].name == "flat white"
+    assert tail[-1] is lazy[2]
+    assert source._built[:2] == [None, None]
+    assert [flavor.strength for flavor in lazy] == [1, 2, 3]
+    dumped = LazyResult.model_construct(offset=0, limit=0, data=lazy).model_dump()
+    assert dumped["data"][0] == {"id": ids[0], "name": "mocha", "strength": 1}
+
+
+def test_json_fields_describe_native_serialization_per_field() -> None:
+    fields = row_hydrator(note_table()).json_fields()
+
+    assert fields is not None
+    kinds = {key: (column, kind, default) for key, column, kind, default, _ in fields}
+    assert kinds["id"] == ("id", "value", "null")
+    assert kinds["label"] == ("label", "string", "null")
+    assert kinds["meta"] == ("meta", "raw", "{}")
+    assert kinds["tags"] == ("tags", "raw", "[]")
+    assert kinds["maybe_count"] == ("maybe_count", "value", "null")
+    assert kinds["children"] == ("children", "python", "[]")
+    encoder = next(spec[4] for spec in fields if spec[0] == "flexible")
+    assert encoder is not None
+    assert encoder({"a": 1}) == b'{"a":1}'
+
+
+def test_models_with_custom_serializers_have_no_json_fields() -> None:
+    class Stamped(BaseModel):
+        id: int
+
+        @field_serializer("id")
+        def _serialize_id(self, value: int) -> str:
+            return str(value)
+
+    assert RowHydrator(Stamped).json_fields() is None
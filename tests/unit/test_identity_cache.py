@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+from contextvars import ContextVar
+from typing import Any
+
+import pytest
+from pydantic import BaseModel
+
+import ormdantic.cache as cache_module
+from ormdantic import IdentityCache, Ormdantic
+from ormdantic.events import EventRegistry
+from ormdantic.models import Map, OrmTable
+from ormdantic.table import Table
+
+
+class Country(BaseModel):
+    code: str
+    name: str
+
+
+class City(BaseModel):
+    id: int
+    name: str
+
+
+def country_table() -> OrmTable[Country]:
+    return OrmTable[Country](
+        model=Country,
+        tablename="country",
+        pk="code",
+        indexed=[],
+        unique=[],
+        unique_constraints=[],
+        columns=["code", "name"],
+        relationships={},
+        back_references={},
+    )
+
+
+def test_identity_cache_returns_copies_and_evicts_least_recently_used() -> None:
+    cache = IdentityCache(2)
+    france = Country(code="fr", name="France")
+    cache.put(Country, "fr", france)
+    cache.put(Country, "de", Country(code="de", name="Germany"))
+
+    hit = cache.get(Country, "fr")
+    cache.put(Country, "it", Country(code="it", name="Italy"))
+
+    assert hit == france
+    assert hit is not france
+    assert cache.get(Country, "de") is None
+    assert cache.get(Country, "fr") is not cache.get(Country, "fr")
+    assert cache.statistics() == {
+        "size": 2,
+        "max_size": 2,
+        "hits": 3,
+        "misses": 1,
+        "evictions": 1,
+        "expirations": 0,
+        "invalidations": 0,
+    }
+
+
+def test_identity_cache_expires_rows_per_model_ttl(monkeypatch) -> None:
+    now = [100.0]
+    monkeypatch.setattr(cache_module, "monotonic", lambda: now[0])
+    cache = IdentityCache(ttl=10, ttls={City: 0})
+    cache.put(Country, "fr", Country(code="fr", name="France"))
+    cache.put(City, 1, City(id=1, name="Paris"))
+
+    assert not cache.caches(City)
+    assert cache.get(City, 1) is None
+    assert cache.get(Country, "fr") is not None
+    now[0] = 110.0
+    assert cache.get(Country, "fr") is None
+    assert cache.statistics()["expirations"] == 1
+    with pytest.raises(ValueError, match="max_size"):
+        IdentityCache(0)
+    with pytest.raises(ValueError, match="non-negative"):
+        IdentityCache(ttls={City: -1})
+
+
+def test_identity_cache_skips_rows_read_before_an_invalidation() -> None:
+    cache = IdentityCache()
+    generation = cache.generation(Country)
+    cache.invalidate(Country, "fr")
+    cache.put(Country, "fr", Country(code="fr", name="stale"), generation=generation)
+    assert cache.get(Country, "fr") is None
+
+    generation = cache.generation(Country)
+    cache.clear()
+    cache.put(Country, "fr", Country(code="fr", name="stale"), generation=generation)
+    assert cache.get(Country, "fr") is None
+
+    cache.put(Country, "fr", Country(code="fr", name="France"))
+    cache.put(City, 1, City(id=1, name="Paris"))
+    cache.invalidate_table(Country)
+    assert cache.get(Country, "fr") is None
+    assert cache.get(City, 1) is not None
+
+
+async def test_find_one_reads_through_the_identity_cache() -> None:
+    cache = IdentityCache()
+    calls: list[Any] = []
+
+    class CountryHandle:
+        def find_one(self, primary_key: Any, depth: int) -> Any:
+            calls.append(primary_key)
+            return {
+                "columns": ["country\\code", "country\\name"],
+                "rows": [[primary_key, "France"]],
+            }
+
+    table = Table(
+        table_data=country_table(),
+        table_map=Map(),
+        rust_handle=CountryHandle(),
+        events=EventRegistry(),
+        identity_cache=cache,
+    )
+
+    first = await table.find_one("fr")
+    second = await table.find_one("fr")
+
+    assert calls == ["fr"]
+    assert first == second == Country(code="fr", name="France")
+    assert first is not second
+    assert cache.statistics()["hits"] == 1
+
+
+async def test_database_writes_invalidate_cached_rows_through_events() -> None:
+    cache = IdentityCache()
+    db = Ormdantic("sqlite:///:memory:", identity_cache=cache)
+    table = country_table()
+    cache.put(Country, "fr", Country(code="fr", name="France"))
+    cache.put(Country, "de", Country(code="de", name="Germany"))
+
+    db.clear_events()
+    await db._events.dispatch(
+        "after_update", model=Country(code="fr", name="République"), table=table
+    )
+    assert cache.get(Country, "fr") is None
+    assert cache.get(Country, "de") is not None
+
+    await db._events.dispatch("after_delete", pk="de", table=table)
+    assert cache.get(Country, "de") is None
+
+    cache.put(Country, "it", Country(code="it", name="Italy"))
+    db._table_written("update", table)
+    assert cache.get(Country, "it") is not None
+    db._table_written("delete_where", table)
+    assert cache.get(Country, "it") is None
+    assert not db._events.has_handlers("before_execute", "after_execute")
+
+    assert db.runtime_diagnostics()["identity_cache"]["invalidations"] == 3
+
+
+async def test_find_one_bypasses_the_identity_cache_inside_transactions() -> None:
+    cache = IdentityCache()
+    transaction: ContextVar[int | None] = ContextVar("transaction", default=None)
+    calls: list[Any] = []
+
+    class CountryHandle:
+        def find_one(self, primary_key: Any, depth: int) -> Any:
+            calls.append(primary_key)
+            return {
+                "columns": ["country\\code", "country\\name"],
+                "rows": [[primary_key, "France"]],
+            }
+
+        def in_transaction(self, token: int) -> CountryHandle:
+            return self
+
+    table = Table(
+        table_data=country_table(),
+        table_map=Map(),
+        rust_handle=CountryHandle(),
+        events=EventRegistry(),
+        identity_cache=cache,
+        transaction=transaction,
+    )
+    cache.put(Country, "fr", Country(code="fr", name="stale"))
+
+    transaction.set(1)
+    assert await table.find_one("fr") == Country(code="fr", name="France")
+    assert await table.find_one("de") == Country(code="de", name="France")
+    assert calls == ["fr", "de"]
+    assert cache.get(Country, "de") is None
+
+    transaction.set(None)
+    assert await table.find_one("fr") == Country(code="fr", name="stale")
+    assert calls == ["fr", "de"]
+
+
+async def test_commit_invalidates_rows_written_by_the_transaction_again() -> None:
+    class Runtime:
+        def begin(self, options: Any = None) -> int:
+            return 1
+
+        def commit(self, token: int) -> None:
+            pass
+
+        def rollback(self, token: int) -> None:
+            pass
+
+    cache = IdentityCache()
+    db = Ormdantic("sqlite:///:memory:", identity_cache=cache, native_async=False)
+    db._runtime = Runtime()
+    table = country_table()
+
+    async with db.transaction():
+        await db._events.dispatch(
+            "after_update", model=Country(code="fr", name="République"), table=table
+        )
+        # Another task reads the committed row before the update commits.
+        cache.put(Country, "fr", Country(code="fr", name="France"))
+        assert cache.get(Country, "fr") is not None
+    assert cache.get(Country, "fr") is None
+
+    cache.put(Country, "fr", Country(code="fr", name="République"))
+    with pytest.raises(RuntimeError):
+        async with db.transaction():
+            await db._events.dispatch("after_delete", pk="de", table=table)
+            raise RuntimeError("abort")
+    async with db.transaction():
+        pass
+    assert cache.get(Country, "fr") is not None
+    assert db._pending_invalidations.get() is None
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
+from uuid import UUID, uuid4
 
 import pytest
 from pydantic import BaseModel
@@ -14,6 +16,7 @@ from ormdantic.errors import (
 )
 from ormdantic.events import EventRegistry
 from ormdantic.expressions import column, select_query, update_query
+from ormdantic.hydration import merge_selectin_payload
 from ormdantic.loaders import joinedload, noload, selectinload
 from ormdantic.models import Map, OrmTable, Relationship, TableColumn
 from ormdantic.table import DEFAULT_SELECTIN_BATCH_SIZE, Order, Table, _ResolvedLoadPlan
@@ -225,7 +228,7 @@ def test_selectin_and_relationship_helpers_normalize_values() -> None:
     assert table._foreign_key_value(None) is None
     assert table._foreign_key_value(first) is None
     assert table._foreign_key_value("fk-1") == "fk-1"
-    assert table._unique_values([1, "1", 2, None, 1]) == [1, 2]
+    assert table._unique_values([1, "1", 2, None, 1]) == [1, "1", 2]
     assert table._loaded_relationship_values(
         [
             BatchModel(id=10, kind="keep").model_copy(
@@ -235,15 +238,31 @@ def test_selectin_and_relationship_helpers_normalize_values() -> None:
         "children",
         related_table,
     ) == [first, second]
-    assert table._filter_and_order_relationship([first, duplicate, second], option) == [
-        second,
-        first,
-    ]
-    assert table._filter_and_order_relationship(first, option) == first
-    assert table._filter_and_order_relationship(duplicate, option) is None
-    assert table._filter_and_order_relationship(None, option) is None
-    assert table._matches_loader_filter(first, option)
-    assert not table._matches_loader_filter(duplicate, option)
+    assert merge_selectin_payload(
+        parent_keys=[1, "1", None, 1],
+        children=[first, duplicate, second],
+        child_key="id",
+        uselist=True,
+        table_map=table._table_map,
+        filter_by=option.filter_by,
+        order_by=option.order_by,
+    ) == ([[0], [], [], [0]], [0])
+    assert merge_selectin_payload(
+        parent_keys=[2, 1, 3],
+        children=[first, duplicate, second],
+        child_key="id",
+        uselist=False,
+        table_map=table._table_map,
+        filter_by={"kind": "keep"},
+    ) == ([2, 0, None], [2, 0])
+    assert merge_selectin_payload(
+        parent_keys=["keep"],
+        children=[BatchModel(id=3), second, BatchModel(id=4)],
+        child_key="kind",
+        uselist=True,
+        table_map=table._table_map,
+        order_by=["-id"],
+    ) == ([[2, 0, 1]], [2, 0, 1])
 
 
 def test_joined_loader_query_parts_keep_loader_parameters_ordered() -> None:
@@ -549,6 +568,73 @@ async def test_selectin_relationship_assigns_empty_collections_and_scalars() ->
     assert scalar_parent.child_id is None
 
 
+class UuidParent(BaseModel):
+    id: UUID
+    children: list[Any] = []
+
+
+class UuidChild(BaseModel):
+    id: int
+    parent: UuidParent | str | None = None
+
+
+async def test_selectin_relationship_matches_uuid_keys_to_text_foreign_keys() -> None:
+    parent_data = OrmTable[UuidParent](
+        model=UuidParent,
+        tablename="uuid_parent",
+        pk="id",
+        indexed=[],
+        unique=[],
+        unique_constraints=[],
+        columns=["id"],
+        relationships={},
+        back_references={},
+    )
+    child_data = OrmTable[UuidChild](
+        model=UuidChild,
+        tablename="uuid_child",
+        pk="id",
+        indexed=[],
+        unique=[],
+        unique_constraints=[],
+        columns=["id", "parent"],
+        relationships={},
+        back_references={},
+    )
+    table_map = Map(
+        name_to_data={"uuid_parent": parent_data, "uuid_child": child_data},
+        model_to_data={},
+    )
+    table_map.model_to_data = {UuidParent: parent_data, UuidChild: child_data}
+    table = table_for_bind_limit(None, table_map=table_map)
+    first, second = UuidParent(id=uuid4()), UuidParent(id=uuid4())
+    children = [
+        UuidChild(id=1, parent=str(first.id)),
+        UuidChild(id=2, parent=str(second.id)),
+        UuidChild(id=3, parent=str(first.id)),
+    ]
+    pages = {"uuid_child": children, "uuid_parent": [second, first]}
+
+    async def fake_page(handle: Any, where: dict[str, Any], *_: Any) -> list[BaseModel]:
+        return list(pages[handle.tablename])
+
+    table._related_table = lambda data: data  # type: ignore[method-assign,assignment,return-value]
+    table._selectin_page = fake_page  # type: ignore[method-assign,assignment]
+
+    collected = await table._selectin_load_relationship(
+        [first, second], parent_data, "children", "parent", child_data, None, {}
+    )
+    scalars = await table._selectin_load_relationship(
+        children, child_data, "parent", None, parent_data, None, {}
+    )
+
+    assert [child.id for child in first.children] == [1, 3]
+    assert [child.id for child in second.children] == [2]
+    assert len(collected) == 3
+    assert [child.parent for child in children] == [first, second, first]
+    assert scalars == [first, second]
+
+
 async def test_load_selectin_tree_wraps_relationship_errors() -> None:
     leaf_table = OrmTable[BatchModel](
         model=BatchModel,
@@ -609,6 +695,77 @@ async def test_load_selectin_tree_wraps_relationship_errors() -> None:
     assert exc.value.context["relationship"] == "children"
 
 
+@pytest.mark.parametrize(("concurrency", "peak"), [(16, 9), (2, 2)])
+async def test_selectin_tree_loads_batches_and_siblings_concurrently(
+    concurrency: int, peak: int
+) -> None:
+    related_table = OrmTable[BatchModel](
+        model=BatchModel,
+        tablename="related",
+        pk="id",
+        indexed=[],
+        unique=[],
+        unique_constraints=[],
+        columns=["id", "kind"],
+        relationships={},
+        back_references={},
+    )
+    root_table = OrmTable[BatchModel](
+        model=BatchModel,
+        tablename="batch_model",
+        pk="id",
+        indexed=[],
+        unique=[],
+        unique_constraints=[],
+        columns=["id", "kind"],
+        relationships={
+            name: Relationship(foreign_table="related") for name in ("b", "c", "d")
+        },
+        back_references={},
+    )
+    table = Table(
+        table_data=root_table,
+        table_map=Map(name_to_data={"related": related_table}),
+        rust_handle=BindLimitHandle(None),
+        events=EventRegistry(),
+        selectin_concurrency=concurrency,
+    )
+    in_flight = 0
+    seen_peak = 0
+
+    class RelatedHandle:
+        async def find_many(self, *, where: dict[str, Any]) -> Any:
+            nonlocal in_flight, seen_peak
+            in_flight += 1
+            seen_peak = max(seen_peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            rows = [BatchModel(id=value) for value in where["id__in"]]
+            return type("Result", (), {"data": rows})()
+
+    table._related_table = lambda _: RelatedHandle()  # type: ignore[method-assign]
+    parents = []
+    for index in range(3):
+        parent = BatchModel(id=index)
+        for name in ("b", "c", "d"):
+            object.__setattr__(parent, name, index + 10)
+        parents.append(parent)
+
+    await table._load_selectin_tree(
+        parents,
+        root_table,
+        {"b": {}, "c": {}, "d": {}},
+        (),
+        {},
+        {name: selectinload(name).batched(1) for name in ("b", "c", "d")},
+        set(),
+    )
+
+    assert seen_peak == peak
+    assert [parent.b.id for parent in parents] == [10, 11, 12]
+    assert parents[0].c is parents[0].d
+
+
 def test_payload_skips_generated_defaults_and_identity_columns() -> None:
     table_data = OrmTable[PayloadModel](
         model=PayloadModel,
@@ -922,3 +1079,25 @@ def test_loader_plan_validation_covers_disabled_paths_and_bad_columns() -> None:
         table_map=Map(name_to_data={"batch_model": cyclic_table}),
     )
     assert cyclic._expand_depth_paths(3) == {"parent"}
+
+
+async def test_find_one_coalesces_concurrent_lookups_into_batched_queries() -> None:
+    table = table_for_bind_limit(2)
+    table._find_one_batch_window = 0
+    queries: list[list[Any]] = []
+
+    async def find_many(*, where: dict[str, Any]) -> Any:
+        queries.append(where["id__in"])
+        await asyncio.sleep(0)
+        rows = [BatchModel(id=value) for value in where["id__in"] if value != 4]
+        return type("Result", (), {"data": rows})()
+
+    table.find_many = find_many  # type: ignore[method-assign]
+
+    found = await asyncio.gather(*(table.find_one(pk) for pk in (1, 2, 1, 3, 4)))
+
+    assert queries == [[1, 2], [3, 4]]
+    assert [model.id if model else None for model in found] == [1, 2, 1, 3, None]
+    assert found[0] == found[2]
+    assert found[0] is not found[2]
+    assert table._find_one_futures == {}
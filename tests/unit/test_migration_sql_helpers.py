@@ -100,6 +100,38 @@ def test_query_helpers_normalize_result_shapes() -> None:
     )
 
 
+def test_catalog_queries_share_one_connection_and_record_timings() -> None:
+    opened: list[str] = []
+
+    class FakeNativeConnection:
+        def __init__(self, url: str) -> None:
+            opened.append(url)
+
+        def execute(self, sql_text: str, params: list[object]) -> dict[str, object]:
+            return {"rows": [(sql_text,)]}
+
+    def execute_native(*_args: object) -> dict[str, object]:
+        raise AssertionError("catalog queries should reuse the shared connection")
+
+    rust_module = SimpleNamespace(
+        PyNativeConnection=FakeNativeConnection, execute_native=execute_native
+    )
+    url = "postgresql://localhost/db"
+
+    with sql.record_catalog_timings() as timings:
+        with sql.shared_catalog_connection(url):
+            assert sql.query_rows_url(rust_module, url, "SELECT 1") == [["SELECT 1"]]
+            with sql.shared_catalog_connection(url):
+                assert sql.query_rows_url(rust_module, url, "SELECT 2") == [
+                    ["SELECT 2"]
+                ]
+
+    assert opened == [url]
+    assert [timing["sql"] for timing in timings] == ["SELECT 1", "SELECT 2"]
+    assert all(timing["row_count"] == 1 for timing in timings)
+    assert all(timing["duration_ms"] >= 0 for timing in timings)
+
+
 def test_toml_document_helpers_cover_scalars_nested_values_and_errors() -> None:
     payload = {
         "plain": "dark",
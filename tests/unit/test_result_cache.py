@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+from contextvars import ContextVar
+from typing import Any
+
+import pytest
+from pydantic import BaseModel
+
+import ormdantic.cache as cache_module
+from ormdantic import (
+    CachePolicy,
+    FileInvalidationBroadcaster,
+    Ormdantic,
+    ResultCache,
+)
+from ormdantic.events import EventRegistry
+from ormdantic.expressions import column, select_query
+from ormdantic.models import Map, OrmTable
+from ormdantic.table import Table
+
+
+class Flavor(BaseModel):
+    id: int
+    kind: str
+
+
+class FlavorHandle:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, Any]] = []
+
+    def select_expression(self, payload: dict[str, Any]) -> dict[str, Any]:
+        self.calls.append(("select_expression", payload))
+        return {"columns": ["id"], "rows": [[1], [2]], "rowcount": None}
+
+    def count(self, filters: Any, values: dict[str, Any]) -> dict[str, Any]:
+        self.calls.append(("count", dict(values)))
+        return {"columns": ["count"], "rows": [[2]], "rowcount": None}
+
+    def delete(self, primary_key: Any) -> dict[str, Any]:
+        self.calls.append(("delete", primary_key))
+        return {"columns": [], "rows": [], "rowcount": 1}
+
+    def in_transaction(self, token: int) -> FlavorHandle:
+        return self
+
+
+def flavor_table(
+    cache: ResultCache | None,
+    *,
+    written: Any = None,
+    transaction: ContextVar[int | None] | None = None,
+) -> tuple[Table[Flavor], FlavorHandle]:
+    handle = FlavorHandle()
+    table_data = OrmTable[Flavor](
+        model=Flavor,
+        tablename="flavor",
+        pk="id",
+        indexed=[],
+        unique=[],
+        unique_constraints=[],
+        columns=["id", "kind"],
+        relationships={},
+        back_references={},
+    )
+    return Table(
+        table_data=table_data,
+        table_map=Map(),
+        rust_handle=handle,
+        events=EventRegistry(),
+        result_cache=cache,
+        transaction=transaction,
+        written=written,
+    ), handle
+
+
+def test_result_cache_keys_by_typed_binds_and_evicts_by_byte_budget() -> None:
+    assert ResultCache.key("sql", {"a": 1}) != ResultCache.key("sql", {"a": True})
+    assert ResultCache.key("sql", {"a": 1, "b": [2]}) == ResultCache.key(
+        "sql", {"b": [2], "a": 1}
+    )
+
+    rows = {"columns": ["id"], "rows": [[index] for index in range(10)]}
+    size = cache_module._estimate_size(rows)
+    cache = ResultCache(size * 2 + 1)
+    cache.put("first", rows, tables={"flavor"})
+    cache.put("second", {**rows}, tables={"flavor"})
+    assert cache.get("first") is rows
+    cache.put("third", {**rows}, tables={"topping"})
+    cache.put("huge", {"rows": list(range(size))}, tables={"flavor"})
+
+    assert cache.get("second") is None
+    assert cache.get("huge") is None
+    assert cache.statistics() == {
+        "size": 2,
+        "bytes": cache.statistics()["bytes"],
+        "max_bytes": size * 2 + 1,
+        "hits": 1,
+        "misses": 2,
+        "evictions": 1,
+        "expirations": 0,
+        "invalidations": 0,
+    }
+    with pytest.raises(ValueError, match="max_bytes"):
+        ResultCache(0)
+    with pytest.raises(ValueError, match="non-negative"):
+        CachePolicy(ttl=-1)
+
+
+def test_result_cache_invalidates_tables_and_skips_stale_results(monkeypatch) -> None:
+    now = [100.0]
+    monkeypatch.setattr(cache_module, "monotonic", lambda: now[0])
+    cache = ResultCache()
+    cache.put("joined", [1], tables={"flavor", "topping"})
+    cache.put("flat", [2], tables={"flavor"})
+    cache.put("expiring", [3], tables={"cone"}, ttl=5)
+
+    cache.invalidate_tables({"topping"})
+    assert cache.get("joined") is None
+    assert cache.get("flat") == [2]
+    now[0] = 105.0
+    assert cache.get("expiring") is None
+
+    generation = cache.generation({"flavor"})
+    cache.invalidate_tables({"flavor"})
+    cache.put("flat", [2], tables={"flavor"}, generation=generation)
+    assert cache.get("flat") is None
+    assert cache.statistics()["expirations"] == 1
+    assert cache.statistics()["invalidations"] == 2
+
+
+def test_file_broadcaster_shares_invalidations_between_caches(tmp_path) -> None:
+    path = tmp_path / "invalidations"
+    first = ResultCache(broadcaster=FileInvalidationBroadcaster(path))
+    second = ResultCache(broadcaster=FileInvalidationBroadcaster(path))
+    first.put("flavors", [1], tables={"flavor"})
+    second.put("flavors", [1], tables={"flavor"})
+    second.put("toppings", [2], tables={"topping"})
+
+    first.invalidate_tables({"flavor"})
+
+    assert first.get("flavors") is None
+    assert second.get("flavors") is None
+    assert second.get("toppings") == [2]
+    assert FileInvalidationBroadcaster(path).poll() == []
+    path.write_text("")
+    assert first.broadcaster is not None
+    assert first.broadcaster.poll() == []
+
+
+async def test_select_and_count_read_through_the_result_cache() -> None:
+    cache = ResultCache()
+    table, handle = flavor_table(cache)
+    policy = CachePolicy(ttl=60)
+    toppings = select_query("topping", column("flavor_id"))
+
+    first = await table.select(
+        column("id"), where=column("id").in_query(toppings), cache=policy
+    )
+    second = await table.select(
+        column("id"), where=column("id").in_query(toppings), cache=policy
+    )
+    await table.select(column("id"), where=column("kind") == "vanilla", cache=policy)
+    await table.count(cache=policy)
+    await table.count(cache=policy)
+
+    assert list(first) == list(second) == [(1,), (2,)]
+    assert [call[0] for call in handle.calls] == [
+        "select_expression",
+        "select_expression",
+        "count",
+    ]
+
+    cache.invalidate_tables({"topping"})
+    await table.select(
+        column("id"), where=column("id").in_query(toppings), cache=policy
+    )
+    await table.count(cache=policy)
+    assert len(handle.calls) == 4
+
+    uncached, _ = flavor_table(None)
+    with pytest.raises(ValueError, match="result_cache"):
+        await uncached.select(column("id"), cache=policy)
+    await uncached.count(cache=CachePolicy(ttl=0))
+
+
+async def test_database_writes_invalidate_cached_results_through_a_write_hook() -> None:
+    cache = ResultCache()
+    db = Ormdantic("sqlite:///:memory:", result_cache=cache)
+    table, handle = flavor_table(cache, written=db._table_written)
+    policy = CachePolicy(ttl=60)
+    cache.put("toppings", [2], tables={"topping"})
+
+    db.clear_events()
+    await table.count(cache=policy)
+    await table.count(cache=policy)
+    assert await table.delete(1)
+    await table.count(cache=policy)
+
+    assert [call[0] for call in handle.calls] == ["count", "delete", "count"]
+    assert cache.get("toppings") == [2]
+    assert not db._events.has_handlers("before_execute", "after_execute")
+    assert db.runtime_diagnostics()["result_cache"]["invalidations"] == 1
+
+
+async def test_transactions_bypass_the_result_cache_and_invalidate_at_commit() -> None:
+    class Runtime:
+        def begin(self, options: Any = None) -> int:
+            return 1
+
+        def commit(self, token: int) -> None:
+            pass
+
+    cache = ResultCache()
+    db = Ormdantic("sqlite:///:memory:", result_cache=cache, native_async=False)
+    db._runtime = Runtime()
+    table, handle = flavor_table(
+        cache, written=db._table_written, transaction=db._transaction
+    )
+    policy = CachePolicy(ttl=60)
+
+    async with db.transaction():
+        await table.count(cache=policy)
+        await table.count(cache=policy)
+        assert await table.delete(1)
+        # Another task caches the committed count before the delete commits.
+        token = db._transaction.set(None)
+        await table.count(cache=policy)
+        db._transaction.reset(token)
+        assert cache.statistics()["size"] == 1
+
+    assert cache.statistics()["size"] == 0
+    assert [call[0] for call in handle.calls] == [
+        "count",
+        "count",
+        "delete",
+        "count",
+    ]
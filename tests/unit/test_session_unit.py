@@ -5,6 +5,7 @@ from pydantic import BaseModel, Field
 
 from ormdantic.models import Map, OrmTable, Relationship
 from ormdantic.session import Session, _SessionSavepoint
+from ormdantic.tracking import install_change_tracking, is_change_tracked
 
 
 class Flavor(BaseModel):
@@ -64,6 +65,16 @@ class FakeTable:
         self.deleted.append(pk)
         self.stored.pop(pk, None)
 
+    async def update_many(
+        self, models: list[Flavor], *, columns: frozenset[str] | None = None
+    ) -> list[Flavor]:
+        return [await self.update(model) for model in models]
+
+    async def delete_many(self, pks: list[str]) -> int:
+        for pk in pks:
+            await self.delete(pk)
+        return len(pks)
+
 
 class FakeDatabase:
     def __init__(self, *, fail_commit: bool = False) -> None:
@@ -121,6 +132,7 @@ class MultiFakeTable:
         self.inserted: list[BaseModel] = []
         self.insert_many_calls: list[list[BaseModel]] = []
         self.updated: list[BaseModel] = []
+        self.update_many_calls: list[tuple[list[BaseModel], frozenset[str] | None]] = []
         self.deleted: list[object] = []
 
     async def find_one(self, pk: object, *, depth: int = 0) -> BaseModel | None:
@@ -148,6 +160,17 @@ class MultiFakeTable:
         self.deleted.append(pk)
         self.stored.pop(pk, None)
 
+    async def update_many(
+        self, models: list[BaseModel], *, columns: frozenset[str] | None = None
+    ) -> list[BaseModel]:
+        self.update_many_calls.append((list(models), columns))
+        return [await self.update(model) for model in models]
+
+    async def delete_many(self, pks: list[object]) -> int:
+        for pk in pks:
+            await self.delete(pk)
+        return len(pks)
+
 
 class RelationshipDatabase:
     def __init__(self) -> None:
@@ -365,3 +388,88 @@ async def test_session_detects_relationship_changes_identity_conflicts_and_cycle
     node_a.peer = node_b
     node_b.peer = node_a
     assert session._dependency_ordered([node_a, node_b]) == [node_b, node_a]
+
+
+class TrackedRecipe(BaseModel):
+    id: str
+    name: str
+    tags: list[str] | None = None
+
+
+install_change_tracking(TrackedRecipe, ["id", "name", "tags"])
+
+
+class TrackedDatabase(RelationshipDatabase):
+    def __init__(self) -> None:
+        super().__init__()
+        table = OrmTable[TrackedRecipe](
+            model=TrackedRecipe,
+            tablename="recipes",
+            pk="id",
+            columns=["id", "name", "tags"],
+            indexed=[],
+            unique=[],
+            unique_constraints=[],
+            relationships={},
+            back_references={},
+        )
+        self._table_map.name_to_data["recipes"] = table
+        self._table_map.model_to_data[TrackedRecipe] = table
+        self.tables[TrackedRecipe] = MultiFakeTable()
+
+
+async def test_session_flush_compares_only_assigned_and_mutable_models() -> None:
+    database = TrackedDatabase()
+    session = Session(database)
+    renamed, reverted, retagged, untouched = (
+        TrackedRecipe(id="1", name="mocha"),
+        TrackedRecipe(id="2", name="latte"),
+        TrackedRecipe(id="3", name="cortado", tags=["hot"]),
+        TrackedRecipe(id="4", name="flat white"),
+    )
+    for model in (renamed, reverted, retagged, untouched):
+        session._remember(model)
+
+    assert is_change_tracked(TrackedRecipe)
+    assert not is_change_tracked(Flavor)
+    assert session._snapshots == {(TrackedRecipe, "3"): {"tags": ["hot"]}}
+
+    renamed.name = "vanilla"
+    reverted.name = "espresso"
+    reverted.name = "latte"
+    assert retagged.tags is not None
+    retagged.tags.append("iced")
+    assert session._changes == {
+        (TrackedRecipe, "1"): {"name": "mocha"},
+        (TrackedRecipe, "2"): {"name": "latte"},
+    }
+
+    await session.flush()
+
+    assert database.tables[TrackedRecipe].update_many_calls == [
+        ([renamed], {"name"}),
+        ([retagged], {"tags"}),
+    ]
+    assert session._changes == {}
+    assert session._snapshots[(TrackedRecipe, "3")] == {"tags": ["hot", "iced"]}
+
+    session.expire(renamed)
+    renamed.name = "detached"
+    assert session._changes == {}
+
+
+async def test_sessions_sharing_a_tracked_model_both_record_assignments() -> None:
+    database = TrackedDatabase()
+    first, second = Session(database), Session(database)
+    recipe = TrackedRecipe(id="1", name="mocha")
+    first._remember(recipe)
+    second._remember(recipe)
+
+    recipe.name = "vanilla"
+    await second.rollback()
+    recipe.name = "hazelnut"
+
+    assert first._changes == {(TrackedRecipe, "1"): {"name": "mocha"}}
+    assert second._changes == {}
+    await first.flush()
+    assert database.tables[TrackedRecipe].update_many_calls == [([recipe], {"name"})]
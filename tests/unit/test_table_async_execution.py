@@ -3,50 +3,64 @@ from __future__ import annotations
 import asyncio
 import threading
 import time
+from contextvars import ContextVar
 from typing import Any
 
+import pytest
 from pydantic import BaseModel
 
 from ormdantic.engine import NativeEngine
 from ormdantic.events import EventRegistry
-from ormdantic.models import Map, OrmTable
+from ormdantic.models import Map, OrmTable, Result
 from ormdantic.table import Table
+from ormdantic.types import ModelType
 
 
 class Item(BaseModel):
     id: str
 
 
-class SlowHandle:
-    execution_thread_id: int | None = None
-
-    def count(self, filters: object, values: object) -> dict[str, object]:
-        self.execution_thread_id = threading.get_ident()
-        time.sleep(0.05)
-        return {"columns": ["count"], "rows": [[1]], "rowcount": None}
-
-
-async def test_table_native_call_does_not_block_event_loop() -> None:
-    table_data = OrmTable[Item](
-        model=Item,
-        tablename="items",
+def _table(
+    model: type[ModelType],
+    columns: list[str],
+    handle: object,
+    events: EventRegistry | None = None,
+    **options: Any,
+) -> Table[ModelType]:
+    table_data = OrmTable[model](  # type: ignore[valid-type]
+        model=model,
+        tablename=f"{model.__name__.lower()}s",
         pk="id",
-        columns=["id"],
+        columns=columns,
         indexed=[],
         unique=[],
         unique_constraints=[],
         relationships={},
         back_references={},
     )
-    table_map = Map(name_to_data={"items": table_data}, model_to_data={})
-    table_map.model_to_data = {Item: table_data}
-    handle = SlowHandle()
-    table = Table[Item](
+    table_map = Map(name_to_data={table_data.tablename: table_data}, model_to_data={})
+    table_map.model_to_data = {model: table_data}
+    return Table[model](  # type: ignore[valid-type]
         table_data=table_data,
         table_map=table_map,
         rust_handle=handle,
-        events=EventRegistry(),
+        events=events if events is not None else EventRegistry(),
+        **options,
     )
+
+
+class SlowHandle:
+    execution_thread_id: int | None = None
+
+    def count(self, filters: object, values: object) -> dict[str, object]:
+        self.execution_thread_id = threading.get_ident()
+        time.sleep(0.05)
+        return {"columns": ["count"], "rows": [[1]], "rowcount": None}
+
+
+async def test_table_native_call_does_not_block_event_loop() -> None:
+    handle = SlowHandle()
+    table = _table(Item, ["id"], handle)
     event_loop_thread_id = threading.get_ident()
 
     count = await table.count()
@@ -56,6 +70,258 @@ async def test_table_native_call_does_not_block_event_loop() -> None:
     assert count == 1
 
 
+class AwaitableHandle:
+    awaitable = True
+
+    def __init__(self) -> None:
+        self.bind_thread_id: int | None = None
+
+    def count(self, filters: object, values: object) -> asyncio.Future[object]:
+        self.bind_thread_id = threading.get_ident()
+        future = asyncio.get_running_loop().create_future()
+        future.set_result({"columns": ["count"], "rows": [[3]], "rowcount": None})
+        return future
+
+
+async def test_table_awaits_native_futures_without_worker_thread_hop() -> None:
+    handle = AwaitableHandle()
+    table = _table(Item, ["id"], handle)
+
+    count = await table.count()
+
+    assert handle.bind_thread_id == threading.get_ident()
+    assert count == 3
+
+
+class ChunkedRows:
+    def __init__(self, chunks: list[list[list[object]]]) -> None:
+        self.chunks = chunks
+        self.closed = False
+
+    def next_chunk(self) -> dict[str, object] | None:
+        if not self.chunks:
+            return None
+        return {"columns": ["items\\id"], "rows": self.chunks.pop(0), "rowcount": None}
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class StreamingHandle:
+    def __init__(self, rows: ChunkedRows) -> None:
+        self.rows = rows
+        self.chunk_size: int | None = None
+
+    def stream(
+        self,
+        filters: object,
+        values: object,
+        order_by: list[str],
+        order_direction: str,
+        chunk_size: int,
+    ) -> ChunkedRows:
+        self.chunk_size = chunk_size
+        return self.rows
+
+
+async def test_table_stream_yields_bounded_batches_and_closes_rows() -> None:
+    rows = ChunkedRows([[["a"], ["b"]], [["c"]]])
+    handle = StreamingHandle(rows)
+    table = _table(Item, ["id"], handle)
+
+    batches = [
+        [item.id for item in batch] async for batch in table.stream(chunk_size=2)
+    ]
+
+    assert batches == [["a", "b"], ["c"]]
+    assert handle.chunk_size == 2
+    assert rows.closed
+
+
+async def test_table_find_iter_stops_reading_when_consumer_breaks() -> None:
+    rows = ChunkedRows([[["a"], ["b"]], [["c"]]])
+    table = _table(Item, ["id"], StreamingHandle(rows))
+
+    seen = []
+    iterator = table.find_iter(chunk_size=2)
+    async for item in iterator:
+        seen.append(item.id)
+        break
+    await iterator.aclose()
+
+    assert seen == ["a"]
+    assert rows.chunks == [[["c"]]]
+    assert rows.closed
+
+
+class JsonHandle:
+    def __init__(self) -> None:
+        self.fields: list[tuple[object, ...]] = []
+
+    def find_many_json(
+        self,
+        filters: object,
+        values: object,
+        order_by: list[str],
+        order_direction: str,
+        fields: list[tuple[object, ...]],
+        limit: int | None,
+        offset: int | None,
+    ) -> bytes:
+        self.fields = fields
+        return b'[{"id":"a"},{"id":"b"}]'
+
+
+async def test_table_find_many_json_wraps_native_rows_like_a_result() -> None:
+    handle = JsonHandle()
+    table = _table(Item, ["id"], handle)
+
+    payload = await table.find_many_json(limit=2)
+
+    expected = Result(offset=0, limit=2, data=[Item(id="a"), Item(id="b")])
+    assert payload == expected.to_json_bytes()
+    assert handle.fields == [("id", "id", "string", "null", None)]
+
+
+class CopyHandle:
+    def __init__(self) -> None:
+        self.calls: list[tuple[list[str], list[list[object]]]] = []
+
+    def copy_rows(self, columns: list[str], rows: list[list[object]]) -> int:
+        self.calls.append((columns, rows))
+        return len(rows)
+
+
+async def test_table_copy_from_batches_models_and_rows_by_shape() -> None:
+    handle = CopyHandle()
+    events = EventRegistry()
+    inserted_events: list[str] = []
+    events.on("after_insert", lambda model, table: inserted_events.append(model.id))
+    table = _table(Item, ["id"], handle, events)
+
+    inserted = await table.copy_from(
+        [Item(id="a"), {"id": "b"}, Item(id="c")], batch_size=2
+    )
+    models = await table.insert_many([Item(id="d")], method="copy")
+
+    assert inserted == 3
+    assert [model.id for model in models] == ["d"]
+    assert handle.calls == [
+        (["id"], [["a"], ["b"]]),
+        (["id"], [["c"]]),
+        (["id"], [["d"]]),
+    ]
+    assert inserted_events == ["a", "c", "d"]
+    with pytest.raises(ValueError, match="'name' is not a column on Item"):
+        await table.copy_from([{"name": "x"}])
+
+
+class Flavor(BaseModel):
+    id: str
+    name: str
+
+
+class BatchWriteHandle:
+    def __init__(self) -> None:
+        self.updates: list[tuple[list[dict[str, object]], int | None]] = []
+        self.deletes: list[tuple[list[object], int | None]] = []
+
+    def update(self, payload: dict[str, object]) -> dict[str, object]:
+        self.updates.append(([payload], None))
+        return {"columns": [], "rows": [], "rowcount": 1}
+
+    def update_many(
+        self, payloads: list[dict[str, object]], batch_size: int | None
+    ) -> dict[str, object]:
+        self.updates.append((payloads, batch_size))
+        return {"columns": [], "rows": [], "rowcount": len(payloads)}
+
+    def delete_many(
+        self, primary_keys: list[object], batch_size: int | None
+    ) -> dict[str, object]:
+        self.deletes.append((primary_keys, batch_size))
+        return {"columns": [], "rows": [], "rowcount": len(primary_keys)}
+
+
+async def test_table_update_and_delete_many_send_one_native_call_per_shape() -> None:
+    handle = BatchWriteHandle()
+    events = EventRegistry()
+    deleted_events: list[object] = []
+    events.on("after_delete", lambda pk, table: deleted_events.append(pk))
+    table = _table(Flavor, ["id", "name"], handle, events)
+    models = [Flavor(id=str(index), name=f"flavor-{index}") for index in range(3)]
+
+    updated = await table.update_many(models, batch_size=2)
+    deleted = await table.delete_many(["0", "1"])
+
+    assert updated == models
+    assert handle.updates == [
+        (
+            [
+                {"id": "0", "name": "flavor-0"},
+                {"id": "1", "name": "flavor-1"},
+                {"id": "2", "name": "flavor-2"},
+            ],
+            2,
+        )
+    ]
+    assert handle.deletes == [(["0", "1"], None)]
+    assert deleted == 2
+    assert deleted_events == ["0", "1"]
+
+
+class Article(BaseModel):
+    id: str
+    views: int
+    body: str
+
+
+async def test_table_updates_write_only_the_requested_columns() -> None:
+    handle = BatchWriteHandle()
+    table = _table(Article, ["id", "views", "body"], handle)
+    articles = [Article(id=str(index), views=index, body="long") for index in (1, 2)]
+
+    await table.update_many(articles, columns=["views"])
+    await table.update(articles[0], columns=("body",))
+    await table.update(articles[0], columns=[])
+    await table.update_many(articles, columns=["id"])
+
+    assert handle.updates == [
+        ([{"id": "1", "views": 1}, {"id": "2", "views": 2}], None),
+        ([{"id": "1", "body": "long"}], None),
+    ]
+    with pytest.raises(ValueError, match="'title' is not a column on Article"):
+        await table.update(articles[0], columns=["title"])
+
+
+async def test_table_builds_execute_payloads_only_for_listeners(monkeypatch) -> None:
+    events = EventRegistry()
+    table = _table(Article, ["id", "views", "body"], BatchWriteHandle(), events)
+    built: list[str] = []
+    build_payloads = table._execution_payloads
+
+    def record_payloads(operation: str, *args: Any) -> Any:
+        built.append(operation)
+        return build_payloads(operation, *args)
+
+    monkeypatch.setattr(table, "_execution_payloads", record_payloads)
+    article = Article(id="1", views=1, body="long")
+
+    await table.update(article)
+    assert built == []
+
+    executed: list[tuple[str, int | None]] = []
+    events.on(
+        "after_execute",
+        lambda operation, row_count, **_payload: executed.append(
+            (operation, row_count)
+        ),
+    )
+    await table.update(article)
+    assert built == ["update"]
+    assert executed == [("update", 0)]
+
+
 async def test_native_sqlite_io_releases_python_while_query_is_running(
     tmp_path,
 ) -> None:
@@ -88,3 +354,36 @@ async def test_native_sqlite_io_releases_python_while_query_is_running(
     result = await asyncio.wait_for(query_task, 30)
 
     assert result.scalar() == 12500002500000
+
+
+class TransactionHandle:
+    def __init__(self, token: int | None = None) -> None:
+        self.token = token
+
+    def in_transaction(self, token: int) -> TransactionHandle:
+        return TransactionHandle(token)
+
+    def count(self, filters: object, values: object) -> dict[str, object]:
+        return {"columns": ["count"], "rows": [[self.token or 0]], "rowcount": None}
+
+
+async def test_only_the_transaction_owner_runs_on_its_connection() -> None:
+    transaction: ContextVar[int | None] = ContextVar("transaction", default=None)
+    table = _table(Item, ["id"], TransactionHandle(), transaction=transaction)
+    opened = asyncio.Event()
+    release = asyncio.Event()
+
+    async def owner() -> int:
+        transaction.set(7)
+        opened.set()
+        await release.wait()
+        return await table.count()
+
+    async def bystander() -> int:
+        await opened.wait()
+        try:
+            return await table.count()
+        finally:
+            release.set()
+
+    assert await asyncio.gather(owner(), bystander()) == [7, 0]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from enum import Enum
 from typing import Any
 
@@ -42,13 +43,14 @@ class RecordingRuntime:
         self.commits = 0
         self.rollbacks = 0
 
-    def begin(self, options=None) -> None:
+    def begin(self, options=None) -> int:
         self.begin_options.append(options)
+        return len(self.begin_options)
 
-    def commit(self) -> None:
+    def commit(self, token: int) -> None:
         self.commits += 1
 
-    def rollback(self) -> None:
+    def rollback(self, token: int) -> None:
         self.rollbacks += 1
 
 
@@ -67,21 +69,21 @@ class FailingRuntime(RecordingRuntime):
     def drop_all(self) -> None:
         self._maybe_fail("drop_all")
 
-    def commit(self) -> None:
+    def commit(self, token: int) -> None:
         self._maybe_fail("commit")
-        super().commit()
+        super().commit(token)
 
-    def rollback(self) -> None:
+    def rollback(self, token: int) -> None:
         self._maybe_fail("rollback")
-        super().rollback()
+        super().rollback(token)
 
-    def savepoint(self, name: str) -> None:
+    def savepoint(self, token: int, name: str) -> None:
         self._maybe_fail("savepoint")
 
-    def rollback_to_savepoint(self, name: str) -> None:
+    def rollback_to_savepoint(self, token: int, name: str) -> None:
         self._maybe_fail("rollback_to_savepoint")
 
-    def release_savepoint(self, name: str) -> None:
+    def release_savepoint(self, token: int, name: str) -> None:
         self._maybe_fail("release_savepoint")
 
 
@@ -159,6 +161,41 @@ async def test_session_passes_native_options_to_runtime() -> None:
     assert runtime.rollbacks == 0
 
 
+async def test_transaction_calls_run_on_native_runtime_workers() -> None:
+    class SpawningRuntime(RecordingRuntime):
+        def __init__(self) -> None:
+            super().__init__()
+            self.spawned = 0
+            self.lanes: list[bool] = []
+
+        def spawn(self, call: Any, pinned: bool = False) -> Any:
+            self.spawned += 1
+            self.lanes.append(pinned)
+            future = asyncio.get_running_loop().create_future()
+            future.set_result(call())
+            return future
+
+    db = Ormdantic("sqlite:///:memory:")
+    runtime = SpawningRuntime()
+    db._runtime = runtime
+
+    async with db.transaction():
+        pass
+
+    assert runtime.spawned == 2
+    assert runtime.lanes == [False, True]
+    assert runtime.commits == 1
+
+    threaded = Ormdantic("sqlite:///:memory:", native_async=False)
+    threaded._runtime = runtime
+
+    async with threaded.transaction():
+        pass
+
+    assert runtime.spawned == 2
+    assert runtime.commits == 2
+
+
 async def test_transaction_rejects_unknown_isolation_level() -> None:
     db = Ormdantic("sqlite:///:memory:")
 
@@ -261,6 +298,7 @@ async def test_transaction_helper_errors_dispatch_wrapped_failures(
         seen.append(payload.get("error"))
 
     db._events.on(event_name, record)
+    db._transaction.set(1)
     method = getattr(db, method_name)
     args = ("sp1",) if "savepoint" in method_name else ()
 
@@ -271,6 +309,141 @@ async def test_transaction_helper_errors_dispatch_wrapped_failures(
     assert isinstance(seen[0], TransactionError)
 
 
+async def test_pool_options_are_forwarded_to_runtime_and_reported(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    created: list[dict[str, Any]] = []
+
+    class PooledRuntime(RecordingRuntime):
+        def __init__(self, connection: str, tables: list[Any], **pool: Any) -> None:
+            super().__init__()
+            assert connection == "postgresql://localhost/db"
+            created.append(pool)
+
+        def pool_statistics(self) -> dict[str, Any]:
+            return {"max_size": 4, "in_use": 0}
+
+    monkeypatch.setattr(orm_module._ormdantic, "PyDatabase", PooledRuntime)
+    db = Ormdantic(
+        "postgresql://localhost/db",
+        pool_max_size=4,
+        pool_timeout=2.5,
+        pool_pre_ping=True,
+    )
+
+    assert db.runtime_diagnostics()["pool"] is None
+    db._runtime = db._build_runtime_database()
+
+    assert created == [{"pool_max_size": 4, "pool_timeout": 2.5, "pool_pre_ping": True}]
+    assert db.runtime_diagnostics()["pool"] == {"max_size": 4, "in_use": 0}
+
+
+async def test_select_cache_size_is_forwarded_and_counters_reported(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    created: list[dict[str, Any]] = []
+
+    class CachingRuntime(RecordingRuntime):
+        def __init__(self, connection: str, tables: list[Any], **options: Any) -> None:
+            super().__init__()
+            created.append(options)
+
+        def select_cache_statistics(self) -> dict[str, Any]:
+            return {"capacity": 32, "hits": 5, "misses": 1}
+
+    monkeypatch.setattr(orm_module._ormdantic, "PyDatabase", CachingRuntime)
+    db = Ormdantic("sqlite:///:memory:", statement_cache_size=64, select_cache_size=32)
+
+    assert db.runtime_diagnostics()["select_cache"] is None
+    db._runtime = db._build_runtime_database()
+
+    assert created == [{"statement_cache_size": 64, "select_cache_size": 32}]
+    assert db.runtime_diagnostics()["select_cache"] == {
+        "capacity": 32,
+        "hits": 5,
+        "misses": 1,
+    }
+
+
+async def test_query_metrics_are_reported_and_exported_for_prometheus(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    find_many = {
+        "calls": 3,
+        "errors": 1,
+        "rows": 20,
+        "bytes": 512,
+        "pool_wait_ms": 1.5,
+        "total_ms": 4.0,
+        "max_ms": 2.0,
+        "p50_ms": 1.0,
+        "p90_ms": 2.0,
+        "p99_ms": 2.0,
+        "buckets": [(0.001, 1), (0.0025, 3), (float("inf"), 3)],
+    }
+
+    class MeasuredRuntime(RecordingRuntime):
+        def __init__(self, connection: str, tables: list[Any], **options: Any) -> None:
+            super().__init__()
+
+        def query_metrics(self) -> dict[str, Any]:
+            return {
+                'flavor"s': {
+                    "compile_cache_hits": 2,
+                    "compile_cache_misses": 1,
+                    "statement_cache_hits": 2,
+                    "statement_cache_misses": 1,
+                    "operations": {"find_many": find_many},
+                }
+            }
+
+    monkeypatch.setattr(orm_module._ormdantic, "PyDatabase", MeasuredRuntime)
+    db = Ormdantic("sqlite:///:memory:")
+
+    assert db.runtime_diagnostics()["query_metrics"] is None
+    assert "ormdantic_queries_total{" not in db.prometheus_metrics()
+    db._runtime = db._build_runtime_database()
+
+    metrics = db.runtime_diagnostics()["query_metrics"]
+    assert metrics['flavor"s']["operations"]["find_many"] is find_many
+    exported = db.prometheus_metrics().splitlines()
+    labels = 'table="flavor\\"s",operation="find_many"'
+    assert "# TYPE ormdantic_query_duration_seconds histogram" in exported
+    assert f"ormdantic_queries_total{{{labels}}} 3" in exported
+    assert f"ormdantic_query_pool_wait_seconds_total{{{labels}}} 0.0015" in exported
+    assert (
+        f'ormdantic_query_duration_seconds_bucket{{{labels},le="0.001"}} 1' in exported
+    )
+    assert (
+        f'ormdantic_query_duration_seconds_bucket{{{labels},le="+Inf"}} 3' in exported
+    )
+    assert f"ormdantic_query_duration_seconds_sum{{{labels}}} 0.004" in exported
+    assert f"ormdantic_query_duration_seconds_count{{{labels}}} 3" in exported
+    assert 'ormdantic_statement_cache_misses_total{table="flavor\\"s"} 1' in exported
+
+
+@pytest.mark.parametrize(
+    ("options", "message"),
+    [
+        ({"pool_max_size": 0}, "pool_max_size must be at least 1"),
+        ({"pool_min_size": -1}, "pool_min_size must be non-negative"),
+        (
+            {"pool_min_size": 3, "pool_max_size": 2},
+            "pool_min_size must not exceed pool_max_size",
+        ),
+        ({"pool_timeout": -1.0}, "pool_timeout must be non-negative"),
+        ({"pool_idle_timeout": -1.0}, "pool_idle_timeout must be non-negative"),
+        ({"statement_cache_size": -1}, "statement_cache_size must be non-negative"),
+        ({"select_cache_size": -1}, "select_cache_size must be non-negative"),
+    ],
+)
+def test_pool_options_reject_invalid_values(
+    options: dict[str, Any], message: str
+) -> None:
+    with pytest.raises(ValueError, match=message):
+        Ormdantic("sqlite:///:memory:", **options)
+
+
 def test_runtime_enum_drop_sql_quotes_identifiers() -> None:
     assert (
         _drop_runtime_enum_type_sql(("flavor", ["a"])) == 'DROP TYPE IF EXISTS "flavor"'